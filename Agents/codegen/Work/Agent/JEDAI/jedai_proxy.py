@@ -1,7 +1,11 @@
 import httpx
 import json
+import os
 import time
 import asyncio
+import hashlib
+from collections import OrderedDict, defaultdict, deque
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.responses import StreamingResponse, JSONResponse
 from pydantic import BaseModel, Field
@@ -12,14 +16,212 @@ from model_config import JEDAI_MODELS, get_model_config, MODEL_ALIASES
 app = FastAPI(title="JEDAI to OpenAI Proxy")
 auth = JedaiAuth()
 
+# Upstream connection pool (one long-lived client, reused across requests)
+UPSTREAM_TIMEOUT = httpx.Timeout(300.0, connect=60.0)
+UPSTREAM_LIMITS = httpx.Limits(
+    max_connections=int(os.environ.get("JEDAI_PROXY_MAX_CONNECTIONS", "100")),
+    max_keepalive_connections=int(os.environ.get("JEDAI_PROXY_MAX_KEEPALIVE", "20")),
+    keepalive_expiry=60.0,
+)
+# Concurrent upstream requests per client (X-Client-Id header, "user" field or client IP)
+CLIENT_CONCURRENCY = int(os.environ.get("JEDAI_PROXY_CLIENT_CONCURRENCY", "8"))
+# Exact-match cache for temperature 0, non-streaming requests (0 disables)
+CACHE_SIZE = int(os.environ.get("JEDAI_PROXY_CACHE_SIZE", "256"))
+CACHE_TTL = float(os.environ.get("JEDAI_PROXY_CACHE_TTL", "3600"))
+# Log headers and dump every request body to last_request.json
+DEBUG = os.environ.get("JEDAI_PROXY_DEBUG", "0") == "1"
+
+_upstream: Optional[httpx.AsyncClient] = None
+_token_lock = asyncio.Lock()
+
+
+def get_upstream_client() -> httpx.AsyncClient:
+    global _upstream
+    if _upstream is None or _upstream.is_closed:
+        _upstream = httpx.AsyncClient(verify=False, timeout=UPSTREAM_TIMEOUT, limits=UPSTREAM_LIMITS)
+    return _upstream
+
+
+class ProxyMetrics:
+    """Counters and recent latency samples (single event loop, no locking)"""
+
+    def __init__(self, window: int = 1000):
+        self.started = time.time()
+        self.counters = defaultdict(int)
+        self.status = defaultdict(int)
+        self.latency = deque(maxlen=window)
+        self.first_chunk = deque(maxlen=window)
+        self.queue_wait = deque(maxlen=window)
+        self.in_flight = 0
+        self.queued = 0
+
+    def record(self, status: int, seconds: float):
+        self.counters["requests"] += 1
+        self.status[str(status)] += 1
+        self.latency.append(seconds)
+
+    @staticmethod
+    def _percentiles(samples) -> Dict[str, Any]:
+        if not samples:
+            return {"count": 0}
+        ordered = sorted(samples)
+        n = len(ordered)
+        ms = lambda v: round(v * 1000, 1)
+        return {
+            "count": n,
+            "p50_ms": ms(ordered[n // 2]),
+            "p95_ms": ms(ordered[min(n - 1, int(n * 0.95))]),
+            "max_ms": ms(ordered[-1]),
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        hits = self.counters["cache_hits"] + self.counters["cache_coalesced"]
+        lookups = hits + self.counters["cache_misses"]
+        return {
+            "uptime_s": round(time.time() - self.started, 1),
+            "requests": self.counters["requests"],
+            "status": dict(self.status),
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "latency": self._percentiles(self.latency),
+            "stream_first_chunk": self._percentiles(self.first_chunk),
+            "queue_wait": self._percentiles(self.queue_wait),
+            "cache": {
+                "enabled": CACHE_SIZE > 0,
+                "entries": len(response_cache.entries),
+                "hits": self.counters["cache_hits"],
+                "coalesced": self.counters["cache_coalesced"],
+                "misses": self.counters["cache_misses"],
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            },
+            "token_refreshes": self.counters["token_refreshes"],
+            "clients": client_limiter.snapshot(),
+        }
+
+
+class ClientLimiter:
+    """Caps concurrent upstream requests per client; excess requests queue"""
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._active = defaultdict(int)
+        self._waiting = defaultdict(int)
+
+    @asynccontextmanager
+    async def slot(self, client_id: str):
+        semaphore = self._semaphores.setdefault(client_id, asyncio.Semaphore(self.limit))
+        start = time.perf_counter()
+        metrics.queued += 1
+        self._waiting[client_id] += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            metrics.queued -= 1
+            self._waiting[client_id] -= 1
+        metrics.queue_wait.append(time.perf_counter() - start)
+        metrics.in_flight += 1
+        self._active[client_id] += 1
+        try:
+            yield
+        finally:
+            metrics.in_flight -= 1
+            self._active[client_id] -= 1
+            semaphore.release()
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        return {
+            client: {"active": self._active[client], "waiting": self._waiting[client]}
+            for client in self._semaphores
+        }
+
+
+class ResponseCache:
+    """LRU of upstream JSON responses keyed by the exact JEDAI request body"""
+
+    def __init__(self, size: int, ttl: float):
+        self.size = size
+        self.ttl = ttl
+        self.entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # Identical requests already sent upstream: later ones await the same task
+        self.inflight: Dict[str, asyncio.Task] = {}
+
+    @staticmethod
+    def key(body: Dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(body, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires, content = entry
+        if time.time() > expires:
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return content
+
+    def put(self, key: str, content: Any):
+        self.entries[key] = (time.time() + self.ttl, content)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+
+metrics = ProxyMetrics()
+client_limiter = ClientLimiter(CLIENT_CONCURRENCY)
+response_cache = ResponseCache(CACHE_SIZE, CACHE_TTL)
+
+
+async def current_token() -> str:
+    """Cached token; the first login runs in a thread, once for all waiting requests"""
+    if auth.token and auth.connected_url:
+        return auth.token
+    async with _token_lock:
+        if not (auth.token and auth.connected_url):
+            if not await asyncio.to_thread(auth.connect):
+                raise HTTPException(status_code=502, detail="JEDAI authentication failed")
+        return auth.token
+
+
+async def refresh_token(stale_token: str) -> str:
+    """Single-flight refresh: requests rejected with the same stale token share one login"""
+    async with _token_lock:
+        if auth.token and auth.connected_url and auth.token != stale_token:
+            return auth.token  # refreshed by a concurrent request
+        metrics.counters["token_refreshes"] += 1
+        if not await asyncio.to_thread(auth.refresh_token):
+            raise HTTPException(status_code=502, detail="JEDAI token refresh failed")
+        return auth.token
+
+
+def _chat_url() -> str:
+    return f"{auth.connected_url}/api/copilot/v1/llm/chat/completions"
+
+
+def _auth_headers(token: str) -> Dict[str, str]:
+    return {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {token}"
+    }
+
+
+def client_id_of(raw_request: Request, request: "ChatCompletionRequest") -> str:
+    client_id = raw_request.headers.get("x-client-id") or request.user
+    if not client_id and raw_request.client:
+        client_id = raw_request.client.host
+    return client_id or "unknown"
+
+
 @app.middleware("http")
 async def store_request(request: Request, call_next):
     # Log incoming requests for debugging
     print(f"[REQUEST] {request.method} {request.url.path}")
-    print(f"[HEADERS] {dict(request.headers)}")
+    if DEBUG:
+        print(f"[HEADERS] {dict(request.headers)}")
     
     # Log request body for POST requests
-    if request.method == "POST":
+    if DEBUG and request.method == "POST":
         body = await request.body()
         try:
             body_json = json.loads(body)
@@ -94,10 +296,16 @@ class ChatCompletionRequest(BaseModel):
 @app.on_event("startup")
 async def startup_event():
     print("Starting JEDAI Proxy...")
+    get_upstream_client()
     # Pre-login on startup
-    if not auth.connect():
+    if not await asyncio.to_thread(auth.connect):
         print("Warning: Initial login failed. Will retry on first request.")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    if _upstream is not None:
+        await _upstream.aclose()
+
 async def build_jedai_body(request: ChatCompletionRequest):
     model_config, real_name = get_model_config(request.model)
     
@@ -168,40 +376,82 @@ async def list_models():
             
     return {"object": "list", "data": data}
 
+@app.get("/metrics")
+async def proxy_metrics():
+    """Latency, queueing, cache hit rate and per-client load"""
+    return metrics.snapshot()
+
 @app.post("/v1/chat/completions")
-async def chat_completions(request: ChatCompletionRequest):
-    return await handle_chat_request(request)
+async def chat_completions(request: ChatCompletionRequest, raw_request: Request):
+    return await handle_chat_request(request, raw_request)
 
 @app.post("/v1/responses")
-async def responses(request: ChatCompletionRequest):
+async def responses(request: ChatCompletionRequest, raw_request: Request):
     """Continue extension compatibility endpoint"""
     print("[INFO] Continue extension using /v1/responses endpoint")
-    return await handle_chat_request(request)
+    return await handle_chat_request(request, raw_request)
 
-async def handle_chat_request(request: ChatCompletionRequest):
-    token = auth.get_token()
-    url = f"{auth.connected_url}/api/copilot/v1/llm/chat/completions"
-    
+async def _post_completion(jedai_body: Dict[str, Any], client_id: str) -> Dict[str, Any]:
+    """Non-streaming upstream call on the pooled client, retried once after a token refresh"""
+    token = await current_token()
+    async with client_limiter.slot(client_id):
+        for attempt in range(2):
+            resp = await get_upstream_client().post(_chat_url(), json=jedai_body, headers=_auth_headers(token))
+            if resp.status_code in [401, 403] and attempt == 0:
+                print("Token expired, refreshing...")
+                token = await refresh_token(token)
+                continue
+            if resp.status_code != 200:
+                raise HTTPException(status_code=resp.status_code, detail=resp.text)
+            return resp.json()
+
+async def _cached_completion(jedai_body: Dict[str, Any], client_id: str):
+    """Returns (content, "HIT" | "MISS")"""
+    key = response_cache.key(jedai_body)
+    content = response_cache.get(key)
+    if content is not None:
+        metrics.counters["cache_hits"] += 1
+        return content, "HIT"
+
+    task = response_cache.inflight.get(key)
+    if task is None:
+        metrics.counters["cache_misses"] += 1
+        task = asyncio.ensure_future(_post_completion(jedai_body, client_id))
+        response_cache.inflight[key] = task
+
+        def _done(t):
+            response_cache.inflight.pop(key, None)
+            if not t.cancelled() and t.exception() is None:
+                response_cache.put(key, t.result())
+        task.add_done_callback(_done)
+        status = "MISS"
+    else:
+        metrics.counters["cache_coalesced"] += 1
+        status = "HIT"
+    # shield: a disconnecting caller must not cancel the request others are waiting on
+    return await asyncio.shield(task), status
+
+async def handle_chat_request(request: ChatCompletionRequest, raw_request: Request):
     jedai_body = await build_jedai_body(request)
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {token}"
-    }
+    client_id = client_id_of(raw_request, request)
+    start = time.perf_counter()
 
     if request.stream:
         async def stream_generator():
-            timeout = httpx.Timeout(300.0, connect=60.0)
-            async with httpx.AsyncClient(verify=False, timeout=timeout) as client:
-                retry_count = 1
-                while True:
-                    request_headers = headers.copy()
-                    
-                    try:
-                         async with client.stream("POST", url, json=jedai_body, headers=request_headers) as resp:
-                            if resp.status_code in [401, 403] and retry_count > 0:
-                                # Break context to handle retry
+            status = 200
+            first_chunk = True
+            try:
+                async with client_limiter.slot(client_id):
+                    token = await current_token()
+                    for attempt in range(2):
+                        async with get_upstream_client().stream(
+                            "POST", _chat_url(), json=jedai_body, headers=_auth_headers(token)
+                        ) as resp:
+                            if resp.status_code in [401, 403] and attempt == 0:
+                                # Retry below, once this response is closed
                                 pass
                             elif resp.status_code != 200:
+                                status = resp.status_code
                                 content = await resp.aread()
                                 err_data = json.dumps({"error": f"Upstream error {resp.status_code}: {content.decode()}"})
                                 yield f"data: {err_data}\n\n"
@@ -209,49 +459,46 @@ async def handle_chat_request(request: ChatCompletionRequest):
                             else:
                                 async for chunk in resp.aiter_lines():
                                     if chunk:
+                                        if first_chunk:
+                                            metrics.first_chunk.append(time.perf_counter() - start)
+                                            first_chunk = False
                                         # JEDAI might filter keep-alives?
                                         yield chunk + "\n\n"
                                 return
-                    except Exception as e:
-                        err_data = json.dumps({"error": f"Stream error: {str(e)}"})
-                        yield f"data: {err_data}\n\n"
-                        return
 
-                    # Retry logic (outside inner async with)
-                    if retry_count > 0:
                         print("Token expired (stream), refreshing...")
-                        auth.clear_token()
-                        auth.connect(force=True)
-                        new_token = auth.get_token()
-                        headers["Authorization"] = f"Bearer {new_token}"
-                        retry_count -= 1
-                    else:
-                        return
+                        token = await refresh_token(token)
+            except Exception as e:
+                status = getattr(e, "status_code", 502)
+                err_data = json.dumps({"error": f"Stream error: {str(e)}"})
+                yield f"data: {err_data}\n\n"
+            finally:
+                metrics.record(status, time.perf_counter() - start)
 
         return StreamingResponse(stream_generator(), media_type="text/event-stream")
 
     else:
         # Non-streaming request
-        async def do_request(retry=True):
-            timeout = httpx.Timeout(300.0, connect=60.0)
-            async with httpx.AsyncClient(verify=False, timeout=timeout) as client:
-                resp = await client.post(url, json=jedai_body, headers=headers)
-                if resp.status_code in [401, 403] and retry:
-                    return "RETRY"
-                if resp.status_code != 200:
-                    raise HTTPException(status_code=resp.status_code, detail=resp.text)
-                return JSONResponse(content=resp.json())
-
-        result = await do_request()
-        if result == "RETRY":
-            print("Token expired, refreshing...")
-            auth.clear_token()
-            auth.connect(force=True)
-            token = auth.get_token()
-            headers["Authorization"] = f"Bearer {token}"
-            result = await do_request(retry=False)
-        
-        return result
+        status = 200
+        try:
+            cacheable = (
+                CACHE_SIZE > 0
+                and jedai_body.get("temperature") == 0
+                and (request.n or 1) == 1
+                and "no-cache" not in raw_request.headers.get("cache-control", "")
+            )
+            if cacheable:
+                content, cache_status = await _cached_completion(jedai_body, client_id)
+                return JSONResponse(content=content, headers={"X-Proxy-Cache": cache_status})
+            return JSONResponse(content=await _post_completion(jedai_body, client_id))
+        except HTTPException as e:
+            status = e.status_code
+            raise
+        except Exception:
+            status = 500
+            raise
+        finally:
+            metrics.record(status, time.perf_counter() - start)
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+jedai_proxy单元测试 (不连接JEDAI)
+上游用httpx.MockTransport模拟, 验证token刷新、缓存和并发限制
+"""
+import asyncio
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("requests")  # jedai_auth
+httpx = pytest.importorskip("httpx")
+
+sys.path.insert(0, str(Path(__file__).parent))
+import jedai_proxy  # noqa: E402
+
+
+def _completion(text: str):
+    return {"choices": [{"message": {"role": "assistant", "content": text}}]}
+
+
+class ProxyTestCase(unittest.IsolatedAsyncioTestCase):
+    client_limit = 8
+
+    async def asyncSetUp(self):
+        self.upstream_calls = []
+        self.refreshes = 0
+        self.patches = [
+            mock.patch.object(jedai_proxy, "_token_lock", asyncio.Lock()),
+            mock.patch.object(jedai_proxy, "metrics", jedai_proxy.ProxyMetrics()),
+            mock.patch.object(jedai_proxy, "client_limiter", jedai_proxy.ClientLimiter(self.client_limit)),
+            mock.patch.object(jedai_proxy, "response_cache", jedai_proxy.ResponseCache(16, 60)),
+            mock.patch.object(jedai_proxy.auth, "token", "old-token"),
+            mock.patch.object(jedai_proxy.auth, "connected_url", "https://jedai.test"),
+            mock.patch.object(jedai_proxy.auth, "refresh_token", side_effect=self._refresh),
+            mock.patch("builtins.print"),
+        ]
+        for patch in self.patches:
+            patch.start()
+        jedai_proxy._upstream = httpx.AsyncClient(transport=httpx.MockTransport(self.handle_upstream))
+        self.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=jedai_proxy.app),
+                                        base_url="http://proxy")
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        await jedai_proxy._upstream.aclose()
+        jedai_proxy._upstream = None
+        for patch in self.patches:
+            patch.stop()
+
+    def _refresh(self):
+        # runs in a worker thread, like the real login
+        time.sleep(0.05)
+        self.refreshes += 1
+        jedai_proxy.auth.token = "new-token"
+        return True
+
+    async def handle_upstream(self, request):
+        self.upstream_calls.append(request)
+        return httpx.Response(200, json=_completion("hello"))
+
+    def post(self, temperature=0.0, content="hi", client_id="tester"):
+        return self.client.post("/v1/chat/completions", headers={"X-Client-Id": client_id}, json={
+            "model": "claude-sonnet-4", "temperature": temperature,
+            "messages": [{"role": "user", "content": content}],
+        })
+
+
+class TestTokenRefresh(ProxyTestCase):
+    async def handle_upstream(self, request):
+        self.upstream_calls.append(request)
+        await asyncio.sleep(0.01)
+        if request.headers["authorization"] != "Bearer new-token":
+            return httpx.Response(401, text="token expired")
+        return httpx.Response(200, json=_completion("hello"))
+
+    async def test_concurrent_requests_share_one_refresh(self):
+        responses = await asyncio.gather(*(self.post(temperature=0.5, content=f"q{i}") for i in range(6)))
+        self.assertEqual([r.status_code for r in responses], [200] * 6)
+        self.assertEqual(self.refreshes, 1)
+        self.assertEqual(jedai_proxy.metrics.counters["token_refreshes"], 1)
+
+
+class TestResponseCache(ProxyTestCase):
+    async def test_temperature_zero_is_cached(self):
+        first = await self.post(temperature=0)
+        second = await self.post(temperature=0)
+        self.assertEqual(first.headers["x-proxy-cache"], "MISS")
+        self.assertEqual(second.headers["x-proxy-cache"], "HIT")
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(len(self.upstream_calls), 1)
+
+    async def test_temperature_above_zero_is_never_cached(self):
+        for _ in range(3):
+            response = await self.post(temperature=0.7)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn("x-proxy-cache", response.headers)
+        self.assertEqual(len(self.upstream_calls), 3)
+        self.assertEqual(len(jedai_proxy.response_cache.entries), 0)
+
+    async def test_no_cache_header_bypasses_cache(self):
+        await self.post(temperature=0)
+        response = await self.client.post("/v1/chat/completions", headers={"Cache-Control": "no-cache"}, json={
+            "model": "claude-sonnet-4", "temperature": 0, "messages": [{"role": "user", "content": "hi"}],
+        })
+        self.assertNotIn("x-proxy-cache", response.headers)
+        self.assertEqual(len(self.upstream_calls), 2)
+
+
+class TestClientLimiter(ProxyTestCase):
+    client_limit = 2
+
+    async def asyncSetUp(self):
+        self.release = asyncio.Event()
+        self.active = 0
+        self.peak = 0
+        await super().asyncSetUp()
+
+    async def handle_upstream(self, request):
+        self.upstream_calls.append(request)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await self.release.wait()
+        self.active -= 1
+        return httpx.Response(200, json=_completion("hello"))
+
+    async def test_requests_above_limit_queue(self):
+        tasks = [asyncio.ensure_future(self.post(temperature=0.5, content=f"q{i}")) for i in range(5)]
+        for _ in range(100):
+            if len(self.upstream_calls) == 2 and jedai_proxy.metrics.queued == 3:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(len(self.upstream_calls), 2)
+        self.assertEqual(jedai_proxy.client_limiter.snapshot()["tester"], {"active": 2, "waiting": 3})
+
+        self.release.set()
+        responses = await asyncio.gather(*tasks)
+        self.assertEqual([r.status_code for r in responses], [200] * 5)
+        self.assertEqual(self.peak, 2)
+        self.assertEqual(jedai_proxy.metrics.queued, 0)
+
+    async def test_limit_is_per_client(self):
+        tasks = [asyncio.ensure_future(self.post(temperature=0.5, content=f"q{i}", client_id=f"c{i % 2}"))
+                 for i in range(4)]
+        for _ in range(100):
+            if len(self.upstream_calls) == 4:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(len(self.upstream_calls), 4)
+        self.release.set()
+        await asyncio.gather(*tasks)
+
+
+if __name__ == "__main__":
+    unittest.main()
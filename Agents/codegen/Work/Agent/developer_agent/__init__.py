@@ -2,7 +2,7 @@
 Developer Agent Package
 """
 from .state import AgentState, AgentConfig, LLMConfig, create_initial_state, generate_item_id
-from .cache import FileSystemCache, StateCache, resume_from_checkpoint
+from .cache import FileSystemCache, BlobCheckpointCache, StateCache, create_cache, resume_from_checkpoint
 from .tools import (
     discover_log_files,
     extract_log_snippet,
@@ -10,6 +10,7 @@ from .tools import (
     discover_files,
     extract_snippet
 )
+from .file_tree_index import FileTreeIndex, get_file_index, glob_files
 from .validator import validate_10_2_compliance, determine_error_source
 from .llm_client import LLMClient, get_llm_client
 from .prompts import (
@@ -32,6 +33,7 @@ from .nodes import (
     should_continue
 )
 from .graph import build_agent_graph, run_agent, run_agent_simple
+from .batch_runner import BatchRunner, BatchReport, ItemResult, run_batch
 from .main import run_from_code
 
 __version__ = "1.0.0"
@@ -45,7 +47,9 @@ __all__ = [
     
     # Cache
     "FileSystemCache",
+    "BlobCheckpointCache",
     "StateCache",
+    "create_cache",
     "resume_from_checkpoint",
     
     # Tools
@@ -54,6 +58,9 @@ __all__ = [
     "parse_item_spec",
     "discover_files",
     "extract_snippet",
+    "FileTreeIndex",
+    "get_file_index",
+    "glob_files",
     
     # Validator
     "validate_10_2_compliance",
@@ -87,5 +94,9 @@ __all__ = [
     "build_agent_graph",
     "run_agent",
     "run_agent_simple",
+    "BatchRunner",
+    "BatchReport",
+    "ItemResult",
+    "run_batch",
     "run_from_code",
 ]
@@ -0,0 +1,555 @@
+"""
+Developer Agent - Batch Runner
+
+Runs the agent for many ItemSpecs (e.g. a whole check module) in one process
+instead of one run_agent() per item, overlapping the independent work:
+
+- Items run concurrently, each in its own thread (max_items at a time)
+- All LLM calls of all items share one concurrency limit (llm_concurrency)
+- Validation exec's the generated code, so it runs in a separate process pool:
+  CPU-bound Gate 2 tests do not hold the GIL and hung code can be killed
+- load_spec + discover_logs are prefetched for queued items while the running
+  items wait on the LLM
+- Every item has a deadline; a failed or stuck item is reported on its own and
+  its slot is handed to the next item instead of stalling the batch; LLM calls
+  of an abandoned item give up their limiter slot at the deadline
+"""
+from typing import List, Dict, Any, Optional, Callable
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    CancelledError,
+    TimeoutError as FutureTimeout
+)
+from concurrent.futures.process import BrokenProcessPool
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+
+from state import AgentState, AgentConfig, create_initial_state, generate_item_id
+from cache import create_cache
+from validator import validate_10_2_compliance
+from llm_client import LLMClient
+from nodes import (
+    load_spec_node,
+    discover_logs_node,
+    agent_a_node,
+    agent_b_node,
+    validate_node,
+    reflect_a_node,
+    reflect_b_node,
+    human_required_node,
+    should_continue,
+    extract_stage_outputs
+)
+from graph import LANGGRAPH_AVAILABLE, build_agent_graph
+
+# Defaults (overridable per BatchRunner)
+BATCH_MAX_ITEMS = int(os.environ.get("DEV_AGENT_BATCH_ITEMS", "4"))
+BATCH_LLM_CONCURRENCY = int(os.environ.get("DEV_AGENT_LLM_CONCURRENCY", "4"))
+BATCH_VALIDATE_WORKERS = int(os.environ.get("DEV_AGENT_VALIDATE_WORKERS", str(min(4, os.cpu_count() or 1))))
+BATCH_PREFETCH_AHEAD = int(os.environ.get("DEV_AGENT_PREFETCH_AHEAD", "4"))
+BATCH_ITEM_TIMEOUT = float(os.environ.get("DEV_AGENT_ITEM_TIMEOUT", "1800"))
+BATCH_VALIDATE_TIMEOUT = float(os.environ.get("DEV_AGENT_VALIDATE_TIMEOUT", "60"))
+
+# How often the dispatcher looks for items past their deadline
+_POLL_SECONDS = 0.5
+
+# Fallback routing when LangGraph is not installed (same edges as build_agent_graph)
+_NEXT_NODE = {
+    "agent_a": "agent_b",
+    "agent_b": "validate",
+    "reflect_a": "agent_a",
+    "reflect_b": "agent_b",
+    "human_required": None,
+}
+
+
+class ItemTimeout(Exception):
+    """Raised inside an item when it runs past its deadline"""
+
+
+# Item run by the current thread; LangGraph copies the context into its node threads
+_current_run: ContextVar[Optional["_ItemRun"]] = ContextVar("batch_item_run", default=None)
+
+
+class LimitedLLMClient:
+    """
+    LLM client wrapper: every invoke() holds one slot of a shared limiter
+
+    Inside a batch item, waiting for a slot and the call itself are bounded by
+    the item's deadline, so a timed-out item cannot keep a slot forever and a
+    cancelled item does not take a new one.
+    """
+
+    def __init__(self, client, limiter: threading.BoundedSemaphore):
+        self._client = client
+        self._limiter = limiter
+
+    def invoke(self, prompt: str) -> str:
+        run = _current_run.get()
+        if run is None:
+            with self._limiter:
+                return self._client.invoke(prompt)
+
+        if run.cancelled.is_set():
+            raise ItemTimeout("Item cancelled before LLM call")
+        if not self._limiter.acquire(timeout=max(0.0, run.deadline - time.time())):
+            raise ItemTimeout("Item timed out waiting for an LLM slot")
+        try:
+            remaining = run.deadline - time.time()
+            if run.cancelled.is_set() or remaining <= 0:
+                raise ItemTimeout("Item timed out waiting for an LLM slot")
+            return self._client.invoke(prompt, timeout=remaining)
+        finally:
+            self._limiter.release()
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class ValidationPool:
+    """
+    Process pool for validate_10_2_compliance
+
+    Only as many validations as there are workers are submitted at once, so the
+    timeout measures run time, not queueing. A timed-out validation kills the
+    whole pool (a process pool cannot stop one task); validations of other
+    items that were running in it are retried once on a fresh pool.
+    """
+
+    def __init__(self, workers: int = None, timeout: float = None):
+        self.workers = max(1, workers or BATCH_VALIDATE_WORKERS)
+        self.timeout = timeout if timeout is not None else BATCH_VALIDATE_TIMEOUT
+        self._slots = threading.BoundedSemaphore(self.workers)
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn: never fork a process whose other threads may hold locks
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def _discard(self, pool: ProcessPoolExecutor) -> None:
+        """Drop a broken or hung pool and kill its worker processes"""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        processes = list((getattr(pool, "_processes", None) or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    def validate(self, code_str: str, yaml_str: str) -> Dict[str, Any]:
+        """Same contract as validate_10_2_compliance"""
+        with self._slots:
+            for _ in range(2):
+                pool = self._get_pool()
+                try:
+                    future = pool.submit(validate_10_2_compliance, code_str, yaml_str)
+                    return future.result(timeout=self.timeout)
+                except FutureTimeout:
+                    self._discard(pool)
+                    return {
+                        "valid": False,
+                        "errors": [f"Runtime Error: validation timed out after {self.timeout:.0f}s"],
+                        "gate_results": {}
+                    }
+                except (BrokenProcessPool, CancelledError):
+                    # Pool killed for another item's timeout (or a worker crashed)
+                    self._discard(pool)
+        return {
+            "valid": False,
+            "errors": ["Runtime Error: validation worker crashed"],
+            "gate_results": {}
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass
+class ItemResult:
+    """Outcome of one item in a batch"""
+    item_spec_path: str
+    item_id: str
+    status: str                     # "done" | "human_required" | "error" | "timeout"
+    iterations: int = 0
+    errors: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    state: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class BatchReport:
+    """Results of BatchRunner.run() in input order"""
+    results: List[ItemResult]
+    elapsed: float
+
+    def summary(self) -> Dict[str, Any]:
+        counts: Dict[str, int] = {}
+        for result in self.results:
+            counts[result.status] = counts.get(result.status, 0) + 1
+        busy = sum(r.elapsed for r in self.results)
+        return {
+            "items": len(self.results),
+            "by_status": counts,
+            "elapsed": round(self.elapsed, 2),
+            # > 1 means items overlapped
+            "overlap": round(busy / self.elapsed, 2) if self.elapsed else 0.0,
+        }
+
+
+class _ItemRun:
+    """Mutable bookkeeping for one item while the batch runs"""
+
+    def __init__(self, index: int, item_spec_path: str, search_root: str = None):
+        self.index = index
+        self.item_spec_path = item_spec_path
+        self.search_root = search_root
+        self.item_id = generate_item_id(item_spec_path)
+        self.prefetch = None                # Future[AgentState]
+        self.state: Optional[AgentState] = None
+        self.stage_seconds: Dict[str, float] = {}
+        self.started = 0.0
+        self.deadline = float("inf")
+        self.result: Optional[ItemResult] = None
+        self.lock = threading.Lock()
+        self.cancelled = threading.Event()  # set when the dispatcher abandons the item
+
+
+class BatchRunner:
+    """
+    Multi-item driver around the agent graph
+
+    Example:
+        runner = BatchRunner(AgentConfig.load(), max_items=8, llm_concurrency=4)
+        report = runner.run(["IMP-1-0-0-01_ItemSpec.md", "IMP-1-0-0-02_ItemSpec.md"])
+        print(report.summary())
+    """
+
+    def __init__(
+        self,
+        config: AgentConfig,
+        max_items: int = None,
+        llm_concurrency: int = None,
+        validate_workers: int = None,
+        prefetch_ahead: int = None,
+        item_timeout: float = None,
+        validate_timeout: float = None,
+        llm_factory: Callable[[Any], Any] = None,
+        use_graph: bool = None,
+        save_checkpoints: bool = True
+    ):
+        """
+        Args:
+            config: Agent configuration shared by all items
+            max_items: Items running at once (default DEV_AGENT_BATCH_ITEMS)
+            llm_concurrency: LLM calls in flight across all items (default DEV_AGENT_LLM_CONCURRENCY)
+            validate_workers: Validation processes; 0 validates in-process (default DEV_AGENT_VALIDATE_WORKERS)
+            prefetch_ahead: Queued items whose spec/logs are prepared in advance (default DEV_AGENT_PREFETCH_AHEAD)
+            item_timeout: Seconds per item, prefetch included (default DEV_AGENT_ITEM_TIMEOUT)
+            validate_timeout: Seconds per validation run (default DEV_AGENT_VALIDATE_TIMEOUT)
+            llm_factory: Builds a client from an LLMConfig (default LLMClient); its
+                invoke() must accept timeout= (seconds left until the item's deadline)
+            use_graph: Run the compiled LangGraph (default: when installed)
+            save_checkpoints: Save a checkpoint after every node, like run_agent
+        """
+        self.config = config
+        self.max_items = max(1, max_items or BATCH_MAX_ITEMS)
+        self.prefetch_ahead = max(0, prefetch_ahead if prefetch_ahead is not None else BATCH_PREFETCH_AHEAD)
+        self.item_timeout = item_timeout if item_timeout is not None else BATCH_ITEM_TIMEOUT
+        self.use_graph = LANGGRAPH_AVAILABLE if use_graph is None else use_graph
+        self.save_checkpoints = save_checkpoints
+
+        limiter = threading.BoundedSemaphore(max(1, llm_concurrency or BATCH_LLM_CONCURRENCY))
+        llm_factory = llm_factory or LLMClient
+        # One client per role, shared by all items
+        self.llm_clients = {
+            "agent_a": LimitedLLMClient(llm_factory(config.agent_a_llm), limiter),
+            "agent_b": LimitedLLMClient(llm_factory(config.agent_b_llm), limiter),
+            "reflect": LimitedLLMClient(llm_factory(config.reflect_llm), limiter),
+        }
+
+        if validate_workers is None:
+            validate_workers = BATCH_VALIDATE_WORKERS
+        self.validation_pool = ValidationPool(validate_workers, validate_timeout) if validate_workers > 0 else None
+        self.validate_fn = self.validation_pool.validate if self.validation_pool else None
+
+        # Compiled once; LangGraph graphs are reentrant across threads
+        self.graph = None
+        if self.use_graph:
+            self.graph = build_agent_graph(
+                config,
+                llm_clients=self.llm_clients,
+                validate_fn=self.validate_fn,
+                entry_point="agent_a"
+            )
+
+        self.cache = None
+        if save_checkpoints:
+            self.cache = create_cache(config.cache_dir, config.max_checkpoints_per_hour, config.checkpoint_store)
+
+        self._slots = threading.BoundedSemaphore(self.max_items)
+        self._progress_lock = threading.Lock()
+        self._completed = 0
+        self._total = 0
+
+    # ------------------------------------------------------------------
+    # Dispatcher
+    # ------------------------------------------------------------------
+
+    def run(self, item_spec_paths: List[str], search_root: str = None) -> BatchReport:
+        """
+        Run all items; returns once every item finished, failed or timed out
+
+        Args:
+            item_spec_paths: ItemSpec files (relative to config.item_specs_dir or absolute)
+            search_root: Log search root stored in each initial state (optional)
+        """
+        runs = [_ItemRun(i, path, search_root) for i, path in enumerate(item_spec_paths)]
+        self._completed = 0
+        self._total = len(runs)
+        batch_start = time.time()
+
+        print(f"\n{'='*60}")
+        print(f"Batch: {len(runs)} items, {self.max_items} concurrent, "
+              f"graph={'langgraph' if self.use_graph else 'sequential'}")
+        print(f"{'='*60}\n")
+
+        prefetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="agent-prefetch")
+        next_prefetch = 0
+        active: List[_ItemRun] = []
+        try:
+            for run in runs:
+                # Keep spec/log preparation ahead of the items waiting for a slot
+                horizon = min(len(runs), run.index + self.max_items + self.prefetch_ahead)
+                while next_prefetch < horizon:
+                    queued = runs[next_prefetch]
+                    queued.prefetch = prefetch_pool.submit(self._prepare, queued)
+                    next_prefetch += 1
+
+                while not self._slots.acquire(timeout=_POLL_SECONDS):
+                    self._reap(active)
+                run.started = time.time()
+                run.deadline = run.started + self.item_timeout
+                threading.Thread(
+                    target=self._run_item, args=(run,),
+                    name=f"agent-{run.item_id}", daemon=True
+                ).start()
+                active.append(run)
+
+            while active:
+                time.sleep(_POLL_SECONDS)
+                self._reap(active)
+        finally:
+            prefetch_pool.shutdown(wait=False, cancel_futures=True)
+            if self.validation_pool:
+                self.validation_pool.shutdown()
+
+        report = BatchReport([run.result for run in runs], time.time() - batch_start)
+        print(f"\n{'='*60}")
+        print(f"Batch finished: {report.summary()}")
+        print(f"{'='*60}\n")
+        return report
+
+    def _reap(self, active: List[_ItemRun]) -> None:
+        """Drop finished items; time out the ones past their deadline"""
+        now = time.time()
+        for run in active:
+            if run.result is None and now > run.deadline:
+                # The thread may be stuck in a call that never returns: abandon it
+                run.cancelled.set()
+                self._finish(run, "timeout", [f"Item timed out after {self.item_timeout:.0f}s"])
+        active[:] = [run for run in active if run.result is None]
+
+    def _finish(self, run: _ItemRun, status: str, errors: List[str] = None) -> bool:
+        """Record the item's result once (item thread or dispatcher, first wins)"""
+        with run.lock:
+            if run.result is not None:
+                return False
+            state = run.state or {}
+            run.result = ItemResult(
+                item_spec_path=run.item_spec_path,
+                item_id=state.get("item_id") or run.item_id,
+                status=status,
+                iterations=state.get("iteration_count", 0),
+                errors=list(errors if errors is not None else state.get("validation_errors", [])),
+                elapsed=time.time() - run.started,
+                stage_seconds=dict(run.stage_seconds),
+                state=run.state
+            )
+        self._slots.release()
+
+        with self._progress_lock:
+            self._completed += 1
+            icon = "✓" if status == "done" else "⚠️" if status == "human_required" else "❌"
+            print(f"{icon} [Batch {self._completed}/{self._total}] {run.result.item_id}: {status} "
+                  f"(iterations: {run.result.iterations}, {run.result.elapsed:.1f}s)")
+        return True
+
+    # ------------------------------------------------------------------
+    # Per-item work
+    # ------------------------------------------------------------------
+
+    def _prepare(self, run: _ItemRun) -> AgentState:
+        """load_spec + discover_logs: file I/O only, runs ahead of the item"""
+        state = create_initial_state(run.item_spec_path, run.search_root)
+        for node_name, node in (("load_spec", load_spec_node), ("discover_logs", discover_logs_node)):
+            start = time.time()
+            state = node(state, self.config)
+            run.stage_seconds[node_name] = time.time() - start
+            self._checkpoint(run.item_id, node_name, state)
+        return state
+
+    def _run_item(self, run: _ItemRun) -> None:
+        status, errors = "error", None
+        _current_run.set(run)
+        try:
+            remaining = run.deadline - time.time()
+            try:
+                run.state = run.prefetch.result(timeout=max(0.0, remaining))
+            except FutureTimeout:
+                raise ItemTimeout(f"Item timed out after {self.item_timeout:.0f}s (load_spec/discover_logs)")
+
+            if self.use_graph:
+                self._run_graph(run)
+            else:
+                self._run_nodes(run)
+
+            state = run.state
+            if not state.get("validation_errors"):
+                state["current_stage"] = "done"
+            status = "done" if state.get("current_stage") == "done" else "human_required"
+        except ItemTimeout as e:
+            status, errors = "timeout", [str(e)]
+        except Exception as e:
+            if time.time() >= run.deadline:
+                # e.g. the LLM call hit the timeout it was given
+                status, errors = "timeout", [f"Item timed out after {self.item_timeout:.0f}s ({type(e).__name__})"]
+            else:
+                print(f"❌ [{run.item_id}] {type(e).__name__}: {e}")
+                traceback.print_exc()
+                errors = [f"{type(e).__name__}: {e}"]
+        finally:
+            self._finish(run, status, errors)
+
+    def _run_graph(self, run: _ItemRun) -> None:
+        """Stream the compiled graph from agent_a (spec and logs are prefetched)"""
+        last = time.time()
+        for event in self.graph.stream(run.state):
+            node_name = list(event.keys())[0]
+            now = time.time()
+            self._after_node(run, node_name, event[node_name], now - last)
+            last = now
+
+    def _run_nodes(self, run: _ItemRun) -> None:
+        """Same routing as the graph, without LangGraph"""
+        nodes = {
+            "agent_a": lambda s: agent_a_node(s, self.config, self.llm_clients["agent_a"]),
+            "agent_b": lambda s: agent_b_node(s, self.config, self.llm_clients["agent_b"]),
+            "validate": lambda s: validate_node(s, self.validate_fn),
+            "reflect_a": lambda s: reflect_a_node(s, self.config, self.llm_clients["reflect"]),
+            "reflect_b": lambda s: reflect_b_node(s, self.config, self.llm_clients["reflect"]),
+            # Report next to the checkpoints instead of the default ./cache
+            "human_required": lambda s: human_required_node(s, self.cache),
+        }
+        node_name = "agent_a"
+        while node_name is not None:
+            start = time.time()
+            state = nodes[node_name](run.state)
+            self._after_node(run, node_name, state, time.time() - start)
+
+            if node_name == "validate":
+                route = should_continue(state, self.config.max_iterations)
+                node_name = None if route == "done" else route
+            else:
+                node_name = _NEXT_NODE[node_name]
+
+    def _after_node(self, run: _ItemRun, node_name: str, state: AgentState, seconds: float) -> None:
+        run.state = state
+        run.stage_seconds[node_name] = run.stage_seconds.get(node_name, 0.0) + seconds
+        if run.cancelled.is_set() or run.result is not None:
+            # Already reported as timed out: stop writing checkpoints for it
+            raise ItemTimeout(f"Item timed out after {self.item_timeout:.0f}s")
+        self._checkpoint(run.item_id, node_name, state)
+
+        errors = len(state.get("validation_errors", []))
+        print(f"▶ [{run.item_id}] {node_name} ({seconds:.1f}s) "
+              f"Iteration: {state.get('iteration_count', 0)}, Errors: {errors}")
+        if time.time() > run.deadline:
+            raise ItemTimeout(f"Item timed out after {self.item_timeout:.0f}s (after {node_name})")
+
+    def _checkpoint(self, item_id: str, node_name: str, state: AgentState) -> None:
+        if self.cache is None:
+            return
+        checkpoint_id = self.cache.save_checkpoint(item_id, state)
+        self.cache.save_stage_output(item_id, node_name, {
+            "timestamp": datetime.now().isoformat(),
+            "checkpoint_id": checkpoint_id,
+            "outputs": extract_stage_outputs(node_name, state)
+        })
+
+
+def run_batch(
+    item_spec_paths: List[str],
+    search_root: str = None,
+    config_path: str = None,
+    **runner_options
+) -> BatchReport:
+    """
+    Batch counterpart of run_agent
+
+    Args:
+        item_spec_paths: ItemSpec files
+        search_root: Log file search root directory (overrides config)
+        config_path: Path to config file (optional)
+        **runner_options: BatchRunner options (max_items, llm_concurrency, ...)
+    """
+    config = AgentConfig.load(config_path)
+    if search_root:
+        config.search_root = search_root
+    return BatchRunner(config, **runner_options).run(item_spec_paths, search_root)
+
+
+# CLI interface
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Developer Agent batch runner")
+    parser.add_argument("items", nargs="+", help="ItemSpec file paths")
+    parser.add_argument("--search-root", help="Log file search root")
+    parser.add_argument("--config", help="Config file path")
+    parser.add_argument("--max-items", type=int, help="Items running at once")
+    parser.add_argument("--llm-concurrency", type=int, help="LLM calls in flight across all items")
+    parser.add_argument("--validate-workers", type=int, help="Validation processes (0 = in-process)")
+    parser.add_argument("--item-timeout", type=float, help="Seconds per item")
+
+    args = parser.parse_args()
+
+    report = run_batch(
+        args.items,
+        search_root=args.search_root,
+        config_path=args.config,
+        max_items=args.max_items,
+        llm_concurrency=args.llm_concurrency,
+        validate_workers=args.validate_workers,
+        item_timeout=args.item_timeout
+    )
+    for result in report.results:
+        print(f"{result.status:15s} {result.item_id} ({result.elapsed:.1f}s)")
@@ -2,13 +2,21 @@
 Developer Agent - Cache Implementation
 Based on Agent_Development_Spec.md v1.1
 
-Implements FileSystemCache with hourly checkpoint organization and cleanup.
+Implements FileSystemCache with hourly checkpoint organization and cleanup,
+and BlobCheckpointCache, which stores checkpoints as small manifests over
+compressed, content-addressed blobs shared across iterations and items.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterable
+import gzip
+import hashlib
 import json
 import os
 import shutil
+import threading
+import time
+import uuid
 from datetime import datetime, timedelta
 
 
@@ -21,8 +29,13 @@ class StateCache(ABC):
         pass
     
     @abstractmethod
-    def load_checkpoint(self, item_id: str, checkpoint_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """Load checkpoint, default loads latest"""
+    def load_checkpoint(
+        self,
+        item_id: str,
+        checkpoint_id: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Load checkpoint, default loads latest (fields: only these state fields)"""
         pass
     
     @abstractmethod
@@ -140,7 +153,12 @@ class FileSystemCache(StateCache):
                 shutil.rmtree(folder_path)
                 print(f"[Cache] Removed old hourly folder: {folder}")
     
-    def load_checkpoint(self, item_id: str, checkpoint_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def load_checkpoint(
+        self,
+        item_id: str,
+        checkpoint_id: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Load checkpoint
         
@@ -148,10 +166,25 @@ class FileSystemCache(StateCache):
             item_id: Item identifier
             checkpoint_id: Checkpoint ID in format "{hour_folder}_{time}" (e.g., "2026012814_143025")
                           If None, loads the latest checkpoint
+            fields: Only return these state fields (None = all)
                           
         Returns:
             State dictionary or None if not found
         """
+        path = self._checkpoint_path(item_id, checkpoint_id)
+        
+        if not os.path.exists(path):
+            return None
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if fields is None:
+            return state
+        wanted = set(fields)
+        return {k: v for k, v in state.items() if k in wanted}
+    
+    def _checkpoint_path(self, item_id: str, checkpoint_id: Optional[str] = None) -> str:
+        """Resolve checkpoint_id (None = latest) to its file path"""
         item_dir = os.path.join(self.cache_dir, item_id)
         
         if checkpoint_id:
@@ -169,11 +202,7 @@ class FileSystemCache(StateCache):
         else:
             path = os.path.join(item_dir, "checkpoint_latest.json")
         
-        if not os.path.exists(path):
-            return None
-        
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return path
     
     def save_stage_output(self, item_id: str, stage: str, output: dict) -> None:
         """
@@ -281,18 +310,334 @@ class FileSystemCache(StateCache):
         return stats
 
 
-def resume_from_checkpoint(item_id: str, cache: StateCache) -> Optional[Dict[str, Any]]:
+class BlobCheckpointCache(FileSystemCache):
+    """
+    Checkpoint store with content-addressed, compressed, deduplicated blobs
+    
+    A checkpoint is a small manifest mapping each state field to the hash of
+    its serialized value; large values (item spec, log snippets, generated
+    code) are written once as gzip blobs and shared by every checkpoint and
+    every item that contains the same content. Checkpointing after every
+    graph node therefore only writes the fields that changed.
+    
+    Directory Structure:
+        cache/
+        ├── blobs/
+        │   └── {hash[:2]}/{hash}.json.gz
+        └── {item_id}/
+            ├── checkpoint_latest.json          (manifest)
+            ├── hourly/{hour}/checkpoint_{time}.json  (manifests)
+            └── stage_outputs/ ...
+    
+    Plain JSON checkpoints written by FileSystemCache are still loadable.
+    Blobs no longer referenced by any manifest are removed by gc(), which
+    cleanup_old_hours() runs at most once per gc_interval_seconds.
+    """
+    
+    MANIFEST_FORMAT = "blob-manifest/1"
+    BLOB_DIR = "blobs"
+    GC_STAMP = ".blob_gc_stamp"   # mtime = last gc() run, shared by all processes
+    INLINE_MAX_BYTES = 256        # smaller values are kept inside the manifest
+    SPLIT_FIELDS = ("log_snippets",)  # dict fields stored as one blob per key
+    
+    def __init__(
+        self,
+        cache_dir: str = "./cache",
+        max_checkpoints_per_hour: int = 10,
+        compress_level: int = 6,
+        blob_cache_size: int = 256,
+        gc_grace_seconds: int = 3600,
+        gc_interval_seconds: int = 3600
+    ):
+        """
+        Initialize BlobCheckpointCache
+        
+        Args:
+            cache_dir: Base directory for cache storage
+            max_checkpoints_per_hour: Maximum manifests to retain per hour
+            compress_level: gzip level for blobs (1-9)
+            blob_cache_size: Number of decoded blobs kept in memory across loads
+            gc_grace_seconds: gc() keeps unreferenced blobs younger than this,
+                              so a concurrent writer's new manifest is never broken
+            gc_interval_seconds: Minimum time between gc() runs triggered by
+                                 cleanup_old_hours() (gc walks every manifest)
+        """
+        super().__init__(cache_dir, max_checkpoints_per_hour)
+        self.compress_level = compress_level
+        self.blob_cache_size = blob_cache_size
+        self.gc_grace_seconds = gc_grace_seconds
+        self.gc_interval_seconds = gc_interval_seconds
+        self._blob_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    # ------------------------------------------------------------------
+    # Blobs
+    # ------------------------------------------------------------------
+    
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, self.BLOB_DIR, digest[:2], f"{digest}.json.gz")
+    
+    def _put_blob(self, data: bytes) -> str:
+        """Store serialized value once; return its hash"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        try:
+            # Already stored: refresh mtime so a concurrent gc() keeps it
+            os.utime(path)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(gzip.compress(data, compresslevel=self.compress_level, mtime=0))
+            os.replace(tmp_path, path)
+        self._remember_blob(digest, data)
+        return digest
+    
+    def _get_blob(self, digest: str) -> Any:
+        with self._lock:
+            data = self._blob_cache.get(digest)
+            if data is not None:
+                self._blob_cache.move_to_end(digest)
+        if data is None:
+            with open(self._blob_path(digest), 'rb') as f:
+                data = gzip.decompress(f.read())
+            self._remember_blob(digest, data)
+        # Decode per load: callers may mutate the returned state
+        return json.loads(data)
+    
+    def _remember_blob(self, digest: str, data: bytes) -> None:
+        with self._lock:
+            self._blob_cache[digest] = data
+            self._blob_cache.move_to_end(digest)
+            while len(self._blob_cache) > self.blob_cache_size:
+                self._blob_cache.popitem(last=False)
+    
+    @staticmethod
+    def _serialize(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    def _encode_field(self, name: str, value: Any) -> dict:
+        """Manifest entry for one state field"""
+        if name in self.SPLIT_FIELDS and isinstance(value, dict):
+            return {"blobs": {k: self._put_blob(self._serialize(v)) for k, v in value.items()}}
+        data = self._serialize(value)
+        if len(data) <= self.INLINE_MAX_BYTES:
+            return {"v": value}
+        return {"blob": self._put_blob(data)}
+    
+    def _decode_field(self, entry: dict) -> Any:
+        if "v" in entry:
+            return entry["v"]
+        if "blob" in entry:
+            return self._get_blob(entry["blob"])
+        return {k: self._get_blob(d) for k, d in entry["blobs"].items()}
+    
+    # ------------------------------------------------------------------
+    # Checkpoints
+    # ------------------------------------------------------------------
+    
+    def save_checkpoint(self, item_id: str, state: Dict[str, Any]) -> str:
+        """
+        Save checkpoint as a manifest of blob hashes
+        
+        Args:
+            item_id: Item identifier
+            state: State dictionary to save
+            
+        Returns:
+            checkpoint_id in format "{hour_folder}_{time}" (time includes
+            microseconds so per-node checkpoints never overwrite each other)
+        """
+        now = datetime.now()
+        hour_folder = now.strftime("%Y%m%d%H")
+        checkpoint_id = now.strftime("%H%M%S%f")
+        
+        manifest = {
+            "format": self.MANIFEST_FORMAT,
+            "checkpoint_id": f"{hour_folder}_{checkpoint_id}",
+            "created_at": now.isoformat(),
+            "fields": {name: self._encode_field(name, value) for name, value in dict(state).items()}
+        }
+        
+        item_dir = os.path.join(self.cache_dir, item_id)
+        hourly_dir = os.path.join(item_dir, "hourly", hour_folder)
+        os.makedirs(hourly_dir, exist_ok=True)
+        
+        self._write_manifest(os.path.join(hourly_dir, f"checkpoint_{checkpoint_id}.json"), manifest)
+        self._write_manifest(os.path.join(item_dir, "checkpoint_latest.json"), manifest)
+        
+        self._cleanup_hourly_checkpoints(hourly_dir)
+        
+        return manifest["checkpoint_id"]
+    
+    @staticmethod
+    def _write_manifest(path: str, manifest: dict) -> None:
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    
+    def load_checkpoint(
+        self,
+        item_id: str,
+        checkpoint_id: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load checkpoint
+        
+        Args:
+            item_id: Item identifier
+            checkpoint_id: Checkpoint ID (None loads the latest)
+            fields: Only resolve these state fields (None = all); other
+                    fields' blobs are not read
+                          
+        Returns:
+            State dictionary or None if not found
+        """
+        manifest = super().load_checkpoint(item_id, checkpoint_id)
+        if manifest is None:
+            return None
+        
+        if manifest.get("format") != self.MANIFEST_FORMAT:
+            # Plain JSON checkpoint from FileSystemCache
+            if fields is None:
+                return manifest
+            wanted = set(fields)
+            return {k: v for k, v in manifest.items() if k in wanted}
+        
+        entries = manifest["fields"]
+        names = entries.keys() if fields is None else [f for f in fields if f in entries]
+        return {name: self._decode_field(entries[name]) for name in names}
+    
+    def cleanup_old_hours(self, item_id: str, keep_hours: int = 24) -> None:
+        """Remove old hourly manifests; garbage-collect blobs if the last gc is old enough"""
+        super().cleanup_old_hours(item_id, keep_hours)
+        if self._claim_gc():
+            self.gc()
+    
+    def _claim_gc(self) -> bool:
+        """True if no gc() ran in the last gc_interval_seconds (and record this one)"""
+        stamp = os.path.join(self.cache_dir, self.GC_STAMP)
+        try:
+            if time.time() - os.path.getmtime(stamp) < self.gc_interval_seconds:
+                return False
+        except FileNotFoundError:
+            pass
+        # Touch first, so concurrent runs starting now skip it
+        with open(stamp, 'a'):
+            pass
+        os.utime(stamp)
+        return True
+    
+    def _referenced_blobs(self) -> set:
+        """Hashes referenced by any manifest of any item"""
+        referenced = set()
+        for root, dirs, files in os.walk(self.cache_dir):
+            if os.path.abspath(root) == os.path.abspath(self.cache_dir):
+                dirs[:] = [d for d in dirs if d != self.BLOB_DIR]
+            for name in files:
+                if not (name.startswith("checkpoint_") and name.endswith(".json")):
+                    continue
+                try:
+                    with open(os.path.join(root, name), 'r', encoding='utf-8') as f:
+                        manifest = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                if not isinstance(manifest, dict) or manifest.get("format") != self.MANIFEST_FORMAT:
+                    continue
+                for entry in manifest["fields"].values():
+                    if "blob" in entry:
+                        referenced.add(entry["blob"])
+                    elif "blobs" in entry:
+                        referenced.update(entry["blobs"].values())
+        return referenced
+    
+    def gc(self) -> int:
+        """
+        Delete blobs not referenced by any remaining manifest
+        
+        Returns:
+            Number of blobs removed
+        """
+        blob_root = os.path.join(self.cache_dir, self.BLOB_DIR)
+        if not os.path.exists(blob_root):
+            return 0
+        
+        referenced = self._referenced_blobs()
+        cutoff = time.time() - self.gc_grace_seconds
+        removed = 0
+        for root, _, files in os.walk(blob_root):
+            for name in files:
+                path = os.path.join(root, name)
+                digest = name.split(".", 1)[0]
+                if digest in referenced:
+                    continue
+                try:
+                    if os.path.getmtime(path) > cutoff:
+                        continue
+                    os.remove(path)
+                    removed += 1
+                except FileNotFoundError:
+                    continue
+        if removed:
+            print(f"[Cache] Garbage-collected {removed} unreferenced blobs")
+        return removed
+    
+    def get_cache_stats(self, item_id: str) -> dict:
+        """Cache statistics, including shared blob store usage"""
+        stats = super().get_cache_stats(item_id)
+        if not stats.get("exists"):
+            return stats
+        
+        blob_count = 0
+        blob_bytes = 0
+        for root, _, files in os.walk(os.path.join(self.cache_dir, self.BLOB_DIR)):
+            for name in files:
+                if name.endswith(".json.gz"):
+                    blob_count += 1
+                    blob_bytes += os.path.getsize(os.path.join(root, name))
+        stats["blob_count"] = blob_count
+        stats["blob_bytes"] = blob_bytes
+        return stats
+
+
+def create_cache(
+    cache_dir: str = "./cache",
+    max_checkpoints_per_hour: int = 10,
+    checkpoint_store: str = "blob"
+) -> FileSystemCache:
+    """
+    Create the checkpoint cache selected by config
+    
+    Args:
+        cache_dir: Base directory for cache storage
+        max_checkpoints_per_hour: Maximum checkpoints to retain per hour
+        checkpoint_store: "blob" (deduplicated manifests) or "json" (full state per checkpoint)
+    """
+    if checkpoint_store == "json":
+        return FileSystemCache(cache_dir, max_checkpoints_per_hour)
+    return BlobCheckpointCache(cache_dir, max_checkpoints_per_hour)
+
+
+def resume_from_checkpoint(
+    item_id: str,
+    cache: StateCache,
+    fields: Optional[Iterable[str]] = None
+) -> Optional[Dict[str, Any]]:
     """
     Resume execution from the latest checkpoint
     
     Args:
         item_id: Item identifier
         cache: Cache instance
+        fields: Only load the state fields the resumed run reads (None = all);
+                with the blob store the other fields' blobs are not read
         
     Returns:
         Loaded state or None
     """
-    state = cache.load_checkpoint(item_id)
+    state = cache.load_checkpoint(item_id, fields=fields)
     
     if state is None:
         print(f"[INFO] No checkpoint found for {item_id}, starting fresh")
@@ -0,0 +1,403 @@
+"""
+Developer Agent - File Tree Index
+
+One os.scandir walk indexes every file under a search root; glob / extension /
+path-fragment queries are then answered from memory instead of running a
+recursive glob.glob per pattern. The index stores each directory's mtime, so
+refresh() only rescans directories whose entries changed, and it can be
+persisted (gzip JSON) so a new process starts from the previous walk.
+
+Like glob.glob, directory symlinks are followed (a directory already on the
+current path is not entered again) and directories match patterns too. A
+shared index is refreshed incrementally when it is requested and its last
+refresh is older than FILE_INDEX_MAX_AGE seconds (or the root's mtime
+changed), and once when a query finds nothing.
+
+AutoGenChecker loads this module through its utils/file_tree_index.py.
+"""
+from typing import List, Dict, Optional, Tuple
+import fnmatch
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+INDEX_FORMAT = 2
+# get_file_index() refreshes a shared index older than this (seconds)
+FILE_INDEX_MAX_AGE = float(os.environ.get("FILE_INDEX_MAX_AGE", "2"))
+# Directories modified this recently are rescanned next time (mtime granularity)
+_MTIME_SETTLE_NS = 2 * 10**9
+
+_indexes: Dict[str, "FileTreeIndex"] = {}
+_indexes_lock = threading.Lock()
+
+
+def _translate_glob(pattern: str) -> "re.Pattern":
+    """
+    Translate a glob (with recursive "**") into a regex over "/"-separated
+    relative paths. Like glob.glob, wildcards never cross "/" and "**/"
+    also matches zero directories.
+    """
+    parts = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i) and i + 2 == n:
+            parts.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            parts.append("[^/]*")
+        elif c == "?":
+            parts.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2 if pattern[i + 1:i + 2] in ("!", "]") else i + 1)
+            if end == -1:
+                parts.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end
+        else:
+            parts.append(re.escape(c))
+        i += 1
+    return re.compile("".join(parts) + r"\Z")
+
+
+class FileTreeIndex:
+    """
+    In-memory index of the files under one root directory
+
+    Hidden entries (names starting with ".") are skipped, matching glob.glob's
+    default. Symlinked directories are followed unless they point back to a
+    directory on their own path (inode loop protection).
+    """
+
+    def __init__(self, root: str, persist_dir: Optional[str] = None):
+        """
+        Args:
+            root: Directory to index
+            persist_dir: Directory for the persisted index (None = memory only)
+        """
+        self.root = os.path.abspath(root)
+        self.persist_path = None
+        if persist_dir:
+            digest = hashlib.sha1(self.root.encode("utf-8")).hexdigest()[:16]
+            self.persist_path = os.path.join(persist_dir, f"file_index_{digest}.json.gz")
+        # {relative dir: (mtime_ns, [file names], [subdir names])}
+        self._dirs: Dict[str, Tuple[int, List[str], List[str]]] = {}
+        self._files: Optional[List[str]] = None
+        self._dir_paths: Optional[List[str]] = None
+        self._lock = threading.Lock()
+        self.refreshed_at = 0.0
+        self.root_mtime_ns = None
+        self.last_rescanned = 0
+        # True until the first query after a refresh (a miss then needs no rescan)
+        self._just_refreshed = False
+        if self.persist_path:
+            self._load()
+
+    # ------------------------------------------------------------------
+    # Build / refresh
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> "FileTreeIndex":
+        """Walk the tree once, rescanning only directories whose mtime changed"""
+        with self._lock:
+            old_dirs = self._dirs
+            new_dirs = {}
+            rescanned = 0
+            now_ns = time.time_ns()
+            root_mtime_ns = None
+            # (relative dir, (st_dev, st_ino) of every directory on its path)
+            stack = [("", frozenset())]
+            while stack:
+                rel, ancestors = stack.pop()
+                path = os.path.join(self.root, rel) if rel else self.root
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                inode = (st.st_dev, st.st_ino)
+                if inode in ancestors:
+                    continue  # symlink back into its own path
+                ancestors = ancestors | {inode}
+                mtime_ns = st.st_mtime_ns
+                if not rel:
+                    root_mtime_ns = mtime_ns
+
+                cached = old_dirs.get(rel)
+                if cached is not None and cached[0] == mtime_ns:
+                    files, subdirs = cached[1], cached[2]
+                else:
+                    files, subdirs = self._scan_dir(path)
+                    rescanned += 1
+                if now_ns - mtime_ns < _MTIME_SETTLE_NS:
+                    mtime_ns = -1  # may still change within the same mtime tick
+
+                new_dirs[rel] = (mtime_ns, files, subdirs)
+                stack.extend((f"{rel}/{d}" if rel else d, ancestors) for d in reversed(subdirs))
+
+            self._dirs = new_dirs
+            if rescanned or new_dirs.keys() != old_dirs.keys():
+                self._files = None
+                self._dir_paths = None
+                self._save()
+            self.refreshed_at = time.time()
+            self.root_mtime_ns = root_mtime_ns
+            self.last_rescanned = rescanned
+            self._just_refreshed = True
+        return self
+
+    def is_stale(self, max_age: float = None) -> bool:
+        """
+        True if never refreshed, the root directory's mtime changed, or the
+        last refresh is older than max_age seconds (subdirectory changes do
+        not touch the root's mtime)
+        """
+        if max_age is not None and time.time() - self.refreshed_at >= max_age:
+            return True
+        try:
+            mtime_ns = os.stat(self.root).st_mtime_ns
+        except OSError:
+            return self.root_mtime_ns is not None
+        return self.root_mtime_ns is None or mtime_ns != self.root_mtime_ns
+
+    @staticmethod
+    def _scan_dir(path: str) -> Tuple[List[str], List[str]]:
+        files, subdirs = [], []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir():
+                            subdirs.append(entry.name)
+                        elif entry.is_file():
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        files.sort()
+        subdirs.sort()
+        return files, subdirs
+
+    def _load(self) -> None:
+        try:
+            with gzip.open(self.persist_path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("format") != INDEX_FORMAT or data.get("root") != self.root:
+            return
+        self._dirs = {rel: (entry[0], entry[1], entry[2]) for rel, entry in data["dirs"].items()}
+
+    def _save(self) -> None:
+        if not self.persist_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.persist_path), exist_ok=True)
+            tmp_path = f"{self.persist_path}.{os.getpid()}.tmp"
+            with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+                json.dump({"format": INDEX_FORMAT, "root": self.root, "dirs": self._dirs}, f)
+            os.replace(tmp_path, self.persist_path)
+        except OSError as e:
+            print(f"[FileIndex] Could not persist index for {self.root}: {e}")
+
+    # ------------------------------------------------------------------
+    # Queries (paths are returned absolute, sorted; a query that finds
+    # nothing refreshes the index once and retries)
+    # ------------------------------------------------------------------
+
+    def files(self) -> List[str]:
+        """All indexed files as "/"-separated paths relative to root"""
+        files = self._files
+        if files is None:
+            files = sorted(
+                f"{rel}/{name}" if rel else name
+                for rel, (_, names, _) in self._dirs.items()
+                for name in names
+            )
+            self._files = files
+        return files
+
+    def dirs(self) -> List[str]:
+        """All indexed directories (except root) as "/"-separated relative paths"""
+        dir_paths = self._dir_paths
+        if dir_paths is None:
+            dir_paths = sorted(
+                f"{rel}/{name}" if rel else name
+                for rel, (_, _, subdirs) in self._dirs.items()
+                for name in subdirs
+            )
+            self._dir_paths = dir_paths
+        return dir_paths
+
+    def _absolute(self, rel_paths: List[str], limit: Optional[int]) -> List[str]:
+        if limit is not None:
+            rel_paths = rel_paths[:limit]
+        return [os.path.join(self.root, *p.split("/")) for p in rel_paths]
+
+    def _retry_on_miss(self, query):
+        just_refreshed, self._just_refreshed = self._just_refreshed, False
+        result = query()
+        if not result and not just_refreshed:
+            self.refresh()
+            self._just_refreshed = False
+            result = query()
+        return result
+
+    def glob(self, pattern: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Files and directories matching a glob relative to root
+        (e.g. "**/*.log", "sta/*.rpt.gz"), as glob.glob(recursive=True) returns them
+
+        Args:
+            pattern: Glob pattern; "**" matches any number of directories;
+                     a trailing "/" matches directories only
+            limit: Maximum number of results
+        """
+        pattern = pattern.replace(os.sep, "/").lstrip("/")
+        return self._retry_on_miss(lambda: self._glob(pattern, limit))
+
+    def _glob(self, pattern: str, limit: Optional[int]) -> List[str]:
+        dirs_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        if not dirs_only and pattern.startswith("**/") and "/" not in pattern[3:]:
+            # Basename-only glob anywhere in the tree: match names only
+            return self._find(pattern[3:], None, None, limit, include_dirs=True)
+
+        regex = _translate_glob(pattern)
+        matches = [] if dirs_only else [p for p in self.files() if regex.match(p)]
+        matches.extend(p for p in self.dirs() if regex.match(p))
+        base_dirs = []
+        if pattern == "**" or pattern.endswith("/**"):
+            # glob also yields the directory "**" starts from, with a trailing separator
+            if pattern == "**":
+                base_dirs = [""]
+            else:
+                base = _translate_glob(pattern[:-3])
+                base_dirs = [p for p in self.dirs() if base.match(p)]
+        suffix = [""] if dirs_only else []
+        results = [os.path.join(self.root, *p.split("/"), "") for p in base_dirs]
+        results.extend(os.path.join(self.root, *p.split("/"), *suffix) for p in sorted(matches))
+        return results[:limit] if limit is not None else results
+
+    def find(
+        self,
+        name: Optional[str] = None,
+        ext: Optional[str] = None,
+        contains: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Files whose basename matches a glob, with a given extension, and/or
+        whose relative path contains a fragment (all given filters must match)
+
+        Args:
+            name: Basename glob (e.g. "*.log", "sta_*.rpt")
+            ext: Extension including the dot (e.g. ".log.gz")
+            contains: Path fragment (e.g. "/sta/", "signoff")
+            limit: Maximum number of results
+        """
+        return self._retry_on_miss(lambda: self._find(name, ext, contains, limit))
+
+    def _find(
+        self,
+        name: Optional[str],
+        ext: Optional[str],
+        contains: Optional[str],
+        limit: Optional[int],
+        include_dirs: bool = False
+    ) -> List[str]:
+        fast_ext = None
+        if name and re.fullmatch(r"\*(\.[^*?\[/]+)", name):
+            fast_ext, name = name[1:], None
+        name_regex = re.compile(fnmatch.translate(name)) if name else None
+
+        paths = self.files()
+        if include_dirs:
+            paths = sorted(paths + self.dirs())
+        matches = []
+        for path in paths:
+            basename = path.rsplit("/", 1)[-1]
+            if fast_ext and not basename.endswith(fast_ext):
+                continue
+            if ext and not basename.endswith(ext):
+                continue
+            if contains and contains not in path:
+                continue
+            if name_regex and not name_regex.match(basename):
+                continue
+            matches.append(path)
+            if limit is not None and len(matches) >= limit:
+                break
+        return self._absolute(matches, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "dirs": len(self._dirs),
+            "files": len(self.files()),
+            "last_rescanned_dirs": self.last_rescanned,
+        }
+
+
+def get_file_index(root: str, persist_dir: Optional[str] = None) -> FileTreeIndex:
+    """
+    Shared, lazily refreshed index for root
+
+    The index is refreshed on first use, whenever the root directory's mtime
+    changed, and when the last refresh is older than FILE_INDEX_MAX_AGE. A
+    refresh only stats directories; unchanged ones are not listed again.
+
+    Args:
+        root: Directory to index
+        persist_dir: Directory for the persisted index (optional)
+    """
+    key = os.path.abspath(root)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = FileTreeIndex(key, persist_dir)
+            _indexes[key] = index
+    if index.is_stale(FILE_INDEX_MAX_AGE):
+        index.refresh()
+    return index
+
+
+def glob_files(pattern: str, persist_dir: Optional[str] = None) -> List[str]:
+    """
+    glob.glob(pattern, recursive=True) replacement for absolute patterns
+
+    Patterns with "**" are answered from the index of their static prefix
+    directory; other patterns only list one directory and use glob directly.
+    """
+    if "**" not in pattern:
+        return sorted(glob.glob(pattern))
+
+    parts = pattern.replace(os.sep, "/").split("/")
+    static = []
+    for part in parts:
+        if glob.has_magic(part):
+            break
+        static.append(part)
+    root = "/".join(static)
+    if not root:
+        root = "/" if pattern.startswith("/") else "."
+    if not os.path.isdir(root):
+        return []
+    rest = "/".join(parts[len(static):])
+    return get_file_index(root, persist_dir).glob(rest)
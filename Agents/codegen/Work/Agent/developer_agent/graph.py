@@ -15,7 +15,7 @@ except ImportError:
     print("Warning: langgraph not installed. Run: pip install langgraph")
 
 from state import AgentState, AgentConfig, create_initial_state, generate_item_id
-from cache import FileSystemCache, resume_from_checkpoint
+from cache import create_cache, resume_from_checkpoint
 from nodes import (
     load_spec_node,
     discover_logs_node,
@@ -30,10 +30,23 @@ from nodes import (
 )
 
 
-def build_agent_graph(config: AgentConfig = None):
+def build_agent_graph(
+    config: AgentConfig = None,
+    llm_clients: Dict[str, Any] = None,
+    validate_fn=None,
+    entry_point: str = "load_spec"
+):
     """
     Build LangGraph workflow with smart fix routing
     
+    Args:
+        config: Agent configuration
+        llm_clients: Optional clients keyed by "agent_a", "agent_b", "reflect"
+                     (default: each node creates one from config)
+        validate_fn: Optional replacement for validate_10_2_compliance
+        entry_point: First node; "agent_a" skips load_spec/discover_logs for
+                     states whose spec and logs were already prepared
+    
     Returns:
         Compiled StateGraph
     """
@@ -43,21 +56,24 @@ def build_agent_graph(config: AgentConfig = None):
             "pip install langgraph"
         )
     
+    llm_clients = llm_clients or {}
     graph = StateGraph(AgentState)
     
     # Add nodes
-    graph.add_node("load_spec", lambda s: load_spec_node(s, config))
-    graph.add_node("discover_logs", lambda s: discover_logs_node(s, config))
-    graph.add_node("agent_a", lambda s: agent_a_node(s, config))
-    graph.add_node("agent_b", lambda s: agent_b_node(s, config))
-    graph.add_node("validate", validate_node)
-    graph.add_node("reflect_a", lambda s: reflect_a_node(s, config))
-    graph.add_node("reflect_b", lambda s: reflect_b_node(s, config))
+    if entry_point == "load_spec":
+        graph.add_node("load_spec", lambda s: load_spec_node(s, config))
+        graph.add_node("discover_logs", lambda s: discover_logs_node(s, config))
+    graph.add_node("agent_a", lambda s: agent_a_node(s, config, llm_clients.get("agent_a")))
+    graph.add_node("agent_b", lambda s: agent_b_node(s, config, llm_clients.get("agent_b")))
+    graph.add_node("validate", lambda s: validate_node(s, validate_fn))
+    graph.add_node("reflect_a", lambda s: reflect_a_node(s, config, llm_clients.get("reflect")))
+    graph.add_node("reflect_b", lambda s: reflect_b_node(s, config, llm_clients.get("reflect")))
     graph.add_node("human_required", human_required_node)
     
     # Add edges: Normal flow
-    graph.add_edge("load_spec", "discover_logs")
-    graph.add_edge("discover_logs", "agent_a")
+    if entry_point == "load_spec":
+        graph.add_edge("load_spec", "discover_logs")
+        graph.add_edge("discover_logs", "agent_a")
     graph.add_edge("agent_a", "agent_b")
     graph.add_edge("agent_b", "validate")
     
@@ -81,11 +97,19 @@ def build_agent_graph(config: AgentConfig = None):
     graph.add_edge("human_required", END)
     
     # Set entry point
-    graph.set_entry_point("load_spec")
+    graph.set_entry_point(entry_point)
     
     return graph.compile()
 
 
+# A resumed run starts again at load_spec / discover_logs, which rebuild these
+# fields; they are not read back from the checkpoint
+_REBUILT_ON_RESUME = ("item_spec_content", "parsed_spec", "discovered_log_files", "log_snippets")
+RESUME_FIELDS = tuple(
+    name for name in AgentState.__annotations__ if name not in _REBUILT_ON_RESUME
+) + ("item_id",)
+
+
 def run_agent(
     item_spec_path: str,
     search_root: str = None,
@@ -112,17 +136,18 @@ def run_agent(
         config.search_root = search_root
     
     # Initialize cache
-    cache = FileSystemCache(config.cache_dir, config.max_checkpoints_per_hour)
+    cache = create_cache(config.cache_dir, config.max_checkpoints_per_hour, config.checkpoint_store)
     item_id = generate_item_id(item_spec_path)
     
     # Resume from checkpoint or create initial state
     if resume:
-        state = resume_from_checkpoint(item_id, cache)
-        if state is None:
-            state = create_initial_state(item_spec_path, search_root)
-        elif state.get("current_stage") in ("done", "human_required"):
-            print(f"[INFO] Cannot resume from stage: {state['current_stage']}")
-            return state
+        resumed = resume_from_checkpoint(item_id, cache, fields=RESUME_FIELDS)
+        state = create_initial_state(item_spec_path, search_root)
+        if resumed is not None:
+            state.update(resumed)
+            if state.get("current_stage") in ("done", "human_required"):
+                print(f"[INFO] Cannot resume from stage: {state['current_stage']}")
+                return state
     else:
         state = create_initial_state(item_spec_path, search_root)
     
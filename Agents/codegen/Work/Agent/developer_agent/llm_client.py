@@ -50,6 +50,11 @@ def list_available_models() -> List[Tuple[str, str]]:
     return AVAILABLE_MODELS
 
 
+def _timeout_option(timeout: float = None) -> dict:
+    """timeout= for the SDK call; omitted when None (None would disable the SDK default)"""
+    return {"timeout": timeout} if timeout is not None else {}
+
+
 class LLMClient:
     """
     Unified LLM Client that uses JEDAI LangChain
@@ -100,34 +105,36 @@ class LLMClient:
             )
         return self._llm
     
-    def invoke(self, prompt: str) -> str:
+    def invoke(self, prompt: str, timeout: float = None) -> str:
         """
         Invoke LLM with a prompt and return the response
         
         Args:
             prompt: The prompt to send to the LLM
+            timeout: Request timeout in seconds (optional, provider default if None)
             
         Returns:
             Response text from the LLM
         """
         if self.config.provider == "jedai":
-            return self._invoke_jedai(prompt)
+            return self._invoke_jedai(prompt, timeout)
         elif self.config.provider == "openai":
-            return self._invoke_openai(prompt)
+            return self._invoke_openai(prompt, timeout)
         elif self.config.provider == "anthropic":
-            return self._invoke_anthropic(prompt)
+            return self._invoke_anthropic(prompt, timeout)
         elif self.config.provider == "azure":
-            return self._invoke_azure(prompt)
+            return self._invoke_azure(prompt, timeout)
         else:
             raise ValueError(f"Unsupported LLM provider: {self.config.provider}")
     
-    def _invoke_jedai(self, prompt: str) -> str:
+    def _invoke_jedai(self, prompt: str, timeout: float = None) -> str:
         """Invoke JEDAI LLM (default)"""
         llm = self._ensure_llm()
-        response = llm.invoke(prompt)
+        # ChatOpenAI passes request options through to the completions call
+        response = llm.invoke(prompt, **_timeout_option(timeout))
         return response.content
     
-    def _invoke_openai(self, prompt: str) -> str:
+    def _invoke_openai(self, prompt: str, timeout: float = None) -> str:
         """Invoke OpenAI LLM"""
         try:
             from openai import OpenAI
@@ -139,11 +146,12 @@ class LLMClient:
             model=self.config.model,
             messages=[{"role": "user", "content": prompt}],
             temperature=self.config.temperature,
-            max_tokens=self.config.max_tokens
+            max_tokens=self.config.max_tokens,
+            **_timeout_option(timeout)
         )
         return response.choices[0].message.content
     
-    def _invoke_anthropic(self, prompt: str) -> str:
+    def _invoke_anthropic(self, prompt: str, timeout: float = None) -> str:
         """Invoke Anthropic LLM"""
         try:
             from anthropic import Anthropic
@@ -155,11 +163,12 @@ class LLMClient:
             model=self.config.model,
             messages=[{"role": "user", "content": prompt}],
             temperature=self.config.temperature,
-            max_tokens=self.config.max_tokens
+            max_tokens=self.config.max_tokens,
+            **_timeout_option(timeout)
         )
         return response.content[0].text
     
-    def _invoke_azure(self, prompt: str) -> str:
+    def _invoke_azure(self, prompt: str, timeout: float = None) -> str:
         """Invoke Azure OpenAI LLM"""
         try:
             from openai import AzureOpenAI
@@ -171,7 +180,8 @@ class LLMClient:
             model=self.config.model,
             messages=[{"role": "user", "content": prompt}],
             temperature=self.config.temperature,
-            max_tokens=self.config.max_tokens
+            max_tokens=self.config.max_tokens,
+            **_timeout_option(timeout)
         )
         return response.choices[0].message.content
 
@@ -14,7 +14,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from state import AgentConfig, create_initial_state, generate_item_id
-from cache import FileSystemCache
+from cache import create_cache
 from graph import run_agent, run_agent_simple
 
 
@@ -99,15 +99,15 @@ Examples:
     
     # Handle cache operations
     if args.list_cache:
-        list_cache_checkpoints(args.list_cache)
+        list_cache_checkpoints(args.list_cache, args.config)
         return
     
     if args.cache_stats:
-        show_cache_stats(args.cache_stats)
+        show_cache_stats(args.cache_stats, args.config)
         return
     
     if args.cleanup_cache:
-        cleanup_cache(args.cleanup_cache)
+        cleanup_cache(args.cleanup_cache, config_path=args.config)
         return
     
     # Require --item for main operations
@@ -153,9 +153,15 @@ Examples:
         sys.exit(2)
 
 
-def list_cache_checkpoints(item_id: str):
+def _open_cache(config_path: str = None):
+    """Open the checkpoint store selected by the agent config"""
+    config = AgentConfig.load(config_path)
+    return create_cache(config.cache_dir, config.max_checkpoints_per_hour, config.checkpoint_store)
+
+
+def list_cache_checkpoints(item_id: str, config_path: str = None):
     """List all cached checkpoints for an item"""
-    cache = FileSystemCache()
+    cache = _open_cache(config_path)
     checkpoints = cache.list_checkpoints(item_id)
     
     if not checkpoints:
@@ -169,9 +175,9 @@ def list_cache_checkpoints(item_id: str):
     print(f"\nTotal: {len(checkpoints)} checkpoints")
 
 
-def show_cache_stats(item_id: str):
+def show_cache_stats(item_id: str, config_path: str = None):
     """Show cache statistics for an item"""
-    cache = FileSystemCache()
+    cache = _open_cache(config_path)
     stats = cache.get_cache_stats(item_id)
     
     if not stats.get("exists"):
@@ -183,11 +189,13 @@ def show_cache_stats(item_id: str):
     print(f"  Total checkpoints: {stats.get('total_checkpoints', 0)}")
     print(f"  Has latest: {stats.get('has_latest', False)}")
     print(f"  Stages: {', '.join(stats.get('stages', []))}")
+    if "blob_count" in stats:
+        print(f"  Shared blobs: {stats['blob_count']} ({stats['blob_bytes'] / 1024:.1f} KB)")
 
 
-def cleanup_cache(item_id: str, keep_hours: int = 24):
-    """Cleanup old cache for an item"""
-    cache = FileSystemCache()
+def cleanup_cache(item_id: str, keep_hours: int = 24, config_path: str = None):
+    """Cleanup old cache for an item (unreferenced blobs at most once per gc interval)"""
+    cache = _open_cache(config_path)
     print(f"Cleaning up cache for {item_id} (keeping last {keep_hours} hours)...")
     cache.cleanup_old_hours(item_id, keep_hours)
     print("Done.")
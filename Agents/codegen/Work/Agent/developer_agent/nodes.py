@@ -206,11 +206,14 @@ def discover_logs_node(state: AgentState, config: AgentConfig = None) -> AgentSt
     search_root = config.search_root
     
     if os.path.exists(search_root):
+        # All patterns share one file tree index of search_root (persisted in the cache dir)
+        index_dir = os.path.join(config.cache_dir, "file_index")
         for pattern in file_patterns:
             result = discover_files(
                 base_path=search_root,
                 pattern=pattern,
-                limit=5
+                limit=5,
+                index_dir=index_dir
             )
             all_files.extend(result.get("matched_files", []))
     
@@ -386,7 +389,7 @@ def agent_b_node(state: AgentState, config: AgentConfig = None, llm_client: LLMC
     return state
 
 
-def validate_node(state: AgentState) -> AgentState:
+def validate_node(state: AgentState, validate_fn=None) -> AgentState:
     """
     Validation node: Invoke three-layer validator
     
@@ -399,9 +402,16 @@ def validate_node(state: AgentState) -> AgentState:
         - state["validation_errors"]: Error list
         - state["gate_results"]: Gate test results
         - state["error_source"]: Error source determination
+    
+    Args:
+        validate_fn: Replacement for validate_10_2_compliance with the same
+                     signature (e.g. the batch runner's process-pool validator)
     """
     state["current_stage"] = "validate"
     
+    if validate_fn is None:
+        validate_fn = validate_10_2_compliance
+    
     item_id = state.get("item_id", "unknown")
     
     # Combine all code
@@ -414,7 +424,7 @@ def validate_node(state: AgentState) -> AgentState:
 '''
     
     # Invoke validator
-    validation_result = validate_10_2_compliance(
+    validation_result = validate_fn(
         full_code, 
         state.get("yaml_config", "")
     )
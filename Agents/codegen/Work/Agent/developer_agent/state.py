@@ -86,6 +86,7 @@ class AgentConfig:
     log_level: str
     log_file: str
     log_llm_calls: bool
+    checkpoint_store: str = "blob"       # "blob" (deduplicated manifests) | "json"
     
     @classmethod
     def load(cls, config_path: str = None) -> "AgentConfig":
@@ -116,7 +117,8 @@ class AgentConfig:
             max_checkpoints_per_hour=cfg['cache']['max_checkpoints_per_hour'],
             log_level=cfg['logging']['level'],
             log_file=cfg['logging']['log_file'],
-            log_llm_calls=cfg['logging']['log_llm_calls']
+            log_llm_calls=cfg['logging']['log_llm_calls'],
+            checkpoint_store=cfg['cache'].get('checkpoint_store', 'blob')
         )
 
 
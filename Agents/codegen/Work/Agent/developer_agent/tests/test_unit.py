@@ -8,20 +8,26 @@ import sys
 import tempfile
 import shutil
 import json
+import time
 from datetime import datetime
+from unittest import mock
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from state import AgentState, AgentConfig, LLMConfig, create_initial_state, generate_item_id
-from cache import FileSystemCache, resume_from_checkpoint
+from cache import FileSystemCache, BlobCheckpointCache, resume_from_checkpoint
+import graph
 from tools import (
     extract_file_patterns_from_spec_content,
     extract_file_patterns_from_spec,
     extract_keywords_from_spec,
     parse_item_spec,
-    extract_log_snippet
+    extract_log_snippet,
+    discover_files
 )
+import file_tree_index
+from file_tree_index import FileTreeIndex, get_file_index
 from validator import (
     validate_10_2_compliance,
     determine_error_source,
@@ -140,6 +146,112 @@ class TestCache(unittest.TestCase):
         self.assertIn("load_spec", stats["stages"])
 
 
+class TestBlobCheckpointCache(unittest.TestCase):
+    """Test BlobCheckpointCache (deduplicated manifests)"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = BlobCheckpointCache(self.test_dir, max_checkpoints_per_hour=50, gc_grace_seconds=0)
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.test_dir)
+    
+    def _blob_files(self):
+        blob_root = os.path.join(self.test_dir, "blobs")
+        return [f for _, _, files in os.walk(blob_root) for f in files]
+    
+    def _make_state(self):
+        state = create_initial_state("test_item.md")
+        state["item_spec_content"] = "# ItemSpec\n" + "check timing report\n" * 200
+        state["log_snippets"] = {"sta.log": {"content": "WNS -0.1\n" * 100}}
+        state["atom_a_code"] = "def extract_context(text, source_file):\n" + "    pass\n" * 100
+        return state
+    
+    def test_checkpoints_share_blobs(self):
+        """Unchanged fields are stored once across checkpoints and items"""
+        state = self._make_state()
+        first = self.cache.save_checkpoint("item_a", state)
+        blobs_after_first = len(self._blob_files())
+        
+        state["iteration_count"] = 1
+        state["current_stage"] = "reflect_b"
+        second = self.cache.save_checkpoint("item_a", state)
+        self.cache.save_checkpoint("item_b", state)
+        self.assertNotEqual(first, second)
+        self.assertEqual(len(self._blob_files()), blobs_after_first)
+        
+        state["atom_b_code"] = "def validate_logic(items):\n" + "    return []\n" * 50
+        self.cache.save_checkpoint("item_a", state)
+        self.assertEqual(len(self._blob_files()), blobs_after_first + 1)
+        
+        loaded = self.cache.load_checkpoint("item_a")
+        self.assertEqual(loaded, dict(state))
+        self.assertEqual(self.cache.load_checkpoint("item_a", first)["iteration_count"], 0)
+        self.assertEqual(
+            self.cache.load_checkpoint("item_b", fields=["current_stage", "missing"]),
+            {"current_stage": "reflect_b"}
+        )
+        self.assertEqual(len(self.cache.list_checkpoints("item_a")), 3)
+    
+    def test_loads_plain_checkpoints(self):
+        """Checkpoints written by FileSystemCache remain loadable"""
+        state = self._make_state()
+        FileSystemCache(self.test_dir).save_checkpoint("legacy", state)
+        self.assertEqual(self.cache.load_checkpoint("legacy"), dict(state))
+        self.assertEqual(self.cache.load_checkpoint("legacy", fields=["current_stage"]), {"current_stage": "init"})
+    
+    def test_gc_removes_unreferenced_blobs(self):
+        """Blobs survive while referenced and are collected afterwards"""
+        state = self._make_state()
+        self.cache.save_checkpoint("item_a", state)
+        self.cache.save_checkpoint("item_b", state)
+        count = len(self._blob_files())
+        
+        shutil.rmtree(os.path.join(self.test_dir, "item_a"))
+        self.assertEqual(self.cache.gc(), 0)
+        
+        shutil.rmtree(os.path.join(self.test_dir, "item_b"))
+        self.assertEqual(self.cache.gc(), count)
+        self.assertEqual(self._blob_files(), [])
+    
+    def test_cleanup_runs_gc_once_per_interval(self):
+        """cleanup_old_hours() only walks the store when the last gc is old enough"""
+        with mock.patch.object(self.cache, "gc", return_value=0) as gc:
+            self.cache.cleanup_old_hours("item_a")
+            self.cache.cleanup_old_hours("item_a")
+            BlobCheckpointCache(self.test_dir).cleanup_old_hours("item_b")
+            self.assertEqual(gc.call_count, 1)
+            
+            stamp = os.path.join(self.test_dir, BlobCheckpointCache.GC_STAMP)
+            old = time.time() - self.cache.gc_interval_seconds - 1
+            os.utime(stamp, (old, old))
+            self.cache.cleanup_old_hours("item_a")
+            self.assertEqual(gc.call_count, 2)
+    
+    def test_resume_skips_rebuilt_fields(self):
+        """Resume only decodes the fields the resumed run reads"""
+        state = self._make_state()
+        state["current_stage"] = "validate"
+        self.cache.save_checkpoint("item_a", state)
+        
+        manifest = self.cache._checkpoint_path("item_a")
+        with open(manifest, 'r', encoding='utf-8') as f:
+            entries = json.load(f)["fields"]
+        decoded = []
+        decode = self.cache._decode_field
+        with mock.patch.object(self.cache, "_decode_field",
+                               side_effect=lambda entry: decoded.append(entry) or decode(entry)):
+            resumed = resume_from_checkpoint("item_a", self.cache, fields=graph.RESUME_FIELDS)
+        
+        self.assertNotIn("item_spec_content", resumed)
+        self.assertNotIn("log_snippets", resumed)
+        self.assertEqual(resumed["atom_a_code"], state["atom_a_code"])
+        self.assertNotIn(entries["item_spec_content"], decoded)
+        self.assertNotIn(entries["log_snippets"], decoded)
+
+
 class TestTools(unittest.TestCase):
     """Test tools.py module"""
     
@@ -225,6 +337,101 @@ File patterns: `*.log`, `*.rpt`
             self.assertIn("netlist", result["snippets"][0]["content"])
         finally:
             os.unlink(temp_file)
+    
+    def test_extract_log_snippet_streaming(self):
+        """Context crosses read blocks; results are cached until the file changes"""
+        import tools
+        lines = ["Line %d: %s\n" % (i, "WNS -0.12" if i == 40 else "info") for i in range(1, 101)]
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
+            f.writelines(lines)
+            temp_file = f.name
+        
+        original_chunk = tools.SNIPPET_CHUNK_SIZE
+        tools.SNIPPET_CHUNK_SIZE = 32  # many block boundaries in a small file
+        try:
+            result = extract_log_snippet(temp_file, ["wns", "WNS", "missing"], context_lines=2)
+            self.assertEqual([s["keyword"] for s in result["snippets"]], ["wns", "WNS"])
+            self.assertEqual(result["snippets"][0]["line_number"], 40)
+            self.assertEqual(result["snippets"][0]["content"], "".join(lines[37:42]))
+            self.assertEqual(result["file_header"], "".join(lines[:50]))
+            
+            result["snippets"].clear()  # callers may mutate; the cache must not change
+            cached = extract_log_snippet(temp_file, ["wns", "WNS", "missing"], context_lines=2)
+            self.assertEqual(len(cached["snippets"]), 2)
+            
+            capped = extract_log_snippet(temp_file, ["line 1:", "wns"], context_lines=0, max_total_length=20)
+            self.assertEqual([s["keyword"] for s in capped["snippets"]], ["line 1:"])
+            self.assertTrue(capped["truncated"])
+        finally:
+            tools.SNIPPET_CHUNK_SIZE = original_chunk
+            os.unlink(temp_file)
+
+
+class TestFileTreeIndex(unittest.TestCase):
+    """Test file_tree_index.py module"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.test_dir = tempfile.mkdtemp()
+        for rel in ["top.log", "sta/run1/sta.log", "sta/run1/timing.rpt.gz", "pnr/route.log", ".hidden/skip.log"]:
+            path = os.path.join(self.test_dir, *rel.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "w").close()
+    
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.test_dir)
+    
+    def _rel(self, paths):
+        return [os.path.relpath(p, self.test_dir).replace(os.sep, "/") for p in paths]
+    
+    def test_queries_match_recursive_glob(self):
+        """Glob, extension and path-fragment queries"""
+        index = FileTreeIndex(self.test_dir).refresh()
+        self.assertEqual(self._rel(index.glob("**/*.log")), ["pnr/route.log", "sta/run1/sta.log", "top.log"])
+        self.assertEqual(self._rel(index.glob("sta/**/*.gz")), ["sta/run1/timing.rpt.gz"])
+        self.assertEqual(self._rel(index.glob("*.log")), ["top.log"])
+        self.assertEqual(self._rel(index.find(ext=".log", contains="sta/")), ["sta/run1/sta.log"])
+        
+        result = discover_files(self.test_dir, "*.log", limit=2)
+        self.assertEqual(self._rel(result["matched_files"]), ["pnr/route.log", "sta/run1/sta.log"])
+    
+    def test_incremental_refresh_and_persistence(self):
+        """Only changed directories are rescanned; a persisted index is reused"""
+        index_dir = os.path.join(self.test_dir, ".index")
+        index = FileTreeIndex(self.test_dir, index_dir).refresh()
+        
+        new_file = os.path.join(self.test_dir, "pnr", "drc.log")
+        open(new_file, "w").close()
+        index.refresh()
+        self.assertIn(new_file, index.glob("**/drc.log"))
+        
+        reloaded = FileTreeIndex(self.test_dir, index_dir)
+        self.assertEqual(reloaded.files(), index.files())
+    
+    def test_shared_index_sees_subdirectory_changes(self):
+        """Files added/removed below the root show up once the refresh interval passed"""
+        index = get_file_index(self.test_dir)
+        old_file = os.path.join(self.test_dir, "sta", "run1", "sta.log")
+        new_file = os.path.join(self.test_dir, "pnr", "drc.log")
+        os.unlink(old_file)
+        open(new_file, "w").close()
+        
+        index.refreshed_at -= file_tree_index.FILE_INDEX_MAX_AGE
+        self.assertIs(get_file_index(self.test_dir), index)
+        logs = index.glob("**/*.log")
+        self.assertIn(new_file, logs)
+        self.assertNotIn(old_file, logs)
+    
+    def test_directories_and_symlinks(self):
+        """Directories match like glob.glob; symlinked dirs are followed without looping"""
+        os.symlink(os.path.join(self.test_dir, "sta"), os.path.join(self.test_dir, "pnr", "sta_link"))
+        os.symlink(self.test_dir, os.path.join(self.test_dir, "sta", "run1", "loop"))
+        index = FileTreeIndex(self.test_dir).refresh()
+        self.assertIn("pnr/sta_link/run1/sta.log", index.files())
+        self.assertNotIn("sta/run1/loop/top.log", index.files())
+        self.assertEqual(self._rel(index.glob("**/run1")), ["pnr/sta_link/run1", "sta/run1"])
+        self.assertEqual(self._rel(index.glob("sta/**/")), ["sta", "sta/run1", "sta/run1/loop"])
 
 
 class TestValidator(unittest.TestCase):
@@ -4,25 +4,43 @@ Based on Agent_Development_Spec.md v1.1
 
 Implements log discovery, snippet extraction, and ItemSpec parsing tools.
 """
+from collections import OrderedDict, deque
 from typing import List, Dict, Any, Optional
+import copy
 import os
 import re
-import glob
 import gzip
+import threading
+
+from file_tree_index import get_file_index
+
+
+# Snippet extraction: streaming block size, header length and result cache size
+SNIPPET_CHUNK_SIZE = 1 << 20
+SNIPPET_HEADER_LINES = 50
+_SNIPPET_CACHE_SIZE = 256
+
+_snippet_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_snippet_cache_lock = threading.Lock()
 
 
 def discover_log_files(
     item_spec_content: str,
     search_root: str,
-    max_files: int = 10
+    max_files: int = 10,
+    index_dir: str = None
 ) -> Dict[str, List[str]]:
     """
     Discover relevant log files based on ItemSpec description
     
+    Patterns are answered from the shared file tree index of search_root
+    (one walk, refreshed incrementally) instead of a recursive glob each.
+    
     Args:
         item_spec_content: Content of the ItemSpec document
         search_root: Root directory to search for logs
         max_files: Maximum files per category
+        index_dir: Directory to persist the file tree index (optional)
         
     Returns:
         Dictionary with categorized file paths:
@@ -36,14 +54,15 @@ def discover_log_files(
     # Extract patterns from ItemSpec
     patterns = extract_file_patterns_from_spec_content(item_spec_content)
     
+    index = get_file_index(search_root, index_dir) if os.path.exists(search_root) else None
+    
     results = {}
     for category, pattern_list in patterns.items():
         files = []
         for pattern in pattern_list:
-            if os.path.exists(search_root):
-                matches = glob.glob(os.path.join(search_root, "**", pattern), recursive=True)
-                files.extend(matches[:max_files])
-        results[category] = list(set(files))[:max_files]
+            if index is not None:
+                files.extend(index.glob("**/" + pattern, limit=max_files))
+        results[category] = sorted(set(files))[:max_files]
     
     return results
 
@@ -135,16 +154,25 @@ def extract_log_snippet(
     file_path: str,
     keywords: List[str],
     context_lines: int = 10,
-    max_snippet_length: int = 2000
+    max_snippet_length: int = 2000,
+    max_total_length: int = 20000
 ) -> Dict[str, Any]:
     """
     Extract code snippets containing keywords from a log file
     
+    The file is streamed once in binary blocks: every pending keyword is
+    searched in the lowercased block (case-insensitive for ASCII), only blocks
+    with a hit are split into lines, and reading stops as soon as every
+    keyword's first match and its trailing context have been seen. Results
+    are cached per (file, size, mtime, keywords, limits).
+    
     Args:
         file_path: Path to the log file
         keywords: Keywords to search for
         context_lines: Number of context lines around match
         max_snippet_length: Maximum length of each snippet
+        max_total_length: Maximum total length of all snippets; later
+                          snippets are dropped and "truncated" is set
         
     Returns:
         {
@@ -157,13 +185,23 @@ def extract_log_snippet(
         }
     """
     try:
+        stat = os.stat(file_path)
+        cache_key = (
+            os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns,
+            tuple(keywords), context_lines, max_snippet_length, max_total_length
+        )
+        with _snippet_cache_lock:
+            cached = _snippet_cache.get(cache_key)
+            if cached is not None:
+                _snippet_cache.move_to_end(cache_key)
+                return copy.deepcopy(cached)
+        
         # Handle compressed files
-        if file_path.endswith('.gz'):
-            with gzip.open(file_path, 'rt', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-        else:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
+        opener = gzip.open if file_path.endswith('.gz') else open
+        with opener(file_path, 'rb') as f:
+            hits, header, truncated = _scan_log_snippets(
+                f, keywords, context_lines, max_snippet_length, max_total_length
+            )
     except Exception as e:
         return {
             "file_path": file_path,
@@ -172,34 +210,168 @@ def extract_log_snippet(
             "file_header": ""
         }
     
+    # Only first match per keyword; results keep keyword order
     snippets = []
     for keyword in keywords:
-        for i, line in enumerate(lines):
-            if keyword.lower() in line.lower():
-                start = max(0, i - context_lines)
-                end = min(len(lines), i + context_lines + 1)
-                snippet_content = ''.join(lines[start:end])
-                
-                if len(snippet_content) > max_snippet_length:
-                    snippet_content = snippet_content[:max_snippet_length] + "..."
-                
-                snippets.append({
-                    "keyword": keyword,
-                    "line_number": i + 1,
-                    "content": snippet_content
-                })
-                break  # Only first match per keyword
-    
-    # Extract file header (for version info)
-    file_header = ''.join(lines[:50])
-    if len(file_header) > max_snippet_length:
-        file_header = file_header[:max_snippet_length] + "..."
+        hit = hits.get(keyword.lower())
+        if hit:
+            snippets.append({
+                "keyword": keyword,
+                "line_number": hit[0],
+                "content": hit[1]
+            })
     
-    return {
+    # File header (for version info)
+    file_header = _truncate_snippet(header, max_snippet_length)
+    
+    result = {
         "file_path": file_path,
         "snippets": snippets,
         "file_header": file_header
     }
+    if truncated:
+        result["truncated"] = True
+    
+    with _snippet_cache_lock:
+        _snippet_cache[cache_key] = copy.deepcopy(result)
+        while len(_snippet_cache) > _SNIPPET_CACHE_SIZE:
+            _snippet_cache.popitem(last=False)
+    return result
+
+
+def _decode_lines(lines: List[bytes]) -> str:
+    return b"".join(lines).decode('utf-8', errors='ignore').replace('\r\n', '\n')
+
+
+def _truncate_snippet(lines: List[bytes], max_length: int) -> str:
+    content = _decode_lines(lines)
+    if len(content) > max_length:
+        content = content[:max_length] + "..."
+    return content
+
+
+def _split_lines(block: bytes) -> List[bytes]:
+    """Split into lines keeping "\n" (the last line may lack it at EOF)"""
+    parts = block.split(b"\n")
+    lines = [part + b"\n" for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
+def _tail_lines(block: bytes, count: int) -> List[bytes]:
+    """Last count lines of block without splitting all of it"""
+    if count <= 0 or not block:
+        return []
+    pos = len(block) - 1 if block.endswith(b"\n") else len(block)
+    for _ in range(count):
+        pos = block.rfind(b"\n", 0, pos)
+        if pos == -1:
+            break
+    return _split_lines(block[pos + 1:])
+
+
+def _scan_log_snippets(f, keywords, context_lines, max_snippet_length, max_total_length):
+    """
+    One streaming pass over a binary file object
+    
+    Returns:
+        (hits, header_lines, truncated) where hits maps lowercased keyword
+        to (line_number, content)
+    """
+    context_lines = max(0, context_lines)
+    pending = {k.lower(): k.lower().encode('utf-8') for k in keywords}
+    hits: Dict[str, tuple] = {}
+    open_snippets: List[Dict[str, Any]] = []
+    header: List[bytes] = []
+    previous = deque(maxlen=context_lines)  # lines just before the current block
+    line_base = 0
+    total_length = 0
+    truncated = False
+    carry = b""
+    
+    def finish(snippet):
+        nonlocal total_length, truncated
+        content = _truncate_snippet(snippet["lines"], max_snippet_length)
+        if max_total_length is not None and total_length + len(content) > max_total_length:
+            truncated = True
+            return
+        total_length += len(content)
+        hits[snippet["key"]] = (snippet["line_number"], content)
+    
+    while True:
+        chunk = f.read(SNIPPET_CHUNK_SIZE)
+        block = carry + chunk
+        if not block:
+            break
+        if chunk:
+            # Only complete lines; the partial last line carries over
+            end = block.rfind(b"\n") + 1
+            if end == 0:
+                carry = block
+                continue
+            block, carry = block[:end], block[end:]
+        else:
+            carry = b""
+        
+        lowered = block.lower()
+        hit_lines: Dict[int, List[str]] = {}
+        for key, needle in list(pending.items()):
+            pos = lowered.find(needle)
+            if pos != -1:
+                hit_lines.setdefault(lowered.count(b"\n", 0, pos), []).append(key)
+                del pending[key]
+        
+        if hit_lines or open_snippets or len(header) < SNIPPET_HEADER_LINES:
+            lines = _split_lines(block)
+            if len(header) < SNIPPET_HEADER_LINES:
+                header.extend(lines[:SNIPPET_HEADER_LINES - len(header)])
+            for i, line in enumerate(lines):
+                # Trailing context of snippets opened earlier
+                for snippet in open_snippets:
+                    snippet["lines"].append(line)
+                    snippet["remaining"] -= 1
+                for snippet in [s for s in open_snippets if s["remaining"] <= 0]:
+                    open_snippets.remove(snippet)
+                    finish(snippet)
+                
+                for key in hit_lines.get(i, ()):
+                    if max_total_length is not None and total_length >= max_total_length:
+                        truncated = True
+                        continue
+                    before = lines[max(0, i - context_lines):i]
+                    if len(before) < context_lines:
+                        missing = context_lines - len(before)
+                        before = list(previous)[-missing:] + before if previous else before
+                    snippet = {
+                        "key": key,
+                        "line_number": line_base + i + 1,
+                        "lines": before + [line],
+                        "remaining": context_lines
+                    }
+                    if context_lines == 0:
+                        finish(snippet)
+                    else:
+                        open_snippets.append(snippet)
+                
+                if not open_snippets and i >= max(hit_lines, default=-1) and len(header) >= SNIPPET_HEADER_LINES:
+                    break
+            previous.extend(lines[-context_lines:] if context_lines else [])
+        else:
+            previous.extend(_tail_lines(block, context_lines))
+        
+        line_base += lowered.count(b"\n")
+        
+        if not pending and not open_snippets and len(header) >= SNIPPET_HEADER_LINES:
+            break
+        if not chunk:
+            break
+    
+    # EOF: snippets with less trailing context than requested
+    for snippet in open_snippets:
+        finish(snippet)
+    
+    return hits, header, truncated
 
 
 def parse_item_spec(spec_content: str) -> Dict[str, Any]:
@@ -359,14 +531,15 @@ def _parse_implementation_section(section: str) -> Dict:
     }
 
 
-def discover_files(base_path: str, pattern: str, limit: int = 10) -> Dict[str, List[str]]:
+def discover_files(base_path: str, pattern: str, limit: int = 10, index_dir: str = None) -> Dict[str, List[str]]:
     """
-    Discover files matching a pattern
+    Discover files matching a pattern anywhere under base_path
     
     Args:
         base_path: Base directory to search
         pattern: Glob pattern (e.g., "*.log")
         limit: Maximum number of files to return
+        index_dir: Directory to persist the file tree index (optional)
         
     Returns:
         {"matched_files": [...]}
@@ -374,8 +547,8 @@ def discover_files(base_path: str, pattern: str, limit: int = 10) -> Dict[str, L
     if not os.path.exists(base_path):
         return {"matched_files": [], "error": f"Path does not exist: {base_path}"}
     
-    matches = glob.glob(os.path.join(base_path, "**", pattern), recursive=True)
-    return {"matched_files": matches[:limit]}
+    matches = get_file_index(base_path, index_dir).glob("**/" + pattern, limit=limit)
+    return {"matched_files": matches}
 
 
 def extract_snippet(file_path: str, keywords: List[str]) -> Dict[str, Any]:
@@ -17,21 +17,38 @@ JEDAI LLM Client
    - 首次认证后自动保存到 ~/.jedai_token
    - 下次启动自动加载，无需重新输入密码
    - Token 过期后自动重新认证
+
+4. 连接池 / 异步:
+   - 同步请求共用一个 requests.Session (复用 TLS 连接)
+   - achat() 是真正的异步请求: 有 httpx 时使用共享的 httpx.AsyncClient,
+     否则在线程中执行同步请求, 都不阻塞 event loop
+   - get_shared_client() 返回进程共享的客户端 (共享 token 和连接池)
+   - JEDAI_POOL_SIZE: 连接池大小 (默认 8)
 """
 
 import os
 import json
+import asyncio
 import getpass
+import threading
+import weakref
 from pathlib import Path
 from typing import Optional, Dict, List, Any
 from dataclasses import dataclass
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
 
 # JEDAI 默认配置
 JEDAI_URLS = [
@@ -44,6 +61,16 @@ DEFAULT_DEPLOYMENT = "claude-sonnet-4-5"
 # Token 缓存文件
 TOKEN_CACHE_FILE = Path.home() / ".jedai_token"
 
+# 请求超时 (Layer 2 生成复杂内容需要更长时间)
+REQUEST_TIMEOUT = 300
+
+
+def _pool_size() -> int:
+    try:
+        return max(1, int(os.environ.get("JEDAI_POOL_SIZE", "8")))
+    except ValueError:
+        return 8
+
 # JEDAI 支持的模型配置 (从 AutoGenChecker 同步 - 37 models total)
 JEDAI_MODELS = {
     # ========== GEMINI models ==========
@@ -133,6 +160,56 @@ MODEL_ALIASES = {
 }
 
 
+# ============================================================================
+# 共享连接池
+# ============================================================================
+
+_session = None
+_session_lock = threading.Lock()
+_async_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_http_session() -> "requests.Session":
+    """进程共享的 requests.Session (线程安全, 复用连接)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            pool_size = _pool_size()
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.verify = False
+            _session = session
+    return _session
+
+
+def _get_async_client() -> "httpx.AsyncClient":
+    """当前 event loop 共享的 httpx.AsyncClient (AsyncClient 不能跨 loop 使用)"""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        pool_size = _pool_size()
+        client = httpx.AsyncClient(
+            verify=False,
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    """关闭当前 event loop 的 AsyncClient (在 asyncio.run 结束前调用)"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    client = _async_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
 @dataclass
 class JedaiResponse:
     """JEDAI 响应"""
@@ -174,6 +251,8 @@ class JedaiClient:
         
         self.token: Optional[str] = None
         self._connected_url: Optional[str] = None
+        # 并发请求只认证一次 (避免多次提示输入密码)
+        self._auth_lock = threading.Lock()
         
         # 尝试从环境变量或缓存加载 token
         self._load_cached_token()
@@ -240,12 +319,19 @@ class JedaiClient:
         if self.token and self._connected_url and not force_reauth:
             return True
         
+        with self._auth_lock:
+            # 等锁期间其他线程可能已完成认证
+            if self.token and self._connected_url and not force_reauth:
+                return True
+            return self._login()
+    
+    def _login(self) -> bool:
         urls = [self.url] if self.url else JEDAI_URLS
         password = self._get_password()
         
         for url in urls:
             try:
-                response = requests.post(
+                response = get_http_session().post(
                     f"{url}/api/v1/security/login",
                     headers={"Content-Type": "application/json"},
                     json={
@@ -268,31 +354,15 @@ class JedaiClient:
         
         return False
     
-    def chat(
+    def _build_body(
         self,
         messages: List[Dict[str, str]],
-        system: Optional[str] = None,
-        max_tokens: int = 2048,
-        temperature: float = 0.0,
-        model: Optional[str] = None
-    ) -> JedaiResponse:
-        """
-        发送对话请求
-        
-        Args:
-            messages: 消息列表 [{"role": "user", "content": "..."}]
-            system: 系统提示
-            max_tokens: 最大输出 tokens
-            temperature: 温度
-            model: 模型名称或别名 (可选，支持 37 种模型)
-                   别名示例: "sonnet", "opus", "gemini", "llama", "gpt-5" 等
-            
-        Returns:
-            JedaiResponse: 响应对象
-        """
-        if not self._connect():
-            raise ConnectionError("无法连接 JEDAI 服务")
-        
+        system: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        model: Optional[str],
+    ) -> Dict[str, Any]:
+        """构建请求体 (解析模型别名和模型家族参数)"""
         # 解析模型配置 (支持别名)
         model_key = model or self.deployment
         # 先检查别名
@@ -345,17 +415,43 @@ class JedaiClient:
             # 打印实际调用的 LLM 模型信息
             print(f"[JEDAI] Using LLM: {family}/{deployment} (location: {location})")
         
-        # 发送请求，支持 token 过期自动重试
+        return body
+    
+    def _chat_url(self) -> str:
+        return f"{self._connected_url}/api/copilot/v1/llm/chat/completions"
+    
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.token}",
+        }
+    
+    def _parse_response(self, status_code: int, text: str) -> JedaiResponse:
+        if status_code != 200:
+            raise Exception(f"JEDAI 请求失败: {status_code} - {text}")
+        
+        result = json.loads(text)
+        
+        # 提取响应
+        content = result["choices"][0]["message"]["content"]
+        usage = result.get("usage", {})
+        
+        return JedaiResponse(
+            content=content,
+            input_tokens=usage.get("prompt_tokens", 0),
+            output_tokens=usage.get("completion_tokens", 0),
+            model=result.get("model", self.deployment),
+            raw_response=result
+        )
+    
+    def _send(self, body: Dict[str, Any]) -> JedaiResponse:
+        """同步发送请求 (共享连接池)，支持 token 过期自动重试"""
         for attempt in range(2):
-            response = requests.post(
-                f"{self._connected_url}/api/copilot/v1/llm/chat/completions",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.token}",
-                },
+            response = get_http_session().post(
+                self._chat_url(),
+                headers=self._headers(),
                 json=body,
-                timeout=300,  # 增加到 5 分钟，Layer 2 生成复杂内容需要更长时间
-                verify=False,
+                timeout=REQUEST_TIMEOUT,
             )
             
             # 401/403 表示 token 过期，重新认证
@@ -366,22 +462,70 @@ class JedaiClient:
             
             break
         
-        if response.status_code != 200:
-            raise Exception(f"JEDAI 请求失败: {response.status_code} - {response.text}")
+        return self._parse_response(response.status_code, response.text)
+    
+    def chat(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        max_tokens: int = 2048,
+        temperature: float = 0.0,
+        model: Optional[str] = None
+    ) -> JedaiResponse:
+        """
+        发送对话请求
         
-        result = response.json()
+        Args:
+            messages: 消息列表 [{"role": "user", "content": "..."}]
+            system: 系统提示
+            max_tokens: 最大输出 tokens
+            temperature: 温度
+            model: 模型名称或别名 (可选，支持 37 种模型)
+                   别名示例: "sonnet", "opus", "gemini", "llama", "gpt-5" 等
+            
+        Returns:
+            JedaiResponse: 响应对象
+        """
+        if not self._connect():
+            raise ConnectionError("无法连接 JEDAI 服务")
         
-        # 提取响应
-        content = result["choices"][0]["message"]["content"]
-        usage = result.get("usage", {})
+        body = self._build_body(messages, system, max_tokens, temperature, model)
+        return self._send(body)
+    
+    async def achat(
+        self,
+        messages: List[Dict[str, str]],
+        system: Optional[str] = None,
+        max_tokens: int = 2048,
+        temperature: float = 0.0,
+        model: Optional[str] = None
+    ) -> JedaiResponse:
+        """
+        异步发送对话请求 (参数同 chat)，等待响应时不阻塞 event loop
+        """
+        if not (self.token and self._connected_url):
+            # 认证可能需要交互输入密码，在线程中执行
+            if not await asyncio.to_thread(self._connect):
+                raise ConnectionError("无法连接 JEDAI 服务")
         
-        return JedaiResponse(
-            content=content,
-            input_tokens=usage.get("prompt_tokens", 0),
-            output_tokens=usage.get("completion_tokens", 0),
-            model=result.get("model", self.deployment),
-            raw_response=result
-        )
+        body = self._build_body(messages, system, max_tokens, temperature, model)
+        
+        if not HAS_HTTPX:
+            return await asyncio.to_thread(self._send, body)
+        
+        client = _get_async_client()
+        for attempt in range(2):
+            response = await client.post(self._chat_url(), headers=self._headers(), json=body)
+            
+            # 401/403 表示 token 过期，重新认证
+            if response.status_code in [401, 403] and attempt == 0:
+                self._clear_token_cache()
+                if await asyncio.to_thread(self._connect, True):
+                    continue
+            
+            break
+        
+        return self._parse_response(response.status_code, response.text)
     
     # Anthropic SDK 兼容接口
     class Messages:
@@ -448,6 +592,23 @@ class _Usage:
 # 便捷函数
 # ============================================================================
 
+_shared_client: Optional[JedaiClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client() -> JedaiClient:
+    """
+    进程共享的 JEDAI 客户端 (共享 token 和连接池)
+    
+    多个 Agent / 并发任务使用同一个客户端，只认证一次
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = JedaiClient()
+    return _shared_client
+
+
 def create_client(
     username: Optional[str] = None,
     password: Optional[str] = None
@@ -7,6 +7,7 @@ item_spec 评估、门禁、修复工具集
 - ItemSpecGate: 在线门禁检查器
 - ItemSpecRepairer: 定向修复器
 - ItemSpecEvaluator: 离线评估器
+- BatchItemSpecPipeline: 多 spec 并发流水线（Gate / Repair / Publish 阶段重叠）
 """
 
 from .item_spec_gate import (
@@ -36,6 +37,16 @@ from .item_spec_evaluator import (
     create_gold_sample,
 )
 
+from .batch_pipeline import (
+    BatchItemSpecPipeline,
+    BatchConfig,
+    BatchTask,
+    BatchReport,
+    SpecRecord,
+    SkillChatAdapter,
+    run_batch_on_specs,
+)
+
 __all__ = [
     # Gate
     "ItemSpecGate",
@@ -58,4 +69,12 @@ __all__ = [
     "evaluate_item_spec",
     "compare_models",
     "create_gold_sample",
+    # Batch pipeline
+    "BatchItemSpecPipeline",
+    "BatchConfig",
+    "BatchTask",
+    "BatchReport",
+    "SpecRecord",
+    "SkillChatAdapter",
+    "run_batch_on_specs",
 ]
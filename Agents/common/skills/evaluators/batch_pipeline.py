@@ -0,0 +1,433 @@
+"""
+批量流水线: 多个 item_spec 并发通过 Generate → Gate → Repair → Publish
+======================================================================
+ItemSpecPipeline.run 一次只处理一个 spec，350 个 item 串行跑需要数小时。
+BatchItemSpecPipeline 把每个阶段拆成独立的 worker 组，阶段之间用有界队列连接:
+
+    feeder ─▶ [generate x N] ─▶ [gate x N] ─▶ [repair x N] ─▶ [publish x N]
+
+- 阶段重叠: spec A 在 repair（等 LLM）时，spec B 已在 gate、spec C 在 generate
+- 背压: 队列有上限（queue_size），上游不会无限堆积
+- 规则优先: Gate 全部是确定性规则检查，只有 Gate 失败的 spec 才进入 Repair；
+  Repairer 先做规则修复，仅 regex 无法自动修复时才调用 LLM
+- 计量: 每个 spec 的 LLM 调用通过 LLMSkill 的 track_usage 单独累计，
+  报告吞吐量与每 spec 的 token / 成本
+
+使用方式:
+    from agents.common.skills.evaluators.batch_pipeline import (
+        BatchItemSpecPipeline, BatchTask
+    )
+
+    runner = BatchItemSpecPipeline(llm_client=get_llm_skill())
+    report = await runner.run([
+        BatchTask(spec_id="IMP-5-0-0-05", spec_path="out/IMP-5-0-0-05/item_spec.json"),
+        ...
+    ])
+    print(json.dumps(report.summary(), indent=2))
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Callable, Iterable
+
+from .item_spec_gate import GateResult
+from .item_spec_repairer import RepairResult
+from .pipeline import ItemSpecPipeline, PipelineConfig, PipelineResult
+from ..llm_skill.llm_skill import LLMSkill, LLMStats, track_usage
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("generate", "gate", "repair", "publish")
+
+
+def _default_concurrency() -> int:
+    """每个 LLM 阶段的 worker 数（ITEM_SPEC_PIPELINE_CONCURRENCY，默认 4）"""
+    try:
+        return max(1, int(os.environ.get("ITEM_SPEC_PIPELINE_CONCURRENCY", "4")))
+    except ValueError:
+        return 4
+
+
+@dataclass
+class BatchConfig:
+    """批量流水线配置"""
+    generate_workers: int = field(default_factory=_default_concurrency)  # LLM 生成并发
+    gate_workers: int = 2  # 规则检查（regex 性能测试在线程中执行）
+    repair_workers: int = field(default_factory=_default_concurrency)  # 修复并发（可能调用 LLM）
+    publish_workers: int = 2  # 写文件 / 离线评估
+    queue_size: int = 8  # 阶段间队列上限（背压）
+    model_name: str = "unknown"  # 用于评估报告
+    # 成本估算（每 1K token 单价，0 表示只报告 token）
+    cost_per_1k_input: float = 0.0
+    cost_per_1k_output: float = 0.0
+
+
+@dataclass
+class BatchTask:
+    """单个 spec 的输入（三选一: item_spec / spec_path / generate_task）"""
+    spec_id: str
+    item_spec: dict = None
+    spec_path: str | Path = None
+    generate_task: dict = None
+    output_dir: str | Path = None
+    previous_spec_path: str | Path = None
+
+
+@dataclass
+class SpecRecord:
+    """单个 spec 的批量执行记录"""
+    spec_id: str
+    result: PipelineResult = None
+    stage_ms: dict = field(default_factory=dict)  # 各阶段实际处理耗时
+    usage: LLMStats = field(default_factory=LLMStats)  # 该 spec 的 LLM 计量
+    cost: float = 0.0
+    total_ms: float = 0  # 入队到完成（含排队等待）
+
+    @property
+    def queue_ms(self) -> float:
+        """排队等待耗时"""
+        return max(0.0, self.total_ms - sum(self.stage_ms.values()))
+
+    def to_dict(self) -> dict:
+        return {
+            "spec_id": self.spec_id,
+            **(self.result.to_dict() if self.result else {"success": False}),
+            "stage_ms": {k: round(v, 1) for k, v in self.stage_ms.items()},
+            "queue_ms": round(self.queue_ms, 1),
+            "total_ms": round(self.total_ms, 1),
+            "llm": self.usage.to_dict(),
+            "cost": round(self.cost, 6),
+        }
+
+
+@dataclass
+class BatchReport:
+    """批量执行报告"""
+    records: list  # List[SpecRecord]，与输入顺序一致
+    wall_ms: float = 0
+
+    def summary(self) -> dict:
+        total = len(self.records)
+        results = [r.result for r in self.records if r.result]
+        passed = sum(1 for r in results if r.success)
+        repaired = sum(1 for r in results if r.success and r.repair_result)
+        input_tokens = sum(r.usage.input_tokens for r in self.records)
+        output_tokens = sum(r.usage.output_tokens for r in self.records)
+        cost = sum(r.cost for r in self.records)
+        wall_s = self.wall_ms / 1000
+
+        stage_avg = {}
+        for stage in STAGES:
+            values = [r.stage_ms[stage] for r in self.records if stage in r.stage_ms]
+            if values:
+                stage_avg[stage] = round(sum(values) / len(values), 1)
+
+        return {
+            "total": total,
+            "passed": passed,
+            "failed": total - passed,
+            "repaired": repaired,
+            "wall_s": round(wall_s, 2),
+            "throughput_per_min": round(total / wall_s * 60, 2) if wall_s > 0 else None,
+            "llm_calls": sum(r.usage.call_count for r in self.records),
+            "llm_errors": sum(r.usage.error_count for r in self.records),
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "tokens_per_spec": round((input_tokens + output_tokens) / total, 1) if total else 0,
+            "cost_total": round(cost, 6),
+            "cost_per_spec": round(cost / total, 6) if total else 0,
+            "stage_avg_ms": stage_avg,
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "summary": self.summary(),
+            "specs": [r.to_dict() for r in self.records],
+        }
+
+
+class SkillChatAdapter:
+    """
+    将 LLMSkill.chat(messages=...) 适配为 Repairer 使用的 chat(prompt) -> str 接口
+
+    调用仍走 LLMSkill 的重试 / 限流 / 统计逻辑。
+    """
+
+    def __init__(self, skill: LLMSkill, agent_id: str = "item_spec_repairer", system: str = ""):
+        self.skill = skill
+        self.agent_id = agent_id
+        self.system = system
+
+    async def chat(self, prompt: str) -> str:
+        response = await self.skill.chat(
+            messages=[{"role": "user", "content": prompt}],
+            system=self.system,
+            agent_id=self.agent_id,
+        )
+        return response.content
+
+
+@dataclass
+class _Job:
+    """在阶段之间流转的单个 spec 状态"""
+    task: BatchTask
+    record: SpecRecord
+    enqueued_at: float
+    item_spec: dict = None
+    gate_result: GateResult = None
+    repair_result: RepairResult = None
+
+    @property
+    def output_dir(self) -> Optional[Path]:
+        return Path(self.task.output_dir) if self.task.output_dir else None
+
+
+class BatchItemSpecPipeline:
+    """
+    item_spec 批量流水线
+
+    复用 ItemSpecPipeline 的 Gate / Repairer / Publish 逻辑，单个 spec 的结果
+    与 ItemSpecPipeline.run 一致；区别只在于多个 spec 的阶段可以重叠执行。
+    """
+
+    def __init__(
+        self,
+        config: PipelineConfig = None,
+        batch_config: BatchConfig = None,
+        llm_client: Any = None,
+        generator_func: Callable = None,
+    ):
+        """
+        Args:
+            config: 单个 spec 的 Pipeline 配置
+            batch_config: 并发 / 队列 / 成本配置
+            llm_client: LLMSkill 实例（自动适配）或带 chat(prompt) 的客户端（用于修复）
+            generator_func: 自定义异步生成器函数 generate_task -> item_spec（可选）
+        """
+        self.batch_config = batch_config or BatchConfig()
+        if isinstance(llm_client, LLMSkill):
+            llm_client = SkillChatAdapter(llm_client)
+        self.pipeline = ItemSpecPipeline(
+            config=config, llm_client=llm_client, generator_func=generator_func
+        )
+        self.config = self.pipeline.config
+
+    async def run(self, tasks: Iterable[BatchTask]) -> BatchReport:
+        """
+        并发处理一批 spec
+
+        Returns:
+            BatchReport: records 与输入顺序一致
+        """
+        cfg = self.batch_config
+        start = time.perf_counter()
+        jobs = [
+            _Job(task=t, record=SpecRecord(spec_id=t.spec_id), enqueued_at=0.0)
+            for t in tasks
+        ]
+
+        handlers = {
+            "generate": self._stage_generate,
+            "gate": self._stage_gate,
+            "repair": self._stage_repair,
+            "publish": self._stage_publish,
+        }
+        workers = {
+            "generate": cfg.generate_workers,
+            "gate": cfg.gate_workers,
+            "repair": cfg.repair_workers,
+            "publish": cfg.publish_workers,
+        }
+        queues = {stage: asyncio.Queue(maxsize=max(1, cfg.queue_size)) for stage in STAGES}
+
+        async def feed():
+            for job in jobs:
+                job.enqueued_at = time.perf_counter()
+                await queues["generate"].put(job)
+            for _ in range(max(1, workers["generate"])):
+                await queues["generate"].put(None)
+
+        async def run_stage(index: int, stage: str):
+            inbox = queues[stage]
+            next_stage = STAGES[index + 1] if index + 1 < len(STAGES) else None
+
+            async def worker():
+                while True:
+                    job = await inbox.get()
+                    if job is None:
+                        return
+                    await self._run_handler(stage, handlers[stage], job)
+                    if next_stage:
+                        await queues[next_stage].put(job)
+
+            await asyncio.gather(*(worker() for _ in range(max(1, workers[stage]))))
+            # 本阶段全部完成后通知下游 worker 退出
+            if next_stage:
+                for _ in range(max(1, workers[next_stage])):
+                    await queues[next_stage].put(None)
+
+        await asyncio.gather(feed(), *(run_stage(i, s) for i, s in enumerate(STAGES)))
+
+        report = BatchReport(
+            records=[job.record for job in jobs],
+            wall_ms=(time.perf_counter() - start) * 1000,
+        )
+        summary = report.summary()
+        logger.info(
+            f"[BatchPipeline] {summary['passed']}/{summary['total']} passed in "
+            f"{summary['wall_s']}s ({summary['throughput_per_min']} specs/min, "
+            f"{summary['llm_calls']} LLM calls, cost {summary['cost_total']})"
+        )
+        return report
+
+    async def _run_handler(self, stage: str, handler: Callable, job: _Job) -> None:
+        """执行一个阶段: 计时、按 spec 计量 LLM、异常转为该 spec 的失败结果"""
+        if job.record.result is not None:
+            return  # 前面阶段已结束该 spec
+
+        t0 = time.perf_counter()
+        with track_usage() as usage:
+            try:
+                await handler(job)
+            except Exception as e:
+                logger.warning(f"[BatchPipeline] {job.task.spec_id} failed at {stage}: {e}")
+                job.record.result = PipelineResult(
+                    success=False,
+                    stage=stage,
+                    item_spec=job.item_spec,
+                    gate_result=job.gate_result,
+                    repair_result=job.repair_result,
+                    error_message=f"{stage} failed: {e}",
+                    duration_ms=(time.perf_counter() - job.enqueued_at) * 1000,
+                )
+
+        record = job.record
+        record.stage_ms[stage] = (time.perf_counter() - t0) * 1000
+        record.usage.input_tokens += usage.input_tokens
+        record.usage.output_tokens += usage.output_tokens
+        record.usage.call_count += usage.call_count
+        record.usage.error_count += usage.error_count
+        if usage.last_call_time:
+            record.usage.last_call_time = usage.last_call_time
+
+        if record.result is not None:
+            cfg = self.batch_config
+            record.total_ms = (time.perf_counter() - job.enqueued_at) * 1000
+            record.cost = (
+                record.usage.input_tokens / 1000 * cfg.cost_per_1k_input
+                + record.usage.output_tokens / 1000 * cfg.cost_per_1k_output
+            )
+
+    # ========================================================================
+    # 阶段实现（与 ItemSpecPipeline.run 的各阶段一致）
+    # ========================================================================
+
+    async def _stage_generate(self, job: _Job) -> None:
+        task = job.task
+        if task.item_spec is not None:
+            job.item_spec = task.item_spec
+        elif task.spec_path:
+            job.item_spec = await asyncio.to_thread(_load_json, task.spec_path)
+        elif self.pipeline.generator_func and task.generate_task:
+            job.item_spec = await self.pipeline.generator_func(task.generate_task)
+        else:
+            job.record.result = PipelineResult(
+                success=False,
+                stage="generate",
+                error_message="No item_spec provided and no generator configured",
+                duration_ms=(time.perf_counter() - job.enqueued_at) * 1000,
+            )
+
+    async def _stage_gate(self, job: _Job) -> None:
+        # 纯规则检查；regex 性能测试是 CPU 工作，放到线程中不阻塞其它 spec 的 LLM I/O
+        job.gate_result = await asyncio.to_thread(self.pipeline.gate.check, job.item_spec)
+        if self.config.save_intermediate and job.output_dir:
+            self.pipeline._save_intermediate(
+                job.output_dir, "gate_result.json", job.gate_result.to_dict()
+            )
+
+    async def _stage_repair(self, job: _Job) -> None:
+        if job.gate_result.passed or not self.config.enable_repair:
+            return
+        job.repair_result = await self.pipeline.repairer.repair(
+            job.item_spec, job.gate_result.failures
+        )
+        job.item_spec = job.repair_result.item_spec
+        job.gate_result = job.repair_result.final_gate_result
+        if self.config.save_intermediate and job.output_dir:
+            self.pipeline._save_intermediate(
+                job.output_dir, "repair_result.json", job.repair_result.to_dict()
+            )
+
+    async def _stage_publish(self, job: _Job) -> None:
+        job.record.result = await asyncio.to_thread(
+            self.pipeline._publish,
+            job.item_spec,
+            job.gate_result,
+            job.repair_result,
+            job.output_dir,
+            job.task.previous_spec_path,
+            self.batch_config.model_name,
+            job.enqueued_at,
+        )
+
+
+def _load_json(path: str | Path) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# 快速运行脚本
+async def run_batch_on_specs(
+    spec_paths: Iterable[str | Path],
+    enable_repair: bool = True,
+    llm_client: Any = None,
+    batch_config: BatchConfig = None,
+) -> BatchReport:
+    """
+    便捷函数：对一批已有的 item_spec.json 运行批量流水线（输出写回各自目录）
+
+    Args:
+        spec_paths: item_spec.json 路径列表
+        enable_repair: 是否启用修复
+        llm_client: LLM 客户端（可选，用于 regex 修复）
+        batch_config: 并发 / 成本配置
+
+    Returns:
+        BatchReport
+    """
+    tasks = []
+    for path in spec_paths:
+        path = Path(path)
+        tasks.append(BatchTask(
+            spec_id=path.parent.name or path.stem,
+            spec_path=path,
+            output_dir=path.parent,
+        ))
+
+    runner = BatchItemSpecPipeline(
+        config=PipelineConfig(enable_repair=enable_repair),
+        batch_config=batch_config,
+        llm_client=llm_client,
+    )
+    return await runner.run(tasks)
+
+
+if __name__ == "__main__":
+    import sys
+
+    async def main():
+        if len(sys.argv) > 1:
+            root = Path(sys.argv[1])
+            paths = sorted(root.rglob("item_spec.json")) if root.is_dir() else [Path(p) for p in sys.argv[1:]]
+            report = await run_batch_on_specs(paths)
+            print(json.dumps(report.to_dict(), indent=2, ensure_ascii=False))
+        else:
+            print("Usage: python batch_pipeline.py <dir_with_item_specs | item_spec.json ...>")
+
+    asyncio.run(main())
@@ -11,6 +11,7 @@
 """
 
 import json
+import time
 import asyncio
 import shutil
 from dataclasses import dataclass, field
@@ -116,7 +117,6 @@ class ItemSpecPipeline:
         Returns:
             PipelineResult: 执行结果
         """
-        import time
         start_time = time.perf_counter()
         
         output_dir = Path(output_dir) if output_dir else None
@@ -161,6 +161,22 @@ class ItemSpecPipeline:
                 self._save_intermediate(output_dir, "repair_result.json", repair_result.to_dict())
         
         # Stage 4: Publish or Rollback
+        return self._publish(
+            item_spec, gate_result, repair_result,
+            output_dir, previous_spec_path, model_name, start_time
+        )
+    
+    def _publish(
+        self,
+        item_spec: dict,
+        gate_result: GateResult,
+        repair_result: Optional[RepairResult],
+        output_dir: Optional[Path],
+        previous_spec_path: str | Path,
+        model_name: str,
+        start_time: float,
+    ) -> PipelineResult:
+        """Stage 4: 发布（Gate 通过）或回滚（Gate 失败）"""
         if gate_result.passed:
             # 发布
             output_path = ""
@@ -4,8 +4,9 @@ LLM Skill - 统一 LLM 调用入口
 提供:
 - LLMSkill: 单例模式的 LLM 客户端
 - get_llm_skill(): 获取 LLMSkill 实例
+- track_usage(): 按任务计量 token
 """
 
-from .llm_skill import LLMSkill, get_llm_skill, LLMResponse
+from .llm_skill import LLMSkill, get_llm_skill, LLMResponse, LLMStats, track_usage
 
-__all__ = ["LLMSkill", "get_llm_skill", "LLMResponse"]
+__all__ = ["LLMSkill", "get_llm_skill", "LLMResponse", "LLMStats", "track_usage"]
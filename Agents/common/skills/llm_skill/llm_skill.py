@@ -8,6 +8,7 @@ LLM Skill - 统一 LLM 调用入口 (Singleton)
 - Token 统计 (全局 + 按 Agent)
 - 限流处理 (指数退避)
 - 多 Provider 支持 (JEDAI / Anthropic)
+- 按任务计量 (track_usage: 在当前 asyncio task 内额外累计 token)
 
 使用方式:
     from agents.common.skills.llm_skill import get_llm_skill
@@ -20,6 +21,10 @@ LLM Skill - 统一 LLM 调用入口 (Singleton)
     )
     print(response.content)
     print(llm.get_stats())  # 全局统计
+    
+    with track_usage() as usage:  # 按 spec / 任务计量
+        await llm.chat(...)
+    print(usage.to_dict())
 """
 
 import os
@@ -27,8 +32,10 @@ import json
 import asyncio
 import random
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -69,6 +76,26 @@ class LLMStats:
         }
 
 
+# 当前上下文的计量桶 (track_usage 设置；并发 task 之间互不干扰)
+_scoped_stats: ContextVar[Optional[LLMStats]] = ContextVar("llm_scoped_stats", default=None)
+
+
+@contextmanager
+def track_usage() -> Iterator[LLMStats]:
+    """
+    在当前上下文内额外累计 LLM 调用统计
+    
+    全局 / 按 Agent 统计照常更新；并发的 asyncio task 各自持有独立的计量桶，
+    可用于按 spec / 按任务统计 token 与成本。
+    """
+    stats = LLMStats()
+    token = _scoped_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _scoped_stats.reset(token)
+
+
 # ============================================================================
 # LLM Skill (Singleton)
 # ============================================================================
@@ -242,7 +269,9 @@ class LLMSkill:
         
         for attempt in range(self.MAX_RETRIES):
             try:
-                response = self._client.messages.create(
+                # 同步 SDK 调用放到线程中，避免阻塞事件循环（并发调用可重叠）
+                response = await asyncio.to_thread(
+                    self._client.messages.create,
                     model=model,
                     max_tokens=max_tokens,
                     temperature=temperature,
@@ -295,6 +324,9 @@ class LLMSkill:
                 # 更新错误统计
                 self._agent_stats[agent_id].error_count += 1
                 self._global_stats.error_count += 1
+                scoped = _scoped_stats.get()
+                if scoped is not None:
+                    scoped.error_count += 1
                 
                 raise
         
@@ -317,6 +349,14 @@ class LLMSkill:
         agent_stats.output_tokens += response.output_tokens
         agent_stats.call_count += 1
         agent_stats.last_call_time = now
+        
+        # 当前上下文计量 (track_usage)
+        scoped = _scoped_stats.get()
+        if scoped is not None:
+            scoped.input_tokens += response.input_tokens
+            scoped.output_tokens += response.output_tokens
+            scoped.call_count += 1
+            scoped.last_call_time = now
     
     # ========================================================================
     # 统计 API
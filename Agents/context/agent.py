@@ -16,6 +16,8 @@ ContextAgent - v9.0 Multi-Round Progressive Model with Resume Support
 - 断点恢复：自动检测已完成round并跳过
 - 质量验证：检查TODO残留、section完整性等
 - 输出：<item_id>_ItemSpec.md
+- 批量模式：process_batch() 并发生成多个 item（异步 JEDAI 请求，
+  并发上限 CONTEXT_AGENT_CONCURRENCY，默认 4）
 
 符合 protocols/ 定义的 Agent 接口:
 - 继承 BaseAgent
@@ -23,6 +25,8 @@ ContextAgent - v9.0 Multi-Round Progressive Model with Resume Support
 - 返回 AgentResult
 """
 
+import asyncio
+import contextvars
 import json
 import logging
 import os
@@ -66,6 +70,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 批量模式下当前任务处理的 item（用于日志前缀，每个 asyncio task 独立）
+_current_item: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_item", default=None)
+
 
 # Phase 3: Pydantic models for structured output
 class AnalysisOutput(BaseModel):
@@ -146,9 +153,7 @@ class JedaiLLMRunnable(Runnable):
         raise NotImplementedError("JedaiLLMRunnable only supports async invoke")
     
     async def ainvoke(self, input: str, config=None) -> str:
-        """Async invoke - calls JEDAI client (sync) in event loop"""
-        import asyncio
-        
+        """Async invoke - awaits the JEDAI client's async transport (event loop stays free)"""
         # Extract user_prompt from input (can be string or dict)
         user_prompt = input if isinstance(input, str) else input.get('user_prompt', str(input))
         
@@ -156,12 +161,10 @@ class JedaiLLMRunnable(Runnable):
         messages = [{"role": "user", "content": user_prompt}]
         
         # Call JEDAI with retry logic (3 attempts with exponential backoff)
-        # Note: JedaiClient.chat() is synchronous, not async
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                # JEDAI client is synchronous - call directly without await
-                response = self.jedai_client.chat(
+                response = await self.jedai_client.achat(
                     messages=messages,
                     system=self.system_prompt,
                     model=self.llm_config.get("model", "claude-sonnet-4-5"),
@@ -235,6 +238,10 @@ class ContextAgent(BaseAgent):
     
     def _log_activity(self, message: str):
         """输出 Activity 日志"""
+        item_id = _current_item.get()
+        if item_id:
+            # 批量模式：多个 item 的日志交错输出，加上 item 前缀
+            message = "\n".join(f"[{item_id}] {line}" if line else line for line in message.split("\n"))
         if self.activity_handler:
             self.activity_handler(message)
         print(message)
@@ -265,11 +272,11 @@ class ContextAgent(BaseAgent):
         if cache_key in self._chains:
             return self._chains[cache_key]
         
-        # Initialize JEDAI client if needed
+        # Initialize JEDAI client if needed (process-wide: shared token + connection pool)
         if not self._llm_skill:
             try:
-                from common.jedai_client import JedaiClient
-                self._llm_skill = JedaiClient()
+                from common.jedai_client import get_shared_client
+                self._llm_skill = get_shared_client()
                 logger.info("[Chain] Initialized JEDAI client")
             except Exception as e:
                 logger.error(f"[Chain] Failed to initialize JEDAI client: {e}")
@@ -1099,7 +1106,50 @@ Output the complete Section 4 inside <section4></section4> tags.
         """
         config_path = inputs.get("config_path")
         output_dir = inputs.get("output_dir", "output")
+        return await self._process_item(config_path, output_dir)
+    
+    async def process_batch(
+        self,
+        config_paths: list[str],
+        output_dir: str = "output",
+        concurrency: Optional[int] = None,
+    ) -> list[AgentResult]:
+        """
+        批量模式：并发生成多个 item 的 ItemSpec
+        
+        每个 item 仍按 Round 1-5 顺序执行；不同 item 的 round chain 并发，
+        同时进行的 item 数不超过 concurrency。每个 item 使用独立的断点恢复目录。
         
+        Args:
+            config_paths: item YAML 路径列表
+            output_dir: 输出目录（所有 item 共用）
+            concurrency: 并发上限（默认 CONTEXT_AGENT_CONCURRENCY 或 4）
+            
+        Returns:
+            与 config_paths 顺序一致的 AgentResult 列表
+        """
+        if concurrency is None:
+            try:
+                concurrency = int(os.environ.get("CONTEXT_AGENT_CONCURRENCY", "4"))
+            except ValueError:
+                concurrency = 4
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def run_one(config_path: str) -> AgentResult:
+            async with semaphore:
+                _current_item.set(Path(config_path).stem)
+                return await self._process_item(config_path, output_dir, isolate_cache=True)
+        
+        self._log_activity(f"\n[ContextAgent] Batch: {len(config_paths)} items, concurrency {concurrency}")
+        results = await asyncio.gather(*(run_one(path) for path in config_paths))
+        
+        succeeded = sum(1 for r in results if r.status == "success")
+        self._log_activity(f"\n[ContextAgent] Batch complete: {succeeded}/{len(results)} succeeded")
+        return list(results)
+    
+    async def _process_item(self, config_path: Optional[str], output_dir: str,
+                            isolate_cache: bool = False) -> AgentResult:
+        """处理单个 item 并包装为 AgentResult"""
         if not config_path:
             return AgentResult(
                 result=None,
@@ -1112,7 +1162,7 @@ Output the complete Section 4 inside <section4></section4> tags.
         
         try:
             # 执行主流程
-            result = await self._run_pipeline(config_path, output_dir)
+            result = await self._run_pipeline(config_path, output_dir, isolate_cache)
             
             return AgentResult(
                 result="ItemSpec generation completed",
@@ -1132,10 +1182,12 @@ Output the complete Section 4 inside <section4></section4> tags.
                 errors=[str(e)]
             )
     
-    async def _run_pipeline(self, config_path: str, output_dir: str) -> Dict:
+    async def _run_pipeline(self, config_path: str, output_dir: str, isolate_cache: bool = False) -> Dict:
         """
         完整流程：5轮渐进式生成 (v9.1 - 修复user_prompt注入)
         Round 1: 分析理解 → Round 2: Parsing Logic → Round 3: Check Logic → Round 4: Waiver Logic → Round 5: Implementation Guide
+        
+        isolate_cache: 断点恢复目录按 item 分开（批量模式多个 item 共用 output_dir）
         """
         from datetime import datetime
         
@@ -1172,6 +1224,8 @@ Output the complete Section 4 inside <section4></section4> tags.
         else:
             # 非debug模式：使用隐藏目录.resume_cache支持断点恢复
             debug_dir = output_path / ".resume_cache" / timestamp
+        if isolate_cache:
+            debug_dir = debug_dir / item_id
         
         debug_dir.mkdir(parents=True, exist_ok=True)
         
@@ -1405,27 +1459,36 @@ Please review and manually fix these issues before using this ItemSpec.
 # CLI 入口
 async def main():
     import sys
+    from common.jedai_client import close_async_client
     if len(sys.argv) < 2:
-        print("Usage: python agent.py <config.yaml> [output_dir]")
+        print("Usage: python agent.py <config.yaml | config_dir> [output_dir]")
+        print("  config_dir: generate all *.yaml items concurrently (CONTEXT_AGENT_CONCURRENCY)")
         sys.exit(1)
     
     config_path = sys.argv[1]
     output_dir = sys.argv[2] if len(sys.argv) > 2 else "./output"
     
     agent = ContextAgent(debug_mode=True)
-    result = await agent.process({
-        "config_path": config_path,
-        "output_dir": output_dir
-    })
+    try:
+        if Path(config_path).is_dir():
+            config_paths = sorted(str(p) for p in Path(config_path).glob("*.yaml"))
+            results = await agent.process_batch(config_paths, output_dir)
+        else:
+            results = [await agent.process({
+                "config_path": config_path,
+                "output_dir": output_dir
+            })]
+    finally:
+        await close_async_client()
     
-    if result.status == "success":
-        print(f"\n[OK] Success! ItemSpec generated:")
-        print(f"  - Path: {result.artifacts.get('itemspec_path')}")
-        print(f"  - Item ID: {result.artifacts.get('item_id')}")
-    else:
-        print(f"\n[FAIL] Failed: {result.errors}")
+    for result in results:
+        if result.status == "success":
+            print(f"\n[OK] Success! ItemSpec generated:")
+            print(f"  - Path: {result.artifacts.get('itemspec_path')}")
+            print(f"  - Item ID: {result.artifacts.get('item_id')}")
+        else:
+            print(f"\n[FAIL] Failed: {result.errors}")
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+测试 BatchItemSpecPipeline: 每个 spec 的结果与 ItemSpecPipeline.run 串行结果一致
+"""
+
+import sys
+import copy
+import json
+import asyncio
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+# Setup path
+script_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(script_dir))
+
+from common.skills.evaluators.pipeline import ItemSpecPipeline, PipelineConfig  # noqa: E402
+from common.skills.evaluators.batch_pipeline import (  # noqa: E402
+    BatchItemSpecPipeline, BatchConfig, BatchTask
+)
+
+SPEC_FILE = Path(__file__).resolve().parent / "Validation" / "IMP-10-0-0-00" / "input" / "item_spec.json"
+
+
+def _comparable(result):
+    """去掉耗时和输出路径 (批量与串行写到不同目录)"""
+    data = result.to_dict()
+    for key in ("duration_ms", "output_path", "rollback_path"):
+        data.pop(key)
+    data["item_spec"] = result.item_spec
+    data["gate"] = result.gate_result.to_dict() if result.gate_result else None
+    data["repair"] = result.repair_result.to_dict() if result.repair_result else None
+    if data["gate"]:
+        data["gate"].pop("check_duration_ms")
+    return data
+
+
+class TestBatchPipelineMatchesSerial(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        with open(SPEC_FILE, "r", encoding="utf-8") as f:
+            repairable = json.load(f)
+        self.specs = {
+            "IMP-10-0-0-00": repairable,  # Gate 失败, 规则修复后通过
+            "IMP-X-0-0-00": {"item_id": "IMP-X-0-0-00", "description": "incomplete"},  # 无法修复
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _serial(self):
+        results = {}
+        for spec_id, spec in self.specs.items():
+            pipeline = ItemSpecPipeline(config=PipelineConfig())
+            results[spec_id] = asyncio.run(pipeline.run(
+                item_spec=copy.deepcopy(spec), output_dir=self.test_dir / "serial" / spec_id
+            ))
+        return results
+
+    def test_two_items_match_serial_results(self):
+        serial = self._serial()
+
+        runner = BatchItemSpecPipeline(config=PipelineConfig(), batch_config=BatchConfig(
+            generate_workers=2, gate_workers=2, repair_workers=2, publish_workers=2, queue_size=1
+        ))
+        report = asyncio.run(runner.run([
+            BatchTask(spec_id=spec_id, item_spec=copy.deepcopy(spec),
+                      output_dir=self.test_dir / "batch" / spec_id)
+            for spec_id, spec in self.specs.items()
+        ]))
+
+        self.assertEqual([r.spec_id for r in report.records], list(self.specs))
+        for record in report.records:
+            self.assertEqual(_comparable(record.result), _comparable(serial[record.spec_id]))
+            self.assertEqual(set(record.stage_ms), {"generate", "gate", "repair", "publish"})
+        self.assertTrue(report.records[0].result.success)
+        self.assertFalse(report.records[1].result.success)
+
+        # 写出的文件也一致
+        for spec_id in self.specs:
+            serial_files = sorted(p.relative_to(self.test_dir / "serial" / spec_id)
+                                  for p in (self.test_dir / "serial" / spec_id).rglob("*.json"))
+            batch_files = sorted(p.relative_to(self.test_dir / "batch" / spec_id)
+                                 for p in (self.test_dir / "batch" / spec_id).rglob("*.json"))
+            self.assertEqual(batch_files, serial_files)
+
+        summary = report.summary()
+        self.assertEqual((summary["total"], summary["passed"], summary["repaired"]), (2, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+测试共享 JEDAI 客户端 (achat / get_shared_client) 和 ContextAgent 批量模式
+
+上游用 httpx.MockTransport 模拟, 不连接 JEDAI
+"""
+
+import sys
+import asyncio
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+pytest.importorskip("requests")
+httpx = pytest.importorskip("httpx")
+
+# Setup path
+script_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(script_dir))
+
+from common import jedai_client  # noqa: E402
+
+
+def _completion(text):
+    return {
+        "choices": [{"message": {"role": "assistant", "content": text}}],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 1},
+    }
+
+
+class TestSharedClient(unittest.IsolatedAsyncioTestCase):
+    """achat 复用进程共享客户端和当前 event loop 的连接池"""
+
+    async def asyncSetUp(self):
+        self.requests = []
+        self.patches = [
+            mock.patch.dict("os.environ", {"JEDAI_TOKEN": "test-token", "JEDAI_URL": "https://jedai.test"}),
+            mock.patch.object(jedai_client, "_shared_client", None),
+            mock.patch("builtins.print"),
+        ]
+        for patch in self.patches:
+            patch.start()
+        loop = asyncio.get_running_loop()
+        self.transport_client = httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+        jedai_client._async_clients[loop] = self.transport_client
+
+    async def asyncTearDown(self):
+        await jedai_client.close_async_client()
+        for patch in self.patches:
+            patch.stop()
+
+    async def handle(self, request):
+        self.requests.append(request)
+        await asyncio.sleep(0.01)
+        prompt = request.read().decode()
+        return httpx.Response(200, json=_completion(f"echo {len(prompt)}"))
+
+    async def test_shared_client_is_reused(self):
+        clients = []
+        threads = [threading.Thread(target=lambda: clients.append(jedai_client.get_shared_client()))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(c) for c in clients}), 1)
+        self.assertIs(jedai_client.get_shared_client(), clients[0])
+
+    async def test_concurrent_achat_uses_one_pool(self):
+        client = jedai_client.get_shared_client()
+        responses = await asyncio.gather(*(
+            client.achat([{"role": "user", "content": "x" * i}]) for i in range(5)
+        ))
+        self.assertEqual(len(self.requests), 5)
+        self.assertIs(jedai_client._get_async_client(), self.transport_client)
+        self.assertTrue(all(r.headers["authorization"] == "Bearer test-token" for r in self.requests))
+        self.assertEqual(len({r.content for r in responses}), 5)
+        self.assertEqual(responses[0].input_tokens, 3)
+
+    @unittest.skipUnless(jedai_client.HAS_HTTPX, "httpx transport")
+    async def test_expired_token_reauthenticates_once(self):
+        client = jedai_client.get_shared_client()
+        tokens = iter(["stale", "fresh"])
+        client.token = next(tokens)
+
+        async def handle(request):
+            self.requests.append(request)
+            if request.headers["authorization"] != "Bearer fresh":
+                return httpx.Response(401, text="expired")
+            return httpx.Response(200, json=_completion("ok"))
+        self.transport_client._transport = httpx.MockTransport(handle)
+
+        def login():
+            client.token = next(tokens)
+            return True
+        with mock.patch.object(client, "_login", side_effect=login) as login_mock, \
+             mock.patch.object(client, "_clear_token_cache"):
+            response = await client.achat([{"role": "user", "content": "hi"}])
+        self.assertEqual(response.content, "ok")
+        self.assertEqual(login_mock.call_count, 1)
+        self.assertEqual(len(self.requests), 2)
+
+
+class TestProcessBatch(unittest.IsolatedAsyncioTestCase):
+    """process_batch 并发执行, 结果顺序与输入一致"""
+
+    def setUp(self):
+        pytest.importorskip("protocols")
+        pytest.importorskip("langchain_core")
+        from context import agent as context_agent
+        self.context_agent = context_agent
+
+    async def test_results_keep_input_order(self):
+        context_agent = self.context_agent
+        agent = context_agent.ContextAgent()
+        paths = [f"/items/IMP-{i}.yaml" for i in range(6)]
+        running = 0
+        peak = 0
+
+        async def fake_process_item(config_path, output_dir, isolate_cache=False):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # 后面的 item 先完成
+            await asyncio.sleep(0.01 * (len(paths) - paths.index(config_path)))
+            running -= 1
+            self.assertTrue(isolate_cache)
+            self.assertEqual(context_agent._current_item.get(), Path(config_path).stem)
+            return context_agent.AgentResult(result=config_path, messages=[], artifacts={},
+                                             metadata={}, status="success")
+
+        with mock.patch.object(agent, "_process_item", side_effect=fake_process_item), \
+             mock.patch("builtins.print"):
+            results = await agent.process_batch(paths, "out", concurrency=3)
+
+        self.assertEqual([r.result for r in results], paths)
+        self.assertEqual(peak, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,8 +10,11 @@
 #   - Extract violation entries using state machine parser (single-line and multi-line formats)
 #   - Parse pin name, required limit, actual transition, slack, and timing view
 #   - Filter violations where slack < 0 (negative slack indicates violation)
-#   - Aggregate violations across all input files
-#   - Apply waiver logic to match violations against waive_items patterns
+#   - Aggregate violations across all input files into a columnar ViolationTable
+#     (common/violation_table.py)
+#   - Apply waiver logic once per unique violation name against waive_items patterns
+#   - Expand only the worst CHECKLIST_MAX_DETAIL_ROWS violations into details;
+#     group descriptions keep the accurate total
 #   - Report clean (pass) if all violations are waived or no violations exist
 #
 # Auto Type Detection:
@@ -49,6 +52,7 @@ if str(_COMMON_DIR) not in sys.path:
 
 from base_checker import BaseChecker, CheckResult, ConfigurationError
 from output_formatter import DetailItem, Severity, create_check_result
+from violation_table import ViolationTable
 
 # MANDATORY: Import template mixins (checker_templates v1.1.0)
 from checker_templates.waiver_handler_template import WaiverHandlerMixin
@@ -94,7 +98,7 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
             item_desc="Confirm the max_transition check result is clean."
         )
         # Custom member variables for parsed data
-        self._parsed_items: List[Dict[str, Any]] = []
+        self._violation_table: Optional[ViolationTable] = None
         self._metadata: Dict[str, str] = {}
     
     # =========================================================================
@@ -144,7 +148,7 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         
         Returns:
             Dict with parsed data:
-            - 'items': List[Dict] - Violations with metadata (line_number, file_path)
+            - 'table': ViolationTable - Violations named "<pin> (view: <view>, slack: <slack>ns)"
             - 'metadata': Dict - File metadata (total violations, files processed)
             - 'errors': List - Any parsing errors encountered
         """
@@ -160,9 +164,19 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
             raise ConfigurationError("No valid input files found")
         
         # 2. Parse using state machine for max_transition reports
-        all_violations = []
+        table = ViolationTable()
         errors = []
         
+        def add_violation(pin_name, required, actual, slack, view, line_num, file_path):
+            # Only record violations (slack < 0)
+            if slack < 0:
+                table.append(
+                    pin_name, required, actual, slack,
+                    rule='max_transition', view=view,
+                    line_number=line_num, file_path=file_path,
+                    name=f"{pin_name} (view: {view}, slack: {slack:.4f}ns)"
+                )
+        
         # Patterns for parsing
         pattern_header = re.compile(r'^Check type\s*:\s*max_transition', re.IGNORECASE)
         pattern_table_header = re.compile(r'^\s*Pin Name\s+Required\s+Actual\s+Slack\s+View\s*$')
@@ -203,19 +217,8 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
                             actual = float(match_single.group(3))
                             slack = float(match_single.group(4))
                             view = match_single.group(5)
-                            
-                            # Only record violations (slack < 0)
-                            if slack < 0:
-                                all_violations.append({
-                                    'name': pin_name,
-                                    'pin_name': pin_name,
-                                    'required': required,
-                                    'actual': actual,
-                                    'slack': slack,
-                                    'view': view,
-                                    'line_number': line_num,
-                                    'file_path': str(file_path)
-                                })
+                            add_violation(pin_name, required, actual, slack, view,
+                                          line_num, str(file_path))
                             
                             pending_pin_name = None
                             continue
@@ -234,19 +237,8 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
                             actual = float(match_cont.group(2))
                             slack = float(match_cont.group(3))
                             view = match_cont.group(4)
-                            
-                            # Only record violations (slack < 0)
-                            if slack < 0:
-                                all_violations.append({
-                                    'name': pending_pin_name,
-                                    'pin_name': pending_pin_name,
-                                    'required': required,
-                                    'actual': actual,
-                                    'slack': slack,
-                                    'view': view,
-                                    'line_number': pending_line_num,
-                                    'file_path': str(file_path)
-                                })
+                            add_violation(pending_pin_name, required, actual, slack, view,
+                                          pending_line_num, str(file_path))
                             
                             pending_pin_name = None
                             continue
@@ -259,15 +251,15 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
                 errors.append(f"Error parsing {file_path}: {str(e)}")
         
         # 3. Store frequently reused data on self
-        self._parsed_items = all_violations
+        self._violation_table = table
         self._metadata = {
-            'total_violations': len(all_violations),
+            'total_violations': len(table),
             'files_processed': len(valid_files)
         }
         
-        # 4. Return aggregated dict with items containing line_number and file_path
+        # 4. Return aggregated dict; rows stay columnar until output
         return {
-            'items': all_violations,
+            'table': table,
             'metadata': self._metadata,
             'errors': errors
         }
@@ -287,7 +279,7 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         """
         # Parse input
         data = self._parse_input_files()
-        violations = data.get('items', [])
+        table = data['table']
         errors = data.get('errors', [])
         
         # Check for parsing errors
@@ -307,22 +299,15 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
             )
         
         # Type 1: Check if violations exist
-        if violations:
-            # Convert violations to dict with metadata for source file/line display
-            violation_items = {
-                f"{v['pin_name']} (view: {v['view']}, slack: {v['slack']:.4f}ns)": {
-                    'name': f"{v['pin_name']} (view: {v['view']}, slack: {v['slack']:.4f}ns)",
-                    'line_number': v.get('line_number', 0),
-                    'file_path': v.get('file_path', 'N/A')
-                }
-                for v in violations
-            }
+        if len(table):
+            # Expand a bounded number of violations (worst slack first) with metadata
+            violation_items = table.to_items()
             
             # Use template helper - violations are missing_items (semantic failures)
             return self.build_complete_output(
                 missing_items=violation_items,
                 found_desc=self.FOUND_DESC,
-                missing_desc=self.MISSING_DESC,
+                missing_desc=table.describe_truncation(self.MISSING_DESC),
                 found_reason=self.FOUND_REASON,
                 missing_reason=self.MISSING_REASON
             )
@@ -359,7 +344,7 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         """
         # Parse input
         data = self._parse_input_files()
-        violations = data.get('items', [])
+        violations = self._expand_violations(data['table'])
         
         # Get requirements
         requirements = self.item_data.get('requirements', {})
@@ -374,7 +359,7 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
             matched = False
             for violation in violations:
                 # Build violation string for pattern matching
-                vio_str = f"{violation['pin_name']} (view: {violation['view']}, slack: {violation['slack']:.4f}ns)"
+                vio_str = violation['name']
                 
                 # Pattern matching: check if pattern is substring of violation
                 if pattern.lower() in vio_str.lower():
@@ -446,7 +431,7 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         """
         # Parse input
         parsed_data = self._parse_input_files()
-        violations = parsed_data.get('items', [])
+        violations = self._expand_violations(parsed_data['table'])
         
         # Get requirements
         requirements = self.item_data.get('requirements', {})
@@ -470,7 +455,7 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
             
             # Check if pattern matches any violation
             for violation in violations:
-                vio_str = f"{violation['pin_name']} (view: {violation['view']}, slack: {violation['slack']:.4f}ns)"
+                vio_str = violation['name']
                 
                 # Pattern matching: check if pattern is substring
                 if pattern.lower() in vio_str.lower():
@@ -549,38 +534,20 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         """
         # Parse input
         data = self._parse_input_files()
-        violations = data.get('items', [])
+        table = data['table']
         
         # Parse waiver configuration
         waivers = self.get_waivers()
         waive_items_raw = waivers.get('waive_items', [])
         waive_dict = self.parse_waive_items(waive_items_raw)
         
-        # Apply waivers to violations
-        waived_items = {}
-        unwaived_items = {}
-        used_waiver_patterns = set()
-        
-        for violation in violations:
-            vio_name = f"{violation['pin_name']} (view: {violation['view']}, slack: {violation['slack']:.4f}ns)"
-            vio_data = {
-                'name': vio_name,
-                'line_number': violation.get('line_number', 0),
-                'file_path': violation.get('file_path', 'N/A')
-            }
-            
-            # Check if this violation matches any waiver
-            matched_waiver = None
-            for waiver_pattern in waive_dict.keys():
-                if self.match_waiver_entry(vio_name, {waiver_pattern: waive_dict[waiver_pattern]}):
-                    matched_waiver = waiver_pattern
-                    used_waiver_patterns.add(waiver_pattern)
-                    break
-            
-            if matched_waiver:
-                waived_items[vio_name] = vio_data
-            else:
-                unwaived_items[vio_name] = vio_data
+        # Apply waivers once per unique violation name, then broadcast to all rows
+        waived_table, unwaived_table, used_waivers = table.apply_waivers(
+            waive_dict, self.match_waiver_entry, key='name'
+        )
+        used_waiver_patterns = set(used_waivers)
+        waived_items = waived_table.to_items()
+        unwaived_items = unwaived_table.to_items()
         
         # Build found_items (clean - no violations if no unwaived violations)
         found_items = {}
@@ -614,8 +581,8 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
             waive_dict=waive_dict,
             waived_tag="[WAIVER]",
             found_desc=self.FOUND_DESC,
-            missing_desc=self.MISSING_DESC,
-            waived_desc=self.WAIVED_DESC,
+            missing_desc=unwaived_table.describe_truncation(self.MISSING_DESC),
+            waived_desc=waived_table.describe_truncation(self.WAIVED_DESC),
             found_reason=lambda item: self.FOUND_REASON,
             missing_reason=lambda item: self.MISSING_REASON,
             waived_base_reason=self.WAIVED_BASE_REASON,
@@ -626,6 +593,26 @@ class Check_10_0_0_12(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
     # Helper Methods (Optional - Add as needed)
     # =========================================================================
     
+    def _expand_violations(self, table: ViolationTable) -> List[Dict[str, Any]]:
+        """
+        Expand table rows into violation dicts for pattern (substring) matching.
+        
+        Args:
+            table: Parsed violation table
+            
+        Returns:
+            List of dicts with name, pin_name, line_number, file_path
+        """
+        violations = []
+        for row in table.iter_rows():
+            violations.append({
+                'name': row['name'],
+                'pin_name': row['pin'],
+                'line_number': row['line_number'],
+                'file_path': row['file_path']
+            })
+        return violations
+    
     def _matches_waiver(self, item: str, waive_patterns: List[str]) -> bool:
         """
         Check if item matches any waiver pattern.
@@ -8,11 +8,14 @@
 #   - Parse input files: maxcap_1.rpt, maxcap_2.rpt
 #   - Validate report type is max_capacitance using header pattern
 #   - Extract violations using state machine (SEARCHING_HEADER → IN_TABLE → PENDING_VALUES)
+#     into a columnar ViolationTable (common/violation_table.py)
 #   - Handle single-line violations (pin, required, actual, slack, view on one line)
 #   - Handle multi-line violations (hierarchical pin names wrapping to next line)
 #   - Aggregate violations across all input files
 #   - Track unique timing views and violation counts
-#   - Apply waiver logic to separate waived/unwaived violations
+#   - Apply waiver logic once per unique violation name to separate waived/unwaived violations
+#   - Expand only the worst CHECKLIST_MAX_DETAIL_ROWS violations into details;
+#     group descriptions keep the accurate total
 #   - Report clean result if no unwaived violations exist
 #
 # Auto Type Detection:
@@ -50,6 +53,7 @@ if str(_COMMON_DIR) not in sys.path:
 
 from base_checker import BaseChecker, CheckResult, ConfigurationError
 from output_formatter import DetailItem, Severity, create_check_result
+from violation_table import ViolationTable
 
 # MANDATORY: Import template mixins (checker_templates v1.1.0)
 from checker_templates.waiver_handler_template import WaiverHandlerMixin
@@ -92,7 +96,7 @@ class Check_10_0_0_13(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
             item_desc="Confirm the max_capacitance check result is clean."
         )
         # Custom member variables for parsed data
-        self._parsed_items: List[Dict[str, Any]] = []
+        self._violation_table: Optional[ViolationTable] = None
         self._metadata: Dict[str, Any] = {}
     
     # =========================================================================
@@ -137,9 +141,12 @@ class Check_10_0_0_13(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         - Single-line violations (all fields on one line)
         - Multi-line violations (hierarchical pin names wrapping)
         
+        Rows go into a columnar ViolationTable; each row keeps the violation
+        name exactly as reported ("Pin '<pin>': Required=.., ... (View: ..)").
+        
         Returns:
             Dict with parsed data:
-            - 'items': List[Dict] - Violations with metadata (line_number, file_path)
+            - 'table': ViolationTable - Columnar violations (name, pin, values, view, line, file)
             - 'metadata': Dict - Summary statistics (total_violations, unique_views)
             - 'errors': List - Any parsing errors encountered
         """
@@ -158,11 +165,20 @@ class Check_10_0_0_13(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         pattern_separator = re.compile(r'^\s*-{10,}\s*$')
         pattern_header = re.compile(r'^\s*Pin Name\s+Required\s+Actual\s+Slack\s+View\s*$')
         
-        # 3. Parse all files
-        all_violations = []
-        unique_views = set()
+        # 3. Parse all files into one columnar violation table
+        table = ViolationTable()
         errors = []
         
+        def add_violation(pin_name, required_cap, actual_cap, slack, view_name, line_num, file_path):
+            # Only report violations (negative slack)
+            if float(slack) < 0:
+                table.append(
+                    pin_name, required_cap, actual_cap, slack,
+                    rule='max_capacitance', view=view_name,
+                    line_number=line_num, file_path=file_path,
+                    name=f"Pin '{pin_name}': Required={required_cap}, Actual={actual_cap}, Slack={slack} (View: {view_name})"
+                )
+        
         for file_path in valid_files:
             try:
                 with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
@@ -175,44 +191,19 @@ class Check_10_0_0_13(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
                         # State: SEARCHING_HEADER
                         if state == 'SEARCHING_HEADER':
                             match = pattern_check_type.search(line)
-                            if match:
-                                check_type = match.group(1)
-                                if check_type == 'max_capacitance':
-                                    state = 'IN_TABLE'
+                            if match and match.group(1) == 'max_capacitance':
+                                state = 'IN_TABLE'
                         
                         # State: IN_TABLE
                         elif state == 'IN_TABLE':
-                            # Check for table header
-                            if pattern_header.search(line):
-                                continue
-                            
-                            # Check for separator (end of table)
-                            if pattern_separator.search(line):
+                            # Table header / separator lines
+                            if pattern_header.search(line) or pattern_separator.search(line):
                                 continue
                             
                             # Try single-line violation pattern first
                             match = pattern_violation_single.search(line)
                             if match:
-                                pin_name = match.group(1)
-                                required_cap = match.group(2)
-                                actual_cap = match.group(3)
-                                slack = match.group(4)
-                                view_name = match.group(5)
-                                
-                                # Only report violations (negative slack)
-                                if float(slack) < 0:
-                                    violation_name = f"Pin '{pin_name}': Required={required_cap}, Actual={actual_cap}, Slack={slack} (View: {view_name})"
-                                    all_violations.append({
-                                        'name': violation_name,
-                                        'pin_name': pin_name,
-                                        'required_cap': required_cap,
-                                        'actual_cap': actual_cap,
-                                        'slack': slack,
-                                        'view_name': view_name,
-                                        'line_number': line_num,
-                                        'file_path': str(file_path)
-                                    })
-                                    unique_views.add(view_name)
+                                add_violation(*match.groups(), line_num, str(file_path))
                                 continue
                             
                             # Try multi-line pattern (pin name only)
@@ -221,57 +212,33 @@ class Check_10_0_0_13(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
                                 pending_pin_name = match.group(1)
                                 pending_line_num = line_num
                                 state = 'PENDING_VALUES'
-                                continue
                         
                         # State: PENDING_VALUES
                         elif state == 'PENDING_VALUES':
-                            # Try continuation pattern
+                            # Continuation line carries the values; otherwise drop the pin
                             match = pattern_continuation.search(line)
                             if match:
-                                required_cap = match.group(1)
-                                actual_cap = match.group(2)
-                                slack = match.group(3)
-                                view_name = match.group(4)
-                                
-                                # Only report violations (negative slack)
-                                if float(slack) < 0:
-                                    violation_name = f"Pin '{pending_pin_name}': Required={required_cap}, Actual={actual_cap}, Slack={slack} (View: {view_name})"
-                                    all_violations.append({
-                                        'name': violation_name,
-                                        'pin_name': pending_pin_name,
-                                        'required_cap': required_cap,
-                                        'actual_cap': actual_cap,
-                                        'slack': slack,
-                                        'view_name': view_name,
-                                        'line_number': pending_line_num,
-                                        'file_path': str(file_path)
-                                    })
-                                    unique_views.add(view_name)
-                                
-                                # Reset state
-                                pending_pin_name = None
-                                pending_line_num = None
-                                state = 'IN_TABLE'
-                            else:
-                                # No continuation found, reset state
-                                pending_pin_name = None
-                                pending_line_num = None
-                                state = 'IN_TABLE'
+                                add_violation(pending_pin_name, *match.groups(),
+                                              pending_line_num, str(file_path))
+                            pending_pin_name = None
+                            pending_line_num = None
+                            state = 'IN_TABLE'
             
             except Exception as e:
                 errors.append(f"Error parsing {file_path}: {str(e)}")
         
         # 4. Store frequently reused data on self
-        self._parsed_items = all_violations
+        self._violation_table = table
+        summary = table.summary()
         self._metadata = {
-            'total_violations': len(all_violations),
-            'unique_views': len(unique_views),
-            'views': list(unique_views)
+            'total_violations': summary['total'],
+            'unique_views': len(summary['by_view']),
+            'views': list(summary['by_view'].keys())
         }
         
-        # 5. Return aggregated dict with items containing line_number and file_path
+        # 5. Return aggregated dict; rows stay columnar until output
         return {
-            'items': all_violations,
+            'table': table,
             'metadata': self._metadata,
             'errors': errors
         }
@@ -291,19 +258,11 @@ class Check_10_0_0_13(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         """
         # Parse input
         data = self._parse_input_files()
-        violations = data.get('items', [])
-        metadata = data.get('metadata', {})
+        table = data['table']
         
-        # Convert violations to dict with metadata for source file/line display
+        # Expand a bounded number of violations (worst slack first) with metadata
         # Output format: "Fail: <name>. In line <N>, <filepath>: <reason>"
-        violation_items = {}
-        for violation in violations:
-            vio_name = violation['name']
-            violation_items[vio_name] = {
-                'name': vio_name,
-                'line_number': violation.get('line_number', 0),
-                'file_path': violation.get('file_path', 'N/A')
-            }
+        violation_items = table.to_items()
         
         # For Type 1: violations are missing_items (semantic failures)
         # Clean result if no violations
@@ -315,7 +274,7 @@ class Check_10_0_0_13(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
             found_items=found_items,
             missing_items=missing_items,
             found_desc=self.FOUND_DESC,
-            missing_desc=self.MISSING_DESC,
+            missing_desc=table.describe_truncation(self.MISSING_DESC),
             found_reason=self.FOUND_REASON,
             missing_reason=self.MISSING_REASON
         )
@@ -335,7 +294,7 @@ class Check_10_0_0_13(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         """
         # Parse input
         data = self._parse_input_files()
-        violations = data.get('items', [])
+        violations = self._expand_violations(data['table'])
         
         # Get requirements
         requirements = self.item_data.get('requirements', {})
@@ -398,7 +357,7 @@ class Check_10_0_0_13(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         """
         # Parse input
         data = self._parse_input_files()
-        violations = data.get('items', [])
+        violations = self._expand_violations(data['table'])
         
         # Get requirements and waivers
         requirements = self.item_data.get('requirements', {})
@@ -519,7 +478,7 @@ class Check_10_0_0_13(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         """
         # Parse input
         data = self._parse_input_files()
-        violations = data.get('items', [])
+        table = data['table']
         
         # Parse waiver configuration
         waivers = self.get_waivers()
@@ -528,38 +487,20 @@ class Check_10_0_0_13(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         
         # Build found_items (clean - no violations if violations list is empty)
         found_items = {}
-        if not violations:
+        if len(table) == 0:
             found_items['No violations'] = {
                 'name': 'No violations',
                 'line_number': 0,
                 'file_path': 'N/A'
             }
         
-        # Apply waivers to violations
-        waived_items = {}
-        unwaived_items = {}
-        used_waiver_patterns = set()
-        
-        for violation in violations:
-            vio_name = violation['name']
-            vio_data = {
-                'name': vio_name,
-                'line_number': violation.get('line_number', 0),
-                'file_path': violation.get('file_path', 'N/A')
-            }
-            
-            # Check if this violation matches any waiver
-            matched_waiver = None
-            for waiver_pattern in waive_dict.keys():
-                if self.match_waiver_entry(vio_name, {waiver_pattern: waive_dict[waiver_pattern]}):
-                    matched_waiver = waiver_pattern
-                    used_waiver_patterns.add(waiver_pattern)
-                    break
-            
-            if matched_waiver:
-                waived_items[vio_name] = vio_data
-            else:
-                unwaived_items[vio_name] = vio_data
+        # Apply waivers once per unique violation name, then broadcast to all rows
+        waived_table, unwaived_table, used_waivers = table.apply_waivers(
+            waive_dict, self.match_waiver_entry, key='name'
+        )
+        used_waiver_patterns = set(used_waivers)
+        waived_items = waived_table.to_items()
+        unwaived_items = unwaived_table.to_items()
         
         # Find unused waivers
         unused_waivers = {
@@ -582,8 +523,8 @@ class Check_10_0_0_13(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
             waived_tag="[WAIVER]",
             
             found_desc=self.FOUND_DESC,
-            missing_desc=self.MISSING_DESC,
-            waived_desc=self.WAIVED_DESC,
+            missing_desc=unwaived_table.describe_truncation(self.MISSING_DESC),
+            waived_desc=waived_table.describe_truncation(self.WAIVED_DESC),
             
             found_reason=self.FOUND_REASON,
             missing_reason=self.MISSING_REASON,
@@ -595,6 +536,26 @@ class Check_10_0_0_13(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
     # Helper Methods (Optional - Add as needed)
     # =========================================================================
     
+    def _expand_violations(self, table: ViolationTable) -> List[Dict[str, Any]]:
+        """
+        Expand table rows into violation dicts for pattern (substring) matching.
+        
+        Args:
+            table: Parsed violation table
+            
+        Returns:
+            List of dicts with name, pin_name, line_number, file_path
+        """
+        violations = []
+        for row in table.iter_rows():
+            violations.append({
+                'name': row['name'],
+                'pin_name': row['pin'],
+                'line_number': row['line_number'],
+                'file_path': row['file_path']
+            })
+        return violations
+    
     def _matches_waiver(self, item: str, waive_patterns: List[str]) -> bool:
         """
         Check if item matches any waiver pattern.
@@ -33,7 +33,6 @@
 ################################################################################
 
 from pathlib import Path
-import re
 import sys
 from typing import List, Dict, Tuple, Optional, Any
 
@@ -47,6 +46,7 @@ if str(_COMMON_DIR) not in sys.path:
 
 from base_checker import BaseChecker, CheckResult, ConfigurationError
 from output_formatter import DetailItem, Severity, create_check_result
+from voltus_reader import read_lvs_report
 
 # MANDATORY: Import template mixins (checker_templates v1.1.0)
 from checker_templates.waiver_handler_template import WaiverHandlerMixin
@@ -185,48 +185,33 @@ class Check_11_0_0_01(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         lvs_run_result = None
         cell_statistics = {}
         
-        # 3. Parse each input file for LVS run result information
-        # Pattern 1: Extract overall LVS run result (MATCH/MISMATCH)
-        run_result_pattern = re.compile(r'^#####\s+Run Result\s*:\s*(\w+)\s*$')
-        # Pattern 2: Extract top cell name
-        top_cell_pattern = re.compile(r'^#####\s+Top Cell\s*:\s*(.+?)\s*<vs>\s*(.+?)\s*$')
-        # Pattern 3: Extract cell match statistics
-        statistics_pattern = re.compile(r'^(Cells matched|Cells which mismatch|Cells expanded|Cells not run)\s*\|\s*([\d,]+)\s*$')
-        
+        # 3. Read each lvs.rep.cls through the shared Voltus reader:
+        #    '##### Run Result : MATCH', '##### Top Cell : <layout> <vs> <schematic>'
+        #    and 'Cells matched | N' style statistics
         for file_path in valid_files:
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line_num, line in enumerate(f, 1):
-                        # Extract LVS run result
-                        match = run_result_pattern.search(line)
-                        if match:
-                            lvs_run_result = match.group(1).strip()
-                            items.append({
-                                'name': 'Overall_Run_Result',
-                                'line_number': line_num,
-                                'file_path': str(file_path),
-                                'type': 'lvs_run_result',
-                                'status': lvs_run_result
-                            })
-                            metadata['run_result'] = lvs_run_result
-                            metadata['result_line'] = line_num
-                        
-                        # Extract top cell
-                        match = top_cell_pattern.search(line)
-                        if match:
-                            layout_top = match.group(1).strip()
-                            schematic_top = match.group(2).strip()
-                            metadata['layout_top_cell'] = layout_top
-                            metadata['schematic_top_cell'] = schematic_top
-                        
-                        # Extract cell statistics
-                        match = statistics_pattern.search(line)
-                        if match:
-                            stat_type = match.group(1).strip()
-                            count_str = match.group(2).replace(',', '')
-                            cell_statistics[stat_type] = int(count_str)
+                report = read_lvs_report(file_path, cache_dir=self.cache_dir)
             except Exception as e:
                 errors.append(f"Error parsing {file_path}: {str(e)}")
+                continue
+            
+            for status, line_num in report.run_results:
+                lvs_run_result = status
+                items.append({
+                    'name': 'Overall_Run_Result',
+                    'line_number': line_num,
+                    'file_path': str(file_path),
+                    'type': 'lvs_run_result',
+                    'status': lvs_run_result
+                })
+                metadata['run_result'] = lvs_run_result
+                metadata['result_line'] = line_num
+            
+            if report.layout_top_cell is not None:
+                metadata['layout_top_cell'] = report.layout_top_cell
+                metadata['schematic_top_cell'] = report.schematic_top_cell
+            
+            cell_statistics.update(report.cell_statistics)
         
         # 4. Store frequently reused data on self
         self._parsed_items = items
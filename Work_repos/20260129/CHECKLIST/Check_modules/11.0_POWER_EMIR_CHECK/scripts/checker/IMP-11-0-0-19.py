@@ -48,6 +48,7 @@ if str(_COMMON_DIR) not in sys.path:
 
 from base_checker import BaseChecker, CheckResult, ConfigurationError
 from output_formatter import DetailItem, Severity, create_check_result
+from voltus_reader import read_powerup_report
 
 # MANDATORY: Import template mixins (checker_templates v1.1.0)
 from checker_templates.waiver_handler_template import WaiverHandlerMixin
@@ -209,67 +210,40 @@ class Check_11_0_0_19(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         first_switch_line = 0
         last_switch_line = 0
         
-        # 3. Parse each input file for powerup metrics
+        # 3. Read each Powerup.rpt through the shared Voltus reader (parsed once
+        #    per run; IMP-11-0-0-20 reuses the cached result)
         for file_path in valid_files:
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    in_detailed_section = False
-                    for line_num, line in enumerate(f, 1):
-                        # Pattern 1: Extract maximum rush current
-                        match_rush = re.search(r'Measured maximum rush current\s*=\s*([0-9.eE+-]+)A', line)
-                        if match_rush:
-                            rush_current = float(match_rush.group(1))
-                            rush_current_line = line_num
-                        
-                        # Pattern 2: Extract wake-up time
-                        match_wakeup = re.search(r'Measured wake-up time for switched net\s*=\s*([0-9.eE+-]+)s', line)
-                        if match_wakeup:
-                            wake_up_time = float(match_wakeup.group(1))
-                            wake_up_time_line = line_num
-                        
-                        # Pattern 3: Extract switch counts
-                        match_switches = re.search(r'Number of power switches turned on in this simulation\s*=\s*(\d+)\s*\[of total\s*(\d+)\]', line)
-                        if match_switches:
-                            switches_turned_on = int(match_switches.group(1))
-                            total_switches = int(match_switches.group(2))
-                            switches_line = line_num
-                        
-                        # Pattern 4: Extract last switch information
-                        match_last = re.search(r"Last power switch to turn-on in this simulation is '([^']+)' at time\s*([0-9.eE+-]+)s", line)
-                        if match_last:
-                            last_switch_instance = match_last.group(1)
-                            last_switch_time = float(match_last.group(2))
-                            last_switch_line = line_num
-                        
-                        # Pattern 6: Extract simulation metadata
-                        match_sim_time = re.search(r'Simulation time\s*=\s*([0-9.eE+-]+)s', line)
-                        if match_sim_time:
-                            simulation_time = float(match_sim_time.group(1))
-                        
-                        match_threshold = re.search(r'Threshold \(Vt\)\s*=\s*([0-9.]+)V', line)
-                        if match_threshold:
-                            threshold_voltage = float(match_threshold.group(1))
-                        
-                        # Detect Detailed Report section
-                        if 'Detailed Report' in line:
-                            in_detailed_section = True
-                            continue
-                        
-                        # Pattern 5: Extract first switch from Detailed Report section
-                        # Format: ORDER  TURN-ON TIME  PEAK CURRENT  INSTANCES
-                        # Example: 1  7.33883e-10  0.0134068  cdns_lp6_x48_ew_phy_top_SW_MODULE/PSW_18497:NSLEEPIN
-                        if in_detailed_section and first_switch_instance is None:
-                            # Skip header lines and lines with "ORDER" keyword
-                            if 'ORDER' in line or 'TURN-ON' in line or line.strip() == '':
-                                continue
-                            # Try to match data line: ORDER(int) followed by time, current, instance
-                            match_first = re.search(r'^\s*(\d+)\s+([0-9.eE+-]+)\s+[0-9.eE+-]+\s+(.+)$', line)
-                            if match_first:
-                                first_switch_instance = match_first.group(3).strip()
-                                first_switch_time = float(match_first.group(2))
-                                first_switch_line = line_num
+                report = read_powerup_report(file_path, cache_dir=self.cache_dir)
             except Exception as e:
                 errors.append(f"Error parsing {file_path}: {str(e)}")
+                continue
+            
+            if report.rush_current is not None:
+                rush_current = report.rush_current
+                rush_current_line = report.line_numbers['rush_current']
+            if report.wake_up_time is not None:
+                wake_up_time = report.wake_up_time
+                wake_up_time_line = report.line_numbers['wake_up_time']
+            if report.switches_turned_on is not None:
+                switches_turned_on = report.switches_turned_on
+                total_switches = report.total_switches
+                switches_line = report.line_numbers['switches']
+            if report.last_switch_instance is not None:
+                last_switch_instance = report.last_switch_instance
+                last_switch_time = report.last_switch_time
+                last_switch_line = report.line_numbers['last_switch']
+            if report.simulation_time is not None:
+                simulation_time = report.simulation_time
+            if report.threshold_voltage is not None:
+                threshold_voltage = report.threshold_voltage
+            
+            # First switch of the Detailed Report (ORDER TURN-ON TIME PEAK CURRENT INSTANCES)
+            first_switch = report.switches.first()
+            if first_switch_instance is None and first_switch is not None:
+                first_switch_instance = first_switch['instance']
+                first_switch_time = first_switch['turn_on_time']
+                first_switch_line = first_switch['line_number']
         
         # Store parsed metrics
         self._rush_current = rush_current
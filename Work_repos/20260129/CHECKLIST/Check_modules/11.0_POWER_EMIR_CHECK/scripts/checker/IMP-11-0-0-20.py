@@ -47,6 +47,7 @@ if str(_COMMON_DIR) not in sys.path:
 
 from base_checker import BaseChecker, CheckResult, ConfigurationError
 from output_formatter import DetailItem, Severity, create_check_result
+from voltus_reader import read_powerup_report
 
 # MANDATORY: Import template mixins (checker_templates v1.1.0)
 from checker_templates.waiver_handler_template import WaiverHandlerMixin
@@ -207,70 +208,43 @@ class Check_11_0_0_20(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         # 3. Parse each input file for wake-up time information
         for file_path in valid_files:
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    in_summary_section = False
-                    
-                    for line_num, line in enumerate(f, 1):
-                        # Detect summary section
-                        if 'Summary' in line and not in_summary_section:
-                            in_summary_section = True
-                            continue
-                        
-                        if 'Detailed Report' in line:
-                            in_summary_section = False
-                            continue
-                        
-                        # Only parse summary section
-                        if not in_summary_section:
-                            continue
-                        
-                        # Pattern 1: Extract measured wake-up time
-                        match_wake_up = re.search(r'Measured wake-up time for switched net\s*=\s*([0-9.eE+-]+)s', line)
-                        if match_wake_up:
-                            wake_up_time = float(match_wake_up.group(1))
-                            wakeup_line_num = line_num  # Save line number for metadata
-                            items.append({
-                                'name': f'wake_up_time_{wake_up_time}s',
-                                'value': wake_up_time,
-                                'line_number': line_num,
-                                'file_path': str(file_path),
-                                'type': 'wake_up_time'
-                            })
-                            continue
-                        
-                        # Pattern 2: Extract power switch activation statistics
-                        match_switches = re.search(r'Number of power switches turned on in this simulation\s*=\s*(\d+)\s*\[of total\s*(\d+)\]', line)
-                        if match_switches:
-                            switches_turned_on = int(match_switches.group(1))
-                            total_switches = int(match_switches.group(2))
-                            switches_line_num = line_num  # Save line number
-                            continue
-                        
-                        # Pattern 3: Extract simulation time
-                        match_sim_time = re.search(r'Simulation time\s*=\s*([0-9.eE+-]+)s', line)
-                        if match_sim_time:
-                            simulation_time = float(match_sim_time.group(1))
-                            continue
-                        
-                        # Pattern 3: Extract threshold voltage
-                        match_threshold = re.search(r'Threshold \(Vt\)\s*=\s*([0-9.]+)V', line)
-                        if match_threshold:
-                            threshold_voltage = float(match_threshold.group(1))
-                            continue
-                        
-                        # Pattern 4: Extract maximum rush current
-                        match_rush = re.search(r'Measured maximum rush current\s*=\s*([0-9.eE+-]+)A', line)
-                        if match_rush:
-                            rush_current = float(match_rush.group(1))
-                            rush_current_line_num = line_num  # Save line number
-                            continue
-                        
-                        # Pattern 5: Extract last power switch turn-on information
-                        match_last_switch = re.search(r"Last power switch to turn-on in this simulation is '([^']+)' at time ([0-9.eE+-]+)s", line)
-                        if match_last_switch:
-                            last_switch_instance = match_last_switch.group(1)
-                            last_turn_on_time = float(match_last_switch.group(2))
-                            continue
+                # Summary metrics come from the shared Voltus reader (the
+                # report is parsed once per run and cached for IMP-11-0-0-19)
+                report = read_powerup_report(file_path, cache_dir=self.cache_dir)
+                
+                # Pattern 1: Measured wake-up time
+                if report.wake_up_time is not None:
+                    wake_up_time = report.wake_up_time
+                    wakeup_line_num = report.line_numbers['wake_up_time']  # Save line number for metadata
+                    items.append({
+                        'name': f'wake_up_time_{wake_up_time}s',
+                        'value': wake_up_time,
+                        'line_number': wakeup_line_num,
+                        'file_path': str(file_path),
+                        'type': 'wake_up_time'
+                    })
+                
+                # Pattern 2: Power switch activation statistics
+                if report.switches_turned_on is not None:
+                    switches_turned_on = report.switches_turned_on
+                    total_switches = report.total_switches
+                    switches_line_num = report.line_numbers['switches']
+                
+                # Pattern 3: Simulation time / threshold voltage
+                if report.simulation_time is not None:
+                    simulation_time = report.simulation_time
+                if report.threshold_voltage is not None:
+                    threshold_voltage = report.threshold_voltage
+                
+                # Pattern 4: Maximum rush current
+                if report.rush_current is not None:
+                    rush_current = report.rush_current
+                    rush_current_line_num = report.line_numbers['rush_current']
+                
+                # Pattern 5: Last power switch turn-on information
+                if report.last_switch_instance is not None:
+                    last_switch_instance = report.last_switch_instance
+                    last_turn_on_time = report.last_switch_time
                 
                 # Validate critical data was found
                 if wake_up_time is None:
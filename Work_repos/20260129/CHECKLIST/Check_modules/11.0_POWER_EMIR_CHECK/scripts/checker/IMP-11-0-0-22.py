@@ -32,7 +32,6 @@
 ################################################################################
 
 from pathlib import Path
-import re
 import sys
 from typing import List, Dict, Tuple, Optional, Any
 
@@ -46,6 +45,7 @@ if str(_COMMON_DIR) not in sys.path:
 
 from base_checker import BaseChecker, CheckResult, ConfigurationError
 from output_formatter import DetailItem, Severity, create_check_result
+from voltus_reader import read_voltus_log
 
 # MANDATORY: Import template mixins (checker_templates v1.1.0)
 from checker_templates.waiver_handler_template import WaiverHandlerMixin
@@ -189,75 +189,36 @@ class Check_11_0_0_22(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         clean_files = {}
         files_with_errors = set()
         
-        # Define ERROR patterns (priority order)
-        # FIXED: Match all ERROR lines, including those with numbers before them
-        error_patterns = [
-            # Pattern 1: **ERROR: (ERROR_CODE): message
-            (r'\*\*ERROR:\s*\(([A-Z_]+-\d+)\):\s*(.+)', 'coded_error'),
-            # Pattern 2: Generic ERROR: message (anywhere in line)
-            (r'ERROR:\s+(.+)$', 'generic_error'),
-        ]
-        
-        # Define WARNING patterns (for statistics only)
-        warning_patterns = [
-            r'\*\*WARN:\s*\(([A-Z_]+-\d+)\):\s*(.+)',
-            r'WARNING\s+\(([A-Z_]+-\d+)\):\s*(.+)'
-        ]
-        
-        # 3. Parse each input file for ERROR messages
+        # 3. Read each log through the shared Voltus reader. ERROR lines match
+        #    '**ERROR: (ERROR_CODE): message' first, then 'ERROR: message';
+        #    '**WARN:' / 'WARNING (CODE):' lines are counted for statistics.
         for file_path in valid_files:
-            file_has_errors = False
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line_num, line in enumerate(f, 1):
-                        line_stripped = line.strip()
-                        
-                        # Check for ERROR patterns
-                        error_matched = False
-                        for pattern, pattern_type in error_patterns:
-                            match = re.search(pattern, line_stripped)
-                            if match:
-                                error_matched = True
-                                error_count += 1
-                                file_has_errors = True
-                                files_with_errors.add(str(file_path))
-                                
-                                # Extract error details based on pattern type
-                                if pattern_type == 'coded_error':
-                                    error_code = match.group(1)
-                                    error_message = match.group(2).strip()
-                                elif pattern_type == 'generic_error':
-                                    error_code = None
-                                    error_message = match.group(1).strip()
-                                else:  # case_insensitive_error
-                                    error_code = None
-                                    error_message = match.group(1).strip()
-                                
-                                # Build item name with full context
-                                if error_code:
-                                    item_name = f"[{file_path.name}:{line_num}] ERROR ({error_code}): {error_message}"
-                                else:
-                                    item_name = f"[{file_path.name}:{line_num}] ERROR: {error_message}"
-                                
-                                items.append({
-                                    'name': item_name,
-                                    'line_number': line_num,
-                                    'file_path': str(file_path),
-                                    'error_code': error_code,
-                                    'error_message': error_message,
-                                    'type': 'error'
-                                })
-                                break  # Stop after first match
-                        
-                        # If no ERROR matched, check for WARNING patterns (statistics only)
-                        if not error_matched:
-                            for pattern in warning_patterns:
-                                if re.search(pattern, line_stripped):
-                                    warning_count += 1
-                                    break
-                        
+                log = read_voltus_log(file_path, cache_dir=self.cache_dir)
             except Exception as e:
                 errors.append(f"Error parsing {file_path}: {str(e)}")
+                continue
+            
+            warning_count += log.warning_count
+            error_count += len(log.errors)
+            if log.errors:
+                files_with_errors.add(str(file_path))
+            
+            for msg in log.errors:
+                # Build item name with full context
+                if msg.code:
+                    item_name = f"[{file_path.name}:{msg.line_number}] ERROR ({msg.code}): {msg.text}"
+                else:
+                    item_name = f"[{file_path.name}:{msg.line_number}] ERROR: {msg.text}"
+                
+                items.append({
+                    'name': item_name,
+                    'line_number': msg.line_number,
+                    'file_path': str(file_path),
+                    'error_code': msg.code,
+                    'error_message': msg.text,
+                    'type': 'error'
+                })
         
         # 4. Build clean_files dict (files with no ERROR messages)
         for file_path in valid_files:
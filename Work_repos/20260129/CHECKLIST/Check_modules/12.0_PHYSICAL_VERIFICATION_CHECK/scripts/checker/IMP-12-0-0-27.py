@@ -5,9 +5,11 @@
 #   Confirm Package to Chip comparison passes (bump excel vs bump location in gds/oas)?
 #
 # Logic:
-#   - Parse tv_chip_gds_bump.csv to extract bump names and coordinates
+#   - Load tv_chip_gds_bump.csv (or an Excel bump table) into a columnar BumpTable
 #   - Extract bump location data (name, center_x, center_y, width, height)
 #   - Verify bump existence and coordinate consistency against package requirements
+#     using common/bump_map (name + spatial grid index, coordinate tolerance,
+#     matched / moved / renamed / missing classification)
 #   - Support waiver for specific bumps (DUMMY_*, PAD_NJ_*)
 #
 # Auto Type Detection:
@@ -32,7 +34,6 @@
 ################################################################################
 
 from pathlib import Path
-import re
 import sys
 from typing import List, Dict, Tuple, Optional, Any
 
@@ -46,6 +47,7 @@ if str(_COMMON_DIR) not in sys.path:
 
 from base_checker import BaseChecker, CheckResult, ConfigurationError
 from output_formatter import DetailItem, Severity, create_check_result
+from bump_map import BumpTable, compare_bump_maps, load_bump_table
 
 # MANDATORY: Import template mixins (checker_templates v1.1.0)
 from checker_templates.waiver_handler_template import WaiverHandlerMixin
@@ -113,6 +115,8 @@ class Check_12_0_0_27(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         self._parsed_items: List[Dict[str, Any]] = []
         self._metadata: Dict[str, str] = {}
         self._bump_locations: Dict[str, Dict[str, Any]] = {}
+        self._bump_table: Optional[BumpTable] = None
+        self._parsed_data: Optional[Dict[str, Any]] = None
     
     # =========================================================================
     # Main Check Execution
@@ -179,97 +183,51 @@ class Check_12_0_0_27(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         if not valid_files or len(valid_files) == 0:
             raise ConfigurationError("No valid input files found")
         
-        # 2. Initialize parsing structures
-        items = []
-        metadata = {}
+        if self._parsed_data is not None:
+            return self._parsed_data
+
+        # 2. Load each bump table into columnar form (CSV or Excel)
+        tables = []
         errors = []
-        bump_locations = {}
-        
-        # Coordinate range tracking
-        min_x = float('inf')
-        max_x = float('-inf')
-        min_y = float('inf')
-        max_y = float('-inf')
-        
-        # 3. Parse each input file for bump location information
-        # Pattern: Bump_ID,Name,Center_X,Center_Y,Width,Height,Area,Text_Distance
-        bump_pattern = re.compile(r'^(\d+),([^,]+),(\d+\.\d+),(\d+\.\d+),(\d+\.\d+),(\d+\.\d+),(\d+\.\d+),(\d+\.\d+)$')
-        
         for file_path in valid_files:
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line_num, line in enumerate(f, 1):
-                        line = line.strip()
-                        
-                        # Skip header line
-                        if line_num == 1 and 'Bump_ID' in line:
-                            continue
-                        
-                        # Skip empty lines
-                        if not line:
-                            continue
-                        
-                        # Match bump entry pattern
-                        match = bump_pattern.match(line)
-                        if match:
-                            bump_id = match.group(1)
-                            bump_name = match.group(2)
-                            center_x = float(match.group(3))
-                            center_y = float(match.group(4))
-                            width = float(match.group(5))
-                            height = float(match.group(6))
-                            area = float(match.group(7))
-                            text_distance = float(match.group(8))
-                            
-                            # Track coordinate ranges
-                            min_x = min(min_x, center_x)
-                            max_x = max(max_x, center_x)
-                            min_y = min(min_y, center_y)
-                            max_y = max(max_y, center_y)
-                            
-                            # Store bump location data
-                            bump_data = {
-                                'name': bump_name,
-                                'bump_id': bump_id,
-                                'center_x': center_x,
-                                'center_y': center_y,
-                                'width': width,
-                                'height': height,
-                                'area': area,
-                                'text_distance': text_distance,
-                                'line_number': line_num,
-                                'file_path': str(file_path),
-                                'type': self._classify_bump_type(bump_name)
-                            }
-                            
-                            items.append(bump_data)
-                            bump_locations[bump_name] = bump_data
-                        else:
-                            # Only log non-header lines that don't match
-                            if 'Bump_ID' not in line:
-                                errors.append(f"Line {line_num} in {file_path}: Invalid format - {line[:50]}")
+                table, file_errors = load_bump_table(file_path)
+                tables.append(table)
+                errors.extend(file_errors)
             except Exception as e:
                 errors.append(f"Error parsing {file_path}: {str(e)}")
-        
+        bump_table = BumpTable.concat(tables)
+
+        # 3. Expand rows for per-bump reporting
+        items = []
+        bump_locations = {}
+        for bump_data in bump_table.iter_rows():
+            bump_data['type'] = self._classify_bump_type(bump_data['name'])
+            items.append(bump_data)
+            bump_locations[bump_data['name']] = bump_data
+
         # 4. Store frequently reused data on self
         self._parsed_items = items
         self._bump_locations = bump_locations
-        
+        self._bump_table = bump_table
+
         # Store metadata
+        min_x, max_x, min_y, max_y = bump_table.bbox()
         metadata = {
             'total_bumps': len(items),
-            'min_x': min_x if min_x != float('inf') else 0,
-            'max_x': max_x if max_x != float('-inf') else 0,
-            'min_y': min_y if min_y != float('inf') else 0,
-            'max_y': max_y if max_y != float('-inf') else 0
+            'min_x': min_x,
+            'max_x': max_x,
+            'min_y': min_y,
+            'max_y': max_y
         }
         self._metadata = metadata
-        
-        return {
+
+        self._parsed_data = {
             'items': items,
             'metadata': metadata,
             'errors': errors
         }
+        return self._parsed_data
     # Helper Methods (Optional - Add as needed)
     
 
@@ -339,8 +297,8 @@ class Check_12_0_0_27(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
                 error_key = f"parse_error_{len(violations)}"
                 violations[error_key] = {
                     'line_number': 0,
-                    'file_path': error.get('file_path', 'N/A'),
-                    'reason': error.get('message', 'Unknown parsing error')
+                    'file_path': 'N/A',
+                    'reason': str(error)
                 }
 
         # If no items found, this is a critical violation
@@ -534,8 +492,7 @@ class Check_12_0_0_27(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
             - found_items: {bump_spec: {'line_number': ..., 'file_path': ...}}
             - missing_items: {bump_spec: {'line_number': ..., 'file_path': ..., 'reason': ...}}
         """
-        data = self._parse_input_files()
-        items = data.get('items', [])
+        self._parse_input_files()
 
         requirements = self.item_data.get('requirements', {})
         pattern_items = requirements.get('pattern_items', [])
@@ -546,6 +503,8 @@ class Check_12_0_0_27(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
         # Each pattern_item can be in two formats:
         # 1. String: "BUMP_NAME: X_COORD Y_COORD"
         # 2. Dict: {'BUMP_NAME': 'X_COORD Y_COORD'}
+        expected_records = []
+        expected_patterns = []  # pattern_str per expected record (same order)
         for pattern in pattern_items:
             # Handle dict format (YAML parses "- VSS: 90.0 123.4" as dict)
             if isinstance(pattern, dict):
@@ -560,8 +519,6 @@ class Check_12_0_0_27(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
             else:
                 # Skip unsupported types
                 continue
-            
-            matched = False
 
             # Parse pattern to extract bump name and expected coordinates
             pattern_parts = pattern_str.split(':', 1)
@@ -575,7 +532,7 @@ class Check_12_0_0_27(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
 
             expected_bump_name = pattern_parts[0].strip()
             expected_coords = pattern_parts[1].strip()
-            
+
             # Parse expected coordinates
             try:
                 expected_coords_parts = expected_coords.split()
@@ -596,75 +553,52 @@ class Check_12_0_0_27(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMix
                 }
                 continue
 
-            # Search for matching bump in parsed items
-            # Need to check ALL bumps with matching name to find coordinate match
-            found_match = False
-            for item in items:
-                item_bump_name = item.get('name', '')
-                item_center_x = item.get('center_x', '')
-                item_center_y = item.get('center_y', '')
-
-                # EXACT MATCH for bump name (case-insensitive)
-                if expected_bump_name.lower() == item_bump_name.lower():
-                    # Parse item coordinates
-                    try:
-                        item_x = float(item_center_x)
-                        item_y = float(item_center_y)
-                    except (ValueError, TypeError):
-                        continue
-                    
-                    # EXACT numeric comparison (no tolerance)
-                    if item_x == expected_x and item_y == expected_y:
-                        # Bump found with exact matching coordinates
-                        found_items[pattern_str] = {
-                            'line_number': item.get('line_number', 0),
-                            'file_path': item.get('file_path', 'N/A'),
-                            'reason': f'Bump {expected_bump_name} found at ({item_x}, {item_y}) matching requirement ({expected_x}, {expected_y})'
-                        }
-                        found_match = True
-                        matched = True
-                        break
-
-            if not found_match and not matched:
-                # Bump with exact coordinates not found in GDS extraction
-                # Try to find bump with same name but different coordinates (for reference)
-                closest_coords = None
-                closest_distance = float('inf')
-                closest_line = 0
-                actual_file = 'tv_chip_gds_bump.csv'
-                
-                for item in items:
-                    item_bump_name = item.get('name', '')
-                    if expected_bump_name.lower() == item_bump_name.lower():
-                        try:
-                            item_x = float(item.get('center_x', ''))
-                            item_y = float(item.get('center_y', ''))
-                            # Calculate Euclidean distance
-                            distance = ((item_x - expected_x) ** 2 + (item_y - expected_y) ** 2) ** 0.5
-                            if distance < closest_distance:
-                                closest_coords = (item_x, item_y)
-                                closest_distance = distance
-                                closest_line = item.get('line_number', 0)
-                                actual_file = item.get('file_path', 'tv_chip_gds_bump.csv')
-                        except (ValueError, TypeError):
-                            continue
-                
-                # Construct detailed key and reason
-                if closest_coords:
-                    # Found bump with same name but different coordinates
-                    # Show the closest match for reference
-                    detail_key = f'{expected_bump_name}: {closest_coords[0]} {closest_coords[1]} (expected: {expected_x} {expected_y})'
-                    reason = 'Bump location mismatch - coordinates differ from package requirements'
-                else:
-                    # Bump completely missing from GDS extraction
-                    detail_key = f'{expected_bump_name}: missing in GDS extraction'
-                    reason = 'Bump not found in GDS extraction report'
-                    closest_line = 0  # N/A for missing bumps
-                
-                missing_items[detail_key] = {
-                    'line_number': closest_line,
-                    'file_path': actual_file,
-                    'reason': reason
+            expected_records.append({
+                'name': expected_bump_name,
+                'x': expected_x,
+                'y': expected_y
+            })
+            expected_patterns.append(pattern_str)
+
+        # Compare against extracted bumps: name index + spatial grid, one-to-one,
+        # within CHECKLIST_BUMP_TOLERANCE (replaces per-pattern scans of all bumps).
+        # diff.extra is not reported: pattern_items list only the bumps under
+        # requirement, so the remaining extracted bumps are not violations.
+        actual = self._bump_table
+        diff = compare_bump_maps(BumpTable.from_records(expected_records), actual)
+
+        for match in diff.results:
+            pattern_str = expected_patterns[match.expected_row]
+            expected_x, expected_y = match.expected_xy
+            if match.status == 'matched':
+                item_x, item_y = match.actual_xy
+                found_items[pattern_str] = {
+                    'line_number': int(actual.line_numbers[match.actual_row]),
+                    'file_path': actual.file_paths[match.actual_row],
+                    'reason': f'Bump {match.name} found at ({item_x}, {item_y}) matching requirement ({expected_x}, {expected_y})'
+                }
+            elif match.status == 'moved':
+                # Same bump name at a different location (closest unclaimed one)
+                item_x, item_y = match.actual_xy
+                missing_items[f'{match.name}: {item_x} {item_y} (expected: {expected_x} {expected_y})'] = {
+                    'line_number': int(actual.line_numbers[match.actual_row]),
+                    'file_path': actual.file_paths[match.actual_row],
+                    'reason': 'Bump location mismatch - coordinates differ from package requirements'
+                }
+            elif match.status == 'renamed':
+                # No bump of this name anywhere, but another bump sits at the expected
+                # location: same detail key as a missing bump, the reason names the other bump
+                missing_items[f'{match.name}: missing in GDS extraction'] = {
+                    'line_number': int(actual.line_numbers[match.actual_row]),
+                    'file_path': actual.file_paths[match.actual_row],
+                    'reason': f'Bump not found in GDS extraction report - {match.actual_name} found at the expected location ({expected_x}, {expected_y})'
+                }
+            else:
+                # Bump completely missing from GDS extraction
+                missing_items[f'{match.name}: missing in GDS extraction'] = {
+                    'line_number': 0,
+                    'file_path': 'tv_chip_gds_bump.csv',
+                    'reason': 'Bump not found in GDS extraction report'
                 }
 
         return found_items, missing_items
@@ -5,10 +5,11 @@
 #   Confirm no assign in release netlist.
 #
 # Logic:
-#   - TODO: Parse [input_file_name] to extract [specific_data/patterns]
-#   - TODO: Extract [metadata/settings/constraints] from parsed content
-#   - TODO: Verify [condition/existence/consistency] against [requirements/expected_values]
-#   - TODO: [Optional] Support waiver for [specific_cases]
+#   - Stream release netlist(s) (plain or gzip Verilog) with common/netlist_scanner
+#   - Collect every continuous assign statement (module, lhs, rhs, line number)
+#   - Type 1/4: any assign in any module is a violation
+#   - Type 2/3: pattern_items are module names; only those modules are checked
+#   - Support waiver by assign name "<module>/<lhs>" (wildcards allowed)
 #
 # Auto Type Detection:
 #   Type 1: requirements.value=N/A, pattern_items [] (empty), waivers.value=N/A/0 → Boolean Check
@@ -32,7 +33,6 @@
 ################################################################################
 
 from pathlib import Path
-import re
 import sys
 from typing import List, Dict, Tuple, Optional, Any
 
@@ -46,6 +46,7 @@ if str(_COMMON_DIR) not in sys.path:
 
 from base_checker import BaseChecker, CheckResult, ConfigurationError
 from output_formatter import DetailItem, Severity, create_check_result
+from netlist_scanner import scan_netlists
 
 # MANDATORY: Import template mixins (checker_templates v1.1.0)
 from checker_templates.waiver_handler_template import WaiverHandlerMixin
@@ -57,19 +58,44 @@ from checker_templates.input_file_parser_template import InputFileParserMixin  #
 class Check_8_0_0_24(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMixin, BaseChecker):
     """
     IMP-8-0-0-24: Confirm no assign in release netlist.
-    
+
     Checking Types:
     - Type 1: requirements=N/A, pattern_items [], waivers=N/A/0 → Boolean Check
     - Type 2: requirements>0, pattern_items [...], waivers=N/A/0 → Value Check
     - Type 3: requirements>0, pattern_items [...], waivers>0 → Value Check with Waiver Logic
     - Type 4: requirements=N/A, pattern_items [], waivers>0 → Boolean Check with Waiver Logic
-    
+
     Template Library v1.1.0:
-    - Uses InputFileParserMixin for parsing (parse_log_with_patterns, normalize_command)
+    - Uses netlist_scanner.scan_netlists for single-pass netlist parsing
     - Uses WaiverHandlerMixin for waiver processing (parse_waive_items(waive_items_raw), match_waiver_entry(item, waive_dict))
     - Uses OutputBuilderMixin for result construction (build_complete_output(...))
     """
-    
+
+    # =========================================================================
+    # DESCRIPTION & REASON CONSTANTS - Split by Type semantics (API-026)
+    # =========================================================================
+    # Type 1/4: Boolean checks
+    FOUND_DESC_TYPE1_4 = "No assign statements found in release netlist"
+    MISSING_DESC_TYPE1_4 = "Assign statements found in release netlist"
+    FOUND_REASON_TYPE1_4 = "No assign statement found - netlist is assign-free"
+    MISSING_REASON_TYPE1_4 = "Assign statement found in release netlist"
+
+    # Type 2/3: Pattern checks (pattern_items = modules to check)
+    FOUND_DESC_TYPE2_3 = "Monitored modules have no assign statements"
+    MISSING_DESC_TYPE2_3 = "Assign statements found in monitored modules"
+    FOUND_REASON_TYPE2_3 = "Module checked - no assign statement found"
+    MISSING_REASON_TYPE2_3 = "Assign statement found in monitored module"
+
+    # All Types (waiver description unified)
+    WAIVED_DESC = "Assign statements waived per design approval"
+
+    # Waiver parameters (Type 3/4 ONLY)
+    WAIVED_BASE_REASON = "Assign statement waived - approved exception"
+
+    # Unused waivers (Type 3/4 ONLY)
+    UNUSED_DESC = "Unused waiver entries - no matching assign statement found"
+    UNUSED_WAIVER_REASON = "Waiver entry not matched - corresponding assign statement not found in netlist"
+
     def __init__(self):
         """Initialize the checker."""
         super().__init__(
@@ -77,28 +103,27 @@ class Check_8_0_0_24(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMixi
             item_id="IMP-8-0-0-24",
             item_desc="Confirm no assign in release netlist."
         )
-        # TODO: Add custom member variables for parsed data
-        # Example: self._parsed_data: Dict[str, Any] = {}
-        # Example: self._metadata: Dict[str, str] = {}
-    
+        # Parsed data cache (netlists are large; scan once per run)
+        self._parsed_data: Optional[Dict[str, Any]] = None
+
     # =========================================================================
     # Main Check Execution
     # =========================================================================
-    
+
     def execute_check(self) -> CheckResult:
         """
         Execute check with automatic type detection and delegation.
-        
+
         Returns:
             CheckResult based on detected checker type
         """
         try:
             if self.root is None:
                 raise RuntimeError("Checker not initialized. Call init_checker() first.")
-            
+
             # Detect checker type (use BaseChecker method)
             checker_type = self.detect_checker_type()
-            
+
             # Execute based on type
             if checker_type == 1:
                 return self._execute_type1()
@@ -110,281 +135,285 @@ class Check_8_0_0_24(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMixi
                 return self._execute_type4()
         except ConfigurationError as e:
             return e.check_result
-    
+
     # =========================================================================
     # Input Parsing (Common for All Types)
     # =========================================================================
-    
+
     def _parse_input_files(self) -> Dict[str, Any]:
         """
-        Parse input files to extract relevant data.
-        
-        TODO: Implement specific parsing logic based on input file format
-        
-        RECOMMENDED: Use InputFileParserMixin helper methods:
-        - parse_log_with_patterns(file, patterns) - Pattern matching (7 modes)
-        - extract_file_references(file, extensions) - File reference extraction
-        - normalize_command(cmd) - Command normalization for matching
-        
+        Scan release netlist(s) for continuous assign statements.
+
+        The netlists are streamed once through NetlistScanner (memory-mapped,
+        gzip aware); only assign and module events are kept.
+
         Returns:
-            Dict with parsed data, typically includes:
-            - 'items': List[Dict] - Main items to check (with metadata: line_number, file_path)
-            - 'metadata': Dict - File metadata (tool version, date, design name, etc.)
+            Dict with parsed data:
+            - 'items': List[Dict] - One entry per assign (name, module, lhs, rhs, line_number, file_path)
+            - 'modules': Dict[str, Dict] - Module name -> first definition location
+            - 'metadata': Dict - Scan statistics (event counts)
             - 'errors': List - Any parsing errors encountered
-            - 'warnings': List - Any parsing warnings
-        
-        Example using template helpers:
-            valid_files = self.validate_input_files()
-            if missing_files:
-                raise ConfigurationError(
-                    self.create_missing_files_error(missing_files)
-                )
-            
-            items = []
-            for file_path in valid_files:
-                lines = self.read_file(file_path)
-                for line_num, line in enumerate(lines, 1):
-                    # Pattern matching example
-                    match = re.search(r'ERROR:\s+(.+)', line)
-                    if match:
-                        items.append({
-                            'name': match.group(1),
-                            'line_number': line_num,
-                            'file_path': str(file_path),
-                            'line_content': line.strip()
-                        })
-            
-            return {
-                'items': items,
-                'metadata': {},
-                'errors': []
-            }
         """
-        # 1. Validate input files (raises ConfigurationError if missing)
-        valid_files = self.validate_input_files()
+        if self._parsed_data is not None:
+            return self._parsed_data
+
+        # 1. Validate input files - returns tuple (valid_files_list, missing_files_list)
+        valid_files, missing_files = self.validate_input_files()
+
+        if missing_files:
+            raise ConfigurationError(
+                self.create_missing_files_error(missing_files)
+            )
+
         if not valid_files:
-            raise ConfigurationError("No valid input files found")
-        
-        # TODO: Implement your parsing logic here
-        # Template structure
-        items = []
-        metadata = {}
-        errors = []
-        
-        # 2. Option A: Use parse_log_with_patterns (recommended)
-        # patterns = {
-        #     'error_pattern': r'\*\*ERROR:\s*\(([A-Z]+-\d+)\)',
-        #     'warning_pattern': r'\*\*WARNING:\s*(.+)'
-        # }
-        # for file_path in valid_files:
-        #     result = self.parse_log_with_patterns(file_path, patterns)
-        #     items.extend(result.get('error_pattern', []))
-        
-        # 2. Option B: Manual parsing with normalization
-        for file_path in valid_files:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line_num, line in enumerate(f, 1):
-                    # TODO: Add your pattern matching logic
-                    # match = re.search(r'YOUR_PATTERN', line)
-                    # if match:
-                    #     items.append({
-                    #         'name': match.group(1),
-                    #         'line_number': line_num,
-                    #         'file_path': str(file_path)
-                    #     })
-                    pass
-        
-        # 3. Store frequently reused data on self
-        self._parsed_items = items
-        
-        return {
+            raise ConfigurationError(
+                self.create_missing_files_error(["No input files configured"])
+            )
+
+        # 2. Single streaming pass over all netlists
+        items: List[Dict[str, Any]] = []
+        modules: Dict[str, Dict[str, Any]] = {}
+        errors: List[str] = []
+
+        def on_assign(event):
+            items.append({
+                'name': f"{event.module}/{event.lhs}",
+                'module': event.module,
+                'lhs': event.lhs,
+                'rhs': event.rhs,
+                'line_number': event.line_number,
+                'file_path': event.file_path
+            })
+
+        def on_module(event):
+            modules.setdefault(event.name, {
+                'name': event.name,
+                'line_number': event.line_number,
+                'file_path': event.file_path
+            })
+
+        counts: Dict[str, int] = {}
+        try:
+            counts = scan_netlists(valid_files, {'assign': [on_assign], 'module': [on_module]})
+        except (OSError, EOFError) as e:
+            errors.append(f"Failed to read netlist: {e}")
+
+        self._parsed_data = {
             'items': items,
-            'metadata': metadata,
+            'modules': modules,
+            'metadata': {'counts': counts},
             'errors': errors
         }
-    
+        return self._parsed_data
+
+    def _build_violation(self, item: Dict[str, Any], reason: str) -> Dict[str, Any]:
+        """Build one violation entry for an assign statement."""
+        return {
+            'name': item['name'],
+            'line_number': item['line_number'],
+            'file_path': item['file_path'],
+            'reason': f"{reason}: assign {item['lhs']} = {item['rhs']}"
+        }
+
+    def _split_by_waiver(self, violations: Dict[str, Dict]) -> Tuple[Dict, Dict, Dict, List[str]]:
+        """
+        Split violations into waived/unwaived using waive_items.
+
+        Returns:
+            Tuple of (waived_items, unwaived_items, waive_dict, unused_waivers)
+        """
+        waivers = self.get_waivers()
+        waive_items_raw = waivers.get('waive_items', [])
+        waive_dict = self.parse_waive_items(waive_items_raw)
+
+        waived_items = {}
+        unwaived_items = {}
+        used_waivers = set()
+        for viol_name, viol_data in violations.items():
+            matched_waiver = self.match_waiver_entry(viol_name, waive_dict)
+            if matched_waiver:
+                waived_items[viol_name] = viol_data
+                used_waivers.add(matched_waiver)
+            else:
+                unwaived_items[viol_name] = viol_data
+
+        unused_waivers = [w for w in waive_dict.keys() if w not in used_waivers]
+        return waived_items, unwaived_items, waive_dict, unused_waivers
+
     # =========================================================================
     # Type 1: Boolean Check
     # =========================================================================
-    
+
     def _execute_type1(self) -> CheckResult:
         """
-        Type 1: Boolean Check.
-        
-        Custom boolean validation (file exists? config valid?).
-        Does NOT use pattern_items for searching.
-        
-        Use OutputBuilderMixin.build_complete_output() for automatic formatting.
-        
-        Returns:
-            CheckResult with is_pass based on check logic
+        Type 1: Boolean check without waiver support.
+
+        PASS if the netlist contains no assign statement, FAIL otherwise.
         """
-        # Parse input
-        data = self._parse_input_files()
-        items = data.get('items', [])
-        
-        # TODO: Implement your check logic
-        # Example: Check if certain items exist
-        found_items = items if len(items) > 0 else []
-        missing_items = [] if len(items) > 0 else ['Expected item']
-        
-        # Use template helper for automatic output formatting
+        found_items, violations = self._type1_core_logic()
+
         return self.build_complete_output(
             found_items=found_items,
-            missing_items=missing_items,
-            item_desc=self.item_desc
+            missing_items=violations,
+            found_desc=self.FOUND_DESC_TYPE1_4,
+            missing_desc=self.MISSING_DESC_TYPE1_4,
+            found_reason=self.FOUND_REASON_TYPE1_4,
+            missing_reason=self.MISSING_REASON_TYPE1_4
         )
-    
+
+    def _type1_core_logic(self) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+        """
+        Core Type 1 boolean check logic (shared by Type 1 and Type 4).
+
+        Returns:
+            Tuple of (found_items, violations)
+            - found_items: netlist files without assigns (only when clean)
+            - violations: {'<module>/<lhs>': {'name', 'line_number', 'file_path', 'reason'}}
+        """
+        data = self._parse_input_files()
+        items = data.get('items', [])
+        errors = data.get('errors', [])
+
+        violations = {}
+        if errors:
+            violations['parsing_error'] = {
+                'name': 'parsing_error',
+                'line_number': 0,
+                'file_path': 'N/A',
+                'reason': f"Netlist parsing failed: {'; '.join(errors)}"
+            }
+            return {}, violations
+
+        for item in items:
+            violations[item['name']] = self._build_violation(item, self.MISSING_REASON_TYPE1_4)
+
+        found_items = {}
+        if not violations:
+            valid_files, _ = self.validate_input_files()
+            for file_path in valid_files:
+                found_items[file_path.name] = {
+                    'name': file_path.name,
+                    'line_number': 0,
+                    'file_path': str(file_path)
+                }
+        return found_items, violations
+
     # =========================================================================
     # Type 2: Value Check
     # =========================================================================
-    
+
     def _execute_type2(self) -> CheckResult:
+        """Type 2: Check only the modules listed in pattern_items."""
+        found_items, violations = self._type2_core_logic()
+
+        return self.build_complete_output(
+            found_items=found_items,
+            missing_items=violations,
+            found_desc=self.FOUND_DESC_TYPE2_3,
+            missing_desc=self.MISSING_DESC_TYPE2_3,
+            found_reason=self.FOUND_REASON_TYPE2_3,
+            missing_reason=self.MISSING_REASON_TYPE2_3
+        )
+
+    def _type2_core_logic(self) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
         """
-        Type 2: Value Check.
-        
-        Search pattern_items in input files.
-        found_items = patterns found; missing_items = patterns not found.
-        PASS/FAIL depends on check purpose (violation check vs requirement check).
-        
-        Template auto-handles waiver=0 conversions.
-        
+        Core Type 2 pattern logic (shared by Type 2 and Type 3).
+
+        pattern_items are module names (wildcards allowed). A monitored module
+        without assigns is a found item; each assign inside a monitored module
+        is a violation. Patterns that match no module are reported as missing.
+
         Returns:
-            CheckResult with is_pass based on value comparison
+            Tuple of (found_items, violations)
         """
-        # Parse input
         data = self._parse_input_files()
         items = data.get('items', [])
-        
-        # Get requirements
-        pattern_items = self.item_data.get('requirements', {}).get('pattern_items', [])
-        
-        # TODO: Implement check logic - compare actual vs expected
-        extra_items = [i for i in items if i not in pattern_items]
-        
-        # Use template helper (auto-handles waiver=0)
-        return self.build_complete_output(
-            found_items=items,
-            extra_items=extra_items,
-            item_desc=self.item_desc
-        )
-    
+        modules = data.get('modules', {})
+
+        requirements = self.item_data.get('requirements', {})
+        pattern_items = requirements.get('pattern_items', []) or []
+        pattern_dict = {str(p): '' for p in pattern_items}
+
+        found_items = {}
+        violations = {}
+
+        # Monitored modules (by pattern)
+        monitored = {}
+        matched_patterns = set()
+        for name, loc in modules.items():
+            pattern = self.match_waiver_entry(name, pattern_dict, allow_substring=False)
+            if pattern:
+                monitored[name] = loc
+                matched_patterns.add(pattern)
+
+        dirty_modules = set()
+        for item in items:
+            if item['module'] in monitored:
+                dirty_modules.add(item['module'])
+                violations[item['name']] = self._build_violation(item, self.MISSING_REASON_TYPE2_3)
+
+        for name, loc in monitored.items():
+            if name not in dirty_modules:
+                found_items[name] = dict(loc)
+
+        for pattern in pattern_dict:
+            if pattern not in matched_patterns:
+                violations[pattern] = {
+                    'name': pattern,
+                    'line_number': 0,
+                    'file_path': 'N/A',
+                    'reason': "Module not found in release netlist"
+                }
+
+        return found_items, violations
+
     # =========================================================================
     # Type 3: Value Check with Waiver Logic
     # =========================================================================
-    
+
     def _execute_type3(self) -> CheckResult:
-        """
-        Type 3: Value check with waiver support.
-        
-        Same pattern search logic as Type 2, plus waiver classification.
-        
-        Uses WaiverHandlerMixin for waiver processing:
-        - parse_waive_items(waive_items_raw): Parse waiver configuration
-        - match_waiver_entry(item, waive_dict): Match item against waivers
-        
-        Uses OutputBuilderMixin for result construction:
-        - build_complete_output(...): Assemble final CheckResult with auto-formatting
-        
-        Returns:
-            CheckResult with FAIL for unwaived, INFO for waived items
-        """
-        # Parse input
-        parsed_data = self._parse_input_files()
-        items = parsed_data.get('items', [])
-        
-        # Parse waiver configuration using template helper
-        waive_items_raw = self.get_waive_items()
-        waive_dict = self.parse_waive_items(waive_items_raw)
-        
-        # TODO: Implement your check logic
-        # Example: Find violations/errors in parsed data
-        violations = []  # List of violation names
-        
-        # Separate waived/unwaived using template helper
-        waived_items = []
-        unwaived_items = []
-        
-        for violation in violations:
-            if self.match_waiver_entry(violation, waive_dict):
-                waived_items.append(violation)
-            else:
-                unwaived_items.append(violation)
-        
-        # Find unused waivers
-        used_names = set(w.get('name') for w in waived_items)
-        unused_waivers = [w for w in waive_dict.values() if w['name'] not in used_names]
-        
-        # Use template helper for automatic output formatting
+        """Type 3: Module pattern check with waiver support (reuses Type 2 core logic)."""
+        found_items, violations = self._type2_core_logic()
+        waived_items, missing_items, waive_dict, unused_waivers = self._split_by_waiver(violations)
+
         return self.build_complete_output(
+            found_items=found_items,
+            missing_items=missing_items,
             waived_items=waived_items,
-            unwaived_items=unwaived_items,
-            waive_dict=waive_dict,
             unused_waivers=unused_waivers,
-            item_desc=self.item_desc
+            waive_dict=waive_dict,
+            found_desc=self.FOUND_DESC_TYPE2_3,
+            missing_desc=self.MISSING_DESC_TYPE2_3,
+            waived_desc=self.WAIVED_DESC,
+            found_reason=self.FOUND_REASON_TYPE2_3,
+            missing_reason=self.MISSING_REASON_TYPE2_3,
+            waived_base_reason=self.WAIVED_BASE_REASON,
+            unused_waiver_reason=self.UNUSED_WAIVER_REASON
         )
-    
+
     # =========================================================================
     # Type 4: Boolean Check with Waiver Logic
     # =========================================================================
-    
+
     def _execute_type4(self) -> CheckResult:
-        """
-        Type 4: Boolean check with waiver support (Type 1 + waiver).
-        
-        Same boolean check as Type 1 (no pattern_items), plus waiver classification.
-        
-        Use OutputBuilderMixin.build_complete_output() with has_waiver_value=True.
-        
-        Returns:
-            CheckResult with waiver logic applied
-        """
-        # Parse input
-        data = self._parse_input_files()
-        items = data.get('items', [])
-        
-        # Parse waiver configuration
-        waive_items_raw = self.get_waive_items()
-        waive_dict = self.parse_waive_items(waive_items_raw)
-        
-        # TODO: Implement boolean check logic
-        # Example: Check if violations exist
-        
-        # Use template helper (auto-handles waiver=0)
+        """Type 4: Boolean check with waiver support (reuses Type 1 core logic)."""
+        found_items, violations = self._type1_core_logic()
+        waived_items, missing_items, waive_dict, unused_waivers = self._split_by_waiver(violations)
+
         return self.build_complete_output(
-            found_items=items,
+            found_items=found_items,
+            missing_items=missing_items,
+            waived_items=waived_items,
+            unused_waivers=unused_waivers,
             waive_dict=waive_dict,
-            has_waiver_value=True,
-            item_desc=self.item_desc
+            found_desc=self.FOUND_DESC_TYPE1_4,
+            missing_desc=self.MISSING_DESC_TYPE1_4,
+            waived_desc=self.WAIVED_DESC,
+            found_reason=self.FOUND_REASON_TYPE1_4,
+            missing_reason=self.MISSING_REASON_TYPE1_4,
+            waived_base_reason=self.WAIVED_BASE_REASON,
+            unused_waiver_reason=self.UNUSED_WAIVER_REASON
         )
-    
-    # =========================================================================
-    # Helper Methods (Optional - Add as needed)
-    # =========================================================================
-    
-    def _matches_waiver(self, item: str, waive_patterns: List[str]) -> bool:
-        """
-        Check if item matches any waiver pattern.
-        
-        TODO: Optional - Implement waiver matching logic
-        
-        Args:
-            item: Item to check
-            waive_patterns: List of waiver patterns
-            
-        Returns:
-            True if item matches any pattern
-        """
-        for pattern in waive_patterns:
-            # Support wildcards
-            if '*' in pattern:
-                regex_pattern = pattern.replace('*', '.*')
-                if re.search(regex_pattern, item, re.IGNORECASE):
-                    return True
-            # Exact match
-            elif pattern.lower() == item.lower():
-                return True
-        return False
 
 
 # =========================================================================
@@ -55,6 +55,98 @@ from checker_templates.output_builder_template import OutputBuilderMixin
 from checker_templates.input_file_parser_template import InputFileParserMixin  # Optional but recommended
 
 
+# =========================================================================
+# Per-file Parsing (module level so it can run in a process pool)
+# =========================================================================
+
+# Pattern 1: NDR LEF file loading confirmation
+_PATTERN_NDR_FILE = re.compile(r'INFO\s+\(EXTGRMP-338\)\s*:\s*(.+/ndr/[^\s]+\.lef)', re.IGNORECASE)
+
+# Pattern 2: Version mismatch warnings for NDR LEF files
+_PATTERN_VERSION_MISMATCH = re.compile(
+    r'WARNING\s+\(EXTGRMP-728\)\s*:\s*Different version number exists for tech lef\s+"([^"]+)"\s+with version\s+([\d.]+)\s+and macro lef\s+"([^"]+)"\s+with version\s+([\d.]+)',
+    re.IGNORECASE
+)
+
+# Pattern 3: General WARNING messages with message codes
+_PATTERN_WARNING = re.compile(r'WARNING\s+\(([A-Z]+-\d+)\)\s*:\s*(.+)', re.IGNORECASE)
+
+
+def _parse_qrc_log(file_path: Path) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Parse one Quantus QRC extraction log for NDR LEF information.
+    
+    Args:
+        file_path: QRC log path (one corner)
+    
+    Returns:
+        Dict with 'ndr_files', 'version_mismatches' and 'other_warnings' lists
+    """
+    ndr_files = []
+    version_mismatches = []
+    other_warnings = []
+    
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        for line_num, line in enumerate(f, 1):
+            # Check for NDR LEF file loading
+            match_ndr = _PATTERN_NDR_FILE.search(line)
+            if match_ndr:
+                ndr_file_path = match_ndr.group(1).strip()
+                ndr_files.append({
+                    'name': ndr_file_path,
+                    'file_path': ndr_file_path,
+                    'line_number': line_num,
+                    'source_file': str(file_path),
+                    'line_content': line.strip()
+                })
+                continue
+            
+            # Check for version mismatch warnings
+            match_version = _PATTERN_VERSION_MISMATCH.search(line)
+            if match_version:
+                tech_lef = match_version.group(1).strip()
+                tech_version = match_version.group(2).strip()
+                macro_lef = match_version.group(3).strip()
+                macro_version = match_version.group(4).strip()
+                
+                # Only track if macro lef is NDR file
+                if '/ndr/' in macro_lef.lower():
+                    version_mismatches.append({
+                        'name': f"{macro_lef} (v{macro_version} vs tech v{tech_version})",
+                        'tech_lef': tech_lef,
+                        'tech_version': tech_version,
+                        'macro_lef': macro_lef,
+                        'macro_version': macro_version,
+                        'line_number': line_num,
+                        'file_path': str(file_path),
+                        'line_content': line.strip()
+                    })
+                continue
+            
+            # Check for other warnings related to NDR files
+            match_warning = _PATTERN_WARNING.search(line)
+            if match_warning and '/ndr/' in line.lower():
+                msg_code = match_warning.group(1).strip()
+                msg_text = match_warning.group(2).strip()
+                
+                # Skip version mismatch warnings (already captured)
+                if msg_code != 'EXTGRMP-728':
+                    other_warnings.append({
+                        'name': f"{msg_code}: {msg_text}",
+                        'code': msg_code,
+                        'message': msg_text,
+                        'line_number': line_num,
+                        'file_path': str(file_path),
+                        'line_content': line.strip()
+                    })
+    
+    return {
+        'ndr_files': ndr_files,
+        'version_mismatches': version_mismatches,
+        'other_warnings': other_warnings
+    }
+
+
 # MANDATORY: Inherit mixins in correct order (InputFileParserMixin first if used)
 class Check_9_0_0_02(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMixin, BaseChecker):
     """
@@ -162,83 +254,15 @@ class Check_9_0_0_02(InputFileParserMixin, OutputBuilderMixin, WaiverHandlerMixi
         if not valid_files:
             raise ConfigurationError("No valid input files found")
         
-        # Initialize storage
+        # 2. Parse each file (per-corner logs run in parallel, merged in input order)
+        results, errors = self.map_input_files(_parse_qrc_log, valid_files)
         ndr_files = []
         version_mismatches = []
         other_warnings = []
-        errors = []
-        
-        # Define patterns for parsing
-        # Pattern 1: NDR LEF file loading confirmation
-        pattern_ndr_file = re.compile(r'INFO\s+\(EXTGRMP-338\)\s*:\s*(.+/ndr/[^\s]+\.lef)', re.IGNORECASE)
-        
-        # Pattern 2: Version mismatch warnings for NDR LEF files
-        pattern_version_mismatch = re.compile(
-            r'WARNING\s+\(EXTGRMP-728\)\s*:\s*Different version number exists for tech lef\s+"([^"]+)"\s+with version\s+([\d.]+)\s+and macro lef\s+"([^"]+)"\s+with version\s+([\d.]+)',
-            re.IGNORECASE
-        )
-        
-        # Pattern 3: General WARNING messages with message codes
-        pattern_warning = re.compile(r'WARNING\s+\(([A-Z]+-\d+)\)\s*:\s*(.+)', re.IGNORECASE)
-        
-        # 2. Parse each file
-        for file_path in valid_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line_num, line in enumerate(f, 1):
-                        # Check for NDR LEF file loading
-                        match_ndr = pattern_ndr_file.search(line)
-                        if match_ndr:
-                            ndr_file_path = match_ndr.group(1).strip()
-                            ndr_files.append({
-                                'name': ndr_file_path,
-                                'file_path': ndr_file_path,
-                                'line_number': line_num,
-                                'source_file': str(file_path),
-                                'line_content': line.strip()
-                            })
-                            continue
-                        
-                        # Check for version mismatch warnings
-                        match_version = pattern_version_mismatch.search(line)
-                        if match_version:
-                            tech_lef = match_version.group(1).strip()
-                            tech_version = match_version.group(2).strip()
-                            macro_lef = match_version.group(3).strip()
-                            macro_version = match_version.group(4).strip()
-                            
-                            # Only track if macro lef is NDR file
-                            if '/ndr/' in macro_lef.lower():
-                                version_mismatches.append({
-                                    'name': f"{macro_lef} (v{macro_version} vs tech v{tech_version})",
-                                    'tech_lef': tech_lef,
-                                    'tech_version': tech_version,
-                                    'macro_lef': macro_lef,
-                                    'macro_version': macro_version,
-                                    'line_number': line_num,
-                                    'file_path': str(file_path),
-                                    'line_content': line.strip()
-                                })
-                            continue
-                        
-                        # Check for other warnings related to NDR files
-                        match_warning = pattern_warning.search(line)
-                        if match_warning and '/ndr/' in line.lower():
-                            msg_code = match_warning.group(1).strip()
-                            msg_text = match_warning.group(2).strip()
-                            
-                            # Skip version mismatch warnings (already captured)
-                            if msg_code != 'EXTGRMP-728':
-                                other_warnings.append({
-                                    'name': f"{msg_code}: {msg_text}",
-                                    'code': msg_code,
-                                    'message': msg_text,
-                                    'line_number': line_num,
-                                    'file_path': str(file_path),
-                                    'line_content': line.strip()
-                                })
-            except Exception as e:
-                errors.append(f"Error parsing {file_path}: {str(e)}")
+        for result in results:
+            ndr_files.extend(result['ndr_files'])
+            version_mismatches.extend(result['version_mismatches'])
+            other_warnings.extend(result['other_warnings'])
         
         # 3. Store frequently reused data on self
         self._ndr_files = ndr_files
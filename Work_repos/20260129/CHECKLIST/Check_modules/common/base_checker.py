@@ -45,10 +45,11 @@ class ConfigurationError(Exception):
         super().__init__("Configuration error detected")
 
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Callable
 from parse_interface import load_item_data, find_input_files
 from config_reader import detect_project_root
 from output_formatter import OutputFormatter, CheckResult
+from file_mapper import map_files
 from result_cache_manager import get_global_cache
 
 
@@ -263,6 +264,39 @@ class BaseChecker:
         
         return (valid_files, missing_files)
     
+    def map_input_files(self, parse_fn: Callable[[Path], Any],
+                        files: Optional[List[Path]] = None,
+                        mode: str = 'auto',
+                        max_workers: Optional[int] = None) -> Tuple[List[Any], List[str]]:
+        """
+        Run a per-file parse function over input files in parallel.
+        
+        Replaces the common serial loop:
+            for file_path in valid_files:
+                try:
+                    ... parse file_path ...
+                except Exception as e:
+                    errors.append(f"Error parsing {file_path}: {str(e)}")
+        
+        The pool (serial / thread / process) is chosen from file count and
+        total size (see file_mapper.py); results keep input file order.
+        Use a module-level parse function so large inputs can use processes.
+        
+        Args:
+            parse_fn: Function taking one file Path and returning its parsed data
+            files: Files to parse (default: valid files from validate_input_files())
+            mode: 'auto', 'serial', 'thread' or 'process'
+            max_workers: Worker limit (default: CHECKLIST_PARALLEL_WORKERS / CPU count)
+        
+        Returns:
+            Tuple of (results, errors)
+            - results: parse_fn results in input order (failed files skipped)
+            - errors: "Error parsing <file>: <error>" per failed file
+        """
+        if files is None:
+            files, _ = self.validate_input_files()
+        return map_files(parse_fn, files, mode=mode, max_workers=max_workers)
+    
     def create_config_error(self, error_message: str) -> CheckResult:
         """
         Create error result for configuration errors.
@@ -0,0 +1,584 @@
+################################################################################
+# Script Name: bump_map.py
+#
+# Purpose:
+#   Bump-map engine for package-to-chip comparison (bump excel / package
+#   bump list vs bump locations extracted from GDS/OAS).
+#   - Loads CSV / Excel bump tables into NumPy coordinate columns
+#   - Name index (case-insensitive) and spatial grid index per table
+#   - Tolerance-based matching instead of exact float equality
+#   - Classifies every expected bump as matched / moved / renamed / missing
+#     and every unclaimed extracted bump as extra, in O(N)
+#
+# Key Architecture:
+#   - BumpTable: names + float64 x/y/width/height columns + source locations
+#   - BumpIndex: name -> row array, grid cell -> row list; cell size equals
+#     the tolerance so a lookup only visits the 3x3 neighbouring cells
+#   - compare_bump_maps(): one-to-one assignment in three passes
+#       1. same name within tolerance           -> matched
+#       2. same name elsewhere (nearest)        -> moved (checked before
+#          renamed, so only absent names can be renamed)
+#       3. other (unclaimed) name at position   -> renamed
+#     anything left is missing; unclaimed extracted bumps are extra.
+#     Candidate distances are computed with vectorised NumPy operations.
+#
+# Usage:
+#   from bump_map import load_bump_table, BumpTable, compare_bump_maps
+#
+#   actual, errors = load_bump_table(gds_bump_csv)
+#   expected = BumpTable.from_records([{'name': 'VSS', 'x': 90.0, 'y': 255.36}])
+#   diff = compare_bump_maps(expected, actual, tolerance=0.001)
+#   for match in diff.moved:
+#       print(match.name, match.expected_xy, match.actual_xy, match.distance)
+#
+# Configuration (optional environment variables):
+#   - CHECKLIST_BUMP_TOLERANCE: coordinate tolerance in um (default: 0.001)
+#
+# Author: yyin
+# Date:   2026-10-18
+################################################################################
+import csv
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+DEFAULT_BUMP_TOLERANCE = 0.001
+
+# Smallest grid cell (avoids a degenerate grid for tolerance=0)
+_MIN_CELL_SIZE = 1e-6
+
+# Header aliases (lower-case) for bump table columns
+_COLUMN_ALIASES = {
+    'bump_id': ('bump_id', 'id', 'bump', 'index', 'no'),
+    'name': ('name', 'bump_name', 'net', 'net_name', 'pin', 'pin_name', 'signal'),
+    'x': ('center_x', 'x', 'x_coord', 'bump_x', 'loc_x', 'x(um)'),
+    'y': ('center_y', 'y', 'y_coord', 'bump_y', 'loc_y', 'y(um)'),
+    'width': ('width', 'w'),
+    'height': ('height', 'h'),
+}
+
+# tv_chip_gds_bump.csv layout, used when a file has no header row:
+# Bump_ID,Name,Center_X,Center_Y,Width,Height,Area,Text_Distance
+_DEFAULT_POSITIONS = {'bump_id': 0, 'name': 1, 'x': 2, 'y': 3, 'width': 4, 'height': 5}
+
+_EXCEL_SUFFIXES = ('.xlsx', '.xlsm')
+
+
+def get_bump_tolerance(default: float = DEFAULT_BUMP_TOLERANCE) -> float:
+    """
+    Get the configured bump coordinate tolerance (um).
+
+    Reads CHECKLIST_BUMP_TOLERANCE; invalid or negative values fall back to default.
+
+    Returns:
+        Tolerance in um
+    """
+    raw = os.environ.get('CHECKLIST_BUMP_TOLERANCE')
+    if raw is None or raw.strip() == '':
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        return default
+    return value if value >= 0 else default
+
+
+def _require_numpy() -> None:
+    """Raise a helpful ImportError when numpy is unavailable."""
+    if not NUMPY_AVAILABLE:
+        raise ImportError(
+            "numpy is required for bump map comparison. Install via 'pip install numpy'."
+        )
+
+
+def _load_openpyxl():
+    """
+    Import and return openpyxl.load_workbook.
+
+    Raises ImportError with helpful message if unavailable.
+    """
+    try:
+        from openpyxl import load_workbook  # type: ignore
+        return load_workbook
+    except Exception as e:  # noqa: BLE001 broad for user friendliness
+        raise ImportError(
+            "openpyxl is required to read .xlsx bump tables. Install via 'pip install openpyxl'. Original error: "
+            + str(e)
+        )
+
+
+# =============================================================================
+# Bump table
+# =============================================================================
+
+class BumpTable:
+    """
+    Columnar bump table.
+
+    Names and source files are plain lists; coordinates and dimensions are
+    float64 arrays (NaN when a column is absent).
+    """
+
+    def __init__(self, names: Sequence[str], x: Any, y: Any,
+                 width: Any = None, height: Any = None,
+                 line_numbers: Any = None, file_paths: Optional[Sequence[str]] = None,
+                 bump_ids: Optional[Sequence[str]] = None):
+        _require_numpy()
+        count = len(names)
+        self.names: List[str] = list(names)
+        self.x = np.asarray(x, dtype=np.float64).reshape(count)
+        self.y = np.asarray(y, dtype=np.float64).reshape(count)
+        self.width = self._optional_column(width, count, np.float64, np.nan)
+        self.height = self._optional_column(height, count, np.float64, np.nan)
+        self.line_numbers = self._optional_column(line_numbers, count, np.int64, 0)
+        self.file_paths: List[str] = list(file_paths) if file_paths is not None else ['N/A'] * count
+        self.bump_ids: List[str] = list(bump_ids) if bump_ids is not None else [''] * count
+
+    @staticmethod
+    def _optional_column(values: Any, count: int, dtype: Any, fill: Any) -> Any:
+        if values is None:
+            return np.full(count, fill, dtype=dtype)
+        return np.asarray(values, dtype=dtype).reshape(count)
+
+    @classmethod
+    def from_records(cls, records: Sequence[Dict[str, Any]]) -> 'BumpTable':
+        """
+        Build a table from dicts with keys name, x, y and optional width,
+        height, line_number, file_path, bump_id.
+        """
+        return cls(
+            [str(r['name']) for r in records],
+            [r['x'] for r in records],
+            [r['y'] for r in records],
+            width=[r.get('width', np.nan) for r in records],
+            height=[r.get('height', np.nan) for r in records],
+            line_numbers=[r.get('line_number', 0) for r in records],
+            file_paths=[str(r.get('file_path', 'N/A')) for r in records],
+            bump_ids=[str(r.get('bump_id', '')) for r in records],
+        )
+
+    @classmethod
+    def concat(cls, tables: Sequence['BumpTable']) -> 'BumpTable':
+        """Concatenate several tables (e.g. one per input file)."""
+        _require_numpy()
+        if not tables:
+            return cls([], [], [])
+        names: List[str] = []
+        file_paths: List[str] = []
+        bump_ids: List[str] = []
+        for table in tables:
+            names.extend(table.names)
+            file_paths.extend(table.file_paths)
+            bump_ids.extend(table.bump_ids)
+        return cls(
+            names,
+            np.concatenate([t.x for t in tables]),
+            np.concatenate([t.y for t in tables]),
+            width=np.concatenate([t.width for t in tables]),
+            height=np.concatenate([t.height for t in tables]),
+            line_numbers=np.concatenate([t.line_numbers for t in tables]),
+            file_paths=file_paths,
+            bump_ids=bump_ids,
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Expand one row into a dict (None for absent dimensions)."""
+        width = float(self.width[index])
+        height = float(self.height[index])
+        return {
+            'name': self.names[index],
+            'bump_id': self.bump_ids[index],
+            'center_x': float(self.x[index]),
+            'center_y': float(self.y[index]),
+            'width': None if np.isnan(width) else width,
+            'height': None if np.isnan(height) else height,
+            'line_number': int(self.line_numbers[index]),
+            'file_path': self.file_paths[index],
+        }
+
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over rows as dicts."""
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def bbox(self) -> Tuple[float, float, float, float]:
+        """Return (min_x, max_x, min_y, max_y); zeros for an empty table."""
+        if not len(self):
+            return 0.0, 0.0, 0.0, 0.0
+        return (float(self.x.min()), float(self.x.max()),
+                float(self.y.min()), float(self.y.max()))
+
+
+# =============================================================================
+# Loaders
+# =============================================================================
+
+def _resolve_columns(header: Sequence[Any]) -> Optional[Dict[str, int]]:
+    """Map logical columns to positions; None when the row is not a header."""
+    normalized = [str(h).strip().lower().replace(' ', '_') if h is not None else '' for h in header]
+    positions: Dict[str, int] = {}
+    for key, aliases in _COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in normalized:
+                positions[key] = normalized.index(alias)
+                break
+    if 'name' in positions and 'x' in positions and 'y' in positions:
+        return positions
+    return None
+
+
+def _table_from_rows(rows: Iterator[Tuple[int, Sequence[Any]]], file_path: str
+                     ) -> Tuple[BumpTable, List[str]]:
+    """
+    Convert (line_number, cells) rows into a BumpTable.
+
+    Cells are collected column-wise first and converted to float arrays in one
+    call; rows that fail conversion are reported and dropped.
+    """
+    positions: Optional[Dict[str, int]] = None
+    names: List[str] = []
+    ids: List[str] = []
+    cols: Dict[str, List[Any]] = {'x': [], 'y': [], 'width': [], 'height': []}
+    line_numbers: List[int] = []
+    errors: List[str] = []
+
+    for line_num, cells in rows:
+        if not cells or all(c is None or str(c).strip() == '' for c in cells):
+            continue
+        if positions is None:
+            positions = _resolve_columns(cells)
+            if positions is not None:
+                continue  # header row
+            positions = dict(_DEFAULT_POSITIONS)
+        try:
+            name = cells[positions['name']]
+            x = cells[positions['x']]
+            y = cells[positions['y']]
+        except IndexError:
+            errors.append(f"Line {line_num} in {file_path}: Invalid format - {','.join(str(c) for c in cells)[:50]}")
+            continue
+        if name is None or str(name).strip() == '':
+            errors.append(f"Line {line_num} in {file_path}: Missing bump name")
+            continue
+        names.append(str(name).strip())
+        ids.append(str(cells[positions['bump_id']]).strip() if 'bump_id' in positions and positions['bump_id'] < len(cells) else '')
+        cols['x'].append(x)
+        cols['y'].append(y)
+        for key in ('width', 'height'):
+            pos = positions.get(key)
+            value = cells[pos] if pos is not None and pos < len(cells) else None
+            cols[key].append(np.nan if value is None or str(value).strip() == '' else value)
+        line_numbers.append(line_num)
+
+    arrays: Dict[str, Any] = {}
+    bad = np.zeros(len(names), dtype=bool)
+    for key, values in cols.items():
+        try:
+            arrays[key] = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            # Slow path: convert per cell to locate the offending rows
+            column = np.empty(len(values), dtype=np.float64)
+            for i, value in enumerate(values):
+                try:
+                    column[i] = float(value)
+                except (TypeError, ValueError):
+                    column[i] = np.nan
+                    bad[i] = True
+            arrays[key] = column
+    bad |= np.isnan(arrays['x']) | np.isnan(arrays['y'])
+
+    if bad.any():
+        for i in np.flatnonzero(bad):
+            errors.append(f"Line {line_numbers[i]} in {file_path}: Invalid format - non-numeric value for {names[i]}")
+        keep = np.flatnonzero(~bad)
+        names = [names[i] for i in keep]
+        ids = [ids[i] for i in keep]
+        line_numbers = [line_numbers[i] for i in keep]
+        arrays = {key: value[keep] for key, value in arrays.items()}
+
+    table = BumpTable(names, arrays['x'], arrays['y'],
+                      width=arrays['width'], height=arrays['height'],
+                      line_numbers=line_numbers, file_paths=[file_path] * len(names),
+                      bump_ids=ids)
+    return table, errors
+
+
+def load_bump_csv(path: Union[str, Path], delimiter: str = ',') -> Tuple[BumpTable, List[str]]:
+    """
+    Load a CSV bump table (header optional, tv_chip_gds_bump.csv layout by default).
+
+    Args:
+        path: CSV file path
+        delimiter: Field delimiter
+
+    Returns:
+        Tuple of (BumpTable, errors)
+    """
+    _require_numpy()
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8', errors='ignore', newline='') as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        rows = ((reader.line_num, [c.strip() for c in cells]) for cells in reader)
+        return _table_from_rows(rows, str(path))
+
+
+def load_bump_excel(path: Union[str, Path], sheet: Optional[str] = None) -> Tuple[BumpTable, List[str]]:
+    """
+    Load an Excel bump table (first sheet unless sheet is given).
+
+    Args:
+        path: .xlsx / .xlsm path
+        sheet: Optional worksheet name
+
+    Returns:
+        Tuple of (BumpTable, errors)
+    """
+    _require_numpy()
+    load_workbook = _load_openpyxl()
+    path = Path(path)
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet else wb.worksheets[0]
+        rows = ((i, list(cells)) for i, cells in enumerate(ws.iter_rows(values_only=True), 1))
+        return _table_from_rows(rows, str(path))
+    finally:
+        wb.close()
+
+
+def load_bump_table(path: Union[str, Path], sheet: Optional[str] = None) -> Tuple[BumpTable, List[str]]:
+    """Load a bump table, choosing the Excel or CSV reader by file suffix."""
+    if Path(path).suffix.lower() in _EXCEL_SUFFIXES:
+        return load_bump_excel(path, sheet=sheet)
+    return load_bump_csv(path)
+
+
+# =============================================================================
+# Index
+# =============================================================================
+
+class BumpIndex:
+    """
+    Name and spatial-grid index over a BumpTable.
+
+    The grid cell size equals the tolerance, so every bump within tolerance
+    of a point lies in the point's cell or one of its 8 neighbours.
+    """
+
+    def __init__(self, table: BumpTable, tolerance: Optional[float] = None):
+        _require_numpy()
+        self.table = table
+        self.tolerance = get_bump_tolerance() if tolerance is None else max(float(tolerance), 0.0)
+        self.cell_size = max(self.tolerance, _MIN_CELL_SIZE)
+
+        # Name index: lower-case name -> row array (grouped with one argsort)
+        self._by_name: Dict[str, Any] = {}
+        if len(table):
+            keys = np.array([n.lower() for n in table.names], dtype=object)
+            uniques, inverse = np.unique(keys, return_inverse=True)
+            order = np.argsort(inverse, kind='stable')
+            bounds = np.searchsorted(inverse[order], np.arange(len(uniques) + 1))
+            for i, key in enumerate(uniques):
+                self._by_name[key] = order[bounds[i]:bounds[i + 1]]
+
+        # Spatial grid: (cx, cy) -> rows
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+        cx = np.floor(table.x / self.cell_size).astype(np.int64)
+        cy = np.floor(table.y / self.cell_size).astype(np.int64)
+        for row, key in enumerate(zip(cx.tolist(), cy.tolist())):
+            self._grid.setdefault(key, []).append(row)
+
+    def rows_named(self, name: str) -> Any:
+        """Rows whose name equals name (case-insensitive)."""
+        return self._by_name.get(name.lower(), np.empty(0, dtype=np.int64))
+
+    def rows_near(self, x: float, y: float) -> Tuple[Any, Any]:
+        """
+        Rows within tolerance of (x, y), nearest first.
+
+        Returns:
+            Tuple of (rows, distances) as numpy arrays
+        """
+        cx = int(np.floor(x / self.cell_size))
+        cy = int(np.floor(y / self.cell_size))
+        candidates: List[int] = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                cell = self._grid.get((cx + dx, cy + dy))
+                if cell:
+                    candidates.extend(cell)
+        if not candidates:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        rows = np.asarray(candidates, dtype=np.int64)
+        dist = np.hypot(self.table.x[rows] - x, self.table.y[rows] - y)
+        keep = dist <= self.tolerance + 1e-12
+        rows, dist = rows[keep], dist[keep]
+        order = np.argsort(dist, kind='stable')
+        return rows[order], dist[order]
+
+    def nearest(self, x: float, y: float, rows: Any) -> Tuple[int, float]:
+        """Nearest of the given rows to (x, y); (-1, inf) when rows is empty."""
+        if not len(rows):
+            return -1, float('inf')
+        dist = np.hypot(self.table.x[rows] - x, self.table.y[rows] - y)
+        best = int(np.argmin(dist))
+        return int(rows[best]), float(dist[best])
+
+
+# =============================================================================
+# Comparison
+# =============================================================================
+
+@dataclass
+class BumpMatch:
+    """Outcome for one expected bump."""
+    status: str                       # matched / moved / renamed / missing
+    expected_row: int
+    actual_row: int = -1
+    distance: float = float('inf')
+    name: str = ''
+    actual_name: str = ''
+    expected_xy: Tuple[float, float] = (0.0, 0.0)
+    actual_xy: Optional[Tuple[float, float]] = None
+
+
+@dataclass
+class BumpDiff:
+    """Result of compare_bump_maps()."""
+    expected: BumpTable
+    actual: BumpTable
+    tolerance: float
+    results: List[BumpMatch] = field(default_factory=list)
+    extra_rows: List[int] = field(default_factory=list)
+
+    def _by_status(self, status: str) -> List[BumpMatch]:
+        return [m for m in self.results if m.status == status]
+
+    @property
+    def matched(self) -> List[BumpMatch]:
+        return self._by_status('matched')
+
+    @property
+    def moved(self) -> List[BumpMatch]:
+        return self._by_status('moved')
+
+    @property
+    def renamed(self) -> List[BumpMatch]:
+        return self._by_status('renamed')
+
+    @property
+    def missing(self) -> List[BumpMatch]:
+        return self._by_status('missing')
+
+    @property
+    def extra(self) -> List[Dict[str, Any]]:
+        """Extracted bumps not claimed by any expected bump."""
+        return [self.actual.row(i) for i in self.extra_rows]
+
+    @property
+    def is_clean(self) -> bool:
+        return not self.extra_rows and all(m.status == 'matched' for m in self.results)
+
+    def summary(self) -> Dict[str, int]:
+        counts = {'matched': 0, 'moved': 0, 'renamed': 0, 'missing': 0}
+        for m in self.results:
+            counts[m.status] += 1
+        counts['extra'] = len(self.extra_rows)
+        return counts
+
+
+def compare_bump_maps(expected: BumpTable, actual: BumpTable,
+                      tolerance: Optional[float] = None,
+                      index: Optional[BumpIndex] = None) -> BumpDiff:
+    """
+    Compare expected bumps (package side) with extracted bumps (GDS side).
+
+    Each extracted bump is claimed by at most one expected bump. A moved bump
+    whose name is exhausted still reports the nearest bump of that name
+    (unclaimed), so a bump is only renamed/missing when its name is absent
+    from the extraction. Results keep the order of the expected table.
+
+    Args:
+        expected: Expected bump table
+        actual: Extracted bump table
+        tolerance: Coordinate tolerance in um (default: CHECKLIST_BUMP_TOLERANCE)
+        index: Optional prebuilt BumpIndex over actual (reused across calls)
+
+    Returns:
+        BumpDiff with per-bump results and extra rows
+    """
+    _require_numpy()
+    if index is None or index.table is not actual:
+        index = BumpIndex(actual, tolerance)
+    used = np.zeros(len(actual), dtype=bool)
+    results: List[Optional[BumpMatch]] = [None] * len(expected)
+    ex_x = expected.x.tolist()
+    ex_y = expected.y.tolist()
+    act_names_lower = [n.lower() for n in actual.names]
+
+    def _result(status: str, i: int, row: int = -1, dist: float = float('inf'),
+                claim: bool = True) -> BumpMatch:
+        match = BumpMatch(status, i, row, dist, expected.names[i],
+                          expected_xy=(ex_x[i], ex_y[i]))
+        if row >= 0:
+            used[row] = used[row] or claim
+            match.actual_name = actual.names[row]
+            match.actual_xy = (float(actual.x[row]), float(actual.y[row]))
+        return match
+
+    # Pass 1: same name within tolerance; also remember positional candidates
+    near_cache: Dict[int, Tuple[Any, Any]] = {}
+    for i in range(len(expected)):
+        rows, dist = index.rows_near(ex_x[i], ex_y[i])
+        if not len(rows):
+            continue
+        name = expected.names[i].lower()
+        for row, d in zip(rows.tolist(), dist.tolist()):
+            if not used[row] and act_names_lower[row] == name:
+                results[i] = _result('matched', i, row, d)
+                break
+        else:
+            near_cache[i] = (rows, dist)
+
+    # Pass 2: same name elsewhere -> nearest unclaimed one; if every bump of
+    # that name is already claimed, report the nearest one without claiming it
+    for i in range(len(expected)):
+        if results[i] is not None:
+            continue
+        named = index.rows_named(expected.names[i])
+        if not len(named):
+            continue
+        row, d = index.nearest(ex_x[i], ex_y[i], named[~used[named]])
+        if row >= 0:
+            results[i] = _result('moved', i, row, d)
+        else:
+            row, d = index.nearest(ex_x[i], ex_y[i], named)
+            results[i] = _result('moved', i, row, d, claim=False)
+
+    # Pass 3: an unclaimed bump with another name sits at the expected location
+    for i, (rows, dist) in near_cache.items():
+        if results[i] is not None:
+            continue
+        for row, d in zip(rows.tolist(), dist.tolist()):
+            if not used[row]:
+                results[i] = _result('renamed', i, row, d)
+                break
+
+    for i in range(len(expected)):
+        if results[i] is None:
+            results[i] = _result('missing', i)
+
+    return BumpDiff(expected, actual, index.tolerance,
+                    results=results,
+                    extra_rows=np.flatnonzero(~used).tolist())
@@ -135,7 +135,7 @@ Version: 2.0.0
 
 from typing import Dict, List, Any, Optional, Callable, Union
 from pathlib import Path
-from output_formatter import DetailItem, Severity, create_check_result, CheckResult
+from output_formatter import DetailItem, DetailBatch, Severity, create_check_result, CheckResult
 
 
 class OutputBuilderMixin:
@@ -332,7 +332,8 @@ class OutputBuilderMixin:
                 name_extractor=extract_report_path
             )
         """
-        details = []
+        # Collected column-wise: file paths and reasons are interned once
+        batch = DetailBatch()
         
         # INFO: Waived items first (Type 1/2 waiver=0 or Type 3/4 waivers)
         if waived_items:
@@ -357,13 +358,13 @@ class OutputBuilderMixin:
                     else:
                         reason = f"{waived_base_reason}{waived_tag}" if waived_base_reason else waived_tag
                 
-                details.append(DetailItem(
+                batch.append(
                     severity=Severity.INFO,
                     name=item_name,
                     line_number=metadata.get('line_number', 0),
                     file_path=metadata.get('file_path', default_file),
                     reason=reason
-                ))
+                )
         
         # INFO: Found items
         if found_items:
@@ -377,13 +378,13 @@ class OutputBuilderMixin:
                 # Support callable reason (lambda) - call it with item metadata
                 reason_text = found_reason(metadata) if callable(found_reason) else found_reason
                 
-                details.append(DetailItem(
+                batch.append(
                     severity=Severity.INFO,
                     name=display_name,
                     line_number=metadata.get('line_number', 0),
                     file_path=metadata.get('file_path', default_file),
                     reason=reason_text
-                ))
+                )
         
         # FAIL or INFO: Unwaived missing items (convert to INFO if waiver=0)
         if missing_items:
@@ -403,13 +404,13 @@ class OutputBuilderMixin:
                 # Support callable reason (lambda) - call it with item metadata
                 reason_text = missing_reason(metadata) if callable(missing_reason) else missing_reason
                 
-                details.append(DetailItem(
+                batch.append(
                     severity=final_missing_severity,
                     name=display_name,
                     line_number=metadata.get('line_number', 0),
                     file_path=metadata.get('file_path', default_file),
                     reason=reason_text
-                ))
+                )
         
         # WARN or INFO: Unused waivers (convert to INFO if waiver=0)
         if unused_waivers:
@@ -426,15 +427,15 @@ class OutputBuilderMixin:
                 else:
                     reason = f"{unused_waiver_reason}{tag}"
                 
-                details.append(DetailItem(
+                batch.append(
                     severity=unused_severity,
                     name=item_name,
                     line_number=metadata.get('line_number', 0),
                     file_path=metadata.get('file_path', default_file),
                     reason=reason
-                ))
+                )
         
-        return details
+        return batch.to_details()
     
     # =========================================================================
     # Pattern 2: Build Result Groups from Categorized Items
@@ -0,0 +1,178 @@
+################################################################################
+# Script Name: file_mapper.py
+#
+# Purpose:
+#   Run a per-file parse function over many input files (multi-corner /
+#   multi-view logs and reports) in a thread or process pool.
+#   - Results are returned in input order (stable reports and snapshots)
+#   - Per-file exceptions are collected as "Error parsing <file>: <error>"
+#     strings, the same way checkers record them in their serial loops
+#   - Pool type is chosen from file count and total size
+#
+# Key Architecture:
+#   - serial : one file, tiny inputs, or parallelism disabled
+#   - thread : moderate inputs (I/O bound reads, no pickling needed)
+#   - process: large inputs (CPU bound regex parsing scales with cores);
+#              requires a picklable, module-level parse function and falls
+#              back to threads otherwise
+#
+# Usage:
+#   from file_mapper import map_files
+#
+#   def parse_one(file_path):            # module level for process pools
+#       ...
+#       return items
+#
+#   results, errors = map_files(parse_one, valid_files)
+#   for items in results:
+#       all_items.extend(items)
+#
+# Configuration (optional environment variables):
+#   - CHECKLIST_PARALLEL_WORKERS: max workers (default: CPU count, capped at
+#                                 16; 0 or 1 disables parallelism)
+#   - CHECKLIST_PARALLEL_MIN_BYTES: total size below which files are parsed
+#                                   serially (default: 1 MB)
+#   - CHECKLIST_PARALLEL_PROCESS_BYTES: total size from which a process pool
+#                                       is used (default: 64 MB)
+#
+# Author: yyin
+# Date:   2026-10-18
+################################################################################
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MIN_PARALLEL_BYTES = 1 * 1024 * 1024
+DEFAULT_PROCESS_POOL_BYTES = 64 * 1024 * 1024
+
+MAP_MODES = ('auto', 'serial', 'thread', 'process')
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None or raw.strip() == '':
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def get_max_workers() -> int:
+    """
+    Get the configured worker limit.
+
+    Returns:
+        Number of workers (<= 1 means serial)
+    """
+    default = min(os.cpu_count() or 1, DEFAULT_MAX_WORKERS)
+    return max(_env_int('CHECKLIST_PARALLEL_WORKERS', default), 1)
+
+
+def _total_size(files: Sequence[Path]) -> int:
+    total = 0
+    for file_path in files:
+        try:
+            total += os.path.getsize(file_path)
+        except OSError:
+            pass
+    return total
+
+
+def _is_picklable(obj: Any) -> bool:
+    try:
+        pickle.dumps(obj)
+        return True
+    except Exception:  # noqa: BLE001 any pickling failure means "use threads"
+        return False
+
+
+def choose_mode(parse_fn: Callable[[Path], Any], files: Sequence[Path],
+                max_workers: Optional[int] = None) -> str:
+    """
+    Choose serial / thread / process execution for a file set.
+
+    Args:
+        parse_fn: Per-file parse function
+        files: Files to parse
+        max_workers: Worker limit (default: get_max_workers())
+
+    Returns:
+        'serial', 'thread' or 'process'
+    """
+    workers = get_max_workers() if max_workers is None else max_workers
+    if workers <= 1 or len(files) <= 1:
+        return 'serial'
+    total = _total_size(files)
+    if total < _env_int('CHECKLIST_PARALLEL_MIN_BYTES', DEFAULT_MIN_PARALLEL_BYTES):
+        return 'serial'
+    if total >= _env_int('CHECKLIST_PARALLEL_PROCESS_BYTES', DEFAULT_PROCESS_POOL_BYTES) \
+            and _is_picklable(parse_fn):
+        return 'process'
+    return 'thread'
+
+
+def _call(parse_fn: Callable[[Path], Any], file_path: Path) -> Tuple[bool, Any]:
+    """Run parse_fn and capture its exception (module level: picklable)."""
+    try:
+        return True, parse_fn(file_path)
+    except Exception as e:  # noqa: BLE001 errors are reported per file
+        return False, str(e)
+
+
+def map_files(parse_fn: Callable[[Path], Any],
+              files: Sequence[Union[str, Path]],
+              mode: str = 'auto',
+              max_workers: Optional[int] = None) -> Tuple[List[Any], List[str]]:
+    """
+    Apply parse_fn to every file and merge results in input order.
+
+    Files whose parse raises are skipped in results and reported in errors
+    as "Error parsing <file>: <error>".
+
+    Args:
+        parse_fn: Function taking a Path and returning any result
+        files: Input files (order is preserved)
+        mode: 'auto', 'serial', 'thread' or 'process'
+        max_workers: Worker limit (default: get_max_workers())
+
+    Returns:
+        Tuple of (results, errors)
+    """
+    if mode not in MAP_MODES:
+        raise ValueError(f"Unknown map mode '{mode}', expected one of {MAP_MODES}")
+    paths = [Path(f) for f in files]
+    workers = get_max_workers() if max_workers is None else max(max_workers, 1)
+    if mode == 'auto':
+        mode = choose_mode(parse_fn, paths, workers)
+    elif mode == 'process' and not _is_picklable(parse_fn):
+        mode = 'thread'
+    workers = min(workers, len(paths)) or 1
+
+    outcomes: List[Tuple[bool, Any]]
+    if mode == 'serial' or workers == 1:
+        outcomes = [_call(parse_fn, p) for p in paths]
+    elif mode == 'thread':
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(lambda p: _call(parse_fn, p), paths))
+    else:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(_call, [parse_fn] * len(paths), paths))
+        except (BrokenProcessPool, OSError, pickle.PicklingError):
+            # Worker start-up or result transfer failed: parse in-process
+            outcomes = [_call(parse_fn, p) for p in paths]
+
+    results: List[Any] = []
+    errors: List[str] = []
+    for file_path, (ok, value) in zip(paths, outcomes):
+        if ok:
+            results.append(value)
+        else:
+            errors.append(f"Error parsing {file_path}: {value}")
+    return results, errors
@@ -0,0 +1,470 @@
+################################################################################
+# Script Name: netlist_scanner.py
+#
+# Purpose:
+#   Single-pass, constant-memory scanner for gate-level Verilog netlists
+#   (release / post-route netlists, plain or gzip-compressed).
+#   Streams structural events so several netlist checks can share one pass:
+#   - module / endmodule
+#   - assign statements (lhs, rhs)
+#   - cell instances (cell type, instance name)
+#   - tie cell instances (TIEHI/TIELO style cells)
+#
+# Key Architecture:
+#   - Plain files are memory-mapped; gzip files are decompressed in chunks
+#     (detected by magic bytes, not by extension)
+#   - Byte-level tokenizer (one compiled bytes regex) that skips // and
+#     /* */ comments, compiler directives and handles \escaped identifiers
+#   - Statements are assembled token by token; only depth-0 tokens are kept
+#     for instances (pin connections are never buffered)
+#   - Line numbers are computed lazily by counting newlines between
+#     statement starts, so untouched text is never decoded
+#
+# Usage:
+#   from netlist_scanner import NetlistScanner
+#
+#   scanner = NetlistScanner(netlist_path)
+#   for event in scanner.events():
+#       if event.kind == 'assign':
+#           print(event.module, event.lhs, event.rhs, event.line_number)
+#
+#   # Several checks sharing one pass:
+#   scanner.subscribe('assign', assign_check.on_event)
+#   scanner.subscribe('tie_cell', tie_check.on_event)
+#   counts = scanner.run()
+#
+# Author: yyin
+# Date:   2026-10-18
+################################################################################
+import gzip
+import mmap
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Union
+
+
+# Default tie cell naming (TIEHI, TIELO, TIEH, TIEL, TIE1, TIE0, ...)
+DEFAULT_TIE_CELL_PATTERN = r'^TIE(HI|LO|H|L|1|0)'
+
+# Event kinds emitted by the scanner
+EVENT_KINDS = ('module', 'endmodule', 'assign', 'instance', 'tie_cell')
+
+_CHUNK_SIZE = 8 * 1024 * 1024
+_GZIP_MAGIC = b'\x1f\x8b'
+
+# Keywords that start non-instance statements inside a module body
+_DECLARATION_KEYWORDS = frozenset([
+    b'input', b'output', b'inout', b'wire', b'reg', b'tri', b'tri0', b'tri1',
+    b'supply0', b'supply1', b'wand', b'wor', b'parameter', b'localparam',
+    b'defparam', b'specparam', b'genvar', b'integer', b'real', b'time',
+    b'function', b'task', b'initial', b'always', b'specify', b'primitive',
+])
+_BLOCK_END_KEYWORDS = frozenset([
+    b'endfunction', b'endtask', b'endspecify', b'endprimitive',
+    b'endgenerate', b'end', b'endcase', b'generate',
+])
+
+# One master tokenizer (whitespace folded into each match). Order matters:
+# comments before '/' punctuation, unterminated comment/string openers last
+# so chunk boundaries can be carried.
+_TOKEN_RE = re.compile(
+    rb'[ \t\r\n\f\v]*(?:'                               # leading whitespace
+    rb'(?P<lc>//[^\n]*)'                                # line comment
+    rb'|(?P<bc>/\*.*?\*/)'                              # block comment
+    rb'|(?P<dir>`[^\n]*)'                               # compiler directive
+    rb'|(?P<esc>\\[^ \t\r\n\f\v]+)'                     # escaped identifier
+    rb'|(?P<str>"(?:[^"\\\n]|\\.)*")'                   # string literal
+    rb"|(?P<num>(?:\d[\d_]*)?\s*'[sS]?[bBoOdDhH]\s*[0-9a-fA-FxXzZ_?]+|\d[\d_]*(?:\.\d+)?)"
+    rb'|(?P<id>[A-Za-z_][A-Za-z0-9_$]*)'                # identifier / keyword
+    rb'|(?P<open>/\*|")'                                # unterminated comment/string
+    rb'|(?P<p>.))',                                     # punctuation
+    re.DOTALL,
+)
+
+# Fast path inside instance pin lists: skip plain text and innermost
+# '(...)' groups in one match, e.g. '.D(n1), .CK(clk), .Q(q[3])'.
+# Stops at comments, escaped identifiers, strings, directives and at
+# parens it cannot pair, which the tokenizer then handles.
+_PIN_LIST_SKIP_RE = re.compile(rb'(?:[^()/\\"`;]+|\([^()/\\"`;]*\))+')
+
+
+@dataclass
+class NetlistEvent:
+    """
+    One structural event from a netlist.
+
+    Attributes:
+        kind: 'module', 'endmodule', 'assign', 'instance' or 'tie_cell'
+        name: Module name (module/endmodule), instance name (instance/tie_cell)
+              or assign target (assign)
+        line_number: 1-based line where the statement starts
+        file_path: Source netlist path
+        module: Enclosing module name ('' at top level)
+        cell: Cell / module type for instance and tie_cell events
+        lhs: Assign left-hand side
+        rhs: Assign right-hand side
+    """
+    kind: str
+    name: str
+    line_number: int
+    file_path: str
+    module: str = ''
+    cell: str = ''
+    lhs: str = ''
+    rhs: str = ''
+
+    @property
+    def is_constant_assign(self) -> bool:
+        """True for assigns driving a literal (e.g., assign x = 1'b0)."""
+        return self.kind == 'assign' and bool(re.fullmatch(r"\d*\s*'[sS]?[bBoOdDhH]\s*[0-9a-fA-FxXzZ_?]+|\d+", self.rhs))
+
+
+def _is_gzip(path: Path) -> bool:
+    """Detect gzip by magic bytes (release netlists are often misnamed)."""
+    with open(path, 'rb') as f:
+        return f.read(2) == _GZIP_MAGIC
+
+
+def _count_newlines(buf, start: int, end: int) -> int:
+    """Count newlines in buf[start:end] (bytes or mmap, windowed for mmap)."""
+    if isinstance(buf, (bytes, bytearray)):
+        return buf.count(b'\n', start, end)
+    total = 0
+    while start < end:
+        stop = min(start + _CHUNK_SIZE, end)
+        total += buf[start:stop].count(b'\n')
+        start = stop
+    return total
+
+
+def _join_tokens(tokens: List[bytes]) -> str:
+    """Re-assemble expression tokens into compact text."""
+    parts = []
+    for tok in tokens:
+        parts.append(tok.decode('utf-8', 'replace'))
+        if tok[:1] == b'\\':
+            parts.append(' ')  # escaped identifiers are whitespace-terminated
+    return ''.join(parts).strip()
+
+
+class NetlistScanner:
+    """
+    Streaming gate-level Verilog scanner.
+
+    Memory use is bounded by the longest retained statement prefix:
+    instance pin lists are skipped at paren depth > 0 and assign statements
+    are capped at `max_assign_tokens` tokens.
+    """
+
+    def __init__(self, path: Union[str, Path],
+                 tie_cell_pattern: str = DEFAULT_TIE_CELL_PATTERN,
+                 chunk_size: int = _CHUNK_SIZE,
+                 max_assign_tokens: int = 4096):
+        """
+        Initialize scanner.
+
+        Args:
+            path: Netlist path (plain text or gzip, detected automatically)
+            tie_cell_pattern: Regex (case-insensitive) identifying tie cells by cell name
+            chunk_size: Decompression chunk size for gzip input
+            max_assign_tokens: Tokens retained per assign statement
+        """
+        self.path = Path(path)
+        self._tie_re = re.compile(tie_cell_pattern, re.IGNORECASE)
+        self._chunk_size = chunk_size
+        self._max_assign_tokens = max_assign_tokens
+        self._subscribers: Dict[str, List[Callable[[NetlistEvent], None]]] = {}
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    def subscribe(self, kind: str, callback: Callable[[NetlistEvent], None]) -> None:
+        """
+        Register a callback for one event kind (used by run()).
+
+        Args:
+            kind: One of EVENT_KINDS
+            callback: Called with each matching NetlistEvent
+        """
+        if kind not in EVENT_KINDS:
+            raise ValueError(f"Unknown netlist event kind: {kind}")
+        self._subscribers.setdefault(kind, []).append(callback)
+
+    def run(self) -> Dict[str, int]:
+        """
+        Scan the netlist once, dispatching events to subscribers.
+
+        Returns:
+            Event counts per kind (for all kinds, subscribed or not)
+        """
+        counts = {kind: 0 for kind in EVENT_KINDS}
+        for event in self.events():
+            counts[event.kind] += 1
+            for callback in self._subscribers.get(event.kind, ()):
+                callback(event)
+        return counts
+
+    def events(self) -> Iterator[NetlistEvent]:
+        """
+        Stream events in file order.
+
+        Yields:
+            NetlistEvent objects
+        """
+        state = _StatementState(self)
+        for buf, final, base_offset in self._buffers():
+            yield from state.feed(buf, final, base_offset)
+
+    # =========================================================================
+    # Input Buffers
+    # =========================================================================
+
+    def _buffers(self):
+        """
+        Yield (buffer, is_final, absolute_offset) tuples.
+
+        Plain files yield a single mmap; gzip files yield decompressed chunks.
+        The tokenizer carries unfinished tokens between chunks itself.
+        """
+        if self.path.stat().st_size == 0:
+            yield b'', True, 0
+            return
+
+        if _is_gzip(self.path):
+            offset = 0
+            with gzip.open(self.path, 'rb') as f:
+                chunk = f.read(self._chunk_size)
+                while chunk:
+                    nxt = f.read(self._chunk_size)
+                    yield chunk, not nxt, offset
+                    offset += len(chunk)
+                    chunk = nxt
+            return
+
+        with open(self.path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield mm, True, 0
+            finally:
+                mm.close()
+
+
+class _StatementState:
+    """Tokenizer + statement assembler state carried across buffers."""
+
+    def __init__(self, scanner: NetlistScanner):
+        self.scanner = scanner
+        self.file_path = str(scanner.path)
+        self.module = ''
+        self.carry = b''
+        # Lazy line tracking: newlines counted up to absolute offset line_pos
+        self.line = 1
+        self.line_pos = 0
+        # Events produced by the current token
+        self.pending: List[NetlistEvent] = []
+        # Current statement
+        self.tokens: List[bytes] = []
+        self.start_line = 0
+        self.depth = 0
+        self.is_assign = False
+        self.skip_statement = False
+
+    def _line_at(self, buf, rel_pos: int, base: int) -> int:
+        """Advance lazy line counter to an absolute offset inside buf."""
+        abs_pos = base + rel_pos
+        if abs_pos > self.line_pos:
+            start = max(self.line_pos - base, 0)
+            self.line += _count_newlines(buf, start, rel_pos)
+            self.line_pos = abs_pos
+        return self.line
+
+    def feed(self, data, final: bool, offset: int) -> Iterator[NetlistEvent]:
+        """Tokenize one buffer; yield events for completed statements."""
+        if self.carry:
+            buf = self.carry + bytes(data)
+            base = offset - len(self.carry)
+        else:
+            buf = data
+            base = offset
+        self.carry = b''
+        end = len(buf)
+
+        pos = 0
+        pending = self.pending
+        match_fn = _TOKEN_RE.match
+        skip_fn = _PIN_LIST_SKIP_RE.match
+        while pos < end:
+            if self.depth and not self.is_assign:
+                skipped = skip_fn(buf, pos)
+                if skipped:
+                    pos = skipped.end()
+                    if pos >= end:
+                        break
+            m = match_fn(buf, pos)
+            if m is None:
+                break  # only whitespace left
+            kind = m.lastgroup
+            m_end = m.end()
+            tok_start = m.start(kind)
+
+            # Tokens that may continue into the next chunk are carried over
+            if not final and (m_end == end or kind == 'open'):
+                self._line_at(buf, tok_start, base)
+                self.carry = bytes(buf[tok_start:end])
+                return
+            pos = m_end
+            if kind in ('lc', 'bc', 'dir'):
+                continue
+            if kind == 'open':
+                # Unterminated comment/string at EOF: nothing left to parse
+                break
+
+            if not self.tokens and not self.skip_statement:
+                self.start_line = self._line_at(buf, tok_start, base)
+            self._on_token(m.group(kind), kind)
+            if pending:
+                yield from pending
+                pending.clear()
+
+        # Keep the lazy line counter in step with consumed input
+        self._line_at(buf, end, base)
+
+    def _reset(self) -> None:
+        self.tokens = []
+        self.depth = 0
+        self.is_assign = False
+        self.skip_statement = False
+
+    def _on_token(self, tok: bytes, kind: str) -> None:
+        """Statement assembly for one token (events go to self.pending)."""
+        # Statement-free keywords
+        if kind == 'id' and not self.tokens and not self.skip_statement:
+            if tok == b'endmodule':
+                self.pending.append(NetlistEvent('endmodule', self.module, self.start_line,
+                                                 self.file_path, module=self.module))
+                self.module = ''
+                return
+            if tok in _BLOCK_END_KEYWORDS:
+                return
+            if tok in _DECLARATION_KEYWORDS:
+                self.skip_statement = True
+                return
+            if tok == b'assign':
+                self.is_assign = True
+
+        if tok == b';' and self.depth == 0:
+            if not self.skip_statement:
+                self._emit_statement()
+            self._reset()
+            return
+        if self.skip_statement:
+            return
+
+        if tok in (b'(', b'{', b'['):
+            self.depth += 1
+        elif tok in (b')', b'}', b']'):
+            self.depth = max(self.depth - 1, 0)
+            if not self.is_assign:
+                # Instances keep one ')' marker per closed depth-0 group
+                if self.depth == 0:
+                    self.tokens.append(b')')
+                return
+
+        if self.is_assign:
+            if len(self.tokens) < self.scanner._max_assign_tokens:
+                self.tokens.append(tok)
+        elif self.depth == 0:
+            self.tokens.append(tok)
+
+    def _emit_statement(self) -> None:
+        """Turn an assembled statement into events."""
+        tokens = self.tokens
+        if not tokens:
+            return
+        head = tokens[0]
+        line = self.start_line
+
+        if head == b'module' or head == b'macromodule':
+            if len(tokens) > 1:
+                self.module = _join_tokens(tokens[1:2])
+                self.pending.append(NetlistEvent('module', self.module, line, self.file_path,
+                                                 module=self.module))
+            return
+
+        if self.is_assign:
+            self._emit_assigns(tokens[1:], line)
+            return
+
+        # Instance statement: CELL [#(...)] INST (...) [, INST2 (...)]
+        cell = _join_tokens([head])
+        is_tie = bool(self.scanner._tie_re.search(cell))
+        rest = tokens[1:]
+        if rest and rest[0] == b'#':
+            # Parameter override collapsed to ')' at depth 0
+            rest = rest[2:] if len(rest) > 1 and rest[1] == b')' else rest[1:]
+        expect_name = True
+        for tok in rest:
+            if tok == b',':
+                expect_name = True
+            elif expect_name and tok != b')':
+                inst = _join_tokens([tok])
+                self.pending.append(NetlistEvent('instance', inst, line, self.file_path,
+                                                 module=self.module, cell=cell))
+                if is_tie:
+                    self.pending.append(NetlistEvent('tie_cell', inst, line, self.file_path,
+                                                     module=self.module, cell=cell))
+                expect_name = False
+
+    def _emit_assigns(self, tokens: List[bytes], line: int) -> None:
+        """Split 'a = b, c = d' (top-level commas) into assign events."""
+        depth = 0
+        current: List[bytes] = []
+        parts: List[List[bytes]] = []
+        for tok in tokens:
+            if tok in (b'(', b'{', b'['):
+                depth += 1
+            elif tok in (b')', b'}', b']'):
+                depth -= 1
+            if tok == b',' and depth == 0:
+                parts.append(current)
+                current = []
+                continue
+            current.append(tok)
+        if current:
+            parts.append(current)
+
+        for part in parts:
+            if b'=' not in part:
+                continue
+            eq = part.index(b'=')
+            lhs = _join_tokens(part[:eq])
+            rhs = _join_tokens(part[eq + 1:])
+            self.pending.append(NetlistEvent('assign', lhs, line, self.file_path,
+                                             module=self.module, lhs=lhs, rhs=rhs))
+
+
+def scan_netlists(paths: List[Union[str, Path]],
+                  subscribers: Dict[str, List[Callable[[NetlistEvent], None]]],
+                  tie_cell_pattern: str = DEFAULT_TIE_CELL_PATTERN) -> Dict[str, int]:
+    """
+    Scan several netlists once each, sharing subscribers across files.
+
+    Args:
+        paths: Netlist paths
+        subscribers: Dict mapping event kind -> list of callbacks
+        tie_cell_pattern: Regex identifying tie cells
+
+    Returns:
+        Aggregated event counts per kind
+    """
+    totals = {kind: 0 for kind in EVENT_KINDS}
+    for path in paths:
+        scanner = NetlistScanner(path, tie_cell_pattern=tie_cell_pattern)
+        for kind, callbacks in subscribers.items():
+            for callback in callbacks:
+                scanner.subscribe(kind, callback)
+        for kind, count in scanner.run().items():
+            totals[kind] += count
+    return totals
@@ -10,6 +10,16 @@
 #   - Unified logic: Single _write_log_unified() handles all output types
 #   - Group ordering: ERROR → WARN → INFO (consistent across all types)
 #   - Simplified: ~1200 lines → ~700 lines (-40%)
+#   - Indexed: CheckResult builds name / severity / reason-token indexes over
+#     its details on first use, so matching group items to details is linear
+#     in the number of items rather than items x details
+#   - Compact: DetailItem is slotted and pickles as a plain tuple; DetailBatch
+#     collects large detail sets column-wise with interned file paths and
+#     reasons, then materialises the usual List[DetailItem]
+#   - Streaming: logs / reports are written through a large buffer; with
+#     CHECKLIST_MAX_GROUP_ITEMS set, each group / Occurrence section lists
+#     its first N items plus "... and M more", and the untruncated output
+#     can go to a <file>.full.gz sidecar (see stream_writer.py)
 #
 # Usage:
 #   from output_formatter import OutputFormatter, CheckResult, create_check_result
@@ -19,15 +29,24 @@
 #   formatter.write_log(result, log_path)
 #   formatter.write_report(result, report_path)
 #
+#   # Many details (one per violating pin / log line):
+#   batch = DetailBatch()
+#   batch.extend(Severity.FAIL, names, line_numbers, file_path, reason)
+#   result = create_check_result(value=len(batch), is_pass=False, details=batch)
+#
 # Author: yyin
 # Date:   2025-11-11 (Refactored)
 ################################################################################
 
+from array import array
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
+from stream_writer import (get_max_group_items, more_line, open_sidecar,
+                           open_text_output, remove_sidecar, sidecar_enabled)
+
 
 class Severity(Enum):
     """Severity levels for check results."""
@@ -59,6 +78,9 @@ class ResultType(Enum):
 @dataclass
 class DetailItem:
     """Represents a single detail item in the check result."""
+    # Slotted: checkers create one DetailItem per violating pin / log line
+    __slots__ = ('severity', 'name', 'line_number', 'file_path', 'reason')
+    
     severity: Severity
     name: str                 # e.g., library name
     line_number: int          # Line number in source file
@@ -69,6 +91,223 @@ class DetailItem:
         """Ensure severity is a Severity enum."""
         if isinstance(self.severity, str):
             self.severity = Severity[self.severity.upper()]
+    
+    def __reduce__(self):
+        # Pickle as constructor arguments (no per-item attribute dict)
+        return (DetailItem, (self.severity, self.name, self.line_number,
+                             self.file_path, self.reason))
+    
+    def __setstate__(self, state):
+        # Result caches pickled before DetailItem was slotted carry a dict state
+        if isinstance(state, tuple):
+            state = state[-1]
+        for key, value in (state or {}).items():
+            object.__setattr__(self, key, value)
+
+
+_SEVERITY_ORDER = (Severity.INFO, Severity.WARN, Severity.FAIL)
+_SEVERITY_CODE = {sev: code for code, sev in enumerate(_SEVERITY_ORDER)}
+
+
+class DetailBatch:
+    """
+    Column-wise builder for large detail sets.
+    
+    Rows are stored as parallel columns (severity codes, names, line numbers,
+    interned file path / reason ids) and turned into DetailItems only by
+    to_details() / iteration. Materialised items share one string object per
+    distinct file path and reason. create_check_result() accepts a batch
+    wherever a List[DetailItem] is accepted.
+    """
+    
+    def __init__(self):
+        self._severities = array('b')
+        self._names: List[str] = []
+        self._line_numbers: Union[array, List[Any]] = array('q')
+        self._file_ids = array('l')
+        self._reason_ids = array('l')
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+    
+    def _intern(self, value: str) -> int:
+        idx = self._string_ids.get(value)
+        if idx is None:
+            idx = len(self._strings)
+            self._strings.append(value)
+            self._string_ids[value] = idx
+        return idx
+    
+    def _append_line(self, line_number: Any) -> None:
+        try:
+            self._line_numbers.append(line_number)
+        except (TypeError, OverflowError):
+            # Non-integer line numbers ('N/A', '12'): keep them verbatim
+            self._line_numbers = list(self._line_numbers)
+            self._line_numbers.append(line_number)
+    
+    def append(self, severity: Union[Severity, str], name: str, line_number: Any = 0,
+               file_path: str = '', reason: str = '') -> None:
+        """Add one row (same arguments as DetailItem)."""
+        if severity.__class__ is not Severity:
+            severity = Severity[severity.upper()]
+        self._severities.append(_SEVERITY_CODE[severity])
+        self._names.append(name)
+        self._append_line(line_number)
+        self._file_ids.append(self._intern(file_path))
+        self._reason_ids.append(self._intern(reason))
+    
+    def extend(self, severity: Union[Severity, str, Iterable], names: Iterable[str],
+               line_numbers: Union[int, Iterable[Any]] = 0,
+               file_paths: Union[str, Iterable[str]] = '',
+               reasons: Union[str, Iterable[str]] = '') -> None:
+        """
+        Add rows from parallel columns.
+        
+        Args:
+            severity: One Severity / name for all rows, or one per row
+            names: Row names
+            line_numbers: One int for all rows, or one per row
+            file_paths: One path for all rows, or one per row
+            reasons: One reason for all rows, or one per row
+        """
+        names = list(names)
+        count = len(names)
+        
+        def column(values, scalar_types):
+            if isinstance(values, scalar_types):
+                return [values] * count
+            values = list(values)
+            if len(values) != count:
+                raise ValueError(f"DetailBatch.extend: column has {len(values)} rows, expected {count}")
+            return values
+        
+        severities = column(severity, (Severity, str))
+        lines = column(line_numbers, (int,))
+        files = column(file_paths, (str,))
+        reason_col = column(reasons, (str,))
+        for row in range(count):
+            self.append(severities[row], names[row], lines[row], files[row], reason_col[row])
+    
+    def add(self, detail: DetailItem) -> None:
+        """Add an existing DetailItem."""
+        self.append(detail.severity, detail.name, detail.line_number,
+                    detail.file_path, detail.reason)
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def __getitem__(self, index: int) -> DetailItem:
+        return DetailItem(_SEVERITY_ORDER[self._severities[index]], self._names[index],
+                          self._line_numbers[index], self._strings[self._file_ids[index]],
+                          self._strings[self._reason_ids[index]])
+    
+    def __iter__(self) -> Iterator[DetailItem]:
+        strings = self._strings
+        for sev, name, line, file_id, reason_id in zip(self._severities, self._names,
+                                                       self._line_numbers, self._file_ids,
+                                                       self._reason_ids):
+            yield DetailItem(_SEVERITY_ORDER[sev], name, line, strings[file_id], strings[reason_id])
+    
+    def to_details(self) -> List[DetailItem]:
+        """Materialise the rows as a List[DetailItem] (report order)."""
+        return list(self)
+    
+    def severity_counts(self) -> Dict[Severity, int]:
+        """Number of rows per severity."""
+        counts = {sev: 0 for sev in _SEVERITY_ORDER}
+        for code in self._severities:
+            counts[_SEVERITY_ORDER[code]] += 1
+        return counts
+
+
+def _strip_waiver_tags(reason: str) -> str:
+    """Reason text used for waive_item matching (waiver tags removed)."""
+    return reason.replace('[WAIVED_AS_INFO]', '').replace('[WAIVED_INFO]', '').strip()
+
+
+class DetailIndex:
+    """
+    Lookup structures over a CheckResult's details, each built on first use.
+    
+    - name -> positions of details with that name (report order)
+    - severity -> details with that severity (report order)
+    - reason token -> positions of details whose cleaned reason contains
+      the token, for the waive_item substring fallback
+    """
+    
+    def __init__(self, details: List[DetailItem]):
+        self.details = details
+        self.signature = (id(details), len(details))
+        self._by_name: Optional[Dict[str, List[int]]] = None
+        self._by_severity: Optional[Dict[Severity, List[DetailItem]]] = None
+        self._clean_reasons: Optional[List[str]] = None
+        self._reason_tokens: Optional[Dict[str, List[int]]] = None
+        self._reason_matches: Dict[str, Optional[DetailItem]] = {}
+    
+    def by_name(self) -> Dict[str, List[int]]:
+        if self._by_name is None:
+            by_name: Dict[str, List[int]] = {}
+            for pos, detail in enumerate(self.details):
+                by_name.setdefault(detail.name, []).append(pos)
+            self._by_name = by_name
+        return self._by_name
+    
+    def first_named(self, name: str) -> Optional[DetailItem]:
+        """First detail whose name equals name, or None."""
+        positions = self.by_name().get(name)
+        return self.details[positions[0]] if positions else None
+    
+    def first_of_each(self, names: Iterable[str]) -> List[DetailItem]:
+        """First detail of each distinct name in names, in details order."""
+        by_name = self.by_name()
+        positions = sorted(by_name[name][0] for name in set(names) if name in by_name)
+        return [self.details[pos] for pos in positions]
+    
+    def with_severity(self, severity: Severity) -> List[DetailItem]:
+        """Details with the given severity, in details order (do not mutate)."""
+        if self._by_severity is None:
+            buckets: Dict[Severity, List[DetailItem]] = {sev: [] for sev in Severity}
+            for detail in self.details:
+                buckets[detail.severity].append(detail)
+            self._by_severity = buckets
+        return self._by_severity[severity]
+    
+    def _build_reason_index(self) -> None:
+        clean_reasons = []
+        tokens: Dict[str, List[int]] = {}
+        for pos, detail in enumerate(self.details):
+            clean = _strip_waiver_tags(detail.reason) if detail.reason else ''
+            clean_reasons.append(clean)
+            for token in set(clean.split()):
+                tokens.setdefault(token, []).append(pos)
+        self._clean_reasons = clean_reasons
+        self._reason_tokens = tokens
+    
+    def first_reason_containing(self, text: str) -> Optional[DetailItem]:
+        """
+        First detail with a reason whose cleaned text contains text.
+        
+        Interior words of text must appear as whole words of a matching
+        reason, so the scan is limited to details sharing the rarest one;
+        shorter texts fall back to a (memoised) scan of all reasons.
+        """
+        if text in self._reason_matches:
+            return self._reason_matches[text]
+        if self._clean_reasons is None:
+            self._build_reason_index()
+        words = text.split()
+        if len(words) >= 3:
+            candidates = min((self._reason_tokens.get(w, []) for w in words[1:-1]), key=len)
+        else:
+            candidates = range(len(self.details))
+        match = None
+        for pos in candidates:
+            detail = self.details[pos]
+            if detail.reason and text in self._clean_reasons[pos]:
+                match = detail
+                break
+        self._reason_matches[text] = match
+        return match
 
 
 @dataclass
@@ -106,6 +345,27 @@ class CheckResult:
     basic_errors: Optional[List[str]] = None
     item_desc: Optional[str] = None
     default_group_desc: Optional[str] = None
+    _index: Optional[DetailIndex] = field(default=None, init=False, repr=False, compare=False)
+    
+    def detail_index(self) -> DetailIndex:
+        """
+        Get the lazily built DetailIndex for details.
+        
+        The index is rebuilt when details is replaced or changes length;
+        details are not expected to be edited in place once output starts.
+        """
+        index = self._index
+        if index is None or index.details is not self.details or \
+                index.signature != (id(self.details), len(self.details)):
+            index = DetailIndex(self.details)
+            self._index = index
+        return index
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Indexes are rebuilt on demand; keep them out of pickled result caches
+        state = self.__dict__.copy()
+        state['_index'] = None
+        return state
     
     def get_summary_data(self) -> Dict[str, Any]:
         """
@@ -130,9 +390,10 @@ class CheckResult:
             data["info_message"] = self.info_message
         
         # Add occurrence counts
-        fail_details = [d for d in self.details if d.severity == Severity.FAIL]
-        warn_details = [d for d in self.details if d.severity == Severity.WARN]
-        info_details = [d for d in self.details if d.severity == Severity.INFO]
+        index = self.detail_index()
+        fail_details = index.with_severity(Severity.FAIL)
+        warn_details = index.with_severity(Severity.WARN)
+        info_details = index.with_severity(Severity.INFO)
         
         if fail_details:
             data["occurrence"] = len(fail_details)
@@ -199,6 +460,7 @@ class CheckResult:
         items = []
         idx = 1
         used_detail_ids = set()
+        index = self.detail_index() if details is self.details else DetailIndex(details)
 
         for code in sorted(groups.keys()):
             if not code.startswith(prefix):
@@ -211,13 +473,11 @@ class CheckResult:
             if group_items:
                 for item_name in group_items:
                     # Find matching detail by name first, then by reason (for waive_items)
-                    detail = next((d for d in details if d.name == item_name), None)
+                    detail = index.first_named(item_name)
                     is_waive_item = False
                     if not detail:
                         # Try matching by reason (for waive_items where name="")
-                        clean_reason = item_name.strip()
-                        detail = next((d for d in details
-                                       if d.reason and clean_reason in d.reason.replace('[WAIVED_AS_INFO]', '').replace('[WAIVED_INFO]', '').strip()), None)
+                        detail = index.first_reason_containing(item_name.strip())
                         if detail:
                             is_waive_item = True
 
@@ -403,15 +663,12 @@ class DetailItemClassifier:
     
     @staticmethod
     def group_by_severity(details: List[DetailItem]) -> Dict[str, List[DetailItem]]:
-        """Group details by severity level."""
-        fail_items = [d for d in details if d.severity == Severity.FAIL]
-        warn_items = [d for d in details if d.severity == Severity.WARN]
-        info_items = [d for d in details if d.severity == Severity.INFO]
-        
+        """Group details by severity level (single pass)."""
+        index = DetailIndex(details)
         return {
-            'fail_items': fail_items,
-            'warn_items': warn_items,
-            'info_items': info_items
+            'fail_items': list(index.with_severity(Severity.FAIL)),
+            'warn_items': list(index.with_severity(Severity.WARN)),
+            'info_items': list(index.with_severity(Severity.INFO))
         }
 
 
@@ -434,16 +691,27 @@ class OutputComponents:
     
     @staticmethod
     def write_error_group_log(f, item_id: str, error_code: str, description: str,
-                              items: List[DetailItem], severity_text: str):
+                              items: List[DetailItem], severity_text: str,
+                              max_items: int = 0) -> int:
         """
         Write grouped format (Log):
         IMP-5-0-0-00-ERROR01: description:
           Severity: Fail Occurrence: 3
           - item1
           - item2
+        
+        With max_items > 0 only the first max_items entries are listed,
+        followed by "  ... and M more" (Occurrence keeps the full count).
+        
+        Returns:
+            Number of items omitted
         """
         f.write(f'{item_id}-{error_code}: {description}:\n')
         f.write(f'  Severity: {severity_text} Occurrence: {len(items)}\n')
+        omitted = 0
+        if 0 < max_items < len(items):
+            omitted = len(items) - max_items
+            items = items[:max_items]
         for detail in items:
             # Support empty name - use reason instead
             if detail.name:
@@ -452,6 +720,9 @@ class OutputComponents:
                 f.write(f'  - {detail.reason}\n')
             else:
                 f.write(f'  - N/A\n')
+        if omitted:
+            f.write(more_line(omitted, '  '))
+        return omitted
 
 
 # ========== Main OutputFormatter Class ==========
@@ -459,16 +730,56 @@ class OutputComponents:
 class OutputFormatter:
     """Unified formatter for log and report outputs - fully data-driven."""
     
-    def __init__(self, item_id: str, item_desc: str):
+    def __init__(self, item_id: str, item_desc: str, max_items: Optional[int] = None,
+                 full_detail_sidecar: Optional[bool] = None):
         """
         Initialize the formatter.
         
         Args:
             item_id: Item identifier (e.g., "IMP-5-0-0-00")
             item_desc: Item description (e.g., "Library Check")
+            max_items: Items listed per group / Occurrence section, 0 for all
+                       (default: CHECKLIST_MAX_GROUP_ITEMS)
+            full_detail_sidecar: Write <file>.full.gz with the untruncated
+                                 output when items were omitted
+                                 (default: CHECKLIST_FULL_DETAIL_SIDECAR)
         """
         self.item_id = item_id
         self.item_desc = item_desc
+        self.max_items = get_max_group_items() if max_items is None else max(max_items, 0)
+        self.full_detail_sidecar = (sidecar_enabled() if full_detail_sidecar is None
+                                    else full_detail_sidecar)
+        # Items omitted by the write in progress (0 while writing a sidecar)
+        self._limit = self.max_items
+        self._omitted = 0
+    
+    def _write_stream(self, writer, result: CheckResult, path: Path, mode: str) -> None:
+        """
+        Write one output file, then its full-detail sidecar if items were omitted.
+        
+        Args:
+            writer: Bound unified writer (_write_log_unified / _write_report_unified)
+            result: CheckResult to write
+            path: Output file
+            mode: 'w' or 'a'
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._limit, self._omitted = self.max_items, 0
+        with open_text_output(path, mode) as f:
+            writer(f, result)
+        if not self.max_items:
+            return
+        
+        if self._omitted and self.full_detail_sidecar:
+            self._limit = 0
+            try:
+                with open_sidecar(path, mode) as f:
+                    writer(f, result)
+            finally:
+                self._limit = self.max_items
+        elif mode == 'w':
+            remove_sidecar(path)
     
     def write_log(self, result: CheckResult, log_path: Path, mode: str = 'a') -> None:
         """
@@ -479,10 +790,7 @@ class OutputFormatter:
         - details: Fallback for ungrouped output
         - is_pass: PASS/FAIL prefix
         """
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with log_path.open(mode, encoding='utf-8') as f:
-            self._write_log_unified(f, result)
+        self._write_stream(self._write_log_unified, result, log_path, mode)
     
     def _write_log_unified(self, f, result: CheckResult) -> None:
         """
@@ -526,9 +834,9 @@ class OutputFormatter:
         
         # Step 2.5: Write [WAIVED_INFO] tags for waive_items (name="")
         # Extract waive_items from details
-        waive_items = [d for d in result.details 
-                      if d.severity == Severity.INFO 
-                      and (not d.name or d.name in ["", "N/A"])
+        index = result.detail_index()
+        waive_items = [d for d in index.with_severity(Severity.INFO)
+                      if (not d.name or d.name in ["", "N/A"])
                       and d.reason and '[WAIVED_INFO]' in d.reason]
         
         if waive_items:
@@ -539,21 +847,22 @@ class OutputFormatter:
         
         # Step 3: Write groups in order: ERROR → WARN → INFO
         if result.error_groups:
-            self._write_groups_ordered(f, result.error_groups, result.details)
+            self._write_groups_ordered(f, result.error_groups, result.details, index)
         
         if result.warn_groups:
-            self._write_groups_ordered(f, result.warn_groups, result.details)
+            self._write_groups_ordered(f, result.warn_groups, result.details, index)
         
         if result.info_groups:
-            self._write_groups_ordered(f, result.info_groups, result.details)
+            self._write_groups_ordered(f, result.info_groups, result.details, index)
         
         # Step 4: Fallback for ungrouped details (legacy support)
         if not result.error_groups and not result.warn_groups and not result.info_groups and result.details:
-            self._write_ungrouped_details(f, result.details, result.default_group_desc)
+            self._write_ungrouped_details(f, result.details, result.default_group_desc, index)
         
         f.write('\n')
     
-    def _write_groups_ordered(self, f, groups: Dict[str, Dict], details: List[DetailItem]) -> None:
+    def _write_groups_ordered(self, f, groups: Dict[str, Dict], details: List[DetailItem],
+                              index: Optional[DetailIndex] = None) -> None:
         """
         Write groups in proper order: ERROR → WARN → INFO.
         
@@ -561,7 +870,10 @@ class OutputFormatter:
             f: File handle
             groups: Dict of {"ERROR01": {"description": ..., "items": [...]}}
             details: List of DetailItem for matching
+            index: DetailIndex over details (built if not given)
         """
+        if index is None or index.details is not details:
+            index = DetailIndex(details)
         # Order: ERROR, WARN, INFO
         for prefix in ['ERROR', 'WARN', 'INFO']:
             for code in sorted(groups.keys()):
@@ -576,17 +888,12 @@ class OutputFormatter:
                 if items:
                     # Non-empty items list: match by name
                     # Deduplicate by name to match template's sorted(set(...)) deduplication
-                    seen_names = set()
-                    matched = []
-                    for d in details:
-                        if d.name in items and d.name not in seen_names:
-                            matched.append(d)
-                            seen_names.add(d.name)
+                    # (first detail of each name, in details order)
+                    matched = index.first_of_each(items)
                 else:
                     # Empty items list: extract from details by severity
                     severity_name = prefix if prefix != 'ERROR' else 'FAIL'
-                    matched = [d for d in details 
-                              if d.severity.name.upper() == severity_name.upper()]
+                    matched = list(index.with_severity(Severity[severity_name]))
                 
                 # For INFO groups (except INFO01), filter out waive items
                 # INFO01 is specifically for waived items, so don't filter it
@@ -599,15 +906,20 @@ class OutputFormatter:
                 
                 # Write group
                 severity_text = 'Fail' if prefix == 'ERROR' else prefix.capitalize()
-                OutputComponents.write_error_group_log(
-                    f, self.item_id, code, description, matched, severity_text
+                self._omitted += OutputComponents.write_error_group_log(
+                    f, self.item_id, code, description, matched, severity_text,
+                    self._limit
                 )
     
-    def _write_ungrouped_details(self, f, details: List[DetailItem], default_desc: Optional[str] = None) -> None:
+    def _write_ungrouped_details(self, f, details: List[DetailItem], default_desc: Optional[str] = None,
+                                 index: Optional[DetailIndex] = None) -> None:
         """
         Fallback: Write details without grouping (legacy format).
         Used when error_groups and info_groups are both None.
         """
+        if index is None or index.details is not details:
+            index = DetailIndex(details)
+        
         # Helper to deduplicate by name
         def dedupe_by_name(items):
             seen = set()
@@ -619,24 +931,24 @@ class OutputFormatter:
             return result
         
         # Group by severity and deduplicate
-        fail_items = dedupe_by_name([d for d in details if d.severity == Severity.FAIL])
-        warn_items = dedupe_by_name([d for d in details if d.severity == Severity.WARN])
-        info_items = dedupe_by_name([d for d in details if d.severity == Severity.INFO])
+        fail_items = dedupe_by_name(index.with_severity(Severity.FAIL))
+        warn_items = dedupe_by_name(index.with_severity(Severity.WARN))
+        info_items = dedupe_by_name(index.with_severity(Severity.INFO))
         
         # Write FAIL items as ERROR01
         if fail_items:
             # Use custom description if provided, otherwise use default
             fail_desc = default_desc if default_desc else 'Check failed'
-            OutputComponents.write_error_group_log(
-                f, self.item_id, 'ERROR01', fail_desc, fail_items, 'Fail'
+            self._omitted += OutputComponents.write_error_group_log(
+                f, self.item_id, 'ERROR01', fail_desc, fail_items, 'Fail', self._limit
             )
         
         # Write WARN items as WARN01
         if warn_items:
             # Use custom description if provided, otherwise use default
             warn_desc = default_desc if default_desc else 'Warnings'
-            OutputComponents.write_error_group_log(
-                f, self.item_id, 'WARN01', warn_desc, warn_items, 'Warn'
+            self._omitted += OutputComponents.write_error_group_log(
+                f, self.item_id, 'WARN01', warn_desc, warn_items, 'Warn', self._limit
             )
         
         # Write INFO items as INFO01
@@ -648,8 +960,9 @@ class OutputFormatter:
             if non_waive_info_items:
                 # Use custom description if provided, otherwise use default
                 info_desc = default_desc if default_desc else 'Items found in check'
-                OutputComponents.write_error_group_log(
-                    f, self.item_id, 'INFO01', info_desc, non_waive_info_items, 'Info'
+                self._omitted += OutputComponents.write_error_group_log(
+                    f, self.item_id, 'INFO01', info_desc, non_waive_info_items, 'Info',
+                    self._limit
                 )
     
     def write_report(self, result: CheckResult, report_path: Path, mode: str = 'a') -> None:
@@ -661,10 +974,7 @@ class OutputFormatter:
         - Shows Occurrence sections without group codes (ERROR01, INFO01, etc.)
         - More concise than log format
         """
-        report_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with report_path.open(mode, encoding='utf-8') as f:
-            self._write_report_unified(f, result)
+        self._write_stream(self._write_report_unified, result, report_path, mode)
         
         # Note: Memory cache is used instead of file cache (see BaseChecker._result_cache)
         # No need to generate .cache.json files
@@ -705,9 +1015,10 @@ class OutputFormatter:
             f.write(f'[INFO]:{result.info_message}\n')
         
         # Step 3: Group details by severity
-        fail_items = [d for d in result.details if d.severity == Severity.FAIL]
-        warn_items = [d for d in result.details if d.severity == Severity.WARN]
-        info_items = [d for d in result.details if d.severity == Severity.INFO]
+        index = result.detail_index()
+        fail_items = index.with_severity(Severity.FAIL)
+        warn_items = index.with_severity(Severity.WARN)
+        info_items = index.with_severity(Severity.INFO)
         
         # Separate INFO items: waive_items (name="") vs actual waived items (name!="")
         waive_item_tags = []  # Only for waive_items config (name="" AND has [WAIVED_INFO] tag)
@@ -731,21 +1042,28 @@ class OutputFormatter:
         # Step 4: Write Occurrence sections (without group codes)
         # Write Fail Occurrence
         if fail_items:
-            f.write(f'Fail Occurrence: {len(fail_items)}\n')
-            for idx, item in enumerate(fail_items, 1):
-                self._write_report_item(f, idx, item, 'Fail')
+            self._write_occurrence(f, fail_items, 'Fail')
         
         # Write Warn Occurrence  
         if warn_items:
-            f.write(f'Warn Occurrence: {len(warn_items)}\n')
-            for idx, item in enumerate(warn_items, 1):
-                self._write_report_item(f, idx, item, 'Warn')
+            self._write_occurrence(f, warn_items, 'Warn')
         
         # Write Info Occurrence
         if info_occurrence_items:
-            f.write(f'Info Occurrence: {len(info_occurrence_items)}\n')
-            for idx, item in enumerate(info_occurrence_items, 1):
-                self._write_report_item(f, idx, item, 'Info')
+            self._write_occurrence(f, info_occurrence_items, 'Info')
+    
+    def _write_occurrence(self, f, items: List[DetailItem], severity: str) -> None:
+        """Write one Occurrence section, truncated to the active item limit."""
+        f.write(f'{severity} Occurrence: {len(items)}\n')
+        shown = items
+        if 0 < self._limit < len(items):
+            shown = items[:self._limit]
+        for idx, item in enumerate(shown, 1):
+            self._write_report_item(f, idx, item, severity)
+        if len(shown) < len(items):
+            omitted = len(items) - len(shown)
+            self._omitted += omitted
+            f.write(more_line(omitted))
     
     def _write_report_item(self, f, index: int, item: DetailItem, severity: str) -> None:
         """Write a single report item in standard format."""
@@ -787,7 +1105,7 @@ def create_check_result(value: Any,
                        is_pass: bool,
                        has_pattern_items: bool = False,
                        has_waiver_value: bool = False,
-                       details: Optional[List[DetailItem]] = None,
+                       details: Optional[Union[List[DetailItem], DetailBatch]] = None,
                        error_groups: Optional[Dict[str, Dict[str, Any]]] = None,
                        info_groups: Optional[Dict[str, Dict[str, Any]]] = None,
                        warn_groups: Optional[Dict[str, Dict[str, Any]]] = None,
@@ -799,6 +1117,8 @@ def create_check_result(value: Any,
     result_type = CheckResult.determine_result_type(
         value, is_pass, has_pattern_items, has_waiver_value
     )
+    if isinstance(details, DetailBatch):
+        details = details.to_details()
     
     return CheckResult(
         result_type=result_type,
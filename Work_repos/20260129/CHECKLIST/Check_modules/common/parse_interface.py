@@ -9,7 +9,7 @@
 # Features:
 #   1. Split by check_module -> separate files per module
 #   2. Generate JSON cache for fast access (10-50x faster than YAML)
-#   3. Incremental update - only parse if source changed
+#   3. Incremental update - only regenerate modules whose items changed
 #   4. Multiple output formats: YAML (human-readable) + JSON (fast)
 #
 # Usage:
@@ -139,13 +139,23 @@ def compute_file_hash(filepath: Path) -> str:
     return sha256.hexdigest()
 
 
-def should_regenerate(source_file: Path, target_dir: Path, force: bool = False) -> bool:
+def compute_items_hash(items: Dict[str, Any]) -> str:
+    """Compute SHA256 hash of one module's items (unaffected by edits to other modules)."""
+    try:
+        payload = json.dumps(items, sort_keys=True, ensure_ascii=False, default=str)
+    except TypeError:
+        payload = repr(items)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def should_regenerate(source_file: Path, target_dir: Path, force: bool = False,
+                      items: Optional[Dict[str, Any]] = None) -> bool:
     """
     Check if regeneration is needed.
     
     Returns True if:
     - force flag is set
-    - source file changed (hash mismatch)
+    - module items changed (or source file changed when items not given)
     - target files don't exist
     """
     if force:
@@ -160,17 +170,17 @@ def should_regenerate(source_file: Path, target_dir: Path, force: bool = False)
         return True
     
     # Compare hash
-    current_hash = compute_file_hash(source_file)
+    current_hash = compute_items_hash(items) if items is not None else compute_file_hash(source_file)
     stored_hash = hash_file.read_text(encoding='utf-8').strip()
     
     return current_hash != stored_hash
 
 
-def save_hash(source_file: Path, target_dir: Path):
-    """Save source file hash to target directory."""
+def save_hash(source_file: Path, target_dir: Path, items: Optional[Dict[str, Any]] = None):
+    """Save module items hash (or source file hash) to target directory."""
     target_dir.mkdir(parents=True, exist_ok=True)
     hash_file = target_dir / '.source_hash'
-    current_hash = compute_file_hash(source_file)
+    current_hash = compute_items_hash(items) if items is not None else compute_file_hash(source_file)
     hash_file.write_text(current_hash, encoding='utf-8')
 
 
@@ -351,7 +361,7 @@ def process_module(module_name: str, items: Dict[str, Any], output_format: str):
     # save_unified_yaml(module_name, items, module_dir)
     
     # Save hash for change detection
-    save_hash(DATA_INTERFACE_FILE, module_dir)
+    save_hash(DATA_INTERFACE_FILE, module_dir, items)
 
 
 def parse_and_distribute(force: bool = False, output_format: str = 'yaml', 
@@ -404,7 +414,7 @@ def parse_and_distribute(force: bool = False, output_format: str = 'yaml',
         module_dir = CHECK_MODULES_DIR / module_name / 'inputs'
         
         # Check if regeneration needed
-        if not force and not should_regenerate(DATA_INTERFACE_FILE, module_dir):
+        if not force and not should_regenerate(DATA_INTERFACE_FILE, module_dir, items=items):
             print(f"\n⏭️  Skipping {module_name} (up-to-date)")
             skipped_count += 1
             continue
@@ -19,6 +19,7 @@ import json
 import hashlib
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import fields, is_dataclass
 from datetime import datetime
 import difflib
 
@@ -95,6 +96,9 @@ class SnapshotManager:
         for detail in details:
             if hasattr(detail, '__dict__'):
                 detail = detail.__dict__
+            elif is_dataclass(detail):
+                # Slotted DetailItem (no __dict__)
+                detail = {f.name: getattr(detail, f.name) for f in fields(detail)}
             
             normalized['details'].append({
                 'severity': str(detail.get('severity', '')),
@@ -0,0 +1,131 @@
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+from Check_modules.common.bump_map import (
+    BumpTable, BumpIndex, compare_bump_maps, load_bump_csv, get_bump_tolerance
+)
+
+SAMPLE_CSV = """Bump_ID,Name,Center_X,Center_Y,Width,Height,Area,Text_Distance
+0,VSS,90.0000,255.3600,80.0000,80.0000,5018.4943,0.0000
+1,VSS,90.0000,414.9600,80.0000,80.0000,5018.4943,0.0000
+2,PAD_CA0,657.7400,2090.7600,80.0000,80.0000,5018.4943,0.0000
+3,VDD,339.7400,900.0000,80.0000,80.0000,5018.4943,0.0000
+4,PAD_EXTRA,1000.0000,1000.0000,80.0000,80.0000,5018.4943,0.0000
+5,BROKEN,abc,1.0,80.0000,80.0000,5018.4943,0.0000
+"""
+
+
+class TestBumpMap(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.csv = Path(self.test_dir) / "tv_chip_gds_bump.csv"
+        self.csv.write_text(SAMPLE_CSV)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_load_csv(self):
+        table, errors = load_bump_csv(self.csv)
+        self.assertEqual(len(table), 5)
+        self.assertEqual(len(errors), 1)
+        self.assertIn('Line 7', errors[0])
+        row = table.row(2)
+        self.assertEqual(row['name'], 'PAD_CA0')
+        self.assertEqual(row['center_x'], 657.74)
+        self.assertEqual(row['width'], 80.0)
+        self.assertEqual(row['line_number'], 4)
+        self.assertEqual(table.bbox(), (90.0, 1000.0, 255.36, 2090.76))
+
+    def test_index_lookup(self):
+        table, _ = load_bump_csv(self.csv)
+        index = BumpIndex(table, tolerance=0.01)
+        self.assertEqual(sorted(index.rows_named('vss').tolist()), [0, 1])
+        rows, dist = index.rows_near(90.005, 255.36)
+        self.assertEqual(rows.tolist(), [0])
+        self.assertAlmostEqual(float(dist[0]), 0.005)
+        self.assertEqual(index.rows_near(95.0, 255.36)[0].tolist(), [])
+
+    def test_compare_classifies_bumps(self):
+        actual, _ = load_bump_csv(self.csv)
+        expected = BumpTable.from_records([
+            {'name': 'VSS', 'x': 90.0, 'y': 255.3605},                 # within tolerance
+            {'name': 'VSS', 'x': 90.0, 'y': 414.96},                   # exact
+            {'name': 'PAD_MEM_ADDRESS_A[0]', 'x': 657.74, 'y': 2090.76},  # renamed
+            {'name': 'VDD', 'x': 339.74, 'y': 893.76},                 # moved
+            {'name': 'PAD_GONE', 'x': 5.0, 'y': 5.0},                  # missing
+        ])
+        diff = compare_bump_maps(expected, actual, tolerance=0.001)
+        self.assertEqual([m.status for m in diff.results],
+                         ['matched', 'matched', 'renamed', 'moved', 'missing'])
+        self.assertEqual(diff.renamed[0].actual_name, 'PAD_CA0')
+        self.assertEqual(diff.moved[0].actual_xy, (339.74, 900.0))
+        self.assertEqual([b['name'] for b in diff.extra], ['PAD_EXTRA'])
+        self.assertEqual(diff.summary(), {'matched': 2, 'moved': 1, 'renamed': 1,
+                                          'missing': 1, 'extra': 1})
+        self.assertFalse(diff.is_clean)
+
+    def test_one_to_one_assignment(self):
+        actual = BumpTable(['VSS'], [10.0], [10.0])
+        expected = BumpTable(['VSS', 'VSS'], [10.0, 10.0], [10.0, 10.0])
+        diff = compare_bump_maps(expected, actual, tolerance=0.001)
+        # The duplicate is not matched twice; it points at the claimed bump
+        self.assertEqual([m.status for m in diff.results], ['matched', 'moved'])
+        self.assertEqual(diff.results[1].actual_row, 0)
+        self.assertEqual(diff.extra, [])
+
+    def test_same_name_elsewhere_wins_over_position(self):
+        actual = BumpTable(['VDD', 'PAD_A', 'PAD_B'], [50.0, 10.0, 20.0], [50.0, 10.0, 20.0])
+        expected = BumpTable(['VDD', 'VDD', 'PAD_X'], [10.0, 20.0, 20.0], [10.0, 20.0, 20.0])
+        diff = compare_bump_maps(expected, actual, tolerance=0.001)
+        # VDD exists elsewhere -> moved, even though PAD_A sits at its location;
+        # the second VDD reports the (already claimed) nearest VDD as well
+        self.assertEqual([m.status for m in diff.results], ['moved', 'moved', 'renamed'])
+        self.assertEqual([m.actual_row for m in diff.results], [0, 0, 2])
+        self.assertEqual([b['name'] for b in diff.extra], ['PAD_A'])
+
+    def test_tolerance_env(self):
+        with mock.patch.dict(os.environ, {'CHECKLIST_BUMP_TOLERANCE': '0.5'}):
+            self.assertEqual(get_bump_tolerance(), 0.5)
+            actual = BumpTable(['A'], [0.0], [0.0])
+            expected = BumpTable(['A'], [0.3], [0.0])
+            self.assertEqual(compare_bump_maps(expected, actual).results[0].status, 'matched')
+        with mock.patch.dict(os.environ, {'CHECKLIST_BUMP_TOLERANCE': 'bad'}):
+            self.assertEqual(get_bump_tolerance(), 0.001)
+
+
+class TestBumpCheckerBaseline(unittest.TestCase):
+    """IMP-12-0-0-27 Type 3 on the shipped item config keeps the baseline counts."""
+
+    def test_default_config_counts(self):
+        import importlib.util
+        import yaml
+        check_modules = Path(__file__).resolve().parents[3]
+        module_dir = check_modules / '12.0_PHYSICAL_VERIFICATION_CHECK'
+        spec = importlib.util.spec_from_file_location(
+            'IMP_12_0_0_27', module_dir / 'scripts' / 'checker' / 'IMP-12-0-0-27.py')
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        checker_cls = module.Check_12_0_0_27
+        with open(module_dir / 'inputs' / 'items' / 'IMP-12-0-0-27.yaml', encoding='utf-8') as f:
+            item_data = yaml.safe_load(f)
+        gds_csv = check_modules.parent / 'IP_project_folder' / 'reports' / 'tv_chip_gds_bump.csv'
+
+        checker = checker_cls()
+        checker.item_data = item_data
+        captured = {}
+        with mock.patch.object(checker_cls, 'validate_input_files', return_value=([gds_csv], [])), \
+             mock.patch.object(checker_cls, 'build_complete_output',
+                               side_effect=lambda **kwargs: captured.update(kwargs)):
+            checker._execute_type3()
+        self.assertEqual(len(captured['found_items']), 494)
+        self.assertEqual(len(captured['missing_items']), 167)
+        self.assertEqual(len(captured['waived_items']), 4)
+        self.assertIn('PAD_MEM_ADDRESS_A[0]: missing in GDS extraction', captured['missing_items'])
+        self.assertIn('VDD2: 1868.677 4165.56 (expected: 2186.654 4245.36)', captured['missing_items'])
+
+
+if __name__ == '__main__':
+    unittest.main()
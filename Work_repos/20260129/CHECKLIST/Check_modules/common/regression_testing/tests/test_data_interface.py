@@ -0,0 +1,206 @@
+import os
+import unittest
+import tempfile
+import shutil
+import importlib.util
+from pathlib import Path
+from unittest import mock
+
+import yaml
+
+from Check_modules.common import parse_interface
+
+CHECKLIST_ROOT = Path(__file__).resolve().parents[4]
+_spec = importlib.util.spec_from_file_location(
+    'data_interface', CHECKLIST_ROOT / 'Project_config' / 'scripts' / 'data_interface.py')
+data_interface = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(data_interface)
+
+TEMPLATE = """metadata:
+  version: '1.0'
+  total_items: 3
+sections:
+  5.0_SYNTHESIS_CHECK:
+    IMP-5-0-0-00:
+      description: Check synthesis log
+      input_files:
+      - ${CHECKLIST_ROOT}/IP_project_folder/logs/syn.log
+    # netlist items
+    IMP-5-0-0-01:
+      description: Check netlist
+      input_files: []
+  10.0_STA_DCD_CHECK:
+    IMP-10-0-0-00:
+      description: Check STA
+      input_files: []
+"""
+
+
+class TestDataInterfaceIncremental(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = Path(self.test_dir) / 'DATA_INTERFACE.template.yaml'
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _load(self, text):
+        with open(self.path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        return data_interface.load_yaml_with_nodes(self.path)
+
+    def _render(self, text, edit):
+        loaded = self._load(text)
+        data = yaml.safe_load(text)
+        edit(data)
+        new_text = data_interface.render_yaml_incremental(data, loaded)
+        self.assertEqual(yaml.safe_load(new_text), data)
+        return new_text
+
+    def test_unchanged_returns_original_text(self):
+        loaded = self._load(TEMPLATE)
+        self.assertEqual(data_interface.render_yaml_incremental(yaml.safe_load(TEMPLATE), loaded), TEMPLATE)
+
+    def test_changed_item_only_rewrites_its_block(self):
+        def edit(data):
+            data['sections']['5.0_SYNTHESIS_CHECK']['IMP-5-0-0-01']['description'] = 'Check netlist version'
+        new_text = self._render(TEMPLATE, edit)
+        self.assertEqual(new_text, TEMPLATE.replace('Check netlist\n', 'Check netlist version\n'))
+
+    def test_added_and_removed_items_keep_order_and_comments(self):
+        def edit(data):
+            sta = data['sections']['10.0_STA_DCD_CHECK']
+            sta['IMP-10-0-0-01'] = {'description': 'Check DCD', 'input_files': []}
+            del data['sections']['5.0_SYNTHESIS_CHECK']['IMP-5-0-0-00']
+        new_text = self._render(TEMPLATE, edit)
+        self.assertIn('    # netlist items\n', new_text)
+        self.assertNotIn('IMP-5-0-0-00', new_text)
+        self.assertLess(new_text.index('IMP-10-0-0-00'), new_text.index('IMP-10-0-0-01'))
+        self.assertTrue(new_text.startswith('metadata:\n  version: \'1.0\'\n'))
+
+    def test_crlf_line_endings_preserved(self):
+        text = TEMPLATE.replace('\n', '\r\n')
+
+        def edit(data):
+            data['sections']['10.0_STA_DCD_CHECK']['IMP-10-0-0-00']['description'] = 'Check STA paths'
+        new_text = self._render(text, edit)
+        self.assertEqual(new_text, text.replace('Check STA\r\n', 'Check STA paths\r\n'))
+
+    def test_comment_between_items_survives_neighbour_edits(self):
+        def edit(data):
+            items = data['sections']['5.0_SYNTHESIS_CHECK']
+            items['IMP-5-0-0-00']['input_files'] = []
+            items['IMP-5-0-0-01']['description'] = 'Check netlist version'
+        new_text = self._render(TEMPLATE, edit)
+        self.assertIn("      input_files: []\n    # netlist items\n    IMP-5-0-0-01:\n", new_text)
+
+    def test_flow_style_section_is_redumped_as_block(self):
+        text = "metadata: {version: '1.0'}\nsections: {A: {IMP-1: {description: x}}}\n"
+
+        def edit(data):
+            data['sections']['A']['IMP-1']['description'] = 'y'
+        new_text = self._render(text, edit)
+        self.assertEqual(new_text, "metadata: {version: '1.0'}\nsections:\n  A:\n    IMP-1:\n      description: y\n")
+
+    def test_flow_style_document_falls_back_to_full_dump(self):
+        text = "{metadata: {version: '1.0'}, sections: {A: {IMP-1: {description: x}}}}\n"
+
+        def edit(data):
+            data['sections']['A']['IMP-1']['description'] = 'y'
+        new_text = self._render(text, edit)
+        self.assertEqual(new_text, data_interface._dump_yaml_text(yaml.safe_load(new_text)))
+
+    def test_four_space_indent_stays_valid(self):
+        text = TEMPLATE.replace('\n  ', '\n    ').replace('\n      ', '\n        ')
+
+        def edit(data):
+            data['sections']['10.0_STA_DCD_CHECK']['IMP-10-0-0-01'] = {'description': 'Check DCD'}
+        self._render(text, edit)
+
+    def test_no_existing_file_dumps_everything(self):
+        data = yaml.safe_load(TEMPLATE)
+        new_text = data_interface.render_yaml_incremental(data, None)
+        self.assertEqual(yaml.safe_load(new_text), data)
+
+    def test_patch_mapping_collects_minimal_edits(self):
+        text = "a: 1\nb:\n  x: 1\n  y: 2\nc: 3\n"
+        loaded = self._load(text)
+        lines = text.splitlines(keepends=True)
+        new = {'a': 1, 'b': {'x': 1, 'y': 5}, 'c': 3, 'd': 4}
+        edits = []
+        data_interface._patch_mapping(lines, loaded[1], loaded[2], new, [], len(lines), edits)
+        self.assertEqual(sorted(edits), [(3, 4, '  y: 5\n'), (5, 5, 'd: 4\n')])
+
+    def test_patch_mapping_rejects_flow_style(self):
+        text = "a: {x: 1}\n"
+        loaded = self._load(text)
+        with self.assertRaises(data_interface._PatchError):
+            data_interface._patch_mapping(text.splitlines(keepends=True), loaded[1].value[0][1],
+                                          {'x': 1}, {'x': 2}, ['a'], 1, [])
+
+    def test_diff_interface_items(self):
+        old = yaml.safe_load(TEMPLATE)
+        new = yaml.safe_load(TEMPLATE)
+        new['sections']['5.0_SYNTHESIS_CHECK']['IMP-5-0-0-00']['input_files'] = []
+        del new['sections']['10.0_STA_DCD_CHECK']
+        new['sections']['12.0_PHYSICAL_VERIFICATION_CHECK'] = {'IMP-12-0-0-00': {'description': 'DRC'}}
+        changes = data_interface.diff_interface_items(old, new)
+        self.assertEqual(changes, {
+            'added': [('12.0_PHYSICAL_VERIFICATION_CHECK', 'IMP-12-0-0-00')],
+            'changed': [('5.0_SYNTHESIS_CHECK', 'IMP-5-0-0-00')],
+            'removed': [('10.0_STA_DCD_CHECK', 'IMP-10-0-0-00')],
+        })
+        self.assertEqual(data_interface.diff_interface_items(old, old),
+                         {'added': [], 'changed': [], 'removed': []})
+
+
+class TestParseInterfaceModuleHash(unittest.TestCase):
+    """Editing one module's items leaves the other modules' .source_hash alone."""
+
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.template = self.test_dir / 'DATA_INTERFACE.template.yaml'
+        self.modules = self.test_dir / 'Check_modules'
+        self.patches = [
+            mock.patch.object(parse_interface, 'DATA_INTERFACE_FILE', self.template),
+            mock.patch.object(parse_interface, 'CHECK_MODULES_DIR', self.modules),
+            mock.patch('builtins.print'),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        shutil.rmtree(self.test_dir)
+
+    def _hash(self, module):
+        return (self.modules / module / 'inputs' / '.source_hash').read_text(encoding='utf-8')
+
+    def test_edit_one_module(self):
+        self.template.write_text(TEMPLATE, encoding='utf-8')
+        parse_interface.parse_and_distribute()
+        syn_hash, sta_hash = self._hash('5.0_SYNTHESIS_CHECK'), self._hash('10.0_STA_DCD_CHECK')
+        sta_item = self.modules / '10.0_STA_DCD_CHECK' / 'inputs' / 'items' / 'IMP-10-0-0-00.yaml'
+        sta_mtime = os.stat(sta_item).st_mtime_ns
+
+        self.template.write_text(TEMPLATE.replace('Check netlist\n', 'Check netlist version\n'), encoding='utf-8')
+        data = parse_interface.load_data_interface()
+        items = parse_interface.extract_module_data(data['sections'])
+        sta_dir = self.modules / '10.0_STA_DCD_CHECK' / 'inputs'
+        syn_dir = self.modules / '5.0_SYNTHESIS_CHECK' / 'inputs'
+        self.assertFalse(parse_interface.should_regenerate(self.template, sta_dir,
+                                                           items=items['10.0_STA_DCD_CHECK']))
+        self.assertTrue(parse_interface.should_regenerate(self.template, syn_dir,
+                                                          items=items['5.0_SYNTHESIS_CHECK']))
+
+        parse_interface.parse_and_distribute()
+        self.assertEqual(self._hash('10.0_STA_DCD_CHECK'), sta_hash)
+        self.assertEqual(os.stat(sta_item).st_mtime_ns, sta_mtime)
+        self.assertNotEqual(self._hash('5.0_SYNTHESIS_CHECK'), syn_hash)
+        self.assertEqual(self._hash('5.0_SYNTHESIS_CHECK'),
+                         parse_interface.compute_items_hash(items['5.0_SYNTHESIS_CHECK']))
+
+
+if __name__ == '__main__':
+    unittest.main()
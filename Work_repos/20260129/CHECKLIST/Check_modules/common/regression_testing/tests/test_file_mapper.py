@@ -0,0 +1,68 @@
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+from Check_modules.common.file_mapper import map_files, choose_mode
+
+
+def count_lines(file_path):
+    """Module-level parse function (picklable for process pools)."""
+    text = Path(file_path).read_text()
+    if 'BOOM' in text:
+        raise ValueError('bad content')
+    return (Path(file_path).name, len(text.splitlines()))
+
+
+class TestFileMapper(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.files = []
+        for i in range(6):
+            path = Path(self.test_dir) / f"corner_{i}.log"
+            path.write_text("line\n" * (i + 1))
+            self.files.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_modes_preserve_input_order(self):
+        expected = [(f"corner_{i}.log", i + 1) for i in range(6)]
+        for mode in ('serial', 'thread', 'process'):
+            results, errors = map_files(count_lines, self.files, mode=mode, max_workers=3)
+            self.assertEqual(results, expected, mode)
+            self.assertEqual(errors, [])
+
+    def test_errors_collected_per_file(self):
+        self.files[2].write_text("BOOM\n")
+        missing = Path(self.test_dir) / "missing.log"
+        results, errors = map_files(count_lines, self.files + [missing], mode='thread')
+        self.assertEqual(len(results), 5)
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(errors[0].startswith(f"Error parsing {self.files[2]}: bad content"))
+        self.assertIn("missing.log", errors[1])
+
+    def test_choose_mode(self):
+        self.assertEqual(choose_mode(count_lines, self.files[:1], max_workers=4), 'serial')
+        self.assertEqual(choose_mode(count_lines, self.files, max_workers=1), 'serial')
+        # Small inputs stay serial by default
+        self.assertEqual(choose_mode(count_lines, self.files, max_workers=4), 'serial')
+        env = {'CHECKLIST_PARALLEL_MIN_BYTES': '0', 'CHECKLIST_PARALLEL_PROCESS_BYTES': '10'}
+        with mock.patch.dict(os.environ, env):
+            self.assertEqual(choose_mode(count_lines, self.files, max_workers=4), 'process')
+            # Lambdas cannot be pickled -> threads
+            self.assertEqual(choose_mode(lambda p: p, self.files, max_workers=4), 'thread')
+
+    def test_unpicklable_process_request_falls_back(self):
+        results, errors = map_files(lambda p: p.name, self.files, mode='process', max_workers=2)
+        self.assertEqual(results, [p.name for p in self.files])
+        self.assertEqual(errors, [])
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            map_files(count_lines, self.files, mode='gpu')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import gzip
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from Check_modules.common.netlist_scanner import NetlistScanner, scan_netlists
+
+SAMPLE_NETLIST = r"""`timescale 1ns/1ps
+// assign fake = 1;  comment
+/* block
+   assign also_fake = 2; module nope;
+*/
+module top (a, b, \weird;name , y);
+  input a, b;
+  output [3:0] y;
+  wire n1, n2;
+  assign y[0] = 1'b0, y[1] = a;
+  assign \esc/sig[3]  = {a, b};
+  TIEHIxp5 tie_hi_0 (.H(n1));
+  TIELO_X1 u_tlo (.L(n2));
+  AND2 #(.W(2)) u_and (.A(a), .B(/* c */ b), .Y(y[2]));
+  BUF u_b1 (.A(n1), .Y(n2)), u_b2 (.A(n2), .Y(y[3]));
+  \cell$x  \inst(0)  (.A(a));
+endmodule
+module leaf(x); input x; endmodule
+"""
+
+EXPECTED = [
+    ('module', 'top', 6),
+    ('assign', 'y[0]', 10),
+    ('assign', 'y[1]', 10),
+    ('assign', '\\esc/sig[3]', 11),
+    ('instance', 'tie_hi_0', 12),
+    ('tie_cell', 'tie_hi_0', 12),
+    ('instance', 'u_tlo', 13),
+    ('tie_cell', 'u_tlo', 13),
+    ('instance', 'u_and', 14),
+    ('instance', 'u_b1', 15),
+    ('instance', 'u_b2', 15),
+    ('instance', '\\inst(0)', 16),
+    ('endmodule', 'top', 17),
+    ('module', 'leaf', 18),
+    ('endmodule', 'leaf', 18),
+]
+
+
+class TestNetlistScanner(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.plain = Path(self.test_dir) / "top.v"
+        self.plain.write_bytes(SAMPLE_NETLIST.encode())
+        self.gz = Path(self.test_dir) / "top.v.gz"
+        with gzip.open(self.gz, 'wb') as f:
+            f.write(SAMPLE_NETLIST.encode())
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _summary(self, scanner):
+        return [(e.kind, e.name, e.line_number) for e in scanner.events()]
+
+    def test_plain_netlist_events(self):
+        self.assertEqual(self._summary(NetlistScanner(self.plain)), EXPECTED)
+
+    def test_assign_details(self):
+        assigns = [e for e in NetlistScanner(self.plain).events() if e.kind == 'assign']
+        self.assertEqual([(e.module, e.lhs, e.rhs) for e in assigns],
+                         [('top', 'y[0]', "1'b0"), ('top', 'y[1]', 'a'),
+                          ('top', '\\esc/sig[3]', '{a,b}')])
+        self.assertTrue(assigns[0].is_constant_assign)
+        self.assertFalse(assigns[1].is_constant_assign)
+
+    def test_instance_cells(self):
+        cells = {e.name: e.cell for e in NetlistScanner(self.plain).events()
+                 if e.kind == 'instance'}
+        self.assertEqual(cells['u_and'], 'AND2')
+        self.assertEqual(cells['\\inst(0)'], '\\cell$x')
+
+    def test_gzip_small_chunks_match_plain(self):
+        # Tiny chunks force tokens, comments and escaped names across chunk boundaries
+        for chunk_size in (3, 5, 7, 64):
+            scanner = NetlistScanner(self.gz, chunk_size=chunk_size)
+            self.assertEqual(self._summary(scanner), EXPECTED, chunk_size)
+
+    def test_subscribers_share_one_pass(self):
+        assigns, ties = [], []
+        counts = scan_netlists([self.plain, self.gz],
+                               {'assign': [assigns.append], 'tie_cell': [ties.append]})
+        self.assertEqual(len(assigns), 6)
+        self.assertEqual(len(ties), 4)
+        self.assertEqual(counts['instance'], 12)
+        self.assertEqual(counts['module'], 4)
+
+    def test_custom_tie_pattern(self):
+        ties = [e.name for e in NetlistScanner(self.plain, tie_cell_pattern=r'^BUF').events()
+                if e.kind == 'tie_cell']
+        self.assertEqual(ties, ['u_b1', 'u_b2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import pickle
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from Check_modules.common.output_formatter import (
+    DetailBatch, DetailIndex, DetailItem, OutputFormatter, Severity, create_check_result,
+)
+
+
+def _naive_reason_match(details, text):
+    return next((d for d in details
+                 if d.reason and text in d.reason.replace('[WAIVED_AS_INFO]', '').replace('[WAIVED_INFO]', '').strip()), None)
+
+
+class TestDetailIndex(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.details = [
+            DetailItem(Severity.FAIL, 'a', 1, 'x.rpt', 'Missing a'),
+            DetailItem(Severity.INFO, 'b', 2, 'x.rpt', 'Found b'),
+            DetailItem(Severity.FAIL, 'a', 3, 'x.rpt', 'Missing a again'),
+            DetailItem(Severity.INFO, '', 0, 'N/A', 'legacy waiver for block top/u1 cells[WAIVED_INFO]'),
+            DetailItem(Severity.WARN, 'c', 4, 'y.rpt', 'Unexpected c'),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_name_and_severity_lookup(self):
+        index = DetailIndex(self.details)
+        self.assertIs(index.first_named('a'), self.details[0])
+        self.assertIsNone(index.first_named('zzz'))
+        self.assertEqual(index.first_of_each(['c', 'a', 'a', 'missing']),
+                         [self.details[0], self.details[4]])
+        self.assertEqual(index.with_severity(Severity.FAIL), [self.details[0], self.details[2]])
+        self.assertEqual(index.with_severity(Severity.WARN), [self.details[4]])
+
+    def test_reason_match_equals_linear_scan(self):
+        index = DetailIndex(self.details)
+        for text in ['waiver for block top/u1 cells', 'for block top', 'waiver', 'a again',
+                     'r for block top/u1 ce', 'Missing', 'not present', '']:
+            self.assertIs(index.first_reason_containing(text),
+                          _naive_reason_match(self.details, text), text)
+
+    def test_result_index_refreshes_and_is_not_pickled(self):
+        result = create_check_result(value=1, is_pass=False, details=list(self.details))
+        index = result.detail_index()
+        self.assertIs(result.detail_index(), index)
+        result.details.append(DetailItem(Severity.FAIL, 'd', 5, 'z.rpt', 'Missing d'))
+        self.assertEqual(len(result.detail_index().with_severity(Severity.FAIL)), 3)
+        clone = pickle.loads(pickle.dumps(result))
+        self.assertIsNone(clone._index)
+        self.assertEqual(clone.details, result.details)
+
+    def test_grouped_output(self):
+        result = create_check_result(
+            value=2, is_pass=False, details=self.details,
+            error_groups={'ERROR01': {'description': 'Missing items', 'items': ['a', 'zzz']}},
+            info_groups={'INFO01': {'description': 'Waived', 'items': ['waiver for block top/u1 cells']},
+                         'INFO02': {'description': 'Found', 'items': []}},
+            item_desc='Check')
+        formatter = OutputFormatter('IMP-X', 'Check')
+        log_path = Path(self.test_dir) / 'x.log'
+        formatter.write_log(result, log_path)
+        self.assertEqual(log_path.read_text(),
+                         'FAIL:IMP-X:Check\n'
+                         '[WAIVED_INFO]:legacy waiver for block top/u1 cells\n'
+                         'IMP-X-ERROR01: Missing items:\n'
+                         '  Severity: Fail Occurrence: 1\n'
+                         '  - a\n'
+                         'IMP-X-INFO02: Found:\n'
+                         '  Severity: Info Occurrence: 1\n'
+                         '  - b\n'
+                         '\n')
+        summary = result.get_summary_data()
+        self.assertEqual([f['detail'] for f in summary['failures']], ['a', 'zzz'])
+        self.assertEqual(summary['occurrence'], 2)
+        waived = summary['infos'][0]
+        self.assertEqual((waived['detail'], waived['source_line']), ('N/A', 'N/A'))
+
+
+class TestDetailBatch(unittest.TestCase):
+    def test_columns_round_trip(self):
+        batch = DetailBatch()
+        batch.extend(Severity.FAIL, ['p1', 'p2'], [10, 11], '/run/a.rpt', 'Max cap violation')
+        batch.append('warn', 'p3', 'N/A', '/run/b.rpt', 'Check')
+        batch.add(DetailItem(Severity.INFO, 'p4', 0, '/run/a.rpt', 'Found'))
+        self.assertEqual(len(batch), 4)
+        details = batch.to_details()
+        self.assertEqual(details[0], DetailItem(Severity.FAIL, 'p1', 10, '/run/a.rpt', 'Max cap violation'))
+        self.assertEqual(details[2].line_number, 'N/A')
+        self.assertEqual(batch[3].severity, Severity.INFO)
+        # Interned: one string object per distinct file path / reason
+        self.assertIs(details[0].file_path, details[3].file_path)
+        self.assertIs(details[0].reason, details[1].reason)
+        self.assertEqual(batch.severity_counts(),
+                         {Severity.INFO: 1, Severity.WARN: 1, Severity.FAIL: 2})
+        with self.assertRaises(ValueError):
+            batch.extend(Severity.FAIL, ['x', 'y'], [1])
+
+    def test_create_check_result_accepts_batch(self):
+        batch = DetailBatch()
+        batch.extend(Severity.FAIL, ['a', 'b'], [1, 2], 'x.rpt', 'bad')
+        result = create_check_result(value=2, is_pass=False, details=batch)
+        self.assertIsInstance(result.details, list)
+        self.assertEqual([d.name for d in result.details], ['a', 'b'])
+
+    def test_slotted_detail_pickles_compactly(self):
+        detail = DetailItem('fail', 'a', 1, 'x.rpt', 'bad')
+        self.assertFalse(hasattr(detail, '__dict__'))
+        self.assertEqual(detail.severity, Severity.FAIL)
+        clone = pickle.loads(pickle.dumps([detail, detail], protocol=pickle.HIGHEST_PROTOCOL))
+        self.assertEqual(clone[0], detail)
+        # Caches written before slots: dict state is still restored
+        legacy = DetailItem.__new__(DetailItem)
+        legacy.__setstate__({'severity': Severity.WARN, 'name': 'n', 'line_number': 3,
+                             'file_path': 'f', 'reason': 'r'})
+        self.assertEqual(legacy, DetailItem(Severity.WARN, 'n', 3, 'f', 'r'))
+
+
+if __name__ == '__main__':
+    unittest.main()
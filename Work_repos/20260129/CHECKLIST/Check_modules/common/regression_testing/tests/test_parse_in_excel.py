@@ -0,0 +1,119 @@
+import os
+import csv
+import time
+import unittest
+import tempfile
+import shutil
+import zipfile
+import importlib.util
+from pathlib import Path
+from unittest import mock
+
+CHECKLIST_ROOT = Path(__file__).resolve().parents[4]
+_spec = importlib.util.spec_from_file_location(
+    'parse_in_excel', CHECKLIST_ROOT / 'Project_config' / 'scripts' / 'parse_in_excel.py')
+parse_in_excel = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(parse_in_excel)
+
+WORKBOOK_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+ xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+<sheets><sheet name="BE_check" sheetId="1" r:id="rId1"/></sheets></workbook>"""
+
+RELS_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="worksheet" Target="worksheets/sheet1.xml"/></Relationships>"""
+
+
+def _write_workbook(path, rows):
+    """rows: list of (colE, colF); strings go through the shared string table."""
+    strings = []
+    sheet_rows = []
+    for i, (item, info) in enumerate(rows, 1):
+        cells = []
+        for col, value in (('E', item), ('F', info)):
+            strings.append(value)
+            cells.append('<c r="%s%d" t="s"><v>%d</v></c>' % (col, i, len(strings) - 1))
+        sheet_rows.append('<row r="%d">%s</row>' % (i, ''.join(cells)))
+    sheet = ('<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+             '<sheetData>%s</sheetData></worksheet>' % ''.join(sheet_rows))
+    sst = ('<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">%s</sst>'
+           % ''.join('<si><t>%s</t></si>' % s for s in strings))
+    with zipfile.ZipFile(str(path), 'w') as zf:
+        zf.writestr('xl/workbook.xml', WORKBOOK_XML)
+        zf.writestr('xl/_rels/workbook.xml.rels', RELS_XML)
+        zf.writestr('xl/worksheets/sheet1.xml', sheet)
+        zf.writestr('xl/sharedStrings.xml', sst)
+
+
+class TestParseInExcelCache(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.workbook = self.test_dir / 'Check_List.xlsx'
+        self.out_dir = self.test_dir / 'out'
+        self.cache_dir = self.out_dir / '.parse_cache'
+        _write_workbook(self.workbook, [
+            ('5.0 - SYNTHESIS CHECK', 'header'),
+            ('IMP-5-0-0-00', 'Check synthesis log'),
+        ])
+        env = {k: v for k, v in os.environ.items() if k not in ('CHECKLIST_PARSE_CACHE', 'CHECKLIST_SHEET')}
+        self.patches = [mock.patch.dict(os.environ, env, clear=True), mock.patch('builtins.print')]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        shutil.rmtree(self.test_dir)
+
+    def _run(self):
+        out_csv = parse_in_excel.parse_in_excel('BE', self.workbook, self.out_dir)
+        with open(str(out_csv), encoding='utf-8', newline='') as f:
+            return list(csv.reader(f))[1:]
+
+    def test_cache_hit_skips_parsing(self):
+        first = self._run()
+        self.assertEqual(first, [['5.0_SYNTHESIS_CHECK', 'IMP-5-0-0-00', 'Check synthesis log']])
+        self.assertEqual(len(list(self.cache_dir.glob('rows_*.json.gz'))), 1)
+        with mock.patch.object(parse_in_excel, '_read_sheet_rows', side_effect=AssertionError('parsed')):
+            self.assertEqual(self._run(), first)
+
+    def test_changed_workbook_invalidates_cache(self):
+        self._run()
+        _write_workbook(self.workbook, [
+            ('5.0 - SYNTHESIS CHECK', 'header'),
+            ('IMP-5-0-0-00', 'Check synthesis log'),
+            ('IMP-5-0-0-01', 'Check netlist'),
+        ])
+        with mock.patch.object(parse_in_excel, '_read_sheet_rows',
+                               wraps=parse_in_excel._read_sheet_rows) as reader:
+            rows = self._run()
+        self.assertEqual(reader.call_count, 1)
+        self.assertEqual([r[1] for r in rows], ['IMP-5-0-0-00', 'IMP-5-0-0-01'])
+        self.assertEqual(len(list(self.cache_dir.glob('rows_*.json.gz'))), 2)
+
+    def test_cache_off(self):
+        os.environ['CHECKLIST_PARSE_CACHE'] = 'off'
+        with mock.patch.object(parse_in_excel, '_read_sheet_rows',
+                               wraps=parse_in_excel._read_sheet_rows) as reader:
+            self._run()
+            self._run()
+        self.assertEqual(reader.call_count, 2)
+        self.assertFalse(self.cache_dir.exists())
+
+    def test_old_entries_are_pruned(self):
+        self.cache_dir.mkdir(parents=True)
+        stale = time.time() - 3600
+        for i in range(parse_in_excel.PARSE_CACHE_MAX_ENTRIES):
+            old = self.cache_dir / ('rows_old%d.json.gz' % i)
+            old.write_bytes(b'')
+            os.utime(str(old), (stale + i, stale + i))
+        self._run()
+        names = sorted(p.name for p in self.cache_dir.glob('rows_*.json.gz'))
+        self.assertEqual(len(names), parse_in_excel.PARSE_CACHE_MAX_ENTRIES)
+        self.assertNotIn('rows_old0.json.gz', names)
+        self.assertEqual(len([n for n in names if not n.startswith('rows_old')]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import gzip
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+from Check_modules.common import stream_writer
+from Check_modules.common.stream_writer import aggregate_module_files, append_file, sidecar_path
+from Check_modules.common.output_formatter import (
+    DetailItem, OutputFormatter, Severity, create_check_result,
+)
+
+
+class TestAppendFile(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.src = self.test_dir / 'src.log'
+        self.src.write_bytes(b'PASS:IMP-1:desc\r\n  - \xff raw\n' * 1000)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _append_twice(self, out_path):
+        with open(out_path, 'wb', buffering=0) as out:
+            out.write(b'head\n')
+            append_file(out, self.src)
+            out.write(b'mid\n')
+            append_file(out, self.src)
+        return out_path.read_bytes()
+
+    def test_bytes_are_copied_verbatim(self):
+        data = self.src.read_bytes()
+        self.assertEqual(self._append_twice(self.test_dir / 'out'),
+                         b'head\n' + data + b'mid\n' + data)
+
+    def test_fallback_without_kernel_copy(self):
+        expected = self._append_twice(self.test_dir / 'fast')
+        with mock.patch.object(stream_writer, '_KERNEL_COPIES', []):
+            self.assertEqual(self._append_twice(self.test_dir / 'slow'), expected)
+
+    def test_aggregate_layout(self):
+        logs = self.test_dir / 'Check_modules' / 'M1' / 'logs'
+        logs.mkdir(parents=True)
+        (logs / 'b.log').write_bytes(b'B\n')
+        (logs / 'a.log').write_bytes(b'A\n')
+        out = aggregate_module_files(self.test_dir, ['M1', 'M2'], 'logs', '*.log',
+                                     self.test_dir / 'Work' / 'CheckList.log',
+                                     title='Log', missing='log')
+        self.assertEqual(out.read_text().replace('\r\n', '\n'),
+                         "===== CheckList Aggregated Log =====\n"
+                         f"Root: {self.test_dir}\n"
+                         "Modules: M1, M2\n\n"
+                         "\n===== Module: M1 =====\n"
+                         "\n--- a.log ---\nA\n"
+                         "\n--- b.log ---\nB\n")
+
+
+class TestTruncatedOutput(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        details = [DetailItem(Severity.FAIL, f'pin{i}', i + 1, 'x.rpt', 'Missing')
+                   for i in range(5)]
+        details.append(DetailItem(Severity.INFO, 'ok', 9, 'x.rpt', 'Found'))
+        self.result = create_check_result(
+            value=5, is_pass=False, details=details,
+            error_groups={'ERROR01': {'description': 'Missing pins',
+                                      'items': [f'pin{i}' for i in range(5)]}},
+            info_groups={'INFO01': {'description': 'Found', 'items': ['ok']}},
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _write(self, **kwargs):
+        formatter = OutputFormatter('IMP-1', 'Pins', **kwargs)
+        log_path = self.test_dir / 'IMP-1.log'
+        rpt_path = self.test_dir / 'IMP-1.rpt'
+        formatter.write_log(self.result, log_path, mode='w')
+        formatter.write_report(self.result, rpt_path, mode='w')
+        return log_path, rpt_path
+
+    def test_unlimited_by_default(self):
+        with mock.patch.dict('os.environ', {}, clear=True):
+            log_path, rpt_path = self._write()
+        self.assertIn('  - pin4\n', log_path.read_text())
+        self.assertNotIn('more', rpt_path.read_text())
+        self.assertFalse(sidecar_path(log_path).exists())
+
+    def test_first_n_plus_more_line(self):
+        log_path, rpt_path = self._write(max_items=2, full_detail_sidecar=False)
+        log = log_path.read_text()
+        self.assertIn('  Severity: Fail Occurrence: 5\n  - pin0\n  - pin1\n  ... and 3 more\n', log)
+        self.assertIn('  - ok\n', log)
+        rpt = rpt_path.read_text()
+        self.assertIn('Fail Occurrence: 5\n', rpt)
+        self.assertIn('2: Fail: pin1', rpt)
+        self.assertNotIn('3: Fail:', rpt)
+        self.assertIn('... and 3 more\nInfo Occurrence: 1\n', rpt)
+        self.assertFalse(sidecar_path(rpt_path).exists())
+
+    def test_sidecar_holds_full_output(self):
+        full_log, full_rpt = [p.read_text() for p in self._write()]
+        log_path, rpt_path = self._write(max_items=2, full_detail_sidecar=True)
+        with gzip.open(sidecar_path(log_path), 'rt', encoding='utf-8') as f:
+            self.assertEqual(f.read(), full_log)
+        with gzip.open(sidecar_path(rpt_path), 'rt', encoding='utf-8') as f:
+            self.assertEqual(f.read(), full_rpt)
+        # A later run that omits nothing drops the stale sidecar
+        self._write(max_items=10, full_detail_sidecar=True)
+        self.assertFalse(sidecar_path(log_path).exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
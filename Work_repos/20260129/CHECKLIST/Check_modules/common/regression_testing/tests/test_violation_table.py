@@ -0,0 +1,172 @@
+import os
+import importlib.util
+import unittest
+from pathlib import Path
+from unittest import mock
+from Check_modules.common.violation_table import ViolationTable
+from Check_modules.common.checker_templates.waiver_handler_template import WaiverHandlerMixin
+
+
+class TestViolationTable(unittest.TestCase):
+    def _build(self, count):
+        table = ViolationTable()
+        for i in range(count):
+            table.append(f"pin_{i}", 1.0, 1.0 + i, -float(i), rule='max_capacitance',
+                         view='view_a' if i % 2 else 'view_b', line_number=i + 1,
+                         file_path='a.rpt')
+        return table
+
+    def test_filter_and_top(self):
+        table = self._build(10)
+        self.assertEqual(len(table.filter(view='view_a')), 5)
+        self.assertEqual(len(table.filter(max_slack=-4.5)), 5)
+        worst = table.top(3)
+        self.assertEqual([r['pin'] for r in worst.iter_rows()], ['pin_9', 'pin_8', 'pin_7'])
+
+    def test_histogram_and_summary(self):
+        table = self._build(4)
+        counts, edges = table.histogram(bins=2)
+        self.assertEqual(sum(counts), 4)
+        self.assertEqual(len(edges), 3)
+        summary = table.summary()
+        self.assertEqual(summary['total'], 4)
+        self.assertEqual(summary['violations'], 3)
+        self.assertEqual(summary['worst_slack'], -3.0)
+
+    def test_apply_waivers(self):
+        table = self._build(6)
+        handler = WaiverHandlerMixin()
+        waived, unwaived, used = table.apply_waivers(
+            {'pin_1': 'ok', 'pin_4*': '', 'unused': ''}, handler.match_waiver_entry, key='pin')
+        self.assertEqual(sorted(waived.unique('pin')), ['pin_1', 'pin_4'])
+        self.assertEqual(len(unwaived), 4)
+        self.assertEqual(used, {'pin_1': 1, 'pin_4*': 1})
+
+    def test_apply_waivers_by_name(self):
+        table = ViolationTable()
+        for pin in ('atb_0', 'atb_01', 'atb_01'):
+            table.append(pin, 0.1, 0.2, -0.1, view='v', name=f"Pin '{pin}' (View: v)")
+        handler = WaiverHandlerMixin()
+        waived, unwaived, used = table.apply_waivers({'atb_01': ''}, handler.match_waiver_entry)
+        # Matching the pin alone would also waive atb_0 (substring of atb_01)
+        self.assertEqual(waived.unique('pin'), ['atb_01'])
+        self.assertEqual(unwaived.unique('pin'), ['atb_0'])
+        self.assertEqual(used, {'atb_01': 2})
+
+        calls = []
+        table.apply_waivers({'atb_01': ''}, lambda name, d: calls.append(name))
+        self.assertEqual(len(calls), 2)
+
+    def test_bounded_items(self):
+        table = self._build(50)
+        items = table.to_items(limit=5)
+        self.assertEqual(len(items), 5)
+        self.assertIn("Pin 'pin_49'", next(iter(items)))
+        self.assertEqual(table.describe_truncation('Violations', limit=5),
+                         'Violations (showing worst 5 of 50)')
+        self.assertEqual(table.describe_truncation('Violations', limit=0), 'Violations')
+
+        with mock.patch.dict(os.environ, {'CHECKLIST_MAX_DETAIL_ROWS': '7'}):
+            self.assertEqual(len(table.to_items()), 7)
+
+    def test_frozen_table_rejects_append(self):
+        table = self._build(2)
+        len(table.column('slack'))
+        with self.assertRaises(RuntimeError):
+            table.append('late', 0, 0, 0)
+
+
+CHECK_MODULES_DIR = Path(__file__).resolve().parents[3]
+STA_CHECKER_DIR = CHECK_MODULES_DIR / '10.0_STA_DCD_CHECK' / 'scripts' / 'checker'
+STA_REPORT_DIR = CHECK_MODULES_DIR.parent / 'IP_project_folder' / 'reports' / '10.0'
+CAP_SS = 'func_rcff_0p825v_125c_pcff_cmin_pcss3_hold'
+CAP_FF = 'func_rcff_0p825v_125c_pcff_cmin_pcff3_hold'
+TRAN_AS = 'at_speed_rcff_0p825v_125c_pcff_cmin_pcff3_hold'
+TRAN_FN = 'func_rcff_0p825v_125c_pcff_cmin_pcff3_hold'
+PMA = 'u_pma_top/u_pma_ana_wrapper/u_pma_ana'
+
+
+def _cap(pin, required, actual, slack, view):
+    return f"Pin '{pin}': Required={required}, Actual={actual}, Slack={slack} (View: {view})"
+
+
+def _tran(pin, view, slack):
+    return f"{pin} (view: {view}, slack: {slack}ns)"
+
+
+class TestStaCheckerBaselineParity(unittest.TestCase):
+    """
+    Type 4 waived/unwaived sets of the table-based STA checkers must equal
+    the baseline per-row waiver loop on the sample reports (expected sets
+    below were produced by the pre-ViolationTable checkers).
+    """
+
+    def _run_type4(self, script, reports, waive_items):
+        spec = importlib.util.spec_from_file_location(
+            script.replace('-', '_'), STA_CHECKER_DIR / f"{script}.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        checker_cls = getattr(module, 'Check_' + script[4:].replace('-', '_'))
+        captured = {}
+        with mock.patch.object(checker_cls, 'validate_input_files',
+                               return_value=([STA_REPORT_DIR / r for r in reports], [])), \
+             mock.patch.object(checker_cls, 'get_waivers',
+                               return_value={'waive_items': waive_items}), \
+             mock.patch.object(checker_cls, 'build_complete_output',
+                               side_effect=lambda **kwargs: captured.update(kwargs)), \
+             mock.patch.dict(os.environ, {'CHECKLIST_MAX_DETAIL_ROWS': '0'}):
+            checker_cls()._execute_type4()
+        return (set(captured['waived_items']), set(captured['missing_items']),
+                set(captured['unused_waivers']))
+
+    def test_max_capacitance_waivers_match_baseline(self):
+        waived, missing, unused = self._run_type4(
+            'IMP-10-0-0-13', ['maxcap_1.rpt', 'maxcap_2.rpt'],
+            ['atb_0', f'{PMA}/*core_1', 'cmnda_rext', 'nomatch'])
+        self.assertEqual(waived, {
+            _cap('atb_0', '0.0830', '0.1375', '-0.0545', CAP_FF),
+            _cap('atb_0', '0.0830', '0.1417', '-0.0587', CAP_SS),
+            _cap('cmnda_rext', '0.0830', '0.1273', '-0.0444', CAP_FF),
+            _cap('cmnda_rext', '0.0830', '0.1275', '-0.0445', CAP_SS),
+        })
+        self.assertEqual(missing, {
+            _cap('atb_1', '0.0830', '0.1376', '-0.0547', CAP_FF),
+            _cap('atb_1', '0.0830', '0.1417', '-0.0587', CAP_SS),
+            _cap(f'{PMA}/cmnda_atb_core_0', '0.1000', '0.1375', '-0.0375', CAP_FF),
+            _cap(f'{PMA}/cmnda_atb_core_0', '0.1000', '0.1417', '-0.0417', CAP_SS),
+            _cap(f'{PMA}/cmnda_atb_core_1', '0.1000', '0.1376', '-0.0376', CAP_FF),
+            _cap(f'{PMA}/cmnda_atb_core_1', '0.1000', '0.1417', '-0.0417', CAP_SS),
+        })
+        self.assertEqual(unused, {'nomatch', f'{PMA}/*core_1'})
+
+    def test_max_transition_waivers_match_baseline(self):
+        waived, missing, unused = self._run_type4(
+            'IMP-10-0-0-12', ['maxtran_1.rpt', 'maxtran_2.rpt'],
+            ['atb_1', '*pma_ana_data_m*', 'cmnda_rext', 'nomatch'])
+        self.assertEqual(waived, {
+            _tran('atb_1', TRAN_AS, '-0.4285'),
+            _tran('atb_1', TRAN_FN, '-0.4285'),
+            _tran('cmnda_rext', TRAN_AS, '-0.3666'),
+            _tran('cmnda_rext', TRAN_FN, '-0.4666'),
+            _tran(f'{PMA}/cmnda_rext', TRAN_AS, '-0.4166'),
+            _tran(f'{PMA}/cmnda_rext', TRAN_FN, '-0.4666'),
+            _tran(f'{PMA}/pma_ana_data_m', TRAN_AS, '-0.5108'),
+            _tran(f'{PMA}/pma_ana_data_m', TRAN_FN, '-0.5108'),
+        })
+        self.assertEqual(missing, {
+            _tran('FE_ECO_0828_fix_transC52_cmn_ref_clk_int/clk', TRAN_AS, '-0.1323'),
+            _tran('atb_0', TRAN_AS, '-0.4277'),
+            _tran('atb_0', TRAN_FN, '-0.4277'),
+            _tran('cmn_ref_clk_int', TRAN_AS, '-0.0306'),
+            _tran(f'{PMA}/cmnda_ref_clk_int', TRAN_AS, '-0.3306'),
+            _tran(f'{PMA}/cmnda_ref_clk_int', TRAN_FN, '-0.0490'),
+            _tran(f'{PMA}/data_se_pd_ctrl', TRAN_AS, '-0.0023'),
+            _tran(f'{PMA}/data_se_pd_ctrl', TRAN_FN, '-0.0023'),
+            _tran(f'{PMA}/pma_ana_data_p', TRAN_AS, '-0.5108'),
+            _tran(f'{PMA}/pma_ana_data_p', TRAN_FN, '-0.5108'),
+        })
+        self.assertEqual(unused, {'nomatch'})
+
+
+if __name__ == '__main__':
+    unittest.main()
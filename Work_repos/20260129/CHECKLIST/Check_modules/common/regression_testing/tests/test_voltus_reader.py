@@ -0,0 +1,169 @@
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+from Check_modules.common import voltus_reader
+from Check_modules.common.voltus_reader import (
+    parse_lvs_report, parse_powerup_report, parse_voltus_log, read_powerup_report,
+)
+
+POWERUP_RPT = """
+Summary
+=======
+
+\tSimulation time = 4.50155e-07s
+\tThreshold (Vt)  = 0.675V
+
+\tMeasured maximum rush current          = 0.427297A
+\tMeasured wake-up time for switched net = 1.11e-07s
+
+\tNumber of power switches turned on in this simulation = 3 [of total 4]
+\tLast power switch to turn-on in this simulation is 'top/PSW_3:NSLEEPIN' at time 4.5e-07s.
+
+
+Detailed Report
+===============
+
+\tORDER       TURN-ON TIME  PEAK CURRENT    INSTANCES
+\t1             7.33883e-10   0.0134068     top/PSW_1:NSLEEPIN
+\t2             9.1e-10       0.0200000     top/PSW_2:NSLEEPIN
+\t3             8.2e-10       0.0100000     top/PSW_3:NSLEEPIN
+"""
+
+VOLTUS_LOG = """<CMD> set_rail_analysis_mode -method static -em_temperature 105 -temperature 125
+    RC-Corner Temperature : 125 Celsius
+**ERROR: (IMPLF-388):\tLEF58_MUSTJOINALLPORTS property is specified in pin 'SB[0]'
+ERROR: license checkout failed
+**WARN: (IMPLF-378):\tpin 'A' has no antenna
+WARNING (TCLCMD-1403): 'set_load' ignored
+** WARN:  (VOLTUS_POWR-3401): Leakage Power table missing.
+
+Rail status:
+  0.825V    VDD
+  0V    VSS
+
+Total Power
+-------------------
+Total Internal Power:     2684.12218905 \t   66.5358%
+Total Switching Power:     883.45361717 \t   21.8996%
+Total Leakage Power:       466.52775215 \t   11.5646%
+Total Power:              4034.10355840
+-------------------
+Begin IR Drop (Linear) Report Generation
+  Voltage: 0
+  Threshold: 0.015
+  Minimum, Average, Maximum IR Drop: 0.000V, 0.248mV, 11.639mV
+    Layer with maximum IR Drop:  M0
+Ended IR Drop (Linear) Report Generation
+"""
+
+
+class TestVoltusReader(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.rpt = Path(self.test_dir) / "Powerup.rpt"
+        self.rpt.write_text(POWERUP_RPT)
+        self.log = Path(self.test_dir) / "run.logv"
+        self.log.write_text(VOLTUS_LOG)
+        voltus_reader.clear_cache()
+
+    def tearDown(self):
+        voltus_reader.clear_cache()
+        shutil.rmtree(self.test_dir)
+
+    def test_powerup_summary_and_switch_table(self):
+        report = parse_powerup_report(self.rpt)
+        self.assertEqual(report.rush_current, 0.427297)
+        self.assertEqual(report.wake_up_time, 1.11e-07)
+        self.assertEqual((report.switches_turned_on, report.total_switches), (3, 4))
+        self.assertFalse(report.all_switches_on)
+        self.assertEqual(report.last_switch_instance, 'top/PSW_3:NSLEEPIN')
+        self.assertEqual(report.line_numbers['rush_current'], 8)
+        self.assertEqual(report.line_numbers['switches'], 11)
+
+        table = report.switches
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.first()['instance'], 'top/PSW_1:NSLEEPIN')
+        self.assertEqual(table.first()['line_number'], 19)
+        self.assertEqual(table.peak()['instance'], 'top/PSW_2:NSLEEPIN')
+        times, currents = table.time_series()
+        self.assertEqual(times, sorted(times))
+        self.assertEqual(currents, [0.0134068, 0.01, 0.02])
+
+    def test_voltus_log(self):
+        log = parse_voltus_log(self.log)
+        self.assertEqual([(m.code, m.line_number) for m in log.errors], [('IMPLF-388', 3), (None, 4)])
+        self.assertEqual(log.errors[1].text, 'license checkout failed')
+        # '** WARN:' (with a space) is not a coded warning line
+        self.assertEqual(log.warning_count, 2)
+        self.assertEqual(log.warning_counts(), {'IMPLF-378': 1, 'TCLCMD-1403': 1})
+        self.assertEqual(log.rail_voltages, {'VDD': 0.825, 'VSS': 0.0})
+        self.assertEqual(len(log.power), 1)
+        self.assertAlmostEqual(log.power[0].total, 4034.1035584)
+        self.assertAlmostEqual(log.power[0].leakage, 466.52775215)
+        worst = log.worst_ir_drop()
+        self.assertEqual(worst.kind, 'Linear')
+        self.assertAlmostEqual(worst.maximum, 0.011639)
+        self.assertAlmostEqual(worst.average, 0.000248)
+        self.assertEqual(worst.threshold, 0.015)
+        self.assertEqual(worst.worst_layer, 'M0')
+        self.assertEqual((log.em_temperature, log.rc_corner_temperature), (105.0, 125.0))
+
+    def test_voltus_log_uncoded_warn_text(self):
+        # Rail and power lines that merely contain 'WARN' are still parsed
+        self.log.write_text("Rail status:\n"
+                            "  0.825V    VDD_WARN\n"
+                            "  0V    VSS\n"
+                            "\n"
+                            "Total Internal Power:     1.5 \t   50%  WARNING\n"
+                            "Total Power:              3.0\n")
+        log = parse_voltus_log(self.log)
+        self.assertEqual(log.warning_count, 0)
+        self.assertEqual(log.rail_voltages, {'VDD_WARN': 0.825, 'VSS': 0.0})
+        self.assertEqual(len(log.power), 1)
+        self.assertEqual((log.power[0].internal, log.power[0].total), (1.5, 3.0))
+
+    def test_lvs_report(self):
+        cls = Path(self.test_dir) / "lvs.rep.cls"
+        cls.write_text("##### Run Result : MATCH\n"
+                       "##### Top Cell : tv_chip <vs> tv_chip_sch\n"
+                       "Cells matched | 1,234\n"
+                       "Cells which mismatch | 0\n")
+        report = parse_lvs_report(cls)
+        self.assertEqual(report.run_result, 'MATCH')
+        self.assertEqual(report.run_results, [('MATCH', 1)])
+        self.assertEqual(report.schematic_top_cell, 'tv_chip_sch')
+        self.assertEqual(report.cell_statistics, {'Cells matched': 1234, 'Cells which mismatch': 0})
+
+    def test_disk_cache_shared_across_processes(self):
+        cache_dir = Path(self.test_dir) / ".cache"
+        first = read_powerup_report(self.rpt, cache_dir=cache_dir)
+        self.assertEqual(len(list((cache_dir / 'voltus').glob('*.pkl'))), 1)
+        # Same process: memo returns the same object
+        self.assertIs(read_powerup_report(self.rpt, cache_dir=cache_dir), first)
+
+        # New process (memo cleared): loaded from disk without re-parsing
+        voltus_reader._MEMO.clear()
+        with mock.patch.object(voltus_reader, 'parse_powerup_report',
+                               side_effect=AssertionError('re-parsed')):
+            cached = voltus_reader._cached_read('powerup', self.rpt,
+                                                voltus_reader.parse_powerup_report, cache_dir)
+        self.assertEqual(cached.rush_current, first.rush_current)
+        self.assertEqual(len(cached.switches), 3)
+
+        # Modified file: cache miss
+        self.rpt.write_text(POWERUP_RPT.replace('0.427297A', '0.5A'))
+        os.utime(self.rpt, ns=(0, 10 ** 18))
+        self.assertEqual(read_powerup_report(self.rpt, cache_dir=cache_dir).rush_current, 0.5)
+
+    def test_disk_cache_disabled(self):
+        cache_dir = Path(self.test_dir) / ".cache"
+        with mock.patch.dict(os.environ, {'CHECKLIST_VOLTUS_CACHE': '0'}):
+            read_powerup_report(self.rpt, cache_dir=cache_dir)
+        self.assertFalse((cache_dir / 'voltus').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@
 #
 # Purpose:
 #   Aggregate per-module *.rpt files into a single CheckList.rpt for overview.
+#   Files are appended as raw byte ranges (see stream_writer.append_file).
 #
 # Usage:
 #   from rpt_generator import rpt_generator
@@ -14,6 +15,8 @@
 from pathlib import Path
 from typing import List, Optional
 
+from stream_writer import aggregate_module_files
+
 def rpt_generator(root: Path,
                   modules: List[str],
                   output_file: Optional[Path] = None) -> Path:
@@ -29,33 +32,5 @@ def rpt_generator(root: Path,
     if output_file is None:
         output_file = Path.cwd() / "CheckList.rpt"
 
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-
-    with output_file.open("w", encoding="utf-8", errors="ignore") as out:
-        out.write("===== CheckList Aggregated Report =====\n")
-        out.write(f"Root: {root}\n")
-        out.write(f"Modules: {', '.join(modules)}\n\n")
-
-        any_logs = False
-        for module in modules:
-            logs_dir = root / "Check_modules" / module / "reports"
-            if not logs_dir.is_dir():
-                continue
-            log_files = sorted(logs_dir.glob("*.rpt"))
-            if not log_files:
-                continue
-            out.write(f"\n===== Module: {module} =====\n")
-            for lf in log_files:
-                out.write(f"\n--- {lf.name} ---\n")
-                try:
-                    with lf.open("r", encoding="utf-8", errors="ignore") as f:
-                        for line in f:
-                            out.write(line)
-                except Exception as e:
-                    out.write(f"[ERROR] Could not read {lf}: {e}\n")
-                any_logs = True
-
-        if not any_logs:
-            out.write("No report files found for the given modules.\n")
-
-    return output_file
\ No newline at end of file
+    return aggregate_module_files(root, modules, "reports", "*.rpt", output_file,
+                                  title="Report", missing="report")
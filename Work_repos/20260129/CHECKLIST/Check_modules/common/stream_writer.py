@@ -0,0 +1,274 @@
+################################################################################
+# Script Name: stream_writer.py
+#
+# Purpose:
+#   Output helpers for very large check results and aggregated outputs:
+#   - Truncation policy: list the first N items per log group / report
+#     Occurrence section followed by "... and M more" (counts stay exact)
+#   - Full-detail sidecar: the untruncated log / report written as
+#     <file>.full.gz next to the truncated one
+#   - Byte-range concatenation of per-item logs / reports into the
+#     aggregated CheckList.log / CheckList.rpt (copy_file_range / sendfile,
+#     no decode / re-encode per line)
+#
+# Key Architecture:
+#   - Truncation is off by default: reports are re-parsed by
+#     write_summary_yaml.parse_report when no result cache is available,
+#     so default output stays byte-identical
+#   - Kernel-side copies are tried in order copy_file_range -> sendfile ->
+#     buffered read/write; a failing fast path falls back for the remaining
+#     bytes only
+#
+# Usage:
+#   from stream_writer import get_max_group_items, open_text_output
+#
+#   with open_text_output(log_path, 'w') as f:
+#       f.write(...)
+#
+#   from stream_writer import aggregate_module_files
+#   aggregate_module_files(root, modules, 'logs', '*.log', output_file,
+#                          title='Log', missing='log')
+#
+# Configuration (optional environment variables):
+#   - CHECKLIST_MAX_GROUP_ITEMS: items listed per group / Occurrence section
+#                                (default: 0 = unlimited)
+#   - CHECKLIST_FULL_DETAIL_SIDECAR: set to 1 to write <file>.full.gz with
+#                                    the untruncated output when items were
+#                                    omitted
+#
+# Author: yyin
+# Date:   2026-10-18
+################################################################################
+import errno
+import gzip
+import os
+from pathlib import Path
+from typing import BinaryIO, List, TextIO, Union
+
+# Buffer for per-item log / report writers (one write() per detail line)
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Chunk handed to copy_file_range / sendfile per call
+COPY_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Read size for the plain read/write fallback
+COPY_BUFFER_SIZE = 1024 * 1024
+
+SIDECAR_SUFFIX = '.full.gz'
+
+# errno values meaning "this fast path is not available here"
+_FALLBACK_ERRNOS = {errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP,
+                    errno.EBADF, errno.ENOTSUP, errno.EPERM}
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None or raw.strip() == '':
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def get_max_group_items() -> int:
+    """
+    Get the configured number of items listed per group / Occurrence section.
+
+    Returns:
+        Item limit (0 means unlimited)
+    """
+    return max(_env_int('CHECKLIST_MAX_GROUP_ITEMS', 0), 0)
+
+
+def sidecar_enabled() -> bool:
+    """Check whether full-detail .full.gz sidecars are requested."""
+    return os.environ.get('CHECKLIST_FULL_DETAIL_SIDECAR', '0').strip().lower() \
+        in ('1', 'true', 'on', 'yes')
+
+
+def more_line(omitted: int, indent: str = '') -> str:
+    """Format the line that replaces omitted items."""
+    return f'{indent}... and {omitted} more\n'
+
+
+def sidecar_path(path: Path) -> Path:
+    """Get the full-detail sidecar path for a log / report file."""
+    return path.with_name(path.name + SIDECAR_SUFFIX)
+
+
+def open_text_output(path: Path, mode: str = 'w') -> TextIO:
+    """
+    Open a log / report for writing with a large write buffer.
+
+    Args:
+        path: Output file
+        mode: 'w' or 'a'
+
+    Returns:
+        Text file object (utf-8)
+    """
+    return path.open(mode, encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+
+
+def open_sidecar(path: Path, mode: str = 'w') -> TextIO:
+    """
+    Open the gzip full-detail sidecar of a log / report.
+
+    Appending adds a gzip member, which gzip readers concatenate.
+
+    Args:
+        path: Log / report path (not the sidecar path)
+        mode: 'w' or 'a'
+
+    Returns:
+        Text file object writing compressed utf-8
+    """
+    return gzip.open(sidecar_path(path), mode + 't', encoding='utf-8',
+                     compresslevel=6)
+
+
+def remove_sidecar(path: Path) -> None:
+    """Remove a stale sidecar left by an earlier truncated run."""
+    try:
+        sidecar_path(path).unlink()
+    except OSError:
+        pass
+
+
+# =============================================================================
+# Byte-range concatenation
+# =============================================================================
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+_KERNEL_COPIES = [fn for name, fn in (('copy_file_range', _copy_file_range),
+                                      ('sendfile', _sendfile))
+                  if hasattr(os, name)]
+
+
+def write_all(out: BinaryIO, data: bytes) -> None:
+    """Write data completely to a (possibly unbuffered) binary file."""
+    view = memoryview(data)
+    while view:
+        written = out.write(view)
+        if written is None:
+            continue
+        view = view[written:]
+
+
+def append_file(out: BinaryIO, src_path: Union[str, Path]) -> int:
+    """
+    Append the bytes of src_path to an open binary output file.
+
+    The output should be opened unbuffered (buffering=0): kernel-side
+    copies write at the descriptor's current offset.
+
+    Args:
+        out: Output opened in binary write / append mode
+        src_path: File to append
+
+    Returns:
+        Number of bytes appended
+
+    Raises:
+        OSError: src_path cannot be opened or read
+    """
+    out.flush()
+    dst_fd = out.fileno()
+    with open(src_path, 'rb') as src:
+        src_fd = src.fileno()
+        size = os.fstat(src_fd).st_size
+        copied = 0
+        for copy_fn in _KERNEL_COPIES:
+            try:
+                while copied < size:
+                    sent = copy_fn(src_fd, dst_fd, copied,
+                                   min(COPY_CHUNK_SIZE, size - copied))
+                    if sent == 0:
+                        break
+                    copied += sent
+            except OSError as e:
+                if e.errno not in _FALLBACK_ERRNOS:
+                    raise
+                continue
+            break
+        # Fallback, and any bytes appended after fstat: plain buffered copy
+        src.seek(copied)
+        while True:
+            chunk = src.read(COPY_BUFFER_SIZE)
+            if not chunk:
+                break
+            write_all(out, chunk)
+            copied += len(chunk)
+    return copied
+
+
+def aggregate_module_files(root: Path,
+                           modules: List[str],
+                           subdir: str,
+                           pattern: str,
+                           output_file: Path,
+                           title: str,
+                           missing: str) -> Path:
+    """
+    Concatenate per-module output files into one aggregated file.
+
+    Layout matches the historical text-mode aggregation: a header, then per
+    module a "===== Module: <name> =====" banner and per file a
+    "--- <file> ---" banner followed by the file's bytes. File contents are
+    copied verbatim (no newline translation, undecodable bytes kept), which
+    is identical for files written on the same platform.
+
+    Args:
+        root: CheckList root
+        modules: Module names in output order
+        subdir: Directory under each module ('logs' / 'reports')
+        pattern: Glob for files in that directory ('*.log' / '*.rpt')
+        output_file: Aggregated output path
+        title: Header title ('Log' / 'Report')
+        missing: Noun used when nothing was found ('log' / 'report')
+
+    Returns:
+        output_file
+    """
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    def text(s: str) -> bytes:
+        # Same newline translation a text-mode writer would apply
+        if os.linesep != '\n':
+            s = s.replace('\n', os.linesep)
+        return s.encode('utf-8', errors='ignore')
+
+    with open(output_file, 'wb', buffering=0) as out:
+        write_all(out, text(f"===== CheckList Aggregated {title} =====\n"
+                       f"Root: {root}\n"
+                       f"Modules: {', '.join(modules)}\n\n"))
+
+        any_files = False
+        for module in modules:
+            files_dir = root / "Check_modules" / module / subdir
+            if not files_dir.is_dir():
+                continue
+            files = sorted(files_dir.glob(pattern))
+            if not files:
+                continue
+            write_all(out, text(f"\n===== Module: {module} =====\n"))
+            for src in files:
+                write_all(out, text(f"\n--- {src.name} ---\n"))
+                try:
+                    append_file(out, src)
+                except Exception as e:
+                    write_all(out, text(f"[ERROR] Could not read {src}: {e}\n"))
+                any_files = True
+
+        if not any_files:
+            write_all(out, text(f"No {missing} files found for the given modules.\n"))
+
+    return output_file
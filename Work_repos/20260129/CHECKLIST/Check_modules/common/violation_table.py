@@ -0,0 +1,601 @@
+################################################################################
+# Script Name: violation_table.py
+#
+# Purpose:
+#   Columnar storage for design-rule / STA violation reports (max_capacitance,
+#   max_transition, max_fanout, min-pulse, double_clock, ...).
+#   Violations are kept as compact NumPy columns instead of one dict or
+#   DetailItem per violating pin:
+#   - pin / rule / view / file names and display names are interned into
+#     string pools
+#   - required / actual / slack are float64 columns
+#   - filtering, waiver matching, histograms and top-N are vectorised
+#   - only a bounded number of rows is expanded for OutputFormatter
+#
+# Key Architecture:
+#   - Build phase: append() into typed arrays (no per-row Python objects)
+#   - Query phase: columns frozen to numpy arrays on first access
+#   - Subsets (filter/top/select) share the parent's string pools
+#   - Waivers are matched once per unique display name, not once per row
+#
+# Usage:
+#   from violation_table import ViolationTable
+#
+#   table = ViolationTable()
+#   for each violating row parsed from the report:
+#       table.append(pin, required, actual, slack, rule='max_capacitance',
+#                    view=view, line_number=line_num, file_path=file_path,
+#                    name=f"{pin} (view: {view}, slack: {slack:.4f}ns)")
+#
+#   waived, unwaived, used = table.apply_waivers(waive_dict, self.match_waiver_entry)
+#   missing_items = unwaived.to_items()              # bounded, worst first
+#   desc = unwaived.describe_truncation("Max_capacitance violations detected")
+#
+# Configuration (optional environment variables):
+#   - CHECKLIST_MAX_DETAIL_ROWS: rows expanded per table (default: 1000,
+#                                0 = unlimited)
+#
+# Author: yyin
+# Date:   2026-10-18
+################################################################################
+import os
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+# numpy is only needed by the code paths that build tables; import lazily so
+# that checkers which never touch violation tables still load without it.
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+DEFAULT_MAX_DETAIL_ROWS = 1000
+
+# Column names accepted by filter()/top()/histogram()/count_by()
+NUMERIC_COLUMNS = ('required', 'actual', 'slack', 'line_number')
+POOLED_COLUMNS = ('pin', 'rule', 'view', 'file_path', 'name')
+
+
+def get_max_detail_rows(default: int = DEFAULT_MAX_DETAIL_ROWS) -> int:
+    """
+    Get the configured number of detail rows expanded per violation table.
+
+    Reads CHECKLIST_MAX_DETAIL_ROWS; 0 or a negative value means unlimited.
+
+    Returns:
+        Row limit (0 = unlimited)
+    """
+    raw = os.environ.get('CHECKLIST_MAX_DETAIL_ROWS')
+    if raw is None or raw.strip() == '':
+        return default
+    try:
+        return max(int(raw), 0)
+    except ValueError:
+        return default
+
+
+def _require_numpy() -> None:
+    """Raise a helpful ImportError when numpy is unavailable."""
+    if not NUMPY_AVAILABLE:
+        raise ImportError(
+            "numpy is required for violation tables. Install via 'pip install numpy'."
+        )
+
+
+class StringPool:
+    """
+    Intern table mapping strings to dense integer ids.
+
+    Shared between a ViolationTable and all subsets derived from it, so
+    ids stay comparable across filter()/top()/apply_waivers() results.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._strings: List[str] = []
+
+    def intern(self, value: str) -> int:
+        """Return id for value, adding it to the pool if new."""
+        idx = self._ids.get(value)
+        if idx is None:
+            idx = len(self._strings)
+            self._ids[value] = idx
+            self._strings.append(value)
+        return idx
+
+    def lookup(self, value: str) -> Optional[int]:
+        """Return id for value or None if not interned."""
+        return self._ids.get(value)
+
+    def __getitem__(self, idx: int) -> str:
+        return self._strings[idx]
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    @property
+    def strings(self) -> List[str]:
+        """All interned strings, indexed by id."""
+        return self._strings
+
+
+class ViolationTable:
+    """
+    Columnar table of violations.
+
+    Columns:
+        pin, rule, view, file_path  - int32 ids into StringPools
+        name                        - int32 id of the display name (as the
+                                      checker reports it; '' = derive)
+        required, actual, slack     - float64 values
+        line_number                 - int64 source line
+
+    A table is append-only while being built. The first query freezes the
+    build buffers into numpy arrays; appending afterwards is an error.
+
+    Subsets produced by filter()/select()/top() reuse the parent's pools,
+    so building them only copies the (small) integer/float columns.
+    """
+
+    def __init__(self, pools: Optional[Dict[str, StringPool]] = None,
+                 columns: Optional[Dict[str, Any]] = None):
+        """
+        Initialize an empty table (or a frozen subset view).
+
+        Args:
+            pools: String pools to share (internal, used for subsets)
+            columns: Frozen numpy columns (internal, used for subsets)
+        """
+        self._pools: Dict[str, StringPool] = pools or {
+            name: StringPool() for name in POOLED_COLUMNS
+        }
+        self._columns: Optional[Dict[str, Any]] = columns
+        if columns is None:
+            self._buffers: Optional[Dict[str, array]] = {
+                'pin': array('i'), 'rule': array('i'),
+                'view': array('i'), 'file_path': array('i'),
+                'name': array('i'),
+                'required': array('d'), 'actual': array('d'),
+                'slack': array('d'), 'line_number': array('q'),
+            }
+        else:
+            self._buffers = None
+
+    # =========================================================================
+    # Build Phase
+    # =========================================================================
+
+    def append(self, pin: str, required: float, actual: float, slack: float,
+               rule: str = '', view: str = '', line_number: int = 0,
+               file_path: Union[str, Path] = '', name: str = '') -> None:
+        """
+        Append one violation row.
+
+        Args:
+            pin: Pin / net / instance name
+            required: Required (constraint) value
+            actual: Actual value
+            slack: Slack (negative = violating)
+            rule: Rule type (e.g., 'max_capacitance')
+            view: Analysis view / corner name
+            line_number: Line number in the source report
+            file_path: Source report path
+            name: Display name used for output and waiver matching
+                  ('' = default_name_format(row))
+        """
+        if self._buffers is None:
+            raise RuntimeError("ViolationTable is frozen; cannot append after querying")
+        buf = self._buffers
+        pools = self._pools
+        buf['pin'].append(pools['pin'].intern(pin))
+        buf['rule'].append(pools['rule'].intern(rule))
+        buf['view'].append(pools['view'].intern(view))
+        buf['file_path'].append(pools['file_path'].intern(str(file_path)))
+        buf['name'].append(pools['name'].intern(name))
+        buf['required'].append(float(required))
+        buf['actual'].append(float(actual))
+        buf['slack'].append(float(slack))
+        buf['line_number'].append(int(line_number))
+
+    def extend(self, other: 'ViolationTable') -> None:
+        """
+        Append all rows of another table (re-interning its strings).
+
+        Args:
+            other: Table to merge into this one
+        """
+        for row in other.iter_rows():
+            self.append(**row)
+
+    def _freeze(self) -> Dict[str, Any]:
+        """Convert build buffers into numpy columns (once)."""
+        if self._columns is None:
+            _require_numpy()
+            buf = self._buffers
+            self._columns = {
+                'pin': np.frombuffer(buf['pin'], dtype=np.int32).copy(),
+                'rule': np.frombuffer(buf['rule'], dtype=np.int32).copy(),
+                'view': np.frombuffer(buf['view'], dtype=np.int32).copy(),
+                'file_path': np.frombuffer(buf['file_path'], dtype=np.int32).copy(),
+                'name': np.frombuffer(buf['name'], dtype=np.int32).copy(),
+                'required': np.frombuffer(buf['required'], dtype=np.float64).copy(),
+                'actual': np.frombuffer(buf['actual'], dtype=np.float64).copy(),
+                'slack': np.frombuffer(buf['slack'], dtype=np.float64).copy(),
+                'line_number': np.frombuffer(buf['line_number'], dtype=np.int64).copy(),
+            }
+            self._buffers = None
+        return self._columns
+
+    # =========================================================================
+    # Basic Access
+    # =========================================================================
+
+    def __len__(self) -> int:
+        if self._columns is not None:
+            return int(self._columns['slack'].shape[0])
+        return len(self._buffers['slack'])
+
+    def column(self, name: str) -> Any:
+        """
+        Get a frozen numpy column.
+
+        Args:
+            name: Column name (pin/rule/view/file_path hold pool ids)
+
+        Returns:
+            numpy array
+        """
+        columns = self._freeze()
+        if name not in columns:
+            raise KeyError(f"Unknown violation table column: {name}")
+        return columns[name]
+
+    def strings(self, name: str) -> List[str]:
+        """
+        Get the string pool backing a pooled column.
+
+        Args:
+            name: One of pin/rule/view/file_path/name
+
+        Returns:
+            List of strings indexed by pool id
+        """
+        return self._pools[name].strings
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        Expand a single row into a dict.
+
+        Returns:
+            Dict with pin, required, actual, slack, rule, view, line_number,
+            file_path, name
+        """
+        cols = self._freeze()
+        pools = self._pools
+        return {
+            'pin': pools['pin'][int(cols['pin'][index])],
+            'required': float(cols['required'][index]),
+            'actual': float(cols['actual'][index]),
+            'slack': float(cols['slack'][index]),
+            'rule': pools['rule'][int(cols['rule'][index])],
+            'view': pools['view'][int(cols['view'][index])],
+            'line_number': int(cols['line_number'][index]),
+            'file_path': pools['file_path'][int(cols['file_path'][index])],
+            'name': pools['name'][int(cols['name'][index])],
+        }
+
+    def iter_rows(self, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate rows as dicts (in table order).
+
+        Args:
+            limit: Maximum rows to yield (None = all)
+        """
+        count = len(self) if limit is None else min(limit, len(self))
+        for index in range(count):
+            yield self.row(index)
+
+    # =========================================================================
+    # Subsets
+    # =========================================================================
+
+    def select(self, rows: Any) -> 'ViolationTable':
+        """
+        Create a subset from a boolean mask or an index array.
+
+        Args:
+            rows: numpy boolean mask (len == len(self)) or integer indices
+
+        Returns:
+            New ViolationTable sharing this table's string pools
+        """
+        cols = self._freeze()
+        subset = {name: col[rows] for name, col in cols.items()}
+        return ViolationTable(pools=self._pools, columns=subset)
+
+    def mask(self, rule: Optional[Union[str, List[str]]] = None,
+             view: Optional[Union[str, List[str]]] = None,
+             max_slack: Optional[float] = None,
+             min_slack: Optional[float] = None) -> Any:
+        """
+        Build a boolean row mask from simple column predicates (ANDed).
+
+        Args:
+            rule: Rule name or list of rule names to keep
+            view: View name or list of view names to keep
+            max_slack: Keep rows with slack < max_slack
+            min_slack: Keep rows with slack >= min_slack
+
+        Returns:
+            numpy boolean array
+        """
+        cols = self._freeze()
+        keep = np.ones(len(self), dtype=bool)
+        for name, wanted in (('rule', rule), ('view', view)):
+            if wanted is None:
+                continue
+            if isinstance(wanted, str):
+                wanted = [wanted]
+            ids = [self._pools[name].lookup(w) for w in wanted]
+            ids = [i for i in ids if i is not None]
+            keep &= np.isin(cols[name], np.asarray(ids, dtype=np.int32))
+        if max_slack is not None:
+            keep &= cols['slack'] < max_slack
+        if min_slack is not None:
+            keep &= cols['slack'] >= min_slack
+        return keep
+
+    def filter(self, **predicates) -> 'ViolationTable':
+        """
+        Return rows matching mask(**predicates).
+
+        Example:
+            violating = table.filter(max_slack=0.0)
+            cap_only = table.filter(rule='max_capacitance')
+        """
+        return self.select(self.mask(**predicates))
+
+    def violations(self) -> 'ViolationTable':
+        """Return only violating rows (slack < 0)."""
+        return self.filter(max_slack=0.0)
+
+    def top(self, n: int, column: str = 'slack', worst_first: bool = True) -> 'ViolationTable':
+        """
+        Extract the N worst (or best) rows by a numeric column.
+
+        Uses argpartition so cost is O(N) + O(n log n) for the sorted head.
+        Ties keep original table order.
+
+        Args:
+            n: Number of rows to keep
+            column: Numeric column to rank by (default: slack)
+            worst_first: True = ascending (most negative slack first)
+
+        Returns:
+            New ViolationTable with at most n rows, sorted
+        """
+        if column not in NUMERIC_COLUMNS:
+            raise KeyError(f"top() needs a numeric column, got: {column}")
+        values = self.column(column)
+        total = len(self)
+        if n <= 0 or total == 0:
+            return self.select(np.zeros(0, dtype=np.int64))
+        keys = values if worst_first else -values
+        if n < total:
+            head = np.argpartition(keys, n - 1)[:n]
+        else:
+            head = np.arange(total)
+        order = head[np.lexsort((head, keys[head]))]
+        return self.select(order)
+
+    def sorted(self, column: str = 'slack', worst_first: bool = True) -> 'ViolationTable':
+        """Return all rows sorted by a numeric column (stable)."""
+        return self.top(len(self), column=column, worst_first=worst_first)
+
+    # =========================================================================
+    # Aggregation
+    # =========================================================================
+
+    def histogram(self, column: str = 'slack', bins: Union[int, List[float]] = 10) -> Tuple[List[int], List[float]]:
+        """
+        Histogram of a numeric column.
+
+        Args:
+            column: Numeric column (default: slack)
+            bins: Number of bins or explicit bin edges
+
+        Returns:
+            Tuple of (counts, bin_edges) as plain lists
+        """
+        values = self.column(column)
+        if len(values) == 0:
+            return [], []
+        counts, edges = np.histogram(values, bins=bins)
+        return counts.tolist(), edges.tolist()
+
+    def count_by(self, column: str = 'rule') -> Dict[str, int]:
+        """
+        Count rows per value of a pooled column.
+
+        Args:
+            column: One of pin/rule/view/file_path/name
+
+        Returns:
+            Dict mapping value -> row count (descending by count)
+        """
+        if column not in POOLED_COLUMNS:
+            raise KeyError(f"count_by() needs a pooled column, got: {column}")
+        ids = self.column(column)
+        if len(ids) == 0:
+            return {}
+        counts = np.bincount(ids, minlength=len(self._pools[column]))
+        present = np.flatnonzero(counts)
+        order = present[np.argsort(-counts[present], kind='stable')]
+        pool = self._pools[column]
+        return {pool[int(i)]: int(counts[i]) for i in order}
+
+    def unique(self, column: str = 'pin') -> List[str]:
+        """Distinct values of a pooled column present in this table."""
+        ids = np.unique(self.column(column))
+        pool = self._pools[column]
+        return [pool[int(i)] for i in ids]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Accurate totals for reporting, independent of row truncation.
+
+        Returns:
+            Dict with total, violations, worst_slack, unique_pins, by_rule, by_view
+        """
+        total = len(self)
+        if total == 0:
+            return {'total': 0, 'violations': 0, 'worst_slack': None,
+                    'unique_pins': 0, 'by_rule': {}, 'by_view': {}}
+        slack = self.column('slack')
+        return {
+            'total': total,
+            'violations': int(np.count_nonzero(slack < 0)),
+            'worst_slack': float(slack.min()),
+            'unique_pins': int(np.unique(self.column('pin')).shape[0]),
+            'by_rule': self.count_by('rule'),
+            'by_view': self.count_by('view'),
+        }
+
+    # =========================================================================
+    # Waivers
+    # =========================================================================
+
+    def apply_waivers(self, waive_dict: Dict[str, str],
+                      matcher: Callable[[str, Dict[str, str]], Optional[str]],
+                      key: str = 'name') -> Tuple['ViolationTable', 'ViolationTable', Dict[str, int]]:
+        """
+        Split rows into waived / unwaived.
+
+        The matcher is evaluated once per distinct value of `key` (not per
+        row), then broadcast back to rows with a vectorised lookup. The
+        default key is the display name, i.e. the same string a per-row
+        loop would match, so results are identical to matching every row.
+
+        Args:
+            waive_dict: Waiver mapping (name/pattern -> reason)
+            matcher: Callable(name, waive_dict) -> matched waiver key or None
+                     (e.g., WaiverHandlerMixin.match_waiver_entry)
+            key: Pooled column to match on (default: name)
+
+        Returns:
+            Tuple of (waived_table, unwaived_table, used_waivers) where
+            used_waivers maps waiver key -> number of rows it waived
+        """
+        ids = self.column(key)
+        if not waive_dict or len(ids) == 0:
+            return self.select(np.zeros(len(ids), dtype=bool)), self, {}
+
+        pool = self._pools[key]
+        present = np.unique(ids)
+        waiver_keys = list(waive_dict.keys())
+        waiver_index = {w: i for i, w in enumerate(waiver_keys)}
+        # -1 = not waived; otherwise index into waiver_keys
+        lut = np.full(len(pool), -1, dtype=np.int32)
+        blank_id = pool.lookup('') if key == 'name' else None
+        for pool_id in present:
+            if pool_id == blank_id:
+                continue
+            matched = matcher(pool[int(pool_id)], waive_dict)
+            if matched is not None:
+                lut[pool_id] = waiver_index[matched]
+
+        row_waiver = lut[ids]
+        if blank_id is not None:
+            # Rows appended without a name: match their derived display name
+            decisions: Dict[str, int] = {}
+            for index in np.flatnonzero(ids == blank_id):
+                name = self.default_name_format(self.row(int(index)))
+                if name not in decisions:
+                    matched = matcher(name, waive_dict)
+                    decisions[name] = -1 if matched is None else waiver_index[matched]
+                row_waiver[index] = decisions[name]
+        waived_mask = row_waiver >= 0
+        used_counts = np.bincount(row_waiver[waived_mask], minlength=len(waiver_keys))
+        used = {waiver_keys[i]: int(c) for i, c in enumerate(used_counts) if c}
+        return self.select(waived_mask), self.select(~waived_mask), used
+
+    # =========================================================================
+    # Output Bridge (OutputFormatter / OutputBuilderMixin)
+    # =========================================================================
+
+    @staticmethod
+    def default_name_format(row: Dict[str, Any]) -> str:
+        """
+        Display name of a row: the stored name, or for rows appended without
+        one, Pin 'x': Required=.., Actual=.., Slack=.. (View: v).
+        """
+        if row.get('name'):
+            return row['name']
+        return (f"Pin '{row['pin']}': Required={row['required']:.4f}, "
+                f"Actual={row['actual']:.4f}, Slack={row['slack']:.4f} (View: {row['view']})")
+
+    def to_items(self, limit: Optional[int] = None,
+                 name_format: Optional[Callable[[Dict[str, Any]], str]] = None,
+                 worst_first: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Expand a bounded number of rows into the item-dict shape used by
+        OutputBuilderMixin.build_complete_output().
+
+        Args:
+            limit: Maximum rows to expand (None = CHECKLIST_MAX_DETAIL_ROWS,
+                   0 = unlimited)
+            name_format: Callable(row) -> display name (default: default_name_format)
+            worst_first: Expand worst-slack rows first (default: True)
+
+        Returns:
+            Dict mapping name -> {'name', 'line_number', 'file_path'}
+        """
+        if limit is None:
+            limit = get_max_detail_rows()
+        fmt = name_format or self.default_name_format
+        rows = self
+        if worst_first:
+            rows = self.top(limit if limit else len(self))
+        elif limit:
+            rows = self.select(np.arange(min(limit, len(self))))
+
+        items: Dict[str, Dict[str, Any]] = {}
+        for row in rows.iter_rows():
+            name = fmt(row)
+            if name not in items:
+                items[name] = {
+                    'name': name,
+                    'line_number': row['line_number'],
+                    'file_path': row['file_path'],
+                }
+        return items
+
+    def is_truncated(self, limit: Optional[int] = None) -> bool:
+        """True if to_items(limit) would drop rows."""
+        if limit is None:
+            limit = get_max_detail_rows()
+        return bool(limit) and len(self) > limit
+
+    def describe_truncation(self, description: str, limit: Optional[int] = None) -> str:
+        """
+        Append accurate totals to a group description when rows were truncated.
+
+        Example:
+            "Max_capacitance violations detected (showing worst 1000 of 53211)"
+
+        Args:
+            description: Base group description
+            limit: Row limit used for to_items() (None = configured default)
+
+        Returns:
+            Description, annotated only when truncation happened
+        """
+        if limit is None:
+            limit = get_max_detail_rows()
+        if not self.is_truncated(limit):
+            return description
+        return f"{description} (showing worst {limit} of {len(self)})"
@@ -0,0 +1,579 @@
+################################################################################
+# Script Name: voltus_reader.py
+#
+# Purpose:
+#   Typed readers for the Voltus artefacts used by the 11.0_POWER_EMIR_CHECK
+#   items, parsed once per file and shared between items of the same run:
+#   - Powerup.rpt      -> PowerupReport (summary metrics + switch activation
+#                         table / rush-current time series)
+#   - Voltus run logs  -> VoltusLog (ERROR/WARN messages, power breakdowns,
+#     (.log / .logv)      IR drop summaries, rail voltages, EM temperature)
+#   - lvs.rep.cls      -> LvsReport (run result, top cells, cell statistics)
+#
+# Key Architecture:
+#   - Each checker runs in its own process, so results are cached twice:
+#     an in-process memo plus a pickle per artefact under
+#     <module>/outputs/.cache/voltus/ (pass BaseChecker.cache_dir)
+#   - Cache entries are keyed by resolved path, mtime, size and
+#     PARSER_VERSION; a changed file or parser is simply a cache miss
+#   - Large tables (switch activation rows) are stored as typed arrays,
+#     not one dict per row
+#   - Unreadable / incompatible cache files are ignored and re-parsed
+#
+# Usage:
+#   from voltus_reader import read_powerup_report, read_voltus_log
+#
+#   report = read_powerup_report(file_path, cache_dir=self.cache_dir)
+#   if report.rush_current is not None:
+#       ...
+#   times, currents = report.switches.time_series()
+#
+#   log = read_voltus_log(file_path, cache_dir=self.cache_dir)
+#   for msg in log.errors:
+#       print(msg.line_number, msg.code, msg.text)
+#
+# Configuration (optional environment variables):
+#   - CHECKLIST_VOLTUS_CACHE: set to 0 to disable the on-disk cache
+#   - CHECKLIST_VOLTUS_CACHE_DIR: cache root used when no cache_dir is passed
+#
+# Author: yyin
+# Date:   2026-10-18
+################################################################################
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+# Bump when a parser's output changes so stale pickles are not reused
+PARSER_VERSION = 1
+
+CACHE_SUBDIR = 'voltus'
+
+_MEMO: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+
+
+# =============================================================================
+# Result types
+# =============================================================================
+
+class VoltusMessage(NamedTuple):
+    """One ERROR/WARN message of a Voltus log (code is None if absent)."""
+    severity: str
+    code: Optional[str]
+    text: str
+    line_number: int
+
+
+@dataclass
+class PowerBreakdown:
+    """One 'Total Power' block of a static/dynamic power report."""
+    internal: Optional[float] = None
+    switching: Optional[float] = None
+    leakage: Optional[float] = None
+    total: Optional[float] = None
+    line_number: int = 0
+
+
+@dataclass
+class IRDropSummary:
+    """One 'Begin IR Drop (<kind>) Report Generation' block (values in V)."""
+    kind: str
+    line_number: int
+    threshold: Optional[float] = None
+    minimum: Optional[float] = None
+    average: Optional[float] = None
+    maximum: Optional[float] = None
+    worst_layer: Optional[str] = None
+
+
+class SwitchTable:
+    """
+    Power switch activation table of a Powerup.rpt Detailed Report.
+
+    Columns are typed arrays in report order:
+        order, turn_on_time, peak_current, line_numbers, instances
+    """
+
+    def __init__(self):
+        self.order = array('l')
+        self.turn_on_time = array('d')
+        self.peak_current = array('d')
+        self.line_numbers = array('l')
+        self.instances: List[str] = []
+
+    def append(self, order: int, turn_on_time: float, peak_current: float,
+               instance: str, line_number: int) -> None:
+        self.order.append(order)
+        self.turn_on_time.append(turn_on_time)
+        self.peak_current.append(peak_current)
+        self.instances.append(instance)
+        self.line_numbers.append(line_number)
+
+    def __len__(self) -> int:
+        return len(self.instances)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Return one switch as a dict (negative indexes allowed)."""
+        return {
+            'order': self.order[index],
+            'turn_on_time': self.turn_on_time[index],
+            'peak_current': self.peak_current[index],
+            'instance': self.instances[index],
+            'line_number': self.line_numbers[index],
+        }
+
+    def first(self) -> Optional[Dict[str, Any]]:
+        """First switch in report order, or None for an empty table."""
+        return self.row(0) if self.instances else None
+
+    def time_series(self) -> Tuple[List[float], List[float]]:
+        """
+        Rush-current time series: peak current per switch ordered by turn-on time.
+
+        Returns:
+            Tuple of (turn_on_times, peak_currents)
+        """
+        idx = sorted(range(len(self)), key=self.turn_on_time.__getitem__)
+        return ([self.turn_on_time[i] for i in idx],
+                [self.peak_current[i] for i in idx])
+
+    def peak(self) -> Optional[Dict[str, Any]]:
+        """Switch with the highest peak current, or None for an empty table."""
+        if not self.instances:
+            return None
+        return self.row(max(range(len(self)), key=self.peak_current.__getitem__))
+
+
+@dataclass
+class PowerupReport:
+    """Parsed Powerup.rpt (power-up / rush current analysis)."""
+    file_path: str
+    simulation_time: Optional[float] = None
+    threshold_voltage: Optional[float] = None
+    rush_current: Optional[float] = None
+    wake_up_time: Optional[float] = None
+    switches_turned_on: Optional[int] = None
+    total_switches: Optional[int] = None
+    last_switch_instance: Optional[str] = None
+    last_switch_time: Optional[float] = None
+    # metric name -> line number ('rush_current', 'wake_up_time', 'switches', 'last_switch')
+    line_numbers: Dict[str, int] = field(default_factory=dict)
+    switches: SwitchTable = field(default_factory=SwitchTable)
+
+    @property
+    def all_switches_on(self) -> bool:
+        return (self.switches_turned_on is not None and
+                self.switches_turned_on == self.total_switches)
+
+
+@dataclass
+class VoltusLog:
+    """Parsed Voltus run log (.log / .logv)."""
+    file_path: str
+    errors: List[VoltusMessage] = field(default_factory=list)
+    warnings: List[VoltusMessage] = field(default_factory=list)
+    warning_count: int = 0
+    power: List[PowerBreakdown] = field(default_factory=list)
+    ir_drop: List[IRDropSummary] = field(default_factory=list)
+    rail_voltages: Dict[str, float] = field(default_factory=dict)
+    em_temperature: Optional[float] = None
+    rc_corner_temperature: Optional[float] = None
+
+    def warning_counts(self) -> Dict[str, int]:
+        """Number of coded warnings per message code."""
+        counts: Dict[str, int] = {}
+        for msg in self.warnings:
+            if msg.code:
+                counts[msg.code] = counts.get(msg.code, 0) + 1
+        return counts
+
+    def worst_ir_drop(self) -> Optional[IRDropSummary]:
+        """IR drop block with the highest maximum drop, or None."""
+        blocks = [b for b in self.ir_drop if b.maximum is not None]
+        return max(blocks, key=lambda b: b.maximum) if blocks else None
+
+
+@dataclass
+class LvsReport:
+    """Parsed lvs.rep.cls summary."""
+    file_path: str
+    # (status, line_number) for every '##### Run Result' line
+    run_results: List[Tuple[str, int]] = field(default_factory=list)
+    layout_top_cell: Optional[str] = None
+    schematic_top_cell: Optional[str] = None
+    cell_statistics: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def run_result(self) -> Optional[str]:
+        return self.run_results[-1][0] if self.run_results else None
+
+
+# =============================================================================
+# Parsers
+# =============================================================================
+
+_NUM = r'([0-9.eE+-]+)'
+
+_POWERUP_SUMMARY = (
+    ('simulation_time', re.compile(r'Simulation time\s*=\s*' + _NUM + 's')),
+    ('threshold_voltage', re.compile(r'Threshold \(Vt\)\s*=\s*([0-9.]+)V')),
+    ('rush_current', re.compile(r'Measured maximum rush current\s*=\s*' + _NUM + 'A')),
+    ('wake_up_time', re.compile(r'Measured wake-up time for switched net\s*=\s*' + _NUM + 's')),
+)
+_POWERUP_SWITCHES = re.compile(
+    r'Number of power switches turned on in this simulation\s*=\s*(\d+)\s*\[of total\s*(\d+)\]')
+_POWERUP_LAST = re.compile(
+    r"Last power switch to turn-on in this simulation is '([^']+)' at time\s*" + _NUM + 's')
+_POWERUP_ROW = re.compile(r'^\s*(\d+)\s+' + _NUM + r'\s+' + _NUM + r'\s+(.+)$')
+
+
+def parse_powerup_report(path: Union[str, Path]) -> PowerupReport:
+    """
+    Parse a Voltus Powerup.rpt.
+
+    The Summary section is matched against the metric patterns; rows of the
+    Detailed Report section ("ORDER TURN-ON TIME PEAK CURRENT INSTANCES")
+    go into report.switches.
+
+    Args:
+        path: Powerup.rpt path
+
+    Returns:
+        PowerupReport
+    """
+    report = PowerupReport(file_path=str(path))
+    table = report.switches
+    in_detailed = False
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        for line_num, line in enumerate(f, 1):
+            if in_detailed:
+                if 'ORDER' in line or 'TURN-ON' in line:
+                    continue
+                match = _POWERUP_ROW.match(line)
+                if match:
+                    table.append(int(match.group(1)), float(match.group(2)),
+                                 float(match.group(3)), match.group(4).strip(), line_num)
+                continue
+            if 'Detailed Report' in line:
+                in_detailed = True
+                continue
+            for name, pattern in _POWERUP_SUMMARY:
+                match = pattern.search(line)
+                if match:
+                    setattr(report, name, float(match.group(1)))
+                    if name in ('rush_current', 'wake_up_time'):
+                        report.line_numbers[name] = line_num
+            match = _POWERUP_SWITCHES.search(line)
+            if match:
+                report.switches_turned_on = int(match.group(1))
+                report.total_switches = int(match.group(2))
+                report.line_numbers['switches'] = line_num
+            match = _POWERUP_LAST.search(line)
+            if match:
+                report.last_switch_instance = match.group(1)
+                report.last_switch_time = float(match.group(2))
+                report.line_numbers['last_switch'] = line_num
+    return report
+
+
+_LOG_CODED_ERROR = re.compile(r'\*\*ERROR:\s*\(([A-Z_]+-\d+)\):\s*(.+)')
+_LOG_GENERIC_ERROR = re.compile(r'ERROR:\s+(.+)$')
+_LOG_WARNINGS = (
+    re.compile(r'\*\*WARN:\s*\(([A-Z_]+-\d+)\):\s*(.+)'),
+    re.compile(r'WARNING\s+\(([A-Z_]+-\d+)\):\s*(.+)'),
+)
+_LOG_POWER = re.compile(r'^Total (Internal|Switching|Leakage) Power:\s*' + _NUM)
+_LOG_TOTAL_POWER = re.compile(r'^Total Power:\s*' + _NUM)
+_LOG_IR_BEGIN = re.compile(r'^Begin IR Drop \(([^)]+)\) Report Generation')
+_LOG_IR_THRESHOLD = re.compile(r'^\s+Threshold:\s*' + _NUM)
+_LOG_IR_VALUES = re.compile(
+    r'Minimum, Average, Maximum IR Drop:\s*([0-9.eE+-]+)(m?V),\s*([0-9.eE+-]+)(m?V),\s*([0-9.eE+-]+)(m?V)')
+_LOG_IR_LAYER = re.compile(r'Layer with maximum IR Drop:\s*(\S+)')
+_LOG_RAIL = re.compile(r'^\s+([0-9.eE+-]+)V\s+(\S+)\s*$')
+_LOG_EM_TEMPERATURE = re.compile(r'-em_temperature\s+(-?[0-9.]+)')
+_LOG_RC_TEMPERATURE = re.compile(r'RC-Corner Temperature\s*:\s*(-?[0-9.]+)\s*Celsius')
+
+
+def _volts(value: str, unit: str) -> float:
+    return float(value) / 1000.0 if unit == 'mV' else float(value)
+
+
+def parse_voltus_log(path: Union[str, Path]) -> VoltusLog:
+    """
+    Parse a Voltus run log (.log or .logv).
+
+    ERROR lines match '**ERROR: (CODE): text' first and 'ERROR: text'
+    otherwise (matched on the stripped line). Coded '**WARN: (CODE):' and
+    'WARNING (CODE):' lines are collected as warnings.
+
+    Args:
+        path: Log path
+
+    Returns:
+        VoltusLog
+    """
+    log = VoltusLog(file_path=str(path))
+    power: Optional[PowerBreakdown] = None
+    ir_block: Optional[IRDropSummary] = None
+    in_rail_status = False
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        for line_num, line in enumerate(f, 1):
+            if 'ERROR' in line:
+                stripped = line.strip()
+                match = _LOG_CODED_ERROR.search(stripped)
+                if match:
+                    log.errors.append(VoltusMessage('ERROR', match.group(1),
+                                                    match.group(2).strip(), line_num))
+                    continue
+                match = _LOG_GENERIC_ERROR.search(stripped)
+                if match:
+                    log.errors.append(VoltusMessage('ERROR', None,
+                                                    match.group(1).strip(), line_num))
+                    continue
+            if 'WARN' in line:
+                stripped = line.strip()
+                for pattern in _LOG_WARNINGS:
+                    match = pattern.search(stripped)
+                    if match:
+                        log.warning_count += 1
+                        log.warnings.append(VoltusMessage('WARNING', match.group(1),
+                                                          match.group(2).strip(), line_num))
+                        break
+                if match:
+                    continue
+
+            if in_rail_status:
+                match = _LOG_RAIL.match(line)
+                if match:
+                    log.rail_voltages[match.group(2)] = float(match.group(1))
+                    continue
+                in_rail_status = False
+            if line.startswith('Rail status:'):
+                in_rail_status = True
+                continue
+
+            if line.startswith('Total '):
+                match = _LOG_POWER.match(line)
+                if match:
+                    if power is None:
+                        power = PowerBreakdown(line_number=line_num)
+                    setattr(power, match.group(1).lower(), float(match.group(2)))
+                    continue
+                match = _LOG_TOTAL_POWER.match(line)
+                if match:
+                    if power is None:
+                        power = PowerBreakdown(line_number=line_num)
+                    power.total = float(match.group(1))
+                    log.power.append(power)
+                    power = None
+                    continue
+
+            if line.startswith('Begin IR Drop'):
+                match = _LOG_IR_BEGIN.match(line)
+                if match:
+                    ir_block = IRDropSummary(kind=match.group(1), line_number=line_num)
+                    log.ir_drop.append(ir_block)
+                    continue
+            if ir_block is not None:
+                if line.startswith('Ended') or line.startswith('Begin'):
+                    ir_block = None
+                elif 'IR Drop' in line:
+                    match = _LOG_IR_VALUES.search(line)
+                    if match:
+                        ir_block.minimum = _volts(match.group(1), match.group(2))
+                        ir_block.average = _volts(match.group(3), match.group(4))
+                        ir_block.maximum = _volts(match.group(5), match.group(6))
+                        continue
+                    match = _LOG_IR_LAYER.search(line)
+                    if match:
+                        ir_block.worst_layer = match.group(1)
+                        continue
+                elif ir_block.threshold is None:
+                    match = _LOG_IR_THRESHOLD.match(line)
+                    if match:
+                        ir_block.threshold = float(match.group(1))
+                        continue
+
+            if log.em_temperature is None and '-em_temperature' in line:
+                match = _LOG_EM_TEMPERATURE.search(line)
+                if match:
+                    log.em_temperature = float(match.group(1))
+            if log.rc_corner_temperature is None and 'RC-Corner Temperature' in line:
+                match = _LOG_RC_TEMPERATURE.search(line)
+                if match:
+                    log.rc_corner_temperature = float(match.group(1))
+    return log
+
+
+_LVS_RUN_RESULT = re.compile(r'^#####\s+Run Result\s*:\s*(\w+)\s*$')
+_LVS_TOP_CELL = re.compile(r'^#####\s+Top Cell\s*:\s*(.+?)\s*<vs>\s*(.+?)\s*$')
+_LVS_STATISTICS = re.compile(
+    r'^(Cells matched|Cells which mismatch|Cells expanded|Cells not run)\s*\|\s*([\d,]+)\s*$')
+
+
+def parse_lvs_report(path: Union[str, Path]) -> LvsReport:
+    """
+    Parse an LVS lvs.rep.cls summary.
+
+    Args:
+        path: lvs.rep.cls path
+
+    Returns:
+        LvsReport
+    """
+    report = LvsReport(file_path=str(path))
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        for line_num, line in enumerate(f, 1):
+            if line.startswith('#####'):
+                match = _LVS_RUN_RESULT.search(line)
+                if match:
+                    report.run_results.append((match.group(1).strip(), line_num))
+                    continue
+                match = _LVS_TOP_CELL.search(line)
+                if match:
+                    report.layout_top_cell = match.group(1).strip()
+                    report.schematic_top_cell = match.group(2).strip()
+                continue
+            if line.startswith('Cells'):
+                match = _LVS_STATISTICS.search(line)
+                if match:
+                    report.cell_statistics[match.group(1).strip()] = int(match.group(2).replace(',', ''))
+    return report
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+def _disk_cache_enabled() -> bool:
+    return os.environ.get('CHECKLIST_VOLTUS_CACHE', '1').strip() not in ('0', 'false', 'off')
+
+
+def _resolve_cache_dir(cache_dir: Optional[Union[str, Path]]) -> Optional[Path]:
+    if not _disk_cache_enabled():
+        return None
+    if cache_dir is None:
+        env_dir = os.environ.get('CHECKLIST_VOLTUS_CACHE_DIR', '').strip()
+        if not env_dir:
+            return None
+        cache_dir = env_dir
+    return Path(cache_dir) / CACHE_SUBDIR
+
+
+def _cache_file(cache_root: Path, kind: str, resolved: str, signature: Tuple[int, int]) -> Path:
+    key = f"{PARSER_VERSION}|{kind}|{resolved}|{signature[0]}|{signature[1]}"
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+    return cache_root / f"{kind}_{Path(resolved).name}_{digest}.pkl"
+
+
+def _load_pickle(path: Path) -> Any:
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:  # noqa: BLE001 corrupt / incompatible entry = cache miss
+        return None
+
+
+def _store_pickle(path: Path, value: Any) -> None:
+    tmp = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:  # noqa: BLE001 caching is best effort
+        if tmp is not None and os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def _cached_read(kind: str, path: Union[str, Path], parser: Callable[[Path], Any],
+                 cache_dir: Optional[Union[str, Path]]) -> Any:
+    path = Path(path)
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    resolved = str(path.resolve())
+
+    memo = _MEMO.get((kind, resolved))
+    if memo is not None and memo[0] == signature:
+        return memo[1]
+
+    cache_root = _resolve_cache_dir(cache_dir)
+    cache_file = _cache_file(cache_root, kind, resolved, signature) if cache_root else None
+    value = _load_pickle(cache_file) if cache_file is not None and cache_file.exists() else None
+    if value is None:
+        value = parser(path)
+        if cache_file is not None:
+            _store_pickle(cache_file, value)
+
+    _MEMO[(kind, resolved)] = (signature, value)
+    return value
+
+
+def read_powerup_report(path: Union[str, Path],
+                        cache_dir: Optional[Union[str, Path]] = None) -> PowerupReport:
+    """
+    Cached parse_powerup_report().
+
+    Args:
+        path: Powerup.rpt path
+        cache_dir: Checker cache directory (BaseChecker.cache_dir); entries
+                   are written to <cache_dir>/voltus/
+
+    Returns:
+        PowerupReport (shared object: treat as read-only)
+    """
+    return _cached_read('powerup', path, parse_powerup_report, cache_dir)
+
+
+def read_voltus_log(path: Union[str, Path],
+                    cache_dir: Optional[Union[str, Path]] = None) -> VoltusLog:
+    """
+    Cached parse_voltus_log().
+
+    Args:
+        path: Voltus .log / .logv path
+        cache_dir: Checker cache directory (BaseChecker.cache_dir)
+
+    Returns:
+        VoltusLog (shared object: treat as read-only)
+    """
+    return _cached_read('log', path, parse_voltus_log, cache_dir)
+
+
+def read_lvs_report(path: Union[str, Path],
+                    cache_dir: Optional[Union[str, Path]] = None) -> LvsReport:
+    """
+    Cached parse_lvs_report().
+
+    Args:
+        path: lvs.rep.cls path
+        cache_dir: Checker cache directory (BaseChecker.cache_dir)
+
+    Returns:
+        LvsReport (shared object: treat as read-only)
+    """
+    return _cached_read('lvs', path, parse_lvs_report, cache_dir)
+
+
+def clear_cache(cache_dir: Optional[Union[str, Path]] = None) -> None:
+    """
+    Drop the in-process memo and, if given, the on-disk entries.
+
+    Args:
+        cache_dir: Checker cache directory whose voltus/ entries are removed
+    """
+    _MEMO.clear()
+    cache_root = _resolve_cache_dir(cache_dir)
+    if cache_root is None or not cache_root.is_dir():
+        return
+    for entry in cache_root.glob('*.pkl'):
+        try:
+            entry.unlink()
+        except OSError:
+            pass
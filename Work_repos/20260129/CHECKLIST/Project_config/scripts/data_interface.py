@@ -49,9 +49,15 @@ Examples:
 
 Author: AI Assistant
 Date: 2025-11-27
-Version: 1.2
+Version: 1.3
 
 Change Log:
+  v1.3:
+    - merge/sync/convert/resolve/placeholder: 逐item结构化比较, 只重写变化的块
+      (保留原有顺序、注释和换行符), 写入使用临时文件+rename保证原子性
+    - merge/convert 无变化时不改写template, 下游模块hash不失效
+    - batch_replace_paths_regex: 预编译路径规则, 合并matcher快速跳过无关字符串
+  
   v1.2 (2025-11-27):
     - Enhanced cross-platform compatibility for Linux/Windows
     - Auto-detect CHECKLIST root directory in merge (智能识别路径中的CHECKLIST目录)
@@ -67,6 +73,7 @@ Change Log:
 
 import sys
 import os
+import copy
 import yaml
 import re
 import shutil
@@ -86,6 +93,9 @@ def represent_ordereddict(dumper, data):
 
 yaml.add_representer(OrderedDict, represent_ordereddict)
 
+# libyaml可用时用C实现解析 (大模板快数倍), 结果与SafeLoader一致
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def load_yaml_ordered(file_path: Path) -> OrderedDict:
     """加载YAML并保持顺序"""
@@ -157,6 +167,22 @@ def list_backups(backup_dir: Path) -> List[Dict]:
 # 路径转换工具
 # ============================================================================
 
+_CHECKLIST_DIR_RE = re.compile(r'(.*/CHECKLIST)/')
+
+# ${CHECKLIST_ROOT} 路径替换规则, 按优先级排列: 一个字符串只应用第一类命中的规则
+# (pattern, 替换后是否把反斜杠统一为正斜杠)
+_PATH_PATTERNS = [
+    # Linux/Unix 绝对路径: /path/to/CHECKLIST/
+    (re.compile(r'/(?:[^/]+/)*CHECKLIST/'), False),
+    # Windows路径（正斜杠）: C:/.../CHECKLIST/
+    (re.compile(r'[A-Za-z]:/(?:[^/]+/)*CHECKLIST/'), False),
+    # Windows路径（反斜杠）: C:\...\CHECKLIST\...
+    (re.compile(r'[A-Za-z]:\\(?:[^\\]+\\)*CHECKLIST\\'), True),
+]
+# 所有规则合并成一个matcher: 一次扫描即可排除不含路径的字符串
+_PATH_MATCHER = re.compile('|'.join(f"(?:{pattern.pattern})" for pattern, _ in _PATH_PATTERNS))
+
+
 def convert_to_template_format(data: Any, checklist_root: Path) -> Any:
     """将绝对路径转换为${CHECKLIST_ROOT}格式
     
@@ -176,9 +202,8 @@ def convert_to_template_format(data: Any, checklist_root: Path) -> Any:
         # 查找 IP_project_folder 前面的路径 (包含CHECKLIST)
         if 'IP_project_folder' in normalized_data or 'Check_modules' in normalized_data or 'Data_interface' in normalized_data:
             # 匹配模式: .../CHECKLIST/...
-            import re
             # 提取 CHECKLIST 之前的路径 (贪婪匹配到最后一个CHECKLIST)
-            match = re.search(r'(.*/CHECKLIST)/', normalized_data)
+            match = _CHECKLIST_DIR_RE.search(normalized_data)
             if match:
                 checklist_path = match.group(1)
                 # 替换为模板变量
@@ -229,39 +254,19 @@ def batch_replace_paths_regex(data: Any) -> Tuple[Any, int]:
     
     def replace_in_string(text: str) -> str:
         nonlocal count
-        result = text
-        
-        # 先检测是否已经包含占位符,避免重复替换
-        if '${CHECKLIST_ROOT}' in result:
-            return result
         
-        # Linux/Unix 绝对路径: /path/to/CHECKLIST/
-        pattern_linux = r'/(?:[^/]+/)*CHECKLIST/'
-        matches_linux = re.findall(pattern_linux, result)
-        if matches_linux:
-            count += len(matches_linux)
-            result = re.sub(pattern_linux, '${CHECKLIST_ROOT}/', result)
-            return result
+        # 先检测是否已经包含占位符,避免重复替换; 不含CHECKLIST路径的字符串直接跳过
+        if '${CHECKLIST_ROOT}' in text or 'CHECKLIST' not in text or not _PATH_MATCHER.search(text):
+            return text
         
-        # Windows路径（正斜杠）: C:/.../CHECKLIST/
-        pattern_win_forward = r'[A-Za-z]:/(?:[^/]+/)*CHECKLIST/'
-        matches_win = re.findall(pattern_win_forward, result)
-        if matches_win:
-            count += len(matches_win)
-            result = re.sub(pattern_win_forward, '${CHECKLIST_ROOT}/', result)
-            return result
+        for pattern, to_forward_slash in _PATH_PATTERNS:
+            result, n = pattern.subn('${CHECKLIST_ROOT}/', text)
+            if n:
+                count += n
+                # 统一转换为正斜杠
+                return result.replace('\\', '/') if to_forward_slash else result
         
-        # Windows路径（反斜杠）: C:\...\CHECKLIST\...
-        pattern_win_back = r'[A-Za-z]:\\(?:[^\\]+\\)*CHECKLIST\\'
-        matches_back = re.findall(pattern_win_back, result)
-        if matches_back:
-            count += len(matches_back)
-            result = re.sub(pattern_win_back, '${CHECKLIST_ROOT}/', result)
-            # 统一转换为正斜杠
-            result = result.replace('\\', '/')
-            return result
-        
-        return result
+        return text
     
     def process_data(obj):
         if isinstance(obj, dict):
@@ -277,6 +282,223 @@ def batch_replace_paths_regex(data: Any) -> Tuple[Any, int]:
     return processed_data, count
 
 
+# ============================================================================
+# 结构化差异 & 增量写入
+# ============================================================================
+#
+# 模板按 sections → section → item 逐层比较. 写回时只替换内容变化的块
+# (新增/删除/修改的item, metadata中变化的字段), 其余行原样保留 —— 顺序、注释、
+# 换行符(CRLF/LF)都不变, 下游按模块计算的hash也只对受影响的模块失效.
+# 无法按行定位时(文件不存在/flow风格/解析失败)退回整文件dump.
+
+# 逐层比较的最大深度: [] → ['sections'] → ['sections', <section>], item整体替换
+_PATCH_MAX_DEPTH = 2
+
+
+class _PatchError(Exception):
+    """原文件结构无法按行增量修改"""
+
+
+def load_yaml_with_nodes(file_path: Path) -> Tuple[str, Any, Any]:
+    """读取YAML, 一次解析同时返回 (原始文本, 节点树, 数据)
+
+    节点树带行号, 供 render_yaml_incremental 定位需要替换的块.
+    """
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+    loader = _YAML_LOADER(text)
+    try:
+        node = loader.get_single_node()
+        data = loader.construct_document(node) if node is not None else None
+    finally:
+        loader.dispose()
+    return text, node, data
+
+
+def _try_load_yaml_with_nodes(file_path: Path) -> Optional[Tuple[str, Any, Any]]:
+    if not file_path.exists():
+        return None
+    try:
+        return load_yaml_with_nodes(file_path)
+    except (OSError, UnicodeDecodeError, yaml.YAMLError):
+        return None
+
+
+def diff_interface_items(old_data: Any, new_data: Any) -> Dict[str, List[Tuple[str, str]]]:
+    """计算两个DATA_INTERFACE之间逐item的变更集
+
+    Returns:
+        {'added': [(section, item_id)], 'changed': [...], 'removed': [...]}
+    """
+    def sections_of(data):
+        sections = data.get('sections') if isinstance(data, dict) else None
+        return sections if isinstance(sections, dict) else {}
+
+    old_sections = sections_of(old_data)
+    new_sections = sections_of(new_data)
+    changes = {'added': [], 'changed': [], 'removed': []}
+
+    for section, new_items in new_sections.items():
+        old_items = old_sections.get(section)
+        if not isinstance(old_items, dict):
+            old_items = {}
+        if not isinstance(new_items, dict):
+            new_items = {}
+        for item_id, item in new_items.items():
+            if item_id not in old_items:
+                changes['added'].append((section, item_id))
+            elif old_items[item_id] != item:
+                changes['changed'].append((section, item_id))
+        for item_id in old_items:
+            if item_id not in new_items:
+                changes['removed'].append((section, item_id))
+
+    for section, old_items in old_sections.items():
+        if section not in new_sections and isinstance(old_items, dict):
+            changes['removed'].extend((section, item_id) for item_id in old_items)
+
+    return changes
+
+
+def _dump_yaml_text(data: Any) -> str:
+    return yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+
+def _dump_block(path: List[Any], value: Any) -> str:
+    """按完整嵌套路径dump单个 key: value 块, 缩进/折行与整文件dump一致"""
+    nested = value
+    for key in reversed(path):
+        nested = {key: nested}
+    lines = _dump_yaml_text(nested).splitlines(keepends=True)
+    # 去掉外层路径的key行 (每层一行)
+    return ''.join(lines[len(path) - 1:])
+
+
+def _is_detached_line(line: str, key_column: int) -> bool:
+    """块末尾的空行, 以及缩进不深于key的注释, 归属后面的内容"""
+    stripped = line.strip()
+    if not stripped:
+        return True
+    return stripped.startswith('#') and len(line) - len(line.lstrip()) <= key_column
+
+
+def _block_ranges(lines: List[str], node: Any, keys: List[Any], bound: int) -> List[Tuple[Any, int, int, Any]]:
+    """mapping节点中每个 key: value 块的行范围 [start, end)"""
+    if not isinstance(node, yaml.MappingNode) or node.flow_style or len(node.value) != len(keys):
+        raise _PatchError("not a block mapping")
+    ranges = []
+    pairs = node.value
+    for i, (key_node, value_node) in enumerate(pairs):
+        start = key_node.start_mark.line
+        end = pairs[i + 1][0].start_mark.line if i + 1 < len(pairs) else bound
+        if end <= start:
+            raise _PatchError("overlapping keys")
+        column = key_node.start_mark.column
+        while end > start + 1 and _is_detached_line(lines[end - 1], column):
+            end -= 1
+        ranges.append((keys[i], start, end, value_node))
+    return ranges
+
+
+def _patch_mapping(lines: List[str], node: Any, old: Dict, new: Dict, path: List[Any],
+                   bound: int, edits: List[Tuple[int, int, str]]):
+    """收集把 old 映射改为 new 所需的最小行编辑 (start, end, 替换文本)"""
+    ranges = _block_ranges(lines, node, list(old.keys()), bound)
+    if not ranges:
+        raise _PatchError("empty mapping")
+    by_key = {key: (start, end, value_node) for key, start, end, value_node in ranges}
+    if len(by_key) != len(ranges):
+        raise _PatchError("duplicate keys")
+
+    for key, start, end, value_node in ranges:
+        if key not in new:
+            edits.append((start, end, ''))
+        elif old[key] != new[key]:
+            if (len(path) < _PATCH_MAX_DEPTH and isinstance(old[key], dict)
+                    and isinstance(new[key], dict) and old[key] and new[key]):
+                try:
+                    nested = []
+                    _patch_mapping(lines, value_node, old[key], new[key], path + [key], end, nested)
+                    edits.extend(nested)
+                    continue
+                except _PatchError:
+                    pass
+            edits.append((start, end, _dump_block(path + [key], new[key])))
+
+    # 新增的key插在(新顺序中)前一个已有key之后; 已有key保持原位置
+    insert_at = ranges[0][1]
+    for key, value in new.items():
+        if key in by_key:
+            insert_at = by_key[key][1]
+        else:
+            edits.append((insert_at, insert_at, _dump_block(path + [key], value)))
+
+
+def render_yaml_incremental(data: Any, loaded: Optional[Tuple[str, Any, Any]] = None) -> str:
+    """生成新的YAML文本: 只重写相对 loaded (load_yaml_with_nodes的结果) 变化的块
+
+    没有可用的原文件时返回整文件dump.
+    """
+    if loaded is None or not isinstance(data, dict) or not isinstance(loaded[2], dict):
+        return _dump_yaml_text(data).replace('\n', os.linesep)
+    text, node, old_data = loaded
+    newline = '\r\n' if '\r\n' in text else '\n'
+    if old_data == data:
+        return text
+    try:
+        if re.search('\r(?!\n)|[\x85\u2028\u2029]', text):
+            raise _PatchError("unsupported line breaks")
+        lines = text.splitlines(keepends=True)
+        if len(lines) != text.count('\n') + (0 if text.endswith('\n') else 1):
+            raise _PatchError("unsupported line breaks")
+        if lines and not lines[-1].endswith('\n'):
+            lines[-1] += newline
+        edits = []
+        _patch_mapping(lines, node, old_data, data, [], len(lines), edits)
+
+        out = []
+        pos = 0
+        for start, end, replacement in sorted(edits, key=lambda e: (e[0], e[1])):
+            if start < pos:
+                raise _PatchError("overlapping edits")
+            out.extend(lines[pos:start])
+            if replacement:
+                out.append(replacement.replace('\n', newline) if newline != '\n' else replacement)
+            pos = end
+        out.extend(lines[pos:])
+        new_text = ''.join(out)
+
+        # 增量结果必须与整文件dump语义一致, 否则退回整文件dump
+        if yaml.load(new_text, Loader=_YAML_LOADER) != data:
+            raise _PatchError("patched document differs")
+        return new_text
+    except (_PatchError, yaml.YAMLError):
+        return _dump_yaml_text(data).replace('\n', newline)
+
+
+def write_text_atomic(file_path: Path, text: str):
+    """先写临时文件再rename, 中断时不会留下半个文件"""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = file_path.with_name(f".{file_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+        os.replace(tmp_path, file_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def print_item_changes(changes: Dict[str, List[Tuple[str, str]]], limit: int = 5):
+    """打印逐item变更集"""
+    for kind, mark in (('added', '+'), ('changed', '*'), ('removed', '-')):
+        entries = changes[kind]
+        for section, item_id in entries[:limit]:
+            print(f"  {mark} {section}/{item_id}")
+        if len(entries) > limit:
+            print(f"  {mark} ... and {len(entries) - limit} more")
+
+
 # ============================================================================
 # 子命令 1: 生成占位符 (placeholder)
 # ============================================================================
@@ -482,15 +704,14 @@ def cmd_placeholder(checklist_root: Path) -> bool:
         'sections': sections
     }
     
-    # 备份并写入
+    # 备份并写入 (只重写变化的块)
     print("[STEP 3] Writing template file...")
+    existing = _try_load_yaml_with_nodes(output_file)
     if output_file.exists():
         create_backup(output_file, backup_dir)
         print(f"  Backup created")
     
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        yaml.dump(template_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    write_text_atomic(output_file, render_yaml_incremental(template_data, existing))
     
     print(f"[SUCCESS] Template generated: {output_file.name}")
     print()
@@ -523,9 +744,10 @@ def cmd_merge(checklist_root: Path) -> bool:
         print("[INFO] Run 'placeholder' command first to create template")
         return False
     
-    # 加载template
+    # 加载template (保留原文本和节点树, 写回时只改变化的item)
     print("[STEP 1] Loading existing template...")
-    template_data = load_yaml_ordered(template_file)
+    loaded = load_yaml_with_nodes(template_file)
+    template_data = copy.deepcopy(loaded[2]) or {}
     current_sections = len(template_data.get('sections', {}))
     current_items = sum(len(s) for s in template_data.get('sections', {}).values())
     print(f"  Current: {current_sections} sections, {current_items} items")
@@ -627,6 +849,15 @@ def cmd_merge(checklist_root: Path) -> bool:
     
     print()
     
+    changes = diff_interface_items(loaded[2], template_data)
+    print(f"  Changes: +{len(changes['added'])} added, *{len(changes['changed'])} changed, "
+          f"-{len(changes['removed'])} removed")
+    print_item_changes(changes)
+    if not any(changes.values()):
+        print("[INFO] No item changes, template left untouched")
+        return True
+    print()
+    
     # 更新metadata
     print("[STEP 4] Updating metadata...")
     if 'metadata' not in template_data:
@@ -656,7 +887,7 @@ def cmd_merge(checklist_root: Path) -> bool:
     # 备份并保存
     print("[STEP 5] Saving template...")
     create_backup(template_file, backup_dir)
-    dump_yaml_ordered(template_data, template_file)
+    write_text_atomic(template_file, render_yaml_incremental(template_data, loaded))
     
     print(f"[SUCCESS] Template updated: {template_file.name}")
     print(f"  Processed {merged_count} module(s)")
@@ -687,7 +918,7 @@ def cmd_resolve(checklist_root: Path) -> bool:
         # 读取template
         print("[STEP 1] Loading template...")
         with open(template_file, 'r', encoding='utf-8') as f:
-            template_data = yaml.safe_load(f)
+            template_data = yaml.load(f, Loader=_YAML_LOADER)
         
         sections_count = len(template_data.get('sections', {}))
         items_count = sum(len(items) for items in template_data.get('sections', {}).values())
@@ -703,10 +934,13 @@ def cmd_resolve(checklist_root: Path) -> bool:
         resolved_data = resolve_template_placeholders(template_data, checklist_root_str)
         print()
         
-        # 写入输出
+        # 写入输出 (只重写变化的item)
         print("[STEP 3] Writing DATA_INTERFACE.yaml...")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            yaml.dump(resolved_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        existing = _try_load_yaml_with_nodes(output_file)
+        if existing is not None and existing[2] == resolved_data:
+            print(f"[SUCCESS] Up-to-date: {output_file}")
+            return True
+        write_text_atomic(output_file, render_yaml_incremental(resolved_data, existing))
         
         print(f"[SUCCESS] Generated: {output_file}")
         return True
@@ -778,12 +1012,12 @@ def cmd_sync(local_root: Path, reference_root: Path, dry_run: bool = False, forc
     # 加载templates
     try:
         print("[STEP 1] Loading templates...")
-        with open(local_template, 'r', encoding='utf-8') as f:
-            local_data = yaml.safe_load(f)
+        loaded = load_yaml_with_nodes(local_template)
+        local_data = copy.deepcopy(loaded[2])
         print(f"  Local: {local_template.name}")
         
         with open(reference_template, 'r', encoding='utf-8') as f:
-            reference_data = yaml.safe_load(f)
+            reference_data = yaml.load(f, Loader=_YAML_LOADER)
         print(f"  Reference: {reference_template.name}")
         print()
     except FileNotFoundError as e:
@@ -884,12 +1118,10 @@ def cmd_sync(local_root: Path, reference_root: Path, dry_run: bool = False, forc
         local_data['metadata']['total_items'] = sum(len(items) for items in local_sections.values())
         local_data['metadata']['generated'] = datetime.now().isoformat()
     
-    # 备份并保存
+    # 备份并保存 (只重写变化的item)
     print("[STEP 4] Saving merged template...")
     create_backup(local_template, backup_dir)
-    
-    with open(local_template, 'w', encoding='utf-8') as f:
-        yaml.dump(local_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    write_text_atomic(local_template, render_yaml_incremental(local_data, loaded))
     
     print(f"[SUCCESS] Merged {len(added_items) + len(updated_items)} update(s)")
     if force:
@@ -922,7 +1154,7 @@ def cmd_convert(checklist_root: Path) -> bool:
         # 读取YAML
         print("[STEP 1] Loading DATA_INTERFACE.yaml...")
         with open(input_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
         print()
         
         # 转换路径
@@ -941,13 +1173,20 @@ def cmd_convert(checklist_root: Path) -> bool:
                         if 'Input files' in str(item):
                             philosophy[i] = 'Input files: relative paths with ${CHECKLIST_ROOT} prefix'
         
-        # 备份并保存
+        # 与现有template逐item比较, 只重写变化的块
         print("[STEP 3] Saving template...")
-        if output_file.exists():
+        existing = _try_load_yaml_with_nodes(output_file)
+        if existing is not None:
+            changes = diff_interface_items(existing[2], converted_data)
+            print(f"  Changes: +{len(changes['added'])} added, *{len(changes['changed'])} changed, "
+                  f"-{len(changes['removed'])} removed")
+            print_item_changes(changes)
+            if existing[2] == converted_data:
+                print(f"[SUCCESS] Template up-to-date: {output_file.name}")
+                return True
             create_backup(output_file, backup_dir)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            yaml.dump(converted_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        write_text_atomic(output_file, render_yaml_incremental(converted_data, existing))
         
         print(f"[SUCCESS] Template generated: {output_file.name}")
         print(f"  Converted {count} path(s) to template format")
@@ -7,13 +7,21 @@ Assumptions about the BE sheet layout:
   - A module header line in column E starts with a number (e.g. '5.0 - SYNTHESIS CHECK').
   - For data rows: Column E has the item, Column F (index 5) has its description/info.
   - We collect rows until next module header.
+
+The sheet XML is stream-parsed (iterparse) straight from the archive and the
+extracted rows are cached per workbook content + sheet name (gzip JSON), so
+re-running on an unchanged workbook skips the XML parsing entirely.
+Cache dir: $CHECKLIST_PARSE_CACHE (default <output_dir>/.parse_cache; 'off' disables).
+Only the PARSE_CACHE_MAX_ENTRIES most recently used entries are kept.
 """
 
 import sys, os, zipfile, xml.etree.ElementTree as ET
 from pathlib import Path
-import re, csv
+import re, csv, gzip, hashlib, json
 
 MODULE_HEADER_RE = re.compile(r"^\s*\d+\.?\d*\b")
+PARSE_CACHE_FORMAT = 1
+PARSE_CACHE_MAX_ENTRIES = 8
 
 
 def _norm_sheet_name(name: str) -> str:
@@ -83,43 +91,137 @@ def _read_sheet_rows(xlsx_path: Path, sheet_name: str):
         sheet_path = 'xl/' + sheet_rel
         if sheet_path not in zf.namelist():
             raise ValueError("Sheet path '%s' missing in archive" % sheet_path)
-        shared_strings = []
-        if 'xl/sharedStrings.xml' in zf.namelist():
-            sroot = ET.fromstring(zf.read('xl/sharedStrings.xml'))
-            for si in sroot:
-                texts = []
-                for node in si.iter():
-                    if node.tag.endswith('}t') or node.tag=='t':
-                        if node.text: texts.append(node.text)
-                shared_strings.append(''.join(texts))
-        sroot = ET.fromstring(zf.read(sheet_path))
-        for row in sroot.iter():
-            if not (row.tag.endswith('}row') or row.tag=='row'): continue
-            cells = {}
-            maxc = -1
-            for c in row:
-                if not (c.tag.endswith('}c') or c.tag=='c'): continue
-                ref = c.attrib.get('r') or ''
-                ci = _col_to_index(ref)
-                t = c.attrib.get('t')
-                val = ''
-                v_elem = None
-                for ch in c:
-                    if ch.tag.endswith('}v') or ch.tag=='v': v_elem = ch; break
-                if v_elem is not None and v_elem.text is not None:
-                    raw = v_elem.text
-                    if t == 's':
-                        try:
-                            idx = int(raw)
-                            val = shared_strings[idx] if 0 <= idx < len(shared_strings) else raw
-                        except Exception:
-                            val = raw
-                    else:
-                        val = raw
-                cells[ci] = val
-                if ci > maxc: maxc = ci
-            if cells:
-                yield [cells.get(i,'') for i in range(maxc+1)]
+        shared_strings = _SharedStrings(zf)
+        # Walk the sheet as a stream; each finished row is emitted and dropped
+        stack = []
+        with zf.open(sheet_path) as f:
+            for event, elem in ET.iterparse(f, events=('start', 'end')):
+                if event == 'start':
+                    stack.append(elem)
+                    continue
+                stack.pop()
+                if not _tag_is(elem, 'row'):
+                    continue
+                row = _row_values(elem, shared_strings)
+                elem.clear()
+                if stack:
+                    stack[-1].remove(elem)
+                if row is not None:
+                    yield row
+
+def _tag_is(elem, name: str) -> bool:
+    return elem.tag == name or elem.tag.endswith('}' + name)
+
+class _SharedStrings:
+    """Shared-string table read lazily: sharedStrings.xml is only streamed up to
+    the highest index requested so far."""
+
+    def __init__(self, zf):
+        self._strings = []
+        self._entries = self._iter_entries(zf) if 'xl/sharedStrings.xml' in zf.namelist() else iter(())
+
+    @staticmethod
+    def _iter_entries(zf):
+        stack = []
+        texts = []
+        with zf.open('xl/sharedStrings.xml') as f:
+            for event, elem in ET.iterparse(f, events=('start', 'end')):
+                if event == 'start':
+                    stack.append(elem)
+                    continue
+                stack.pop()
+                if _tag_is(elem, 't'):
+                    if elem.text: texts.append(elem.text)
+                elif len(stack) == 1:
+                    # one <si> (any direct child of <sst>) is complete
+                    yield ''.join(texts)
+                    texts = []
+                    elem.clear()
+                    stack[0].remove(elem)
+
+    def get(self, idx: int, default: str) -> str:
+        while idx >= len(self._strings):
+            try:
+                self._strings.append(next(self._entries))
+            except StopIteration:
+                break
+        return self._strings[idx] if 0 <= idx < len(self._strings) else default
+
+def _row_values(row, shared_strings):
+    cells = {}
+    maxc = -1
+    for c in row:
+        if not _tag_is(c, 'c'): continue
+        ref = c.attrib.get('r') or ''
+        ci = _col_to_index(ref)
+        t = c.attrib.get('t')
+        val = ''
+        v_elem = None
+        for ch in c:
+            if _tag_is(ch, 'v'): v_elem = ch; break
+        if v_elem is not None and v_elem.text is not None:
+            raw = v_elem.text
+            if t == 's':
+                try:
+                    val = shared_strings.get(int(raw), raw)
+                except Exception:
+                    val = raw
+            else:
+                val = raw
+        cells[ci] = val
+        if ci > maxc: maxc = ci
+    if not cells:
+        return None
+    return [cells.get(i,'') for i in range(maxc+1)]
+
+def _parse_cache_path(xlsx_path: Path, sheet_name: str, cache_dir: Path) -> Path:
+    h = hashlib.sha256()
+    with open(str(xlsx_path), 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    h.update(b'\0' + sheet_name.encode('utf-8'))
+    return cache_dir / ('rows_%s.json.gz' % h.hexdigest()[:32])
+
+def _read_sheet_rows_cached(xlsx_path: Path, sheet_name: str, cache_dir=None, verbose=False):
+    """Rows of the sheet as lists, served from the parse cache when the workbook is unchanged."""
+    if cache_dir is None:
+        return list(_read_sheet_rows(xlsx_path, sheet_name))
+    cache_dir = Path(cache_dir)
+    cache_path = _parse_cache_path(xlsx_path, sheet_name, cache_dir)
+    try:
+        with gzip.open(str(cache_path), 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format') == PARSE_CACHE_FORMAT and isinstance(data.get('rows'), list):
+            if verbose:
+                print("Using cached rows:", cache_path, file=sys.stderr)
+            try: os.utime(str(cache_path))
+            except OSError: pass
+            return data['rows']
+    except (OSError, ValueError):
+        pass
+    rows = list(_read_sheet_rows(xlsx_path, sheet_name))
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name('%s.%d.tmp' % (cache_path.name, os.getpid()))
+        with gzip.open(str(tmp_path), 'wt', encoding='utf-8') as f:
+            json.dump({'format': PARSE_CACHE_FORMAT, 'workbook': str(xlsx_path), 'sheet': sheet_name, 'rows': rows}, f)
+        os.replace(str(tmp_path), str(cache_path))
+        _prune_parse_cache(cache_dir)
+    except OSError as e:
+        if verbose:
+            print("WARNING: cannot write parse cache:", e, file=sys.stderr)
+    return rows
+
+def _prune_parse_cache(cache_dir: Path, keep=PARSE_CACHE_MAX_ENTRIES):
+    """Drop all but the `keep` most recently used entries (older workbook versions)."""
+    entries = []
+    for p in cache_dir.glob('rows_*.json.gz'):
+        try: entries.append((p.stat().st_mtime, p))
+        except OSError: pass
+    entries.sort(reverse=True)
+    for _, p in entries[keep:]:
+        try: p.unlink()
+        except OSError: pass
 
 def parse_in_excel(stage, excel_file, output_dir=None, sheet_name='BE_check', verbose=False):
     excel_file = Path(excel_file)
@@ -135,8 +237,13 @@ def parse_in_excel(stage, excel_file, output_dir=None, sheet_name='BE_check', ve
     if not excel_file.exists():
         print("ERROR: Excel file not found:", excel_file, file=sys.stderr)
         return None
+    cache_dir = os.environ.get('CHECKLIST_PARSE_CACHE')
+    if cache_dir is None:
+        cache_dir = output_dir / '.parse_cache'
+    elif cache_dir.strip().lower() in ('', '0', 'off', 'none'):
+        cache_dir = None
     try:
-        rows = list(_read_sheet_rows(excel_file, sheet_name))
+        rows = _read_sheet_rows_cached(excel_file, sheet_name, cache_dir, verbose)
     except Exception as e:
         print("ERROR: cannot parse sheet:", e, file=sys.stderr)
         return None
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from pathlib import Path
 from typing import Sequence
@@ -43,6 +44,9 @@ Examples:
   # Generate complete checker (README + Code + Test)
   python cli.py generate --item-id IMP-10-0-0-11 --module 10.0_STA_DCD_CHECK
   
+  # Batch: whole module, 4 items at a time, at most 30 LLM requests/minute
+  python cli.py generate --module 10.0_STA_DCD_CHECK --ai-agent --jobs 4 --llm-rpm 30
+  
   # Generate code only (skip README and test)
   python cli.py generate --item-id IMP-10-0-0-11 --module 10.0_STA_DCD_CHECK --code-only
   
@@ -170,6 +174,22 @@ Examples:
         action="store_true",
         help="Skip interactive testing phase (Step 6+)",
     )
+    generate_parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Batch mode: number of items generated concurrently (default: 1 = serial)",
+    )
+    generate_parser.add_argument(
+        "--llm-rpm",
+        type=float,
+        help="Max LLM requests per minute across all items (default: AUTOGEN_LLM_RPM or unlimited)",
+    )
+    generate_parser.add_argument(
+        "--llm-max-concurrency",
+        type=int,
+        help="Max in-flight LLM requests per provider (default: AUTOGEN_LLM_MAX_CONCURRENCY or --jobs)",
+    )
     
     # ===== Analyze command =====
     analyze_parser = subparsers.add_parser(
@@ -414,57 +434,70 @@ def _discover_module_items(module: str) -> list:
     return items
 
 
+def _generate_single_item(args: argparse.Namespace) -> int:
+    """Run generation for args.item_id (AI agent or template workflow)."""
+    if args.ai_agent:
+        return _run_ai_agent_mode(args)
+    
+    # Non-AI agent mode
+    CheckerWorkflowOrchestrator.generate_full_checker(
+        item_id=args.item_id,
+        module=args.module,
+        item_desc=args.desc,
+        input_files=args.files,
+        use_llm=not args.no_llm,
+        llm_provider=args.llm_provider,
+        llm_model=args.llm_model,
+        output_dir=args.output_dir,
+    )
+    return 0
+
+
 def _run_batch_generate(args: argparse.Namespace) -> int:
     """
     Run batch generation for multiple checkers.
+    
+    With --jobs N > 1 items run concurrently (see _run_batch_concurrent).
     """
     item_ids = args.item_ids
     total = len(item_ids)
+    jobs = max(1, getattr(args, 'jobs', 1) or 1)
     
     print(f"\n{'='*60}")
     print(f"🚀 Batch Generation: {total} checkers")
     print(f"{'='*60}")
     print(f"Module: {args.module}")
     print(f"Items: {', '.join(item_ids)}")
+    if jobs > 1:
+        print(f"Jobs: {jobs} concurrent")
     print(f"{'='*60}\n")
     
-    results = {"success": [], "failed": []}
-    
-    for i, item_id in enumerate(item_ids, 1):
-        print(f"\n{'='*60}")
-        print(f"[{i}/{total}] Processing {item_id}")
-        print(f"{'='*60}")
-        
-        # Create a copy of args with single item_id
-        args.item_id = item_id
+    if jobs > 1 and total > 1:
+        results = _run_batch_concurrent(args, min(jobs, total))
+    else:
+        results = {"success": [], "failed": []}
         
-        try:
-            if args.ai_agent:
-                result = _run_ai_agent_mode(args)
-            else:
-                # Non-AI agent mode
-                artifacts = CheckerWorkflowOrchestrator.generate_full_checker(
-                    item_id=item_id,
-                    module=args.module,
-                    item_desc=args.desc,
-                    input_files=args.files,
-                    use_llm=not args.no_llm,
-                    llm_provider=args.llm_provider,
-                    llm_model=args.llm_model,
-                    output_dir=args.output_dir,
-                )
-                result = 0
+        for i, item_id in enumerate(item_ids, 1):
+            print(f"\n{'='*60}")
+            print(f"[{i}/{total}] Processing {item_id}")
+            print(f"{'='*60}")
             
-            if result == 0:
-                results["success"].append(item_id)
-                print(f"\n✅ {item_id} completed successfully")
-            else:
-                results["failed"].append(item_id)
-                print(f"\n❌ {item_id} failed with code {result}")
+            # Create a copy of args with single item_id
+            args.item_id = item_id
+            
+            try:
+                result = _generate_single_item(args)
                 
-        except Exception as e:
-            results["failed"].append(item_id)
-            print(f"\n❌ {item_id} failed with error: {e}")
+                if result == 0:
+                    results["success"].append(item_id)
+                    print(f"\n✅ {item_id} completed successfully")
+                else:
+                    results["failed"].append(item_id)
+                    print(f"\n❌ {item_id} failed with code {result}")
+                    
+            except Exception as e:
+                results["failed"].append(item_id)
+                print(f"\n❌ {item_id} failed with error: {e}")
     
     # Print summary
     print(f"\n{'='*60}")
@@ -481,6 +514,67 @@ def _run_batch_generate(args: argparse.Namespace) -> int:
     return 0 if not results["failed"] else 1
 
 
+def _run_batch_concurrent(args: argparse.Namespace, jobs: int) -> dict:
+    """
+    Generate args.item_ids with `jobs` items in flight.
+    
+    Workers are non-interactive (no fix prompts; stdin reads hit EOF), each
+    item's console output goes to logs/batch_<timestamp>/<item_id>.log and
+    the terminal shows a combined progress view. LLM calls from all items
+    share one rate limiter and per-provider concurrency cap.
+    """
+    try:
+        from llm_clients.rate_limit import configure_scheduler
+        from workflow.batch_runner import BatchRunner
+    except ImportError:
+        from AutoGenChecker.llm_clients.rate_limit import configure_scheduler
+        from AutoGenChecker.workflow.batch_runner import BatchRunner
+    
+    max_concurrency = args.llm_max_concurrency
+    if max_concurrency is None and not os.environ.get("AUTOGEN_LLM_MAX_CONCURRENCY"):
+        max_concurrency = jobs
+    scheduler = configure_scheduler(
+        requests_per_minute=args.llm_rpm,
+        max_concurrency=max_concurrency,
+    )
+    rpm = scheduler.requests_per_minute
+    print(f"⚙️  LLM limits: {rpm:g} requests/min" if rpm > 0 else "⚙️  LLM limits: no rate limit",
+          end="")
+    print(f", {scheduler.max_concurrency} in flight per provider"
+          if scheduler.max_concurrency > 0 else ", unlimited in flight")
+    
+    if args.ai_agent and not args.no_interactive_fix:
+        print("ℹ️  Concurrent batch runs are non-interactive (--no-interactive-fix implied)")
+    
+    # Authenticate once up front: a password prompt inside a worker would
+    # be invisible (its output goes to the item log)
+    if not args.no_llm:
+        try:
+            from llm_clients import create_llm_client
+        except ImportError:
+            from AutoGenChecker.llm_clients import create_llm_client
+        kwargs = {"model": args.llm_model} if args.llm_model else {}
+        try:
+            create_llm_client(args.llm_provider, **kwargs).prepare()
+        except Exception as e:
+            print(f"⚠️  LLM client warm-up failed ({e}); items may fail to authenticate")
+    
+    def run_item(item_id: str) -> int:
+        item_args = argparse.Namespace(**vars(args))
+        item_args.item_id = item_id
+        item_args.no_interactive_fix = True
+        return _generate_single_item(item_args)
+    
+    runner = BatchRunner(run_item, jobs, BatchRunner.default_log_dir(_current_dir))
+    print(f"📁 Per-item logs: {runner.log_dir}\n")
+    item_results = runner.run(list(args.item_ids))
+    
+    results = {"success": [], "failed": []}
+    for item in item_results:
+        results["success" if item.success else "failed"].append(item.item_id)
+    return results
+
+
 def _run_ai_agent_mode(args: argparse.Namespace) -> int:
     """
     Run Intelligent AI Agent for complete checker implementation.
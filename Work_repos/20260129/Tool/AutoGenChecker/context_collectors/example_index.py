@@ -0,0 +1,433 @@
+"""Persistent similarity index over existing checker examples.
+
+CheckerExampleCollector used to walk every module's ``inputs/items/*.yaml``,
+parse each config and read each checker script on every generation. This
+index keeps precomputed features per example instead:
+
+Features:
+- Tokenised item description with BM25 term statistics
+- Input-file type signature (file names and extensions)
+- Checker type (Type 1-4) from the requirements / waivers config
+- Code size and AI-generated marker of the checker script
+- Incremental refresh: only examples whose YAML or script mtime/size changed
+  are re-parsed; deleted examples are dropped
+- Top-k retrieval over inverted postings; scripts are read for the winners only
+
+Environment variables:
+- AUTOGEN_EXAMPLE_INDEX_PATH: index file (default: one file per Check_modules
+  root under ~/.autogenchecker/, outside the checkout like the LLM response cache)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import sys
+import threading
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Setup import path
+_parent_dir = Path(__file__).parent.parent
+if str(_parent_dir) not in sys.path:
+    sys.path.insert(0, str(_parent_dir))
+
+try:  # Optional dependency.
+    import yaml  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency guard
+    yaml = None
+
+
+# Bump when the entry layout or feature extraction changes
+INDEX_VERSION = 1
+
+DEFAULT_INDEX_DIR = Path.home() / ".autogenchecker"
+
+# Score weights (0-100 total), unchanged from the original set-overlap scoring
+FILE_POINTS = 40.0
+FILE_POINTS_PER_MATCH = 20.0
+TYPE_POINTS = 30.0
+DESCRIPTION_POINTS = 20.0
+MODULE_POINTS = 10.0
+
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+
+def default_index_path(check_modules_root: Path) -> Path:
+    """Per-root index file under DEFAULT_INDEX_DIR (checkouts do not share one)."""
+    digest = hashlib.sha1(str(Path(check_modules_root).resolve()).encode("utf-8")).hexdigest()[:16]
+    return DEFAULT_INDEX_DIR / f"checker_example_index_{digest}.json"
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case word tokens of a description."""
+    return _TOKEN_RE.findall(str(text).lower())
+
+
+def file_signature(input_files: Iterable[Any]) -> List[str]:
+    """File names plus extensions, e.g. ['qor.rpt', 'rpt']."""
+    types = set()
+    for entry in input_files:
+        name = Path(str(entry)).name.lower()
+        types.add(name)
+        if "." in name:
+            types.add(name.split(".")[-1])
+    return sorted(types)
+
+
+def detect_checker_type(metadata: Any) -> int | None:
+    """Detect checker type (1-4) from YAML metadata."""
+    if not isinstance(metadata, dict):
+        return None
+
+    req = metadata.get("requirements", {})
+    if not isinstance(req, dict):
+        return None
+
+    req_value = req.get("value", "N/A")
+    pattern_items = req.get("pattern_items", [])
+
+    waiver = metadata.get("waivers", {})
+    waiver_value = waiver.get("value", "N/A") if isinstance(waiver, dict) else "N/A"
+
+    if req_value == "N/A" and waiver_value in ["N/A", 0]:
+        return 1
+    elif req_value != "N/A" and pattern_items and waiver_value in ["N/A", 0]:
+        return 2
+    elif req_value != "N/A" and pattern_items and waiver_value not in ["N/A", 0]:
+        return 3
+    elif req_value == "N/A" and waiver_value not in ["N/A", 0]:
+        return 4
+
+    return None
+
+
+def is_ai_generated(script_text: str) -> bool:
+    """Check if script was generated by AutoGenChecker AI.
+
+    Detection markers:
+    - "Author: AutoGenChecker AI"
+    - "Refactored: YYYY-MM-DD (Using checker_templates"
+    """
+    if "Author: AutoGenChecker AI" in script_text:
+        return True
+    return "Refactored:" in script_text and "(Using checker_templates" in script_text
+
+
+def load_metadata(config_file: Path) -> Dict[str, Any]:
+    if yaml is None:
+        return {}
+    try:
+        with config_file.open("r", encoding="utf-8") as handle:
+            data = yaml.safe_load(handle) or {}
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def read_text(script_path: Path) -> str:
+    try:
+        return script_path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        return script_path.read_text(encoding="latin-1", errors="ignore")
+
+
+def _stamp(path: Path) -> List[int]:
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+@dataclass
+class IndexedExample:
+    """Precomputed features of one checker example."""
+
+    module: str
+    item_id: str
+    config_file: str
+    script_path: str
+    config_stamp: List[int]
+    script_stamp: List[int]
+    item_desc: str = ""
+    input_files: List[str] = field(default_factory=list)
+    desc_terms: Dict[str, int] = field(default_factory=dict)
+    file_types: List[str] = field(default_factory=list)
+    checker_type: Optional[int] = None
+    code_size: int = 0
+    ai_generated: bool = False
+
+    @property
+    def key(self) -> str:
+        return f"{self.module}/{self.item_id}"
+
+    def to_example(self) -> Dict[str, Any]:
+        """Example dict for CheckerExampleCollector._build_fragment (reads the script)."""
+        return {
+            "module": self.module,
+            "item_id": self.item_id,
+            "config_file": Path(self.config_file),
+            "script_path": Path(self.script_path),
+            "metadata": {"item_desc": self.item_desc, "input_files": list(self.input_files)},
+            "checker_type": self.checker_type,
+            "script_text": read_text(Path(self.script_path)),
+        }
+
+
+def build_entry(module: str, config_file: Path, script_path: Path) -> Optional[IndexedExample]:
+    """Parse one example; None when the checker script is empty."""
+    script_text = read_text(script_path)
+    if not script_text.strip():
+        return None
+    metadata = load_metadata(config_file)
+    raw_inputs = metadata.get("input_files")
+    if isinstance(raw_inputs, list):
+        input_files = [str(entry) for entry in raw_inputs]
+    elif isinstance(raw_inputs, str):
+        input_files = [raw_inputs]
+    else:
+        input_files = []
+    item_desc = str(metadata.get("item_desc") or "")
+    return IndexedExample(
+        module=module,
+        item_id=config_file.stem,
+        config_file=str(config_file),
+        script_path=str(script_path),
+        config_stamp=_stamp(config_file),
+        script_stamp=_stamp(script_path),
+        item_desc=item_desc,
+        input_files=input_files,
+        desc_terms=dict(Counter(tokenize(item_desc))),
+        file_types=file_signature(input_files),
+        checker_type=detect_checker_type(metadata),
+        code_size=len(script_text),
+        ai_generated=is_ai_generated(script_text),
+    )
+
+
+class ExampleIndex:
+    """Incrementally refreshed, file-backed index of checker examples."""
+
+    def __init__(self, check_modules_root: Path, path: Path | str | None = None) -> None:
+        """
+        Args:
+            check_modules_root: CHECKLIST/Check_modules directory
+            path: Index file (None: AUTOGEN_EXAMPLE_INDEX_PATH or default_index_path())
+        """
+        self.root = Path(check_modules_root)
+        self.path = Path(path or os.environ.get("AUTOGEN_EXAMPLE_INDEX_PATH")
+                         or default_index_path(self.root))
+        self._lock = threading.Lock()
+        # Insertion order = (module, item) order of a directory walk, which
+        # is also the tie-break order of search results
+        self._entries: Dict[str, IndexedExample] = self._load()
+        self._rebuild_postings()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> Dict[str, IndexedExample]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != INDEX_VERSION or data.get("root") != str(self.root):
+            return {}
+        try:
+            entries = [IndexedExample(**raw) for raw in data.get("examples", [])]
+        except TypeError:
+            return {}
+        return {entry.key: entry for entry in entries}
+
+    def _save(self) -> None:
+        payload = {
+            "version": INDEX_VERSION,
+            "root": str(self.root),
+            "examples": [asdict(entry) for entry in self._entries.values()],
+        }
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            # An unwritable index location still works, it just rebuilds next time
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def _walk(self) -> Iterable[Tuple[str, Path, Path]]:
+        if not self.root.is_dir():
+            return
+        for module_dir in sorted(self.root.iterdir()):
+            if not module_dir.is_dir() or module_dir.name.lower() == "common":
+                continue
+            items_dir = module_dir / "inputs" / "items"
+            scripts_dir = module_dir / "scripts" / "checker"
+            if not items_dir.exists() or not scripts_dir.exists():
+                continue
+            for config_file in sorted(items_dir.glob("*.yaml")):
+                script_path = scripts_dir / f"{config_file.stem}.py"
+                if script_path.exists():
+                    yield module_dir.name, config_file, script_path
+
+    def refresh(self) -> Dict[str, int]:
+        """Bring the index up to date with the tree; returns change counts."""
+        with self._lock:
+            stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+            entries: Dict[str, IndexedExample] = {}
+            for module, config_file, script_path in self._walk():
+                key = f"{module}/{config_file.stem}"
+                old = self._entries.get(key)
+                try:
+                    if (old is not None and old.config_stamp == _stamp(config_file)
+                            and old.script_stamp == _stamp(script_path)):
+                        entries[key] = old
+                        stats["unchanged"] += 1
+                        continue
+                    entry = build_entry(module, config_file, script_path)
+                except OSError:
+                    continue
+                if entry is None:
+                    continue
+                entries[key] = entry
+                stats["updated" if old is not None else "added"] += 1
+            stats["removed"] = len(set(self._entries) - set(entries))
+            changed = (stats["added"] or stats["updated"] or stats["removed"]
+                       or list(entries) != list(self._entries))
+            self._entries = entries
+            if changed:
+                self._rebuild_postings()
+                self._save()
+            return stats
+
+    def _rebuild_postings(self) -> None:
+        """Derive BM25 statistics and inverted postings from the entries."""
+        self._ordered: List[IndexedExample] = list(self._entries.values())
+        self._desc_postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._file_postings: Dict[str, List[int]] = defaultdict(list)
+        self._module_postings: Dict[str, List[int]] = defaultdict(list)
+        self._type_postings: Dict[int, List[int]] = defaultdict(list)
+        self._doc_len: List[int] = []
+        for doc, entry in enumerate(self._ordered):
+            for term, tf in entry.desc_terms.items():
+                self._desc_postings[term].append((doc, tf))
+            for file_type in entry.file_types:
+                self._file_postings[file_type].append(doc)
+            self._module_postings[entry.module].append(doc)
+            if entry.checker_type is not None:
+                self._type_postings[entry.checker_type].append(doc)
+            self._doc_len.append(sum(entry.desc_terms.values()))
+        total = len(self._ordered)
+        self._avg_len = (sum(self._doc_len) / total) if total else 0.0
+        self._idf = {
+            term: math.log(1.0 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._desc_postings.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Retrieval
+    # ------------------------------------------------------------------
+
+    def _bm25(self, terms: Iterable[str]) -> Dict[int, float]:
+        scores: Dict[int, float] = defaultdict(float)
+        avg_len = self._avg_len or 1.0
+        for term in set(terms):
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            for doc, tf in self._desc_postings[term]:
+                norm = BM25_K1 * (1.0 - BM25_B + BM25_B * self._doc_len[doc] / avg_len)
+                scores[doc] += idf * tf * (BM25_K1 + 1.0) / (tf + norm)
+        return scores
+
+    def search(
+        self,
+        description: str = "",
+        input_files: Iterable[Any] = (),
+        checker_type: int | None = None,
+        module: str = "",
+        k: int = 3,
+        exclude_ai_generated: bool = False,
+        max_script_chars: int = 0,
+    ) -> List[Tuple[float, IndexedExample]]:
+        """
+        Return the k most similar examples as (score, entry), best first.
+
+        Scoring (0-100):
+        - Input file match: 20 points per shared name/extension, max 40
+        - Checker type match: 30 points
+        - Description similarity: BM25, scaled so the best match gets 20
+        - Same module: 10 points
+
+        Ties keep directory order, preferring scripts that fit in
+        max_script_chars (they reach the prompt untruncated).
+        """
+        with self._lock:
+            ordered = self._ordered
+            scores = [0.0] * len(ordered)
+
+            file_hits: Dict[int, int] = defaultdict(int)
+            for file_type in file_signature(input_files):
+                for doc in self._file_postings.get(file_type, ()):
+                    file_hits[doc] += 1
+            for doc, overlap in file_hits.items():
+                scores[doc] += min(FILE_POINTS, overlap * FILE_POINTS_PER_MATCH)
+
+            if checker_type is not None:
+                for doc in self._type_postings.get(checker_type, ()):
+                    scores[doc] += TYPE_POINTS
+
+            desc_scores = self._bm25(tokenize(description))
+            best = max(desc_scores.values(), default=0.0)
+            if best > 0:
+                for doc, value in desc_scores.items():
+                    scores[doc] += DESCRIPTION_POINTS * value / best
+
+            for doc in self._module_postings.get(module, ()):
+                scores[doc] += MODULE_POINTS
+
+            candidates = (
+                doc for doc, entry in enumerate(ordered)
+                if not (exclude_ai_generated and entry.ai_generated)
+            )
+            top = heapq.nlargest(
+                k,
+                candidates,
+                key=lambda doc: (
+                    scores[doc],
+                    not max_script_chars or ordered[doc].code_size <= max_script_chars,
+                ),
+            )
+            return [(scores[doc], ordered[doc]) for doc in top]
+
+
+_indexes: Dict[Tuple[str, str], ExampleIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_example_index(check_modules_root: Path, path: Path | str | None = None) -> ExampleIndex:
+    """Return the process-wide index for a Check_modules root."""
+    key = (str(check_modules_root), str(path or ""))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = ExampleIndex(check_modules_root, path)
+        return index
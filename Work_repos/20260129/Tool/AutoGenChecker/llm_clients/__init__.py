@@ -4,6 +4,8 @@ Supported providers:
 - OpenAI: Requires OPENAI_API_KEY environment variable
 - Anthropic: Requires ANTHROPIC_API_KEY environment variable  
 - JedAI: Cadence internal API, uses LDAP authentication (no external API key needed)
+
+Responses are cached on disk by request content (see response_cache.py).
 """
 
 from .anthropic_client import AnthropicMessagesClient
@@ -11,11 +13,14 @@ from .base import BaseLLMClient
 from .factory import create_llm_client
 from .jedai_client import JedAIClient
 from .openai_client import OpenAIChatClient
+from .response_cache import CacheMissError, ResponseCache
 
 __all__ = [
 	"AnthropicMessagesClient",
 	"BaseLLMClient",
+	"CacheMissError",
 	"JedAIClient",
 	"OpenAIChatClient",
+	"ResponseCache",
 	"create_llm_client",
 ]
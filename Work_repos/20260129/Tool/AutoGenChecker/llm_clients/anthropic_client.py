@@ -13,9 +13,11 @@ if str(_parent_dir) not in sys.path:
 
 try:
     from llm_clients.base import BaseLLMClient
+    from llm_clients.response_cache import ResponseCache
     from utils.models import LLMCallConfig, LLMResponse
 except ImportError:
     from AutoGenChecker.llm_clients.base import BaseLLMClient
+    from AutoGenChecker.llm_clients.response_cache import ResponseCache
     from AutoGenChecker.utils.models import LLMCallConfig, LLMResponse
 
 try:  # Optional dependency guard.
@@ -38,13 +40,14 @@ class AnthropicMessagesClient(BaseLLMClient):
         default_model: str = "claude-3-5-sonnet-20241022",
         base_url: str | None = None,
         system_prompt: str | None = None,
+        response_cache: ResponseCache | bool | None = None,
     ) -> None:
         if anthropic is None:
             raise ImportError(
                 "The anthropic package is required. Install it via 'pip install anthropic'."
             )
 
-        super().__init__(default_model=default_model)
+        super().__init__(default_model=default_model, response_cache=response_cache)
         self._api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self._api_key:
             raise ValueError("Anthropic API key not provided. Set ANTHROPIC_API_KEY.")
@@ -56,7 +59,7 @@ class AnthropicMessagesClient(BaseLLMClient):
         self._client = anthropic.Anthropic(**client_kwargs)
         self._system_prompt = system_prompt or self._DEFAULT_SYSTEM
 
-    def complete(
+    def _complete(
         self, prompt: str, *, config: LLMCallConfig | None = None
     ) -> LLMResponse:  # type: ignore[override]
         resolved = self.resolve_config(config)
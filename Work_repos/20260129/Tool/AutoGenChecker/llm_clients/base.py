@@ -5,6 +5,7 @@ from __future__ import annotations
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Any, Dict, Generator, Iterator
 
 # Setup import path
 _parent_dir = Path(__file__).parent.parent
@@ -13,19 +14,138 @@ if str(_parent_dir) not in sys.path:
 
 try:
     from utils.models import LLMCallConfig, LLMResponse
+    from llm_clients.rate_limit import get_scheduler
+    from llm_clients.response_cache import (
+        CacheMissError, ResponseCache, get_default_cache, is_bypassed, make_cache_key,
+    )
 except ImportError:
     from AutoGenChecker.utils.models import LLMCallConfig, LLMResponse
+    from AutoGenChecker.llm_clients.rate_limit import get_scheduler
+    from AutoGenChecker.llm_clients.response_cache import (
+        CacheMissError, ResponseCache, get_default_cache, is_bypassed, make_cache_key,
+    )
 
 
 class BaseLLMClient(ABC):
-    """Normalized interface around vendor specific SDKs."""
+    """Normalized interface around vendor specific SDKs.
 
-    def __init__(self, default_model: str | None = None) -> None:
+    ``complete`` answers repeated identical requests from the response cache
+    (see ``response_cache.py``) and sends the rest through the shared
+    request scheduler (see ``rate_limit.py``); subclasses implement
+    ``_complete`` with the actual API call.
+
+    ``complete_stream`` yields the response text incrementally; providers
+    that can stream override ``_complete_stream``, the rest yield the whole
+    text once.
+    """
+
+    _system_prompt: str | None = None
+
+    def __init__(
+        self,
+        default_model: str | None = None,
+        response_cache: ResponseCache | bool | None = None,
+    ) -> None:
+        """
+        Args:
+            default_model: Model used when the call config names none
+            response_cache: Cache instance, False to disable, None for the
+                            process-wide default (AUTOGEN_LLM_CACHE)
+        """
         self._default_model = default_model
+        if response_cache is None or response_cache is True:
+            response_cache = get_default_cache()
+        self._response_cache: ResponseCache | None = response_cache or None
 
-    @abstractmethod
     def complete(self, prompt: str, *, config: LLMCallConfig | None = None) -> LLMResponse:
-        """Execute a single prompt-completion request."""
+        """Execute a single prompt-completion request (cached unless bypassed)."""
+        resolved = self.resolve_config(config)
+        cache = self._response_cache
+        if cache is None or is_bypassed(resolved):
+            return self._scheduled_complete(prompt, resolved)
+
+        key = self._cache_key(prompt, resolved)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        if cache.mode == "replay":
+            raise self._replay_miss(key, resolved)
+        response = self._scheduled_complete(prompt, resolved)
+        cache.put(key, response)
+        return response
+
+    def complete_stream(
+        self, prompt: str, *, config: LLMCallConfig | None = None
+    ) -> Iterator[str]:
+        """Execute a prompt-completion request, yielding text chunks as they arrive.
+
+        Shares the cache with ``complete``: a hit is yielded as one chunk, and
+        a fully consumed stream is stored like a regular response.
+        """
+        resolved = self.resolve_config(config)
+        cache = self._response_cache
+        key = None
+        if cache is not None and not is_bypassed(resolved):
+            key = self._cache_key(prompt, resolved)
+            cached = cache.get(key)
+            if cached is not None:
+                yield cached.text
+                return
+            if cache.mode == "replay":
+                raise self._replay_miss(key, resolved)
+
+        scheduler = get_scheduler()
+        if scheduler.enabled:
+            with scheduler.slot(type(self).__name__):
+                response = yield from self._complete_stream(prompt, config=resolved)
+        else:
+            response = yield from self._complete_stream(prompt, config=resolved)
+        if key is not None:
+            cache.put(key, response)
+
+    def _complete_stream(
+        self, prompt: str, *, config: LLMCallConfig
+    ) -> Generator[str, None, LLMResponse]:
+        """Yield response text chunks and return the final response.
+
+        Default: one chunk holding the full ``_complete`` text.
+        """
+        response = self._complete(prompt, config=config)
+        yield response.text
+        return response
+
+    def _cache_key(self, prompt: str, config: LLMCallConfig) -> str:
+        # The default model is part of the identity: JedAI maps unsupported
+        # config models (e.g. the "gpt-4.1" LLMCallConfig default) onto it
+        namespace = f"{type(self).__name__}:{self._default_model}"
+        return make_cache_key(namespace, prompt, config, self._system_prompt)
+
+    def _replay_miss(self, key: str, config: LLMCallConfig) -> CacheMissError:
+        return CacheMissError(
+            f"No recorded LLM response for {type(self).__name__}/{config.model} "
+            f"(key {key[:12]}) and AUTOGEN_LLM_CACHE=replay"
+        )
+
+    def _scheduled_complete(self, prompt: str, config: LLMCallConfig) -> LLMResponse:
+        scheduler = get_scheduler()
+        if not scheduler.enabled:
+            return self._complete(prompt, config=config)
+        with scheduler.slot(type(self).__name__):
+            return self._complete(prompt, config=config)
+
+    @abstractmethod
+    def _complete(self, prompt: str, *, config: LLMCallConfig) -> LLMResponse:
+        """Send a single prompt-completion request to the provider."""
+
+    def prepare(self) -> None:
+        """Authenticate / warm up before the client is used from worker threads.
+
+        No-op by default; clients that may prompt for credentials override it.
+        """
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return response cache statistics ({} when caching is disabled)."""
+        return self._response_cache.stats() if self._response_cache else {}
 
     def resolve_config(self, config: LLMCallConfig | None = None) -> LLMCallConfig:
         if config is None:
@@ -8,6 +8,13 @@ Features:
 - Uses LDAP authentication (your Cadence credentials)
 - Supports Claude Opus 4, Claude Sonnet 4, Gemini 2.5 Pro/Flash
 - Automatic URL fallback for reliability
+- Pooled keep-alive HTTP session with retry/backoff on transient errors
+- Streaming completions (``complete_stream``) for token-by-token output
+
+Environment variables:
+- JEDAI_POOL_SIZE: Connections kept alive per host (default: 8)
+- JEDAI_MAX_RETRIES: Retries on connection errors / 429 (default: 3);
+  502-504 on a POST are retried once
 """
 
 from __future__ import annotations
@@ -18,8 +25,9 @@ import os
 import re
 import socket
 import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Generator, Optional, Tuple
 
 # Setup import path
 _parent_dir = Path(__file__).parent.parent
@@ -28,17 +36,92 @@ if str(_parent_dir) not in sys.path:
 
 try:
     from llm_clients.base import BaseLLMClient
+    from llm_clients.response_cache import ResponseCache
     from utils.models import LLMCallConfig, LLMResponse
 except ImportError:
     from AutoGenChecker.llm_clients.base import BaseLLMClient
+    from AutoGenChecker.llm_clients.response_cache import ResponseCache
     from AutoGenChecker.utils.models import LLMCallConfig, LLMResponse
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
 
 
+# Status codes worth retrying: rate limiting and gateway hiccups. Plain 500s
+# usually mean a bad request body and are not retried.
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+# A gateway error on a POST may come after the completion already ran (and was
+# billed) upstream, so those are retried once only; 429 means it never ran.
+GATEWAY_STATUS_CODES = (502, 503, 504)
+
+_session: "requests.Session | None" = None
+_session_lock = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+if requests is not None:
+    class _JedaiRetry(Retry):
+        """Retry that gives up on a POST after its second gateway error."""
+
+        def is_retry(self, method, status_code, has_retry_after=False):
+            if (
+                method == "POST"
+                and status_code in GATEWAY_STATUS_CODES
+                and any(h.status in GATEWAY_STATUS_CODES for h in self.history)
+            ):
+                return False
+            return super().is_retry(method, status_code, has_retry_after)
+
+
+def get_http_session() -> "requests.Session":
+    """Return the process-wide JEDAI session, created on first use.
+
+    One session is shared by every JedAIClient (and every worker thread), so
+    TCP/TLS connections are reused across calls instead of being set up per
+    request. Connection errors and 429 are retried with exponential backoff
+    (1s, 2s, 4s, ...) honouring Retry-After; a POST that hits a 502-504 is
+    retried once. Read timeouts are not retried: the request may already be
+    running upstream.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            max_retries = _env_int("JEDAI_MAX_RETRIES", 3)
+            pool_size = max(1, _env_int("JEDAI_POOL_SIZE", 8))
+            retry_options = dict(
+                total=max_retries,
+                connect=max_retries,
+                read=0,
+                status=max_retries,
+                backoff_factor=1.0,
+                status_forcelist=RETRY_STATUS_CODES,
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            try:
+                retry = _JedaiRetry(allowed_methods=frozenset({"GET", "POST"}), **retry_options)
+            except TypeError:  # urllib3 < 1.26
+                retry = _JedaiRetry(method_whitelist=frozenset({"GET", "POST"}), **retry_options)
+            adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+            )
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
 # Available JEDAI models (Auto-generated from API - 37 models total)
 JEDAI_MODELS = {
     # GEMINI models
@@ -382,6 +465,7 @@ class JedAIClient(BaseLLMClient):
         password: str | None = None,
         access_token: str | None = None,
         verbose: bool = False,
+        response_cache: ResponseCache | bool | None = None,
     ) -> None:
         """
         Initialize JEDAI client.
@@ -394,6 +478,7 @@ class JedAIClient(BaseLLMClient):
             password: LDAP password (will prompt if not provided and no token)
             access_token: Pre-authenticated JEDAI access token (from .env)
             verbose: Print debug information
+            response_cache: Response cache (False disables, None uses the default)
         """
         if requests is None:
             raise ImportError(
@@ -408,7 +493,7 @@ class JedAIClient(BaseLLMClient):
                 f"Unknown model: {default_model}. Available: {available}"
             )
 
-        super().__init__(default_model=resolved_model)
+        super().__init__(default_model=resolved_model, response_cache=response_cache)
 
         # Load credentials from environment variables if not provided
         self._load_env_credentials()
@@ -503,7 +588,7 @@ class JedAIClient(BaseLLMClient):
                 if i > 0 and self._verbose:
                     print(f"🔄 Trying fallback URL: {url}")
 
-                response = requests.post(
+                response = get_http_session().post(
                     f"{url}/api/v1/security/login",
                     headers={"Content-Type": "application/json"},
                     json={
@@ -537,6 +622,10 @@ class JedAIClient(BaseLLMClient):
             f"Failed to authenticate to JEDAI. Tried: {', '.join(urls_to_try)}"
         )
 
+    def prepare(self) -> None:
+        """Authenticate now (may prompt for the LDAP password) and persist the token."""
+        self._ensure_authenticated()
+
     def _verify_token(self, token: str, url: str) -> bool:
         """
         Verify if an access token is still valid.
@@ -550,7 +639,7 @@ class JedAIClient(BaseLLMClient):
         """
         try:
             # Try a lightweight API call to verify token
-            response = requests.get(
+            response = get_http_session().get(
                 f"{url}/api/v1/security/user",
                 headers={"Authorization": f"Bearer {token}"},
                 timeout=5,
@@ -608,21 +697,10 @@ class JedAIClient(BaseLLMClient):
             if self._verbose:
                 print(f"⚠️  Could not save credentials: {e}")
 
-    def complete(
-        self, prompt: str, *, config: LLMCallConfig | None = None
-    ) -> LLMResponse:
-        """
-        Execute a completion request to JEDAI.
-
-        Args:
-            prompt: The user prompt to send
-            config: Optional LLM configuration (model, temperature, etc.)
-
-        Returns:
-            LLMResponse with the AI's response
-        """
-        resolved = self.resolve_config(config)
-
+    def _build_request(
+        self, prompt: str, resolved: LLMCallConfig
+    ) -> Tuple[str, str, Dict[str, str], Dict[str, Any]]:
+        """Return (model_key, endpoint URL, headers, body) for a chat request."""
         # Get model info - use default model if invalid model specified
         model_key = resolved.model
         if model_key in MODEL_ALIASES:
@@ -659,13 +737,32 @@ class JedAIClient(BaseLLMClient):
             #print(f"📤 Model: {model_info['family']}, Deployment: {model_info['deployment']}")
             #print(f"📤 Location: {model_info['location']}")
 
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {token}",
+        }
+        return model_key, f"{url}/api/copilot/v1/llm/chat/completions", headers, body
+
+    def _complete(
+        self, prompt: str, *, config: LLMCallConfig | None = None
+    ) -> LLMResponse:
+        """
+        Execute a completion request to JEDAI.
+
+        Args:
+            prompt: The user prompt to send
+            config: Optional LLM configuration (model, temperature, etc.)
+
+        Returns:
+            LLMResponse with the AI's response
+        """
+        resolved = self.resolve_config(config)
+        model_key, endpoint, headers, body = self._build_request(prompt, resolved)
+
         # Send request
-        response = requests.post(
-            f"{url}/api/copilot/v1/llm/chat/completions",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {token}",
-            },
+        response = get_http_session().post(
+            endpoint,
+            headers=headers,
             json=body,
             timeout=300,  # LLM calls can take a while (5 minutes for large prompts)
         )
@@ -675,8 +772,74 @@ class JedAIClient(BaseLLMClient):
                 f"JEDAI request failed: {response.status_code} - {response.text}"
             )
 
-        result = response.json()
+        return self._response_from_result(response.json(), model_key)
+
+    def _complete_stream(
+        self, prompt: str, *, config: LLMCallConfig
+    ) -> Generator[str, None, LLMResponse]:
+        """
+        Stream a completion from JEDAI, yielding text deltas as they arrive.
+
+        Sends ``"stream": true`` and reads the server-sent events. Deployments
+        that ignore the flag answer with a plain JSON body; the full text is
+        then yielded as a single chunk.
+
+        Returns:
+            LLMResponse with the concatenated text (generator return value)
+        """
+        resolved = self.resolve_config(config)
+        model_key, endpoint, headers, body = self._build_request(prompt, resolved)
+        body["stream"] = True
 
+        response = get_http_session().post(
+            endpoint,
+            headers=headers,
+            json=body,
+            stream=True,
+            timeout=(15, 300),  # connect, then max gap between chunks
+        )
+        try:
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"JEDAI request failed: {response.status_code} - {response.text}"
+                )
+
+            content_type = response.headers.get("Content-Type", "")
+            if "text/event-stream" not in content_type:
+                result = self._response_from_result(response.json(), model_key)
+                yield result.text
+                return result
+
+            parts: list[str] = []
+            usage: Dict[str, Any] = {}
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    event = json.loads(data)
+                except json.JSONDecodeError:
+                    continue
+                usage.update(event.get("usage") or event.get("usageMetadata") or {})
+                delta = self._extract_delta_from_event(event)
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        finally:
+            response.close()
+
+        return LLMResponse(
+            text="".join(parts),
+            model=model_key,
+            prompt_tokens=usage.get("prompt_tokens") or usage.get("input_tokens"),
+            completion_tokens=usage.get("completion_tokens") or usage.get("output_tokens"),
+            usage=usage or None,
+        )
+
+    def _response_from_result(self, result: Dict[str, Any], model_key: str) -> LLMResponse:
+        """Build an LLMResponse from a non-streaming JSON result."""
         # Parse response (handle different formats)
         text = self._extract_text_from_response(result)
 
@@ -693,6 +856,30 @@ class JedAIClient(BaseLLMClient):
             usage=usage if usage else None,
         )
 
+    def _extract_delta_from_event(self, event: Dict[str, Any]) -> str:
+        """Extract the text delta from one streamed event (any provider format)."""
+        # OpenAI-style: choices[0].delta.content
+        if "choices" in event:
+            try:
+                choice = event["choices"][0]
+                return (choice.get("delta") or choice.get("message") or {}).get("content") or ""
+            except (IndexError, AttributeError):
+                return ""
+
+        # Gemini-style: candidates[0].content.parts[*].text
+        if "candidates" in event:
+            try:
+                parts = event["candidates"][0]["content"]["parts"]
+                return "".join(part.get("text", "") for part in parts)
+            except (KeyError, IndexError):
+                return ""
+
+        # Anthropic-style: content_block_delta events
+        if event.get("type") == "content_block_delta":
+            return (event.get("delta") or {}).get("text") or ""
+
+        return ""
+
     def _extract_text_from_response(self, result: Dict[str, Any]) -> str:
         """Extract text content from various response formats."""
         # Format 1: Gemini-style (candidates)
@@ -727,7 +914,7 @@ class JedAIClient(BaseLLMClient):
     def test_connection(self, timeout: int = 5) -> bool:
         """Test if JEDAI is accessible."""
         try:
-            response = requests.get(
+            response = get_http_session().get(
                 f"{self._jedai_url}/health",
                 timeout=timeout,
             )
@@ -0,0 +1,494 @@
+"""Local mock LLM server for offline load and retry testing.
+
+Speaks the chat-completion wire formats used by the toolchain, so the real
+clients (``JedAIClient``, ``OpenAIChatClient``, ``AnthropicMessagesClient``),
+the JEDAI proxy and the agents can be pointed at it unchanged:
+
+- JEDAI:     POST /api/copilot/v1/llm/chat/completions (+ login / user / health)
+- OpenAI:    POST /v1/chat/completions
+- Anthropic: POST /v1/messages
+
+Responses are replayed from recordings keyed by prompt hash (see
+``prompt_hash``); unknown prompts get a default reply (or 404 in strict
+mode). Latency, rate limits, a concurrency cap and random errors are injected
+per ``MockServerConfig`` with a seeded RNG, so a run is repeatable.
+Streaming requests (``"stream": true``) are answered as server-sent events.
+
+Only the standard library is used.
+
+Usage:
+    python llm_clients/mock_server.py --port 8765 --latency 0.5 --rpm 600
+    JEDAI_URL=http://127.0.0.1:8765 JEDAI_ACCESS_TOKEN=mock-token python cli.py generate ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+MOCK_TOKEN = "mock-token"
+
+JEDAI_CHAT_PATH = "/api/copilot/v1/llm/chat/completions"
+OPENAI_CHAT_PATHS = ("/v1/chat/completions", "/chat/completions")
+ANTHROPIC_MESSAGES_PATH = "/v1/messages"
+
+
+@dataclass
+class MockServerConfig:
+    """Fault and latency injection settings (all off by default)."""
+
+    latency: float = 0.0            # seconds before the first byte
+    latency_jitter: float = 0.0     # + uniform(0, jitter)
+    token_latency: float = 0.0      # seconds per output word (spread over stream chunks)
+    rpm: float = 0.0                # accepted requests per minute, 429 above (0 = unlimited)
+    burst: float = 1.0              # requests accepted back to back before rpm applies
+    max_concurrency: int = 0        # in-flight requests, 429 above (0 = unlimited)
+    retry_after: float = 1.0        # Retry-After header on 429
+    error_rate: float = 0.0         # fraction of requests failed with error_status
+    error_status: int = 503
+    seed: int = 0                   # RNG seed for jitter and injected errors
+    default_response: str = "echo"  # "echo" = repeat the prompt, else a fixed reply
+    strict: bool = False            # 404 for prompts without a recording
+    stream_chunk_words: int = 4     # words per streamed chunk
+
+
+def _canonical_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    canonical = []
+    for message in messages:
+        content = message.get("content", "")
+        if isinstance(content, list):  # content blocks: keep the text parts
+            content = "".join(
+                block.get("text", "") for block in content if isinstance(block, dict)
+            )
+        canonical.append({"role": message.get("role", "user"), "content": content})
+    return canonical
+
+
+def prompt_hash(prompt: Union[str, List[Dict[str, Any]]]) -> str:
+    """Recording key: SHA-256 of a user prompt or of a whole message list."""
+    if isinstance(prompt, str):
+        payload = prompt
+    else:
+        payload = json.dumps(_canonical_messages(prompt), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class MockLLMServer:
+    """Threaded HTTP server replaying recorded LLM responses.
+
+    Example:
+        with MockLLMServer(MockServerConfig(latency=0.2, rpm=120)) as server:
+            client = JedAIClient(jedai_url=server.url, access_token=MOCK_TOKEN)
+            ...
+            print(server.stats())
+    """
+
+    def __init__(
+        self,
+        config: MockServerConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        recordings: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Args:
+            config: Injection settings
+            host: Bind address
+            port: Bind port (0 = pick a free port)
+            recordings: {prompt_hash: response text}
+        """
+        self.config = config or MockServerConfig()
+        self.recordings: Dict[str, str] = dict(recordings or {})
+        self._httpd = ThreadingHTTPServer((host, port), _MockHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._tokens = max(self.config.burst, 1.0)
+        self._tokens_updated = time.monotonic()
+        self._in_flight = 0
+        self.reset_stats()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockLLMServer":
+        """Serve from a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="mock-llm-server", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "MockLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Recordings
+    # ------------------------------------------------------------------
+
+    def add_recording(self, prompt: Union[str, List[Dict[str, Any]]], response: str) -> str:
+        """Register a response for a user prompt or message list; returns its key."""
+        key = prompt_hash(prompt)
+        self.recordings[key] = response
+        return key
+
+    def load_recordings(self, path: Union[str, Path]) -> int:
+        """Load a JSONL file of {"prompt_hash" | "prompt" | "messages", "response"}."""
+        count = 0
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                key = entry.get("prompt_hash") or prompt_hash(
+                    entry["messages"] if "messages" in entry else entry["prompt"]
+                )
+                self.recordings[key] = entry["response"]
+                count += 1
+        return count
+
+    def lookup(self, messages: List[Dict[str, Any]]) -> Tuple[Optional[str], str]:
+        """Return (response, source) for a request: exact messages, then last user prompt."""
+        text = self.recordings.get(prompt_hash(messages))
+        if text is not None:
+            return text, "replayed"
+        canonical = _canonical_messages(messages)
+        user_prompts = [m["content"] for m in canonical if m["role"] == "user"]
+        if user_prompts:
+            text = self.recordings.get(prompt_hash(user_prompts[-1]))
+            if text is not None:
+                return text, "replayed"
+        if self.config.strict:
+            return None, "missing"
+        if self.config.default_response == "echo":
+            return (user_prompts[-1] if user_prompts else ""), "default"
+        return self.config.default_response, "default"
+
+    # ------------------------------------------------------------------
+    # Injection / accounting (called from handler threads)
+    # ------------------------------------------------------------------
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats: Dict[str, Any] = {
+                "requests": 0,
+                "completed": 0,
+                "streamed": 0,
+                "replayed": 0,
+                "default": 0,
+                "missing": 0,
+                "rate_limited": 0,
+                "over_concurrency": 0,
+                "injected_errors": 0,
+                "max_in_flight": 0,
+                "status": {},
+            }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["status"] = dict(self._stats["status"])
+            stats["in_flight"] = self._in_flight
+            return stats
+
+    def _count(self, name: str, status: Optional[int] = None) -> None:
+        with self._lock:
+            self._stats[name] = self._stats.get(name, 0) + 1
+            if status is not None:
+                key = str(status)
+                self._stats["status"][key] = self._stats["status"].get(key, 0) + 1
+
+    def admit(self) -> Optional[int]:
+        """Enter a request; returns an error status to reply with, or None."""
+        config = self.config
+        with self._lock:
+            self._stats["requests"] += 1
+            if config.max_concurrency and self._in_flight >= config.max_concurrency:
+                self._stats["over_concurrency"] += 1
+                return 429
+            if config.rpm > 0:
+                now = time.monotonic()
+                rate = config.rpm / 60.0
+                self._tokens = min(
+                    max(config.burst, 1.0), self._tokens + (now - self._tokens_updated) * rate
+                )
+                self._tokens_updated = now
+                if self._tokens < 1.0:
+                    self._stats["rate_limited"] += 1
+                    return 429
+                self._tokens -= 1.0
+            if config.error_rate > 0 and self._rng.random() < config.error_rate:
+                self._stats["injected_errors"] += 1
+                return config.error_status
+            self._in_flight += 1
+            self._stats["max_in_flight"] = max(self._stats["max_in_flight"], self._in_flight)
+            return None
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def first_byte_delay(self) -> float:
+        config = self.config
+        with self._lock:
+            jitter = self._rng.uniform(0, config.latency_jitter) if config.latency_jitter else 0.0
+        return config.latency + jitter
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    """Routes one HTTP request to the owning MockLLMServer."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, so client connection pooling is exercised
+    server_version = "MockLLM/1.0"
+
+    @property
+    def mock(self) -> MockLLMServer:
+        return self.server.mock
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - quiet by default
+        pass
+
+    # --- plumbing -----------------------------------------------------
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            return json.loads(raw or b"{}")
+        except ValueError:
+            return {}
+
+    def _send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self.mock._count("completed" if status == 200 else "failed", status)
+
+    def _send_error(self, status: int) -> None:
+        headers = {}
+        if status == 429:
+            headers["Retry-After"] = f"{self.mock.config.retry_after:g}"
+        self._send_json(status, {"error": {"code": status, "message": "injected by mock server"}}, headers)
+
+    def _start_stream(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _write_chunk(self, data: str) -> None:
+        payload = data.encode("utf-8")
+        self.wfile.write(f"{len(payload):x}\r\n".encode("ascii") + payload + b"\r\n")
+        self.wfile.flush()
+
+    def _end_stream(self) -> None:
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+        self.mock._count("streamed", 200)
+
+    # --- routes -------------------------------------------------------
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        path = self.path.split("?", 1)[0]
+        if path in ("/health", "/api/v1/security/user"):
+            self._send_json(200, {"status": "ok", "username": "mock"})
+        elif path in ("/v1/models", "/api/v1/models", "/models"):
+            self._send_json(200, {"object": "list", "data": [{"id": "mock-model", "object": "model"}]})
+        elif path == "/mock/stats":
+            self._send_json(200, self.mock.stats())
+        else:
+            self._send_json(404, {"error": f"unknown path {path}"})
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        path = self.path.split("?", 1)[0]
+        body = self._read_json()
+        if path == "/api/v1/security/login":
+            self._send_json(200, {"access_token": MOCK_TOKEN})
+        elif path == "/mock/reset":
+            self.mock.reset_stats()
+            self._send_json(200, {"reset": True})
+        elif path == JEDAI_CHAT_PATH or path in OPENAI_CHAT_PATHS:
+            self._chat(body, anthropic=False)
+        elif path == ANTHROPIC_MESSAGES_PATH:
+            self._chat(body, anthropic=True)
+        else:
+            self._send_json(404, {"error": f"unknown path {path}"})
+
+    def _chat(self, body: Dict[str, Any], anthropic: bool) -> None:
+        mock = self.mock
+        messages = list(body.get("messages") or [])
+        if anthropic and body.get("system"):
+            messages.insert(0, {"role": "system", "content": body["system"]})
+
+        status = mock.admit()
+        if status is not None:
+            self._send_error(status)
+            return
+        try:
+            text, source = mock.lookup(messages)
+            mock._count(source)
+            if text is None:
+                self._send_json(404, {"error": {"code": 404, "message": "no recording for prompt",
+                                                "prompt_hash": prompt_hash(messages)}})
+                return
+            time.sleep(mock.first_byte_delay())
+            model = body.get("model") or body.get("deployment") or "mock-model"
+            if body.get("stream"):
+                self._stream(text, model, messages, anthropic)
+            else:
+                time.sleep(mock.config.token_latency * len(text.split()))
+                self._send_json(200, _completion_payload(text, model, messages, anthropic))
+        finally:
+            mock.release()
+
+    def _stream(self, text: str, model: str, messages: List[Dict[str, Any]], anthropic: bool) -> None:
+        config = self.mock.config
+        words = text.split(" ")
+        size = max(1, config.stream_chunk_words)
+        chunks = [" ".join(words[i:i + size]) + (" " if i + size < len(words) else "")
+                  for i in range(0, len(words), size)]
+        usage = _usage(text, messages)
+        self._start_stream()
+        if anthropic:
+            self._write_chunk(_sse({"type": "message_start", "message": {
+                "id": f"msg_{uuid.uuid4().hex[:12]}", "type": "message", "role": "assistant",
+                "model": model, "content": [],
+                "usage": {"input_tokens": usage["prompt_tokens"], "output_tokens": 0}}},
+                event="message_start"))
+            self._write_chunk(_sse({"type": "content_block_start", "index": 0,
+                                    "content_block": {"type": "text", "text": ""}},
+                                   event="content_block_start"))
+        for chunk in chunks:
+            time.sleep(config.token_latency * len(chunk.split()))
+            if anthropic:
+                event = {"type": "content_block_delta", "index": 0,
+                         "delta": {"type": "text_delta", "text": chunk}}
+                self._write_chunk(_sse(event, event="content_block_delta"))
+            else:
+                self._write_chunk(_sse({"object": "chat.completion.chunk", "model": model,
+                                        "choices": [{"index": 0, "delta": {"content": chunk}}]}))
+        if anthropic:
+            self._write_chunk(_sse({"type": "content_block_stop", "index": 0}, event="content_block_stop"))
+            self._write_chunk(_sse({"type": "message_delta", "delta": {"stop_reason": "end_turn"},
+                                    "usage": {"output_tokens": usage["completion_tokens"]}},
+                                   event="message_delta"))
+            self._write_chunk(_sse({"type": "message_stop"}, event="message_stop"))
+        else:
+            self._write_chunk(_sse({"object": "chat.completion.chunk", "model": model,
+                                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                                    "usage": usage}))
+            self._write_chunk("data: [DONE]\n\n")
+        self._end_stream()
+
+
+def _usage(text: str, messages: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Word counts stand in for tokens."""
+    prompt_words = sum(len(m["content"].split()) for m in _canonical_messages(messages))
+    return {"prompt_tokens": prompt_words, "completion_tokens": len(text.split()),
+            "total_tokens": prompt_words + len(text.split())}
+
+
+def _completion_payload(
+    text: str, model: str, messages: List[Dict[str, Any]], anthropic: bool
+) -> Dict[str, Any]:
+    usage = _usage(text, messages)
+    if anthropic:
+        return {
+            "id": f"msg_{uuid.uuid4().hex[:12]}",
+            "type": "message",
+            "role": "assistant",
+            "model": model,
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": usage["prompt_tokens"], "output_tokens": usage["completion_tokens"]},
+        }
+    return {
+        "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": text},
+                     "finish_reason": "stop"}],
+        "usage": usage,
+    }
+
+
+def _sse(payload: Dict[str, Any], event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(payload)}\n\n"
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    defaults = MockServerConfig()
+    parser = argparse.ArgumentParser(description="Mock LLM server (JEDAI / OpenAI / Anthropic formats)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--recordings", help="JSONL file of recorded responses")
+    parser.add_argument("--latency", type=float, default=defaults.latency)
+    parser.add_argument("--latency-jitter", type=float, default=defaults.latency_jitter)
+    parser.add_argument("--token-latency", type=float, default=defaults.token_latency)
+    parser.add_argument("--rpm", type=float, default=defaults.rpm)
+    parser.add_argument("--burst", type=float, default=defaults.burst)
+    parser.add_argument("--max-concurrency", type=int, default=defaults.max_concurrency)
+    parser.add_argument("--retry-after", type=float, default=defaults.retry_after)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--error-status", type=int, default=defaults.error_status)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--default-response", default=defaults.default_response)
+    parser.add_argument("--strict", action="store_true")
+    args = parser.parse_args(argv)
+
+    config = MockServerConfig(**{
+        name: getattr(args, name) for name in asdict(defaults) if hasattr(args, name)
+    })
+    server = MockLLMServer(config, host=args.host, port=args.port)
+    if args.recordings:
+        print(f"Loaded {server.load_recordings(args.recordings)} recordings")
+    print(f"Mock LLM server on {server.url}  (token: {MOCK_TOKEN})")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+        print(json.dumps(server.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -14,9 +14,11 @@ if str(_parent_dir) not in sys.path:
 
 try:
     from llm_clients.base import BaseLLMClient
+    from llm_clients.response_cache import ResponseCache
     from utils.models import LLMCallConfig, LLMResponse
 except ImportError:
     from AutoGenChecker.llm_clients.base import BaseLLMClient
+    from AutoGenChecker.llm_clients.response_cache import ResponseCache
     from AutoGenChecker.utils.models import LLMCallConfig, LLMResponse
 
 try:  # Optional dependency guard.
@@ -40,13 +42,14 @@ class OpenAIChatClient(BaseLLMClient):
         default_model: str = "gpt-4.1",
         base_url: str | None = None,
         system_prompt: str | None = None,
+        response_cache: ResponseCache | bool | None = None,
     ) -> None:
         if openai is None:
             raise ImportError(
                 "The openai package is required. Install it via 'pip install openai'."
             )
 
-        super().__init__(default_model=default_model)
+        super().__init__(default_model=default_model, response_cache=response_cache)
         self._api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self._api_key:
             raise ValueError("OpenAI API key not provided. Set OPENAI_API_KEY.")
@@ -60,7 +63,7 @@ class OpenAIChatClient(BaseLLMClient):
         self._client = openai.OpenAI(**client_kwargs)
         self._system_prompt = system_prompt or self._DEFAULT_SYSTEM
 
-    def complete(
+    def _complete(
         self, prompt: str, *, config: LLMCallConfig | None = None
     ) -> LLMResponse:  # type: ignore[override]
         resolved = self.resolve_config(config)
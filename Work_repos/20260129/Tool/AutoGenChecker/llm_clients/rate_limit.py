@@ -0,0 +1,163 @@
+"""Request scheduling for LLM clients shared by concurrent workers.
+
+A single token bucket bounds the request rate across all providers, and a
+per-provider semaphore bounds how many requests are in flight at once. Both
+sit in ``BaseLLMClient.complete`` in front of the provider call (cache hits
+are not throttled).
+
+Limits are off unless configured, so single-item runs behave as before.
+
+Environment variables:
+- AUTOGEN_LLM_RPM: requests per minute across all providers (0 = unlimited)
+- AUTOGEN_LLM_BURST: bucket capacity (default: 1 request)
+- AUTOGEN_LLM_MAX_CONCURRENCY: in-flight requests per provider (0 = unlimited)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+import time
+from typing import Dict, Iterator, Optional
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``acquire`` blocks until a token is available."""
+
+    def __init__(self, rate_per_second: float, capacity: float = 1.0) -> None:
+        self.rate = rate_per_second
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens, sleeping as needed. Returns the time spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class RequestScheduler:
+    """Shared rate limit plus per-provider concurrency caps."""
+
+    def __init__(
+        self,
+        requests_per_minute: float = 0,
+        max_concurrency: int = 0,
+        burst: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            requests_per_minute: Global request rate, 0 for unlimited
+            max_concurrency: In-flight requests per provider, 0 for unlimited
+            burst: Requests allowed back to back before the rate applies
+        """
+        self.requests_per_minute = requests_per_minute
+        self.max_concurrency = int(max_concurrency)
+        self._bucket = (
+            TokenBucket(requests_per_minute / 60.0, burst) if requests_per_minute > 0 else None
+        )
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "throttled": 0, "wait_seconds": 0.0}
+
+    @property
+    def enabled(self) -> bool:
+        return self._bucket is not None or self.max_concurrency > 0
+
+    def _semaphore(self, provider: str) -> Optional[threading.BoundedSemaphore]:
+        if self.max_concurrency <= 0:
+            return None
+        with self._lock:
+            sem = self._semaphores.get(provider)
+            if sem is None:
+                sem = self._semaphores[provider] = threading.BoundedSemaphore(self.max_concurrency)
+            return sem
+
+    @contextlib.contextmanager
+    def slot(self, provider: str) -> Iterator[None]:
+        """Hold one request slot for provider (blocks on the caps)."""
+        start = time.monotonic()
+        sem = self._semaphore(provider)
+        if sem is not None:
+            sem.acquire()
+        try:
+            if self._bucket is not None:
+                self._bucket.acquire()
+            waited = time.monotonic() - start
+            with self._lock:
+                self._stats["requests"] += 1
+                self._stats["wait_seconds"] += waited
+                if waited > 0.01:
+                    self._stats["throttled"] += 1
+            yield
+        finally:
+            if sem is not None:
+                sem.release()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._stats)
+
+
+_scheduler: RequestScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def _build_scheduler(
+    requests_per_minute: float | None = None,
+    max_concurrency: int | None = None,
+    burst: float | None = None,
+) -> RequestScheduler:
+    return RequestScheduler(
+        requests_per_minute=(
+            _env_number("AUTOGEN_LLM_RPM", 0) if requests_per_minute is None else requests_per_minute
+        ),
+        max_concurrency=int(
+            _env_number("AUTOGEN_LLM_MAX_CONCURRENCY", 0) if max_concurrency is None else max_concurrency
+        ),
+        burst=_env_number("AUTOGEN_LLM_BURST", 1) if burst is None else burst,
+    )
+
+
+def configure_scheduler(
+    requests_per_minute: float | None = None,
+    max_concurrency: int | None = None,
+    burst: float | None = None,
+) -> RequestScheduler:
+    """Replace the process-wide scheduler (None values fall back to env vars)."""
+    global _scheduler
+    scheduler = _build_scheduler(requests_per_minute, max_concurrency, burst)
+    with _scheduler_lock:
+        _scheduler = scheduler
+    return scheduler
+
+
+def get_scheduler() -> RequestScheduler:
+    """Return the process-wide scheduler, created from env vars on first use."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = _build_scheduler()
+        return _scheduler
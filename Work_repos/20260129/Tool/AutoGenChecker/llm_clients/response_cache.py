@@ -0,0 +1,293 @@
+"""Content-addressed on-disk cache for LLM responses.
+
+Identical requests (same provider, model, system prompt, prompt and decoding
+parameters) are answered from a local SQLite store instead of the remote API,
+e.g. when README generation, self-check or ``_agentic_fix`` are re-run for the
+same item, or when a web UI step is revisited.
+
+Features:
+- SHA-256 key over a canonical JSON of the request
+- TTL expiry and size-bounded LRU eviction
+- Hit / miss statistics (per process, plus per-entry hit counts on disk)
+- Bypass per call (``LLMCallConfig(use_cache=False)``) for intentionally
+  stochastic calls; pass a copy (``dataclasses.replace``) rather than
+  mutating a shared config
+- Replay mode for offline tests: a miss raises ``CacheMissError`` instead of
+  calling the API
+
+Environment variables:
+- AUTOGEN_LLM_CACHE: ``1`` (default), ``0`` to disable, ``replay`` to serve
+  recorded responses only
+- AUTOGEN_LLM_CACHE_PATH: SQLite file (default: ~/.autogenchecker/llm_cache.sqlite3,
+  outside the checkout so recorded responses are never committed)
+- AUTOGEN_LLM_CACHE_TTL: entry lifetime in seconds (default: 7 days, 0 = never)
+- AUTOGEN_LLM_CACHE_MAX_MB: store size before LRU eviction (default: 256)
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Setup import path
+_parent_dir = Path(__file__).parent.parent
+if str(_parent_dir) not in sys.path:
+    sys.path.insert(0, str(_parent_dir))
+
+try:
+    from utils.models import LLMCallConfig, LLMResponse
+except ImportError:
+    from AutoGenChecker.utils.models import LLMCallConfig, LLMResponse
+
+
+# Bump when the key or payload layout changes so old entries are not reused
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_PATH = Path.home() / ".autogenchecker" / "llm_cache.sqlite3"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_MB = 256
+
+# Fraction of the size limit kept after an eviction pass
+_EVICT_TARGET = 0.9
+
+class CacheMissError(LookupError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def cache_mode() -> str:
+    """Return the configured cache mode: 'on', 'off' or 'replay'."""
+    raw = os.environ.get("AUTOGEN_LLM_CACHE", "1").strip().lower()
+    if raw in {"0", "off", "false", "no"}:
+        return "off"
+    if raw == "replay":
+        return "replay"
+    return "on"
+
+
+def is_bypassed(config: LLMCallConfig | None = None) -> bool:
+    """Return True if the cache must be skipped for this call."""
+    return config is not None and not config.use_cache
+
+
+def make_cache_key(
+    namespace: str,
+    prompt: str,
+    config: LLMCallConfig,
+    system_prompt: str | None = None,
+) -> str:
+    """Hash a request into a cache key.
+
+    Args:
+        namespace: Provider identity (client class name)
+        prompt: User prompt
+        config: Resolved call config (model and decoding parameters)
+        system_prompt: System prompt sent with the request
+    """
+    payload = {
+        "v": CACHE_VERSION,
+        "ns": namespace,
+        "model": config.model,
+        "system": system_prompt or "",
+        "prompt": prompt,
+        "max_tokens": config.max_tokens,
+        "temperature": config.temperature,
+        "extra": config.extra_options,
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed LLM response store with TTL and LRU eviction.
+
+    Safe to share between threads; several processes (CLI batch runs and the
+    web backend) may use the same file.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        ttl_seconds: float | None = None,
+        max_bytes: int | None = None,
+        mode: str | None = None,
+    ) -> None:
+        self.path = Path(path or os.environ.get("AUTOGEN_LLM_CACHE_PATH") or DEFAULT_CACHE_PATH)
+        self.ttl_seconds = (
+            _env_number("AUTOGEN_LLM_CACHE_TTL", DEFAULT_TTL_SECONDS)
+            if ttl_seconds is None else ttl_seconds
+        )
+        self.max_bytes = int(
+            _env_number("AUTOGEN_LLM_CACHE_MAX_MB", DEFAULT_MAX_MB) * 1024 * 1024
+            if max_bytes is None else max_bytes
+        )
+        self.mode = mode or cache_mode()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "expired": 0, "evicted": 0}
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " created REAL NOT NULL,"
+                " accessed REAL NOT NULL,"
+                " hits INTEGER NOT NULL DEFAULT 0,"
+                " size INTEGER NOT NULL,"
+                " model TEXT,"
+                " payload TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the underlying connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def _encode(response: LLMResponse) -> str:
+        return json.dumps(dataclasses.asdict(response), ensure_ascii=False, default=str)
+
+    @staticmethod
+    def _decode(payload: str) -> LLMResponse:
+        return LLMResponse(**json.loads(payload))
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def get(self, key: str) -> LLMResponse | None:
+        """Return the cached response for key, or None (expired entries are dropped)."""
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT created, payload FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self._stats["misses"] += 1
+                    return None
+                created, payload = row
+                if self.ttl_seconds > 0 and now - created > self.ttl_seconds:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    conn.commit()
+                    self._stats["expired"] += 1
+                    self._stats["misses"] += 1
+                    return None
+                conn.execute(
+                    "UPDATE responses SET accessed = ?, hits = hits + 1 WHERE key = ?",
+                    (now, key),
+                )
+                conn.commit()
+                response = self._decode(payload)
+            except (sqlite3.Error, OSError, ValueError, TypeError):
+                # A locked / corrupt store must never break an LLM call
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            return response
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store a response and evict least recently used entries over the size limit."""
+        payload = self._encode(response)
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses"
+                    " (key, created, accessed, hits, size, model, payload)"
+                    " VALUES (?, ?, ?, 0, ?, ?, ?)",
+                    (key, now, now, len(payload.encode("utf-8")), response.model, payload),
+                )
+                self._stats["stores"] += 1
+                self._evict(conn)
+                conn.commit()
+            except (sqlite3.Error, OSError):
+                pass
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if self.max_bytes <= 0 or total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * _EVICT_TARGET)
+        doomed = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self._stats["evicted"] += len(doomed)
+
+    def clear(self) -> None:
+        """Delete every stored response."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters of this process plus store size."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+            stats["mode"] = self.mode
+            stats["path"] = str(self.path)
+            try:
+                entries, size, hits = self._connect().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM responses"
+                ).fetchone()
+                stats.update(entries=entries, bytes=size, total_hits=hits)
+            except (sqlite3.Error, OSError):
+                pass
+            return stats
+
+
+_default_cache: ResponseCache | None = None
+_default_lock = threading.Lock()
+
+
+def get_default_cache() -> Optional[ResponseCache]:
+    """Return the process-wide cache, or None when AUTOGEN_LLM_CACHE=0."""
+    global _default_cache
+    mode = cache_mode()
+    if mode == "off":
+        return None
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache(mode=mode)
+        _default_cache.mode = mode
+        return _default_cache
@@ -0,0 +1,90 @@
+"""
+Tests for concurrent batch generation: BatchRunner isolation / progress and
+the shared LLM request scheduler.
+"""
+
+import io
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Setup path
+_tool_dir = Path(__file__).resolve().parents[1]
+if str(_tool_dir) not in sys.path:
+    sys.path.insert(0, str(_tool_dir))
+
+from llm_clients.rate_limit import RequestScheduler, TokenBucket
+from workflow.batch_runner import BatchRunner
+
+
+def test_items_run_concurrently_with_isolated_logs(tmp_path):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def run_item(item_id):
+        print(f"hello from {item_id}")
+        barrier.wait()  # deadlocks unless all three items are in flight
+        if item_id == "IMP-3":
+            raise RuntimeError("boom")
+        return 0 if item_id == "IMP-1" else 2
+
+    progress = io.StringIO()
+    runner = BatchRunner(run_item, jobs=3, log_dir=tmp_path, progress=progress)
+    stdout_before = sys.stdout
+    results = runner.run(["IMP-1", "IMP-2", "IMP-3"])
+
+    assert sys.stdout is stdout_before
+    assert [r.item_id for r in results] == ["IMP-1", "IMP-2", "IMP-3"]
+    assert [r.success for r in results] == [True, False, False]
+    assert results[2].error == "RuntimeError: boom"
+    for item_id in ("IMP-1", "IMP-2", "IMP-3"):
+        log = (tmp_path / f"{item_id}.log").read_text(encoding="utf-8")
+        assert f"hello from {item_id}" in log
+        assert "hello from" not in log.replace(f"hello from {item_id}", "")
+    assert "Traceback" in (tmp_path / "IMP-3.log").read_text(encoding="utf-8")
+    view = progress.getvalue()
+    assert "[3/3]" in view and "hello from" not in view
+
+
+def test_worker_prompts_hit_eof(tmp_path):
+    def run_item(item_id):
+        try:
+            input("Continue? [Y/N]: ")
+        except EOFError:
+            return 0
+        return 1
+
+    results = BatchRunner(run_item, jobs=2, log_dir=tmp_path, progress=io.StringIO()).run(["A", "B"])
+    assert all(r.success for r in results)
+
+
+def test_token_bucket_rate():
+    bucket = TokenBucket(rate_per_second=50, capacity=1)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    # first token is free, the next five wait ~20 ms each
+    assert time.monotonic() - start >= 0.08
+
+
+def test_scheduler_caps_in_flight_requests_per_provider():
+    scheduler = RequestScheduler(max_concurrency=2)
+    lock = threading.Lock()
+    in_flight = {"now": 0, "peak": 0}
+
+    def call():
+        with scheduler.slot("FakeClient"):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(0.02)
+            with lock:
+                in_flight["now"] -= 1
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert in_flight["peak"] == 2
+    assert scheduler.stats()["requests"] == 8
@@ -0,0 +1,94 @@
+"""
+Tests for the dashboard's background git status collector.
+"""
+
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+
+# Setup path
+_backend_dir = Path(__file__).resolve().parents[1] / "web_ui_admin" / "backend"
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from api.git_status import GitStatusCollector, checker_items_from_files
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=dev", "-c", "user.email=dev@example.com", *args],
+        cwd=cwd, check=True, capture_output=True,
+    )
+
+
+def _make_workspace(root: Path, name: str) -> Path:
+    workspace = root / name
+    checker = workspace / "CHECKLIST" / "Check_modules" / "M1" / "scripts" / "checker"
+    checker.mkdir(parents=True)
+    (checker / "IMP-1-0-0-01.py").write_text("# checker\n")
+    _git(workspace.parent, "init", "-q", name)
+    _git(workspace, "add", ".")
+    _git(workspace, "commit", "-q", "-m", "IMP-1-0-0-01 add checker")
+    return workspace
+
+
+def test_checker_items_from_files():
+    files = "CHECKLIST/Check_modules/M1/scripts/checker/IMP-1-0-0-01.py\nREADME.md\n"
+    assert checker_items_from_files(files) == ["IMP-1-0-0-01"]
+
+
+def test_snapshot_is_cached_and_pushes_changes(tmp_path):
+    alice = _make_workspace(tmp_path, "alice_workspace_20260101_120000")
+    _make_workspace(tmp_path, "bob_workspace_20260101_120000")
+    (tmp_path / "not_a_repo").mkdir()
+
+    async def scenario():
+        collector = GitStatusCollector(str(tmp_path), poll_seconds=0.1)
+        states = await collector.snapshot()
+        assert sorted(states) == ["alice_workspace_20260101_120000", "bob_workspace_20260101_120000"]
+        assert states["alice_workspace_20260101_120000"].git_info["modified_items"] == ["IMP-1-0-0-01"]
+
+        # Unchanged workspaces are served from the cache
+        assert await collector.refresh() is False
+
+        updates = collector.subscribe(keepalive=5)
+        first = await updates.__anext__()
+        _git(alice, "commit", "-q", "--allow-empty", "-m", "IMP-2-0-0-02 follow-up")
+        pushed = await asyncio.wait_for(updates.__anext__(), 5)
+        assert pushed > first
+
+        state = (await collector.snapshot())["alice_workspace_20260101_120000"]
+        assert state.recent_commits[0]["message"] == "IMP-2-0-0-02 follow-up"
+        assert state.commits_today == 2
+
+        await updates.aclose()
+        await collector.stop()
+
+    asyncio.run(scenario())
+
+
+def test_uncommitted_changes_are_picked_up(tmp_path):
+    carol = _make_workspace(tmp_path, "carol_workspace_20260101_120000")
+    # No files in the last commit: the dashboard falls back to `git status`
+    _git(carol, "commit", "-q", "--allow-empty", "-m", "wip")
+
+    async def scenario():
+        collector = GitStatusCollector(str(tmp_path), poll_seconds=60)
+        states = await collector.snapshot()
+        assert states["carol_workspace_20260101_120000"].git_info["modified_files_count"] == 0
+        # let the background task's first refresh finish
+        assert await collector.refresh() is False
+        index_mtime = (carol / ".git" / "index").stat().st_mtime_ns
+
+        (carol / "notes.txt").write_text("draft\n")
+        assert await collector.refresh() is True
+        state = (await collector.snapshot())["carol_workspace_20260101_120000"]
+        assert state.git_info["modified_files_count"] == 1
+
+        # Polling alone does not rewrite the index, so the cache stays valid
+        assert await collector.refresh() is False
+        assert (carol / ".git" / "index").stat().st_mtime_ns == index_mtime
+        await collector.stop()
+
+    asyncio.run(scenario())
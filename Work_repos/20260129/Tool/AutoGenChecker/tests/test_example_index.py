@@ -0,0 +1,98 @@
+"""
+Tests for the persistent checker example index (context_collectors/example_index.py).
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Setup path
+_tool_dir = Path(__file__).resolve().parents[1]
+if str(_tool_dir) not in sys.path:
+    sys.path.insert(0, str(_tool_dir))
+
+pytest.importorskip("yaml")
+
+from context_collectors.example_index import ExampleIndex
+
+
+def _add_example(root, module, item_id, desc, input_files, script="print('ok')\n"):
+    items = root / module / "inputs" / "items"
+    scripts = root / module / "scripts" / "checker"
+    items.mkdir(parents=True, exist_ok=True)
+    scripts.mkdir(parents=True, exist_ok=True)
+    files = "\n".join(f"  - ${{CHECKLIST_ROOT}}/IP_project_folder/{f}" for f in input_files)
+    (items / f"{item_id}.yaml").write_text(
+        f"item_desc: {desc}\ninput_files:\n{files}\n"
+        "requirements:\n  value: N/A\nwaivers:\n  value: N/A\n",
+        encoding="utf-8",
+    )
+    (scripts / f"{item_id}.py").write_text(script, encoding="utf-8")
+    return items / f"{item_id}.yaml"
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "Check_modules"
+    _add_example(root, "5.0_SYN", "IMP-5-0-0-01", "Check synthesis log for errors", ["syn.log"])
+    _add_example(root, "5.0_SYN", "IMP-5-0-0-02", "Confirm no latches are inferred", ["latch.rpt"])
+    _add_example(root, "10.0_STA", "IMP-10-0-0-01", "Confirm no unconstrained timing endpoints",
+                 ["sta.log", "qor.rpt"])
+    (root / "common").mkdir()
+    return root
+
+
+def test_search_ranks_by_files_description_and_module(tree, tmp_path):
+    index = ExampleIndex(tree, tmp_path / "index.json")
+    assert index.refresh()["added"] == 3
+
+    score, best = index.search(description="unconstrained timing paths",
+                               input_files=["qor.rpt"], k=1)[0]
+    assert best.item_id == "IMP-10-0-0-01"
+    assert best.checker_type == 1
+    assert score == pytest.approx(40.0 + 20.0)
+
+    results = index.search(description="synthesis errors", module="5.0_SYN", k=3)
+    assert [entry.item_id for _, entry in results][:2] == ["IMP-5-0-0-01", "IMP-5-0-0-02"]
+    example = results[0][1].to_example()
+    assert example["script_text"] == "print('ok')\n"
+
+
+def test_refresh_is_incremental_and_persistent(tree, tmp_path):
+    path = tmp_path / "index.json"
+    ExampleIndex(tree, path).refresh()
+
+    reloaded = ExampleIndex(tree, path)
+    assert len(reloaded) == 3
+    assert reloaded.refresh() == {"added": 0, "updated": 0, "removed": 0, "unchanged": 3}
+
+    config = _add_example(tree, "5.0_SYN", "IMP-5-0-0-02", "Confirm no latches or flops removed",
+                          ["latch.rpt"])
+    os.utime(config, ns=(1, 1))
+    (tree / "10.0_STA" / "scripts" / "checker" / "IMP-10-0-0-01.py").unlink()
+    stats = reloaded.refresh()
+    assert (stats["updated"], stats["removed"], stats["unchanged"]) == (1, 1, 1)
+    assert reloaded.search(description="flops", k=1)[0][1].item_id == "IMP-5-0-0-02"
+
+
+def test_ai_generated_examples_can_be_excluded(tree, tmp_path):
+    _add_example(tree, "5.0_SYN", "IMP-5-0-0-03", "Check synthesis log for warnings", ["syn.log"],
+                 script="# Author: AutoGenChecker AI\n")
+    index = ExampleIndex(tree, tmp_path / "index.json")
+    index.refresh()
+    ids = [e.item_id for _, e in index.search(input_files=["syn.log"], k=4, exclude_ai_generated=True)]
+    assert "IMP-5-0-0-03" not in ids and len(ids) == 3
+
+
+def test_default_index_path_is_outside_the_checkout(tree, tmp_path, monkeypatch):
+    from context_collectors import example_index
+
+    monkeypatch.delenv("AUTOGEN_EXAMPLE_INDEX_PATH", raising=False)
+    monkeypatch.setattr(example_index, "DEFAULT_INDEX_DIR", tmp_path / "home")
+    path = ExampleIndex(tree).path
+    assert _tool_dir not in path.parents
+    assert path.parent == tmp_path / "home"
+    # One file per Check_modules root, so checkouts do not overwrite each other
+    assert ExampleIndex(tmp_path / "other" / "Check_modules").path != path
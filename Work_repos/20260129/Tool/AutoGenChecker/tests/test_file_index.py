@@ -0,0 +1,59 @@
+"""
+Tests for the line-indexed large file reader used by the step2 file API.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Setup path
+_tool_dir = Path(__file__).resolve().parents[1]
+if str(_tool_dir) not in sys.path:
+    sys.path.insert(0, str(_tool_dir))
+
+import utils.file_index as file_index
+from utils.file_index import get_line_index, read_text_head
+
+
+def _write_log(path: Path, count: int, trailing_newline: bool = True) -> list:
+    lines = [f"INFO: step {i}" if i % 7 else f"ERROR: failure {i}" for i in range(count)]
+    path.write_bytes(("\n".join(lines) + ("\n" if trailing_newline else "")).encode("utf-8"))
+    return lines
+
+
+def test_windows_tail_and_search_match_plain_reading(tmp_path, monkeypatch):
+    # Tiny chunks put many checkpoints and chunk boundaries in a small file
+    monkeypatch.setattr(file_index, "CHUNK_SIZE", 64)
+    log = tmp_path / "run.log"
+    lines = _write_log(log, 500, trailing_newline=False)
+
+    index = get_line_index(log)
+    assert index.line_count == 500
+    assert len(index.checkpoints) > 10
+    assert index.read_lines(123, 3) == [f"{l}\n" for l in lines[123:126]]
+    assert index.read_lines(499, 10) == [lines[499]]
+    assert index.tail(2) == [f"{lines[498]}\n", lines[499]]
+
+    hits = index.search(["error"], max_hits=5)
+    assert hits == [(i + 1, lines[i]) for i in range(0, 500, 7)][:5]
+    assert index.search(["error"], ignore_case=False) == []
+
+
+def test_index_is_cached_until_the_file_changes(tmp_path):
+    log = tmp_path / "run.log"
+    _write_log(log, 10)
+    first = get_line_index(log)
+    assert get_line_index(log) is first
+
+    _write_log(log, 20)
+    os.utime(log, ns=(first.mtime_ns + 10**9, first.mtime_ns + 10**9))
+    assert get_line_index(log).line_count == 20
+
+
+def test_read_text_head_cuts_at_line_boundary(tmp_path):
+    log = tmp_path / "run.log"
+    lines = _write_log(log, 100)
+    text, truncated = read_text_head(log, 50)
+    assert truncated and text.endswith("\n") and len(text) <= 50
+    assert text.splitlines() == lines[:len(text.splitlines())]
+    assert read_text_head(log, 10**6) == (log.read_text(encoding="utf-8"), False)
@@ -0,0 +1,67 @@
+"""
+Tests for the shared file tree index used for "**" input file patterns.
+"""
+
+import glob
+import os
+import sys
+from pathlib import Path
+
+# Setup path
+_tool_dir = Path(__file__).resolve().parents[1]
+if str(_tool_dir) not in sys.path:
+    sys.path.insert(0, str(_tool_dir))
+
+from utils.file_tree_index import FileTreeIndex, get_file_index, glob_files
+
+
+def _touch(root: Path, rel: str) -> Path:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.touch()
+    return path
+
+
+def test_glob_files_matches_recursive_glob(tmp_path):
+    for rel in ["logs/sta/run1/sta.log", "logs/sta/run2/sta.log.gz", "logs/pnr/route.log",
+                "logs/top.log", "logs/.hidden/skip.log", "reports/timing.rpt"]:
+        _touch(tmp_path, rel)
+
+    _touch(tmp_path, "shared/lib/c.log")
+    os.symlink(tmp_path / "shared", tmp_path / "logs" / "linked", target_is_directory=True)
+
+    for pattern in ["logs/**/*.log", "logs/**/sta/*/sta.log*", "logs/*.log", "**/*.rpt", "logs/**",
+                    "logs/**/", "logs/*", "**/lib/*", "**/run*"]:
+        full = str(tmp_path / pattern)
+        expected = sorted(glob.glob(full, recursive=True))
+        assert glob_files(full) == expected, pattern
+
+
+def test_symlink_loop_is_not_followed(tmp_path):
+    _touch(tmp_path, "logs/sta/a.log")
+    os.symlink(tmp_path / "logs", tmp_path / "logs" / "sta" / "loop", target_is_directory=True)
+    index = FileTreeIndex(str(tmp_path / "logs")).refresh()
+    assert index.files() == ["sta/a.log"]
+    assert index.dirs() == ["sta", "sta/loop"]
+
+
+def test_index_refreshes_on_root_change_and_miss(tmp_path):
+    _touch(tmp_path, "logs/deep/a.log")
+    index = get_file_index(str(tmp_path / "logs"))
+    assert [Path(p).name for p in index.glob("**/*.log")] == ["a.log"]
+
+    # Root mtime changed: refreshed when the shared index is requested
+    top_file = _touch(tmp_path, "logs/top.log")
+    index = get_file_index(str(tmp_path / "logs"))
+    assert str(top_file) in index.glob("**/*.log")
+
+    # Deeper change, root mtime unchanged: a query that finds nothing refreshes once
+    deep_file = _touch(tmp_path, "logs/deep/b.rpt")
+    index = get_file_index(str(tmp_path / "logs"))
+    assert index.glob("**/*.rpt") == [str(deep_file)]
+
+    # Deeper removal: picked up once the shared index is older than the refresh interval
+    (tmp_path / "logs" / "deep" / "a.log").unlink()
+    index.refreshed_at = 0.0
+    index = get_file_index(str(tmp_path / "logs"))
+    assert [Path(p).name for p in index.glob("**/*.log")] == ["top.log"]
@@ -0,0 +1,188 @@
+"""
+Tests for the LLM response cache in BaseLLMClient.
+
+Uses a fake client, so no provider SDK or network access is needed.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Setup path
+_tool_dir = Path(__file__).resolve().parents[1]
+if str(_tool_dir) not in sys.path:
+    sys.path.insert(0, str(_tool_dir))
+
+from llm_clients.base import BaseLLMClient
+from llm_clients.response_cache import CacheMissError, ResponseCache
+from utils.models import LLMCallConfig, LLMResponse
+
+
+class FakeClient(BaseLLMClient):
+    """Counts provider calls and echoes the prompt."""
+
+    def __init__(self, cache, default_model="fake-model", system_prompt="sys"):
+        super().__init__(default_model=default_model, response_cache=cache)
+        self._system_prompt = system_prompt
+        self.calls = 0
+
+    def _complete(self, prompt, *, config=None):
+        self.calls += 1
+        return LLMResponse(text=f"{prompt}#{self.calls}", model=config.model,
+                           prompt_tokens=3, usage={"prompt_tokens": 3})
+
+
+@pytest.fixture
+def cache(tmp_path):
+    store = ResponseCache(tmp_path / "llm.sqlite3", ttl_seconds=0, max_bytes=0, mode="on")
+    yield store
+    store.close()
+
+
+def test_identical_request_is_served_from_cache(cache):
+    client = FakeClient(cache)
+    first = client.complete("hello", config=LLMCallConfig(temperature=0.2))
+    second = client.complete("hello", config=LLMCallConfig(temperature=0.2))
+    assert client.calls == 1
+    assert second == first
+    assert client.cache_stats()["hits"] == 1
+
+
+def test_key_covers_decoding_params_prompt_and_identity(cache):
+    client = FakeClient(cache)
+    client.complete("hello", config=LLMCallConfig(temperature=0.2))
+    client.complete("hello", config=LLMCallConfig(temperature=0.7))
+    client.complete("hello", config=LLMCallConfig(temperature=0.2, max_tokens=99))
+    client.complete("hello!", config=LLMCallConfig(temperature=0.2))
+    assert client.calls == 4
+    other = FakeClient(cache, default_model="other-model")
+    other.complete("hello", config=LLMCallConfig(temperature=0.2))
+    assert other.calls == 1
+    other_system = FakeClient(cache, system_prompt="different")
+    other_system.complete("hello", config=LLMCallConfig(temperature=0.2))
+    assert other_system.calls == 1
+
+
+def test_bypass_flag(cache):
+    client = FakeClient(cache)
+    client.complete("hi")
+    client.complete("hi", config=LLMCallConfig(model="fake-model", use_cache=False))
+    client.complete("hi")
+    assert client.calls == 2
+
+
+def test_ttl_expiry(tmp_path):
+    store = ResponseCache(tmp_path / "ttl.sqlite3", ttl_seconds=0.05, max_bytes=0, mode="on")
+    client = FakeClient(store)
+    client.complete("hi")
+    time.sleep(0.1)
+    client.complete("hi")
+    assert client.calls == 2
+    assert store.stats()["expired"] == 1
+    store.close()
+
+
+def test_lru_eviction_keeps_recent_entries(tmp_path):
+    store = ResponseCache(tmp_path / "lru.sqlite3", ttl_seconds=0, max_bytes=1500, mode="on")
+    client = FakeClient(store)
+    for i in range(20):
+        client.complete(f"prompt {i} " + "x" * 50)
+    stats = store.stats()
+    assert stats["evicted"] > 0
+    assert stats["bytes"] <= 1500
+    calls = client.calls
+    client.complete("prompt 19 " + "x" * 50)
+    assert client.calls == calls
+    store.close()
+
+
+def test_replay_mode_serves_recorded_and_raises_on_miss(tmp_path):
+    path = tmp_path / "replay.sqlite3"
+    recorder = FakeClient(ResponseCache(path, mode="on"))
+    recorded = recorder.complete("recorded")
+    replayer = FakeClient(ResponseCache(path, mode="replay"))
+    assert replayer.complete("recorded") == recorded
+    with pytest.raises(CacheMissError):
+        replayer.complete("new prompt")
+    assert replayer.calls == 0
+
+
+def test_disabled_cache_always_calls_provider():
+    client = FakeClient(False)
+    client.complete("hi")
+    client.complete("hi")
+    assert client.calls == 2
+    assert client.cache_stats() == {}
+
+
+def test_fix_loop_calls_skip_the_cache(cache):
+    from types import SimpleNamespace
+    from workflow.mixins.self_check_mixin import SelfCheckMixin
+
+    client = FakeClient(cache)
+
+    class Fixer(SelfCheckMixin):
+        verbose = False
+        _search_source_for_api_info = staticmethod(lambda text: "")
+        _find_similar_checkers = staticmethod(lambda config, text: "")
+        _extract_code_from_response = staticmethod(lambda text: text)
+        _get_llm_agent = staticmethod(lambda: SimpleNamespace(_llm_client=client))
+
+    issues = [{"type": "SYNTAX", "message": "bad"}]
+    fixer = Fixer()
+    first = fixer._ai_fix_issues("code", issues, {}, {}, "")
+    second = fixer._ai_fix_issues("code", issues, {}, {}, "")
+    # The same failing code must get a fresh answer, not the cached one
+    assert client.calls == 2
+    assert first != second
+
+
+def _code_generator(client, recorded):
+    from types import SimpleNamespace
+    from workflow.mixins.code_generation_mixin import CodeGenerationMixin
+
+    class Generator(CodeGenerationMixin):
+        _backup_code_template = staticmethod(lambda config: None)
+        _load_existing_skeleton = staticmethod(lambda config: "")
+        _build_code_implementation_prompt = staticmethod(lambda *args: "implement")
+        _get_llm_agent = staticmethod(lambda: SimpleNamespace(_llm_client=client))
+        _log = staticmethod(lambda *args: None)
+
+        def _generate_phase1(self, *args):
+            raise RuntimeError("phase 1 failed")
+
+        def _extract_code_from_response(self, text):
+            # First answer is unusable: forces the fallback retry
+            if len(recorded) == 1:
+                raise ValueError("no code block")
+            return "def main():\n    pass"
+
+    return Generator()
+
+
+@pytest.mark.parametrize("use_cache, expected_use_cache", [(True, [True, False]), (False, [False, False])])
+def test_code_generation_fallback_uses_per_call_configs(cache, use_cache, expected_use_cache):
+    recorded = []
+    client = FakeClient(cache)
+    complete = client.complete
+
+    def record(prompt, *, config=None):
+        recorded.append(config)
+        return complete(prompt, config=config)
+    client.complete = record
+
+    generator = _code_generator(client, recorded)
+    code = generator._ai_implement_complete_code({"item_id": "IMP-1", "module": "m"}, {}, "",
+                                                 use_cache=use_cache)
+    assert code.startswith("def main")
+    assert [c.use_cache for c in recorded] == expected_use_cache
+    # Every attempt gets its own config: nothing shared is mutated
+    assert recorded[0] is not recorded[1]
+    assert client.calls == 2
+
+
+def test_default_cache_path_is_outside_the_checkout():
+    from llm_clients.response_cache import DEFAULT_CACHE_PATH
+    assert _tool_dir not in DEFAULT_CACHE_PATH.parents
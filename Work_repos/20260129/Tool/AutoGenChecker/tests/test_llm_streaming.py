@@ -0,0 +1,130 @@
+"""
+Tests for streaming completions: BaseLLMClient.complete_stream and the
+JedAI server-sent-event parser (fake HTTP session, no network access).
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Setup path
+_tool_dir = Path(__file__).resolve().parents[1]
+if str(_tool_dir) not in sys.path:
+    sys.path.insert(0, str(_tool_dir))
+
+from llm_clients.base import BaseLLMClient
+from llm_clients.response_cache import ResponseCache
+from utils.models import LLMCallConfig, LLMResponse
+
+
+class FakeStreamingClient(BaseLLMClient):
+    """Streams the prompt back word by word."""
+
+    def __init__(self, cache):
+        super().__init__(default_model="fake-model", response_cache=cache)
+        self.calls = 0
+
+    def _complete(self, prompt, *, config=None):
+        raise AssertionError("streaming path must not call _complete")
+
+    def _complete_stream(self, prompt, *, config):
+        self.calls += 1
+        for word in prompt.split():
+            yield word + " "
+        return LLMResponse(text=" ".join(prompt.split()) + " ", model=config.model)
+
+
+def test_stream_yields_chunks_and_fills_cache(tmp_path):
+    cache = ResponseCache(tmp_path / "llm.sqlite3", mode="on")
+    client = FakeStreamingClient(cache)
+    assert list(client.complete_stream("one two three")) == ["one ", "two ", "three "]
+    # Cache hit: whole text in one chunk, no provider call; shared with complete()
+    assert list(client.complete_stream("one two three")) == ["one two three "]
+    assert client.complete("one two three").text == "one two three "
+    assert client.calls == 1
+    cache.close()
+
+
+def test_default_stream_falls_back_to_complete():
+    class PlainClient(BaseLLMClient):
+        def _complete(self, prompt, *, config=None):
+            return LLMResponse(text=prompt.upper(), model=config.model)
+
+    client = PlainClient(default_model="m", response_cache=False)
+    assert list(client.complete_stream("hi", config=LLMCallConfig(model="m"))) == ["HI"]
+
+
+class FakeHTTPResponse:
+    def __init__(self, lines=None, body=None):
+        self.status_code = 200
+        self.headers = {"Content-Type": "application/json" if body else "text/event-stream"}
+        self._lines = lines or []
+        self._body = body
+        self.closed = False
+
+    def iter_lines(self, decode_unicode=False):
+        return iter(self._lines)
+
+    def json(self):
+        return self._body
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    def post(self, url, **kwargs):
+        self.requests.append((url, kwargs))
+        return self.response
+
+
+@pytest.fixture
+def jedai(monkeypatch):
+    pytest.importorskip("requests")
+    from llm_clients import jedai_client
+
+    client = jedai_client.JedAIClient(
+        default_model="claude-sonnet-4-5", access_token="token", response_cache=False
+    )
+    monkeypatch.setattr(client, "_ensure_authenticated", lambda: ("token", "http://jedai"))
+
+    def install(response):
+        session = FakeSession(response)
+        monkeypatch.setattr(jedai_client, "get_http_session", lambda: session)
+        return session
+
+    return client, install
+
+
+def test_jedai_parses_sse_deltas(jedai):
+    client, install = jedai
+    events = [
+        {"choices": [{"delta": {"content": "Hel"}}]},
+        {"choices": [{"delta": {"content": "lo"}}]},
+        {"type": "content_block_delta", "delta": {"text": ", "}},
+        {"candidates": [{"content": {"parts": [{"text": "world"}]}}]},
+        {"choices": [{"delta": {}}], "usage": {"prompt_tokens": 5, "completion_tokens": 4}},
+    ]
+    lines = [": keep-alive", ""] + [f"data: {json.dumps(e)}" for e in events] + ["data: [DONE]"]
+    response = FakeHTTPResponse(lines=lines)
+    session = install(response)
+
+    stream = client.complete_stream("hi")
+    chunks = list(stream)
+    assert chunks == ["Hel", "lo", ", ", "world"]
+    url, kwargs = session.requests[0]
+    assert url == "http://jedai/api/copilot/v1/llm/chat/completions"
+    assert kwargs["stream"] is True and kwargs["json"]["stream"] is True
+    assert response.closed
+
+
+def test_jedai_stream_accepts_plain_json_body(jedai):
+    client, install = jedai
+    install(FakeHTTPResponse(body={"choices": [{"message": {"content": "full text"}}]}))
+    assert list(client.complete_stream("hi")) == ["full text"]
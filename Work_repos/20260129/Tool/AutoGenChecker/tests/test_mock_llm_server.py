@@ -0,0 +1,192 @@
+"""
+Tests for the local mock LLM server (replay, wire formats, fault injection)
+and the batch LLM benchmark harness that drives it.
+"""
+
+import json
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+# Setup path
+_tool_dir = Path(__file__).resolve().parents[1]
+if str(_tool_dir) not in sys.path:
+    sys.path.insert(0, str(_tool_dir))
+
+from llm_clients.base import BaseLLMClient
+from llm_clients.mock_server import (
+    ANTHROPIC_MESSAGES_PATH, JEDAI_CHAT_PATH, MOCK_TOKEN, MockLLMServer, MockServerConfig,
+)
+from utils.models import LLMResponse
+from workflow.llm_benchmark import compare_reports, run_llm_benchmark
+
+
+def _post(url, body, timeout=10):
+    """Return (status, headers, raw body)."""
+    request = urllib.request.Request(
+        url, data=json.dumps(body).encode("utf-8"), headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as resp:
+            return resp.status, resp.headers, resp.read().decode("utf-8")
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read().decode("utf-8")
+
+
+def _chat(text, **extra):
+    return {"messages": [{"role": "system", "content": "sys"}, {"role": "user", "content": text}], **extra}
+
+
+class UrllibChatClient(BaseLLMClient):
+    """Minimal stdlib client for the mock's OpenAI endpoint."""
+
+    def __init__(self, url):
+        super().__init__(default_model="mock-model", response_cache=False)
+        self.url = url
+
+    def _complete(self, prompt, *, config=None):
+        status, _, raw = _post(f"{self.url}/v1/chat/completions", _chat(prompt))
+        if status != 200:
+            raise RuntimeError(f"HTTP {status}")
+        return LLMResponse(text=json.loads(raw)["choices"][0]["message"]["content"], model="mock-model")
+
+
+def test_replay_by_prompt_hash_and_formats(tmp_path):
+    recordings = tmp_path / "rec.jsonl"
+    recordings.write_text(
+        json.dumps({"prompt": "hello", "response": "recorded hello"}) + "\n"
+        + json.dumps({"messages": [{"role": "user", "content": "exact"}], "response": "exact hit"}) + "\n",
+        encoding="utf-8",
+    )
+    with MockLLMServer() as server:
+        assert server.load_recordings(recordings) == 2
+
+        # Keyed by the last user prompt: the client's system prompt does not matter
+        status, _, raw = _post(server.url + JEDAI_CHAT_PATH, _chat("hello"))
+        assert status == 200
+        assert json.loads(raw)["choices"][0]["message"]["content"] == "recorded hello"
+
+        status, _, raw = _post(server.url + "/v1/chat/completions",
+                               {"messages": [{"role": "user", "content": "exact"}]})
+        assert json.loads(raw)["choices"][0]["message"]["content"] == "exact hit"
+
+        # Unknown prompts are echoed; Anthropic format on /v1/messages
+        status, _, raw = _post(server.url + ANTHROPIC_MESSAGES_PATH,
+                               {"system": "sys", "messages": [{"role": "user", "content": "new one"}]})
+        payload = json.loads(raw)
+        assert payload["content"] == [{"type": "text", "text": "new one"}]
+        assert payload["usage"] == {"input_tokens": 3, "output_tokens": 2}
+
+        status, _, raw = _post(server.url + "/api/v1/security/login", {"username": "u"})
+        assert json.loads(raw)["access_token"] == MOCK_TOKEN
+        assert server.stats()["replayed"] == 2 and server.stats()["default"] == 1
+
+    with MockLLMServer(MockServerConfig(strict=True)) as server:
+        status, _, raw = _post(server.url + JEDAI_CHAT_PATH, _chat("unknown"))
+        assert status == 404 and "prompt_hash" in raw
+
+
+def test_streaming_events_reassemble_the_response():
+    text = "one two three four five six seven"
+    with MockLLMServer(MockServerConfig(stream_chunk_words=3)) as server:
+        server.add_recording("go", text)
+        status, headers, raw = _post(server.url + JEDAI_CHAT_PATH, _chat("go", stream=True))
+        assert status == 200 and headers["Content-Type"] == "text/event-stream"
+        data = [line[len("data: "):] for line in raw.splitlines() if line.startswith("data: ")]
+        assert data[-1] == "[DONE]"
+        deltas = [json.loads(d)["choices"][0]["delta"].get("content", "") for d in data[:-1]]
+        assert deltas[:3] == ["one two three ", "four five six ", "seven"]
+        assert "".join(deltas) == text
+
+        status, _, raw = _post(server.url + ANTHROPIC_MESSAGES_PATH,
+                               {"messages": [{"role": "user", "content": "go"}], "stream": True})
+        events = [json.loads(line[len("data: "):]) for line in raw.splitlines() if line.startswith("data: ")]
+        assert "".join(e["delta"]["text"] for e in events if e["type"] == "content_block_delta") == text
+        assert events[-1]["type"] == "message_stop"
+
+
+def test_rate_limit_errors_and_concurrency_cap_are_injected():
+    with MockLLMServer(MockServerConfig(rpm=60, burst=2, retry_after=7)) as server:
+        statuses = [_post(server.url + JEDAI_CHAT_PATH, _chat("x"))[0] for _ in range(3)]
+        assert statuses == [200, 200, 429]
+        status, headers, _ = _post(server.url + JEDAI_CHAT_PATH, _chat("x"))
+        assert status == 429 and headers["Retry-After"] == "7"
+
+    with MockLLMServer(MockServerConfig(error_rate=0.5, seed=3)) as server:
+        first = [_post(server.url + JEDAI_CHAT_PATH, _chat("x"))[0] for _ in range(20)]
+    with MockLLMServer(MockServerConfig(error_rate=0.5, seed=3)) as server:
+        second = [_post(server.url + JEDAI_CHAT_PATH, _chat("x"))[0] for _ in range(20)]
+        assert server.stats()["injected_errors"] == first.count(503)
+    assert first == second and set(first) == {200, 503}
+
+    with MockLLMServer(MockServerConfig(max_concurrency=1, latency=0.5)) as server:
+        results = []
+        slow = threading.Thread(target=lambda: results.append(_post(server.url + JEDAI_CHAT_PATH, _chat("a"))[0]))
+        slow.start()
+        while server.stats()["in_flight"] == 0:
+            time.sleep(0.01)
+        assert _post(server.url + JEDAI_CHAT_PATH, _chat("b"))[0] == 429
+        slow.join()
+        assert results == [200] and server.stats()["over_concurrency"] == 1
+
+
+def test_benchmark_measures_overlap_and_detects_regressions(tmp_path):
+    with MockLLMServer(MockServerConfig(latency=0.2)) as server:
+        client = UrllibChatClient(server.url)
+        serial = run_llm_benchmark(client, items=4, calls_per_item=2, jobs=1, server=server,
+                                   name="serial", log_dir=tmp_path / "serial")
+        parallel = run_llm_benchmark(client, items=4, calls_per_item=2, jobs=4, server=server,
+                                     name="parallel", log_dir=tmp_path / "parallel")
+
+    assert serial.calls == parallel.calls == 8 and serial.failures == parallel.failures == 0
+    assert serial.server["max_in_flight"] == 1 and parallel.server["max_in_flight"] == 4
+    assert parallel.seconds < serial.seconds / 2
+
+    baseline = [parallel.to_dict()]
+    slower = dict(baseline[0], calls_per_second=baseline[0]["calls_per_second"] / 2)
+    assert compare_reports(baseline, baseline) == []
+    assert len(compare_reports([slower], baseline)) == 1
+
+
+def test_jedai_client_against_mock_server():
+    pytest.importorskip("requests")
+    from llm_clients.jedai_client import JedAIClient
+
+    with MockLLMServer() as server:
+        server.add_recording("ping", "pong from mock")
+        client = JedAIClient(jedai_url=server.url, access_token=MOCK_TOKEN, response_cache=False)
+        assert client.complete("ping").text == "pong from mock"
+        assert "".join(client.complete_stream("ping")) == "pong from mock"
+
+
+@pytest.mark.parametrize("status", [502, 503, 504])
+def test_jedai_post_gateway_error_retried_once(status):
+    pytest.importorskip("requests")
+    from llm_clients.jedai_client import JedAIClient
+
+    config = MockServerConfig(error_rate=1.0, error_status=status, retry_after=0)
+    with MockLLMServer(config) as server:
+        client = JedAIClient(jedai_url=server.url, access_token=MOCK_TOKEN, response_cache=False)
+        with pytest.raises(RuntimeError, match=str(status)):
+            client.complete("ping")
+        assert server.stats()["injected_errors"] == 2
+
+
+def test_jedai_rate_limit_keeps_full_retry_budget():
+    pytest.importorskip("requests")
+    from urllib3.response import HTTPResponse
+    from llm_clients.jedai_client import get_http_session
+
+    retry = get_http_session().get_adapter("http://jedai").max_retries
+    for _ in range(2):
+        assert retry.is_retry("POST", 429)
+        retry = retry.increment("POST", "/chat", response=HTTPResponse(status=429))
+    assert retry.is_retry("POST", 429)
+    retry = retry.increment("POST", "/chat", response=HTTPResponse(status=502))
+    assert not retry.is_retry("POST", 503)
+    assert retry.is_retry("GET", 503)
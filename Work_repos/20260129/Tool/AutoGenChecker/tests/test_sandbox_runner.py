@@ -0,0 +1,79 @@
+"""
+Tests for the sandboxed parallel runner of checker test variants.
+"""
+
+import sys
+from pathlib import Path
+
+# Setup path
+_tool_dir = Path(__file__).resolve().parents[1]
+if str(_tool_dir) not in sys.path:
+    sys.path.insert(0, str(_tool_dir))
+
+from workflow.sandbox_runner import SandboxTestRunner
+
+# Minimal checker: reads its item YAML relative to its own location, like the
+# real checkers, and writes logs/ + reports/ in its module directory.
+CHECKER = '''
+import sys
+from pathlib import Path
+import yaml
+
+module_dir = Path(__file__).resolve().parents[2]
+config = yaml.safe_load((module_dir / "inputs" / "items" / "IMP-1.yaml").read_text())
+if config.get("hang"):
+    import time
+    time.sleep(30)
+status = "PASS" if config["expected"] == "ok" else "FAIL"
+(module_dir / "logs").mkdir(exist_ok=True)
+(module_dir / "reports").mkdir(exist_ok=True)
+(module_dir / "logs" / "IMP-1.log").write_text(f"{status}:IMP-1:{config['expected']}")
+(module_dir / "reports" / "IMP-1.rpt").write_text(status)
+print(status)
+'''
+
+
+def _make_workspace(root: Path) -> Path:
+    (root / "Check_modules" / "common").mkdir(parents=True)
+    (root / "Check_modules" / "common" / "helper.py").write_text("X = 1\n")
+    module_dir = root / "Check_modules" / "M1"
+    (module_dir / "inputs" / "items").mkdir(parents=True)
+    (module_dir / "inputs" / "items" / "IMP-1.yaml").write_text("expected: real\n")
+    (module_dir / "scripts" / "checker").mkdir(parents=True)
+    (module_dir / "scripts" / "checker" / "IMP-1.py").write_text("# original\n")
+    (root / "IP_project_folder").mkdir()
+    return root
+
+
+def test_variants_run_isolated(tmp_path):
+    root = _make_workspace(tmp_path / "CHECKLIST")
+    runner = SandboxTestRunner(root, "M1", "IMP-1", CHECKER, jobs=3)
+    outcomes = runner.run({
+        "type1_na": {"expected": "ok"},
+        "type2_na": {"expected": "bad"},
+        "type3_na": {"expected": "ok"},
+    })
+
+    assert list(outcomes) == ["type1_na", "type2_na", "type3_na"]
+    assert [o.check_result for o in outcomes.values()] == ["PASS", "FAIL", "PASS"]
+    assert outcomes["type2_na"].log == "FAIL:IMP-1:bad"
+
+    # The real module is untouched
+    module_dir = root / "Check_modules" / "M1"
+    assert (module_dir / "inputs" / "items" / "IMP-1.yaml").read_text() == "expected: real\n"
+    assert (module_dir / "scripts" / "checker" / "IMP-1.py").read_text() == "# original\n"
+    assert not (module_dir / "logs").exists()
+
+    out_dir = runner.save_outputs(outcomes)
+    assert (out_dir / "IMP-1_type2_na.log").read_text(encoding="utf-8") == "FAIL:IMP-1:bad"
+    assert (out_dir / "IMP-1_type1_na.rpt").read_text(encoding="utf-8") == "PASS"
+
+
+def test_timeout_is_reported_per_variant(tmp_path):
+    root = _make_workspace(tmp_path / "CHECKLIST")
+    runner = SandboxTestRunner(root, "M1", "IMP-1", CHECKER, jobs=2, timeout=2)
+    outcomes = runner.run({"fast": {"expected": "ok"}, "slow": {"expected": "ok", "hang": True}})
+
+    assert outcomes["fast"].check_result == "PASS"
+    assert outcomes["slow"].timed_out
+    assert outcomes["slow"].check_result == "ERROR"
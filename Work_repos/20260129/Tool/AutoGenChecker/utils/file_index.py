@@ -0,0 +1,205 @@
+"""Line-indexed access to large text files (EDA logs and reports).
+
+Counting lines or previewing a multi-GB log by decoding it in text mode
+reads the whole file every time. ``LineIndex`` makes one binary pass that
+counts newlines per chunk and records a sparse checkpoint (byte offset of a
+line start) per chunk; line windows, tail and keyword hits then seek
+instead of re-reading. Indexes are cached per path and rebuilt when the
+file's size or mtime changes.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+CHUNK_SIZE = 1 << 20  # 1 MiB: read size and checkpoint spacing
+_CACHE_SIZE = 64
+
+_cache: "OrderedDict[str, LineIndex]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8", errors="ignore")
+
+
+@dataclass(frozen=True)
+class LineIndex:
+    """Line count and sparse line-start offsets of one file version."""
+
+    path: Path
+    size: int
+    mtime_ns: int
+    line_count: int
+    # (line number, byte offset of that line's start), ascending
+    checkpoints: tuple[tuple[int, int], ...]
+
+    @classmethod
+    def build(cls, path: str | Path) -> "LineIndex":
+        """Scan the file once in binary chunks."""
+
+        path = Path(path)
+        stat = path.stat()
+        checkpoints = [(0, 0)]
+        newlines = 0
+        offset = 0
+        last = b"\n"
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                first = chunk.find(b"\n")
+                if first != -1 and offset:
+                    checkpoints.append((newlines + 1, offset + first + 1))
+                newlines += chunk.count(b"\n")
+                offset += len(chunk)
+                last = chunk[-1:]
+        # A final line without a trailing newline still counts
+        line_count = newlines + (1 if last != b"\n" else 0)
+        return cls(path, offset, stat.st_mtime_ns, line_count, tuple(checkpoints))
+
+    def is_current(self) -> bool:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+    def _seek_line(self, f, line: int) -> None:
+        """Position f at the start of the 0-based line."""
+
+        pos = bisect.bisect_right(self.checkpoints, (line, float("inf"))) - 1
+        start_line, offset = self.checkpoints[pos]
+        f.seek(offset)
+        for _ in range(line - start_line):
+            if not f.readline():
+                break
+
+    def read_lines(self, start: int, count: int) -> list[str]:
+        """Return up to count lines (with line endings) from 0-based start."""
+
+        if count <= 0 or start >= self.line_count:
+            return []
+        start = max(0, start)
+        lines: list[str] = []
+        with open(self.path, "rb") as f:
+            self._seek_line(f, start)
+            for _ in range(count):
+                raw = f.readline()
+                if not raw:
+                    break
+                lines.append(_decode(raw))
+        return lines
+
+    def tail(self, count: int) -> list[str]:
+        """Return the last count lines."""
+
+        return self.read_lines(max(0, self.line_count - count), count)
+
+    def search(
+        self, keywords: Iterable[str], max_hits: int = 100, ignore_case: bool = True
+    ) -> list[tuple[int, str]]:
+        """Return (1-based line number, line) for lines containing any keyword."""
+
+        words = [k.encode("utf-8") for k in keywords if k]
+        if not words or max_hits <= 0:
+            return []
+        if ignore_case:
+            # bytes.lower() + find is much faster than a re.IGNORECASE alternation
+            words = [w.lower() for w in words]
+        hits: list[tuple[int, str]] = []
+        line_no = 0  # newlines before the current block
+        with open(self.path, "rb") as f:
+            carry = b""
+            while len(hits) < max_hits:
+                chunk = f.read(CHUNK_SIZE)
+                block = carry + chunk
+                if not block:
+                    break
+                # Only search complete lines; the remainder carries over
+                end = block.rfind(b"\n") + 1 if chunk else len(block)
+                if end == 0:
+                    carry = block
+                    continue
+                block, carry = block[:end], block[end:]
+                counted_to = 0
+                last_hit_line = -1
+                haystack = block.lower() if ignore_case else block
+                for start in _find_all(haystack, words):
+                    line_no += block.count(b"\n", counted_to, start)
+                    counted_to = start
+                    if line_no == last_hit_line:
+                        continue
+                    last_hit_line = line_no
+                    line_start = block.rfind(b"\n", 0, start) + 1
+                    line_end = block.find(b"\n", start)
+                    line_end = len(block) if line_end == -1 else line_end
+                    hits.append((line_no + 1, _decode(block[line_start:line_end]).rstrip("\r")))
+                    if len(hits) >= max_hits:
+                        break
+                line_no += block.count(b"\n", counted_to)
+                if not chunk:
+                    break
+        return hits
+
+
+def _find_all(haystack: bytes, words: list[bytes]) -> list[int]:
+    """Sorted start offsets of every occurrence of any word."""
+
+    starts: set[int] = set()
+    for word in words:
+        pos = haystack.find(word)
+        while pos != -1:
+            starts.add(pos)
+            # Skip to the next line: one hit per line is enough
+            eol = haystack.find(b"\n", pos)
+            if eol == -1:
+                break
+            pos = haystack.find(word, eol + 1)
+    return sorted(starts)
+
+
+def get_line_index(path: str | Path) -> LineIndex:
+    """Return the cached index for path, rebuilding it if the file changed."""
+
+    key = os.path.abspath(path)
+    with _cache_lock:
+        index = _cache.get(key)
+        if index is not None and index.is_current():
+            _cache.move_to_end(key)
+            return index
+    # Build outside the lock: concurrent requests for other files proceed
+    index = LineIndex.build(key)
+    with _cache_lock:
+        _cache[key] = index
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return index
+
+
+def count_lines(path: str | Path) -> int:
+    """Number of lines in path (cached by size/mtime)."""
+
+    return get_line_index(path).line_count
+
+
+def read_text_head(path: str | Path, max_bytes: int) -> tuple[str, bool]:
+    """Return (text, truncated): at most max_bytes, cut at a line boundary."""
+
+    with open(path, "rb") as f:
+        data = f.read(max_bytes + 1)
+    if len(data) <= max_bytes:
+        return _decode(data), False
+    data = data[:max_bytes]
+    cut = data.rfind(b"\n")
+    if cut != -1:
+        data = data[: cut + 1]
+    return _decode(data), True
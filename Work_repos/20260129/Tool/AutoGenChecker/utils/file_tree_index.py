@@ -0,0 +1,46 @@
+"""
+File Tree Index
+
+The index ("**" input file patterns answered from one cached os.scandir walk)
+is shared with the codegen developer_agent. Its only implementation lives in
+Agents/codegen/Work/Agent/developer_agent/file_tree_index.py; this module
+loads that file and re-exports it.
+"""
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+DEVELOPER_AGENT_DIR = Path(os.environ.get(
+    "DEVELOPER_AGENT_DIR",
+    Path(__file__).resolve().parents[5] / "Agents" / "codegen" / "Work" / "Agent" / "developer_agent"
+))
+
+_MODULE_NAME = "_developer_agent_file_tree_index"
+
+
+def _load_shared_module():
+    module = sys.modules.get(_MODULE_NAME)
+    if module is not None:
+        return module
+    path = DEVELOPER_AGENT_DIR / "file_tree_index.py"
+    if not path.is_file():
+        raise ImportError(f"Shared file tree index not found: {path} (set DEVELOPER_AGENT_DIR)")
+    spec = importlib.util.spec_from_file_location(_MODULE_NAME, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[_MODULE_NAME] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[_MODULE_NAME]
+        raise
+    return module
+
+
+_shared = _load_shared_module()
+
+FileTreeIndex = _shared.FileTreeIndex
+get_file_index = _shared.get_file_index
+glob_files = _shared.glob_files
+
+__all__ = ["FileTreeIndex", "get_file_index", "glob_files"]
@@ -48,6 +48,8 @@ class LLMCallConfig:
     temperature: float = 0.2
     model: str = "gpt-4.1"
     extra_options: dict[str, object] = field(default_factory=dict)
+    # False for intentionally stochastic calls: skip the LLM response cache
+    use_cache: bool = True
 
 
 @dataclass(slots=True)
@@ -2,7 +2,8 @@
 Dashboard API for developer status and real-time activity monitoring.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
 import subprocess
@@ -16,6 +17,17 @@ import asyncio
 import yaml
 import openpyxl
 
+from .git_status import (
+    GitStatusCollector,
+    ITEM_ID_PATTERN,
+    WorkspaceGitState,
+    checker_items_from_files,
+    find_assignment_branch,
+    parse_commit_log,
+    parse_last_commit,
+    run_git,
+)
+
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
 # Workspaces directory path - try multiple locations
@@ -384,17 +396,11 @@ async def get_remote_branches_info() -> dict:
     
     try:
         # git ls-remote is fast - only gets refs without downloading objects
-        result = subprocess.run(
-            ["git", "ls-remote", "origin"],
-            cwd=workspace_path,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        returncode, stdout = await run_git(workspace_path, "ls-remote", "origin", timeout=10)
         
         branches = {}
-        if result.returncode == 0:
-            for line in result.stdout.strip().split("\n"):
+        if returncode == 0:
+            for line in stdout.strip().split("\n"):
                 if "refs/heads/assignment/" in line:
                     parts = line.split("\t")
                     if len(parts) == 2:
@@ -436,16 +442,10 @@ def get_git_info(workspace_path: str, developer_name_snake: str = "", remote_bra
             result["current_branch"] = branch_result.stdout.strip()
         
         # Find assignment branch for this developer from remote_branches
-        if remote_branches and developer_name_snake:
-            assignment_branches = [
-                b for b in remote_branches.keys() 
-                if f"assignment/{developer_name_snake}_" in b
-            ]
-            if assignment_branches:
-                # Sort by date (ascending) and get the first/original assignment
-                assignment_branches.sort()
-                result["assignment_branch"] = assignment_branches[0]
-                result["remote_sha"] = remote_branches.get(assignment_branches[0])
+        assignment_branch = find_assignment_branch(remote_branches, developer_name_snake)
+        if assignment_branch:
+            result["assignment_branch"] = assignment_branch
+            result["remote_sha"] = remote_branches.get(assignment_branch)
         
         # Get last commit info - prefer assignment branch if available
         if result["assignment_branch"]:
@@ -467,12 +467,8 @@ def get_git_info(workspace_path: str, developer_name_snake: str = "", remote_bra
                 timeout=5
             )
         
-        if log_result.returncode == 0 and log_result.stdout.strip():
-            parts = log_result.stdout.strip().split("|", 1)
-            if len(parts) >= 1:
-                result["last_commit_time"] = parts[0]
-            if len(parts) >= 2:
-                result["last_commit_message"] = parts[1]
+        if log_result.returncode == 0:
+            result["last_commit_time"], result["last_commit_message"] = parse_last_commit(log_result.stdout)
         
         # Get modified items from the last commit on assignment branch
         if result["assignment_branch"]:
@@ -495,19 +491,9 @@ def get_git_info(workspace_path: str, developer_name_snake: str = "", remote_bra
             )
         
         if show_result.returncode == 0 and show_result.stdout.strip():
-            files = show_result.stdout.strip().split("\n")
-            # Filter only Check_modules checker files and extract unique item IDs
-            item_ids = set()
-            for file_path in files:
-                # Only look for checker python files: checker/IMP-X-X-X-XX.py
-                if ("Check_modules/" in file_path or "CHECKLIST/Check_modules/" in file_path) and \
-                   "checker/" in file_path and file_path.endswith(".py"):
-                    # Extract item IDs like IMP-8-0-0-01, IMP-10-0-0-00, etc.
-                    match = re.search(r'(IMP-\d+-\d+-\d+-\d+|STA-\d+-\d+-\d+-\d+|MIG-\w+-\d+-\d+-\d+-\d+)', file_path)
-                    if match:
-                        item_ids.add(match.group(1))
-            result["modified_items"] = sorted(list(item_ids))
-            result["modified_files_count"] = len(item_ids)
+            # Item IDs of the checker files in that commit
+            result["modified_items"] = checker_items_from_files(show_result.stdout)
+            result["modified_files_count"] = len(result["modified_items"])
         else:
             # Fallback: check local uncommitted changes
             status_result = subprocess.run(
@@ -527,6 +513,41 @@ def get_git_info(workspace_path: str, developer_name_snake: str = "", remote_bra
     return result
 
 
+def commit_to_activity(commit: dict, developer_name: str, workspace_name: str,
+                       item_status_map: dict) -> dict:
+    """Convert a parsed commit ({hash, time, message}) into an activity dict"""
+    commit_msg = commit["message"]
+    
+    # Parse item_id from commit message if present
+    item_id = None
+    module = None
+    status = "committed"  # Default status
+    
+    match = ITEM_ID_PATTERN.search(commit_msg)
+    if match:
+        item_id = match.group(1)
+        # Extract module from item_id
+        parts_id = item_id.split("-")
+        if len(parts_id) >= 2:
+            module = f"{parts_id[0]}-{parts_id[1]}.0"
+        
+        # Get real status from Excel if available
+        if item_id in item_status_map:
+            status = item_status_map[item_id]['status']
+    
+    return {
+        "id": commit["hash"][:8],
+        "developer": developer_name,
+        "action": commit_msg,
+        "item_id": item_id,
+        "module": module,
+        "message": commit_msg,
+        "status": status,
+        "time": commit["time"],
+        "workspace": workspace_name
+    }
+
+
 def get_recent_commits(workspace_path: str, developer_name: str, workspace_name: str, limit: int = 5) -> List[dict]:
     """Get recent commits from a workspace"""
     commits = []
@@ -544,41 +565,9 @@ def get_recent_commits(workspace_path: str, developer_name: str, workspace_name:
             timeout=10
         )
         
-        if log_result.returncode == 0 and log_result.stdout.strip():
-            for line in log_result.stdout.strip().split("\n"):
-                parts = line.split("|", 2)
-                if len(parts) >= 3:
-                    commit_hash, commit_time, commit_msg = parts
-                    
-                    # Parse item_id from commit message if present
-                    item_id = None
-                    module = None
-                    status = "committed"  # Default status
-                    
-                    if "IMP-" in commit_msg or "STA-" in commit_msg or "MIG-" in commit_msg:
-                        match = re.search(r"(IMP-\d+-\d+-\d+-\d+|STA-\d+-\d+-\d+-\d+|MIG-\w+-\d+-\d+-\d+-\d+)", commit_msg)
-                        if match:
-                            item_id = match.group(1)
-                            # Extract module from item_id
-                            parts_id = item_id.split("-")
-                            if len(parts_id) >= 2:
-                                module = f"{parts_id[0]}-{parts_id[1]}.0"
-                            
-                            # Get real status from Excel if available
-                            if item_id in item_status_map:
-                                status = item_status_map[item_id]['status']
-                    
-                    commits.append({
-                        "id": commit_hash[:8],
-                        "developer": developer_name,
-                        "action": commit_msg,
-                        "item_id": item_id,
-                        "module": module,
-                        "message": commit_msg,
-                        "status": status,
-                        "time": commit_time,
-                        "workspace": workspace_name
-                    })
+        if log_result.returncode == 0:
+            for commit in parse_commit_log(log_result.stdout):
+                commits.append(commit_to_activity(commit, developer_name, workspace_name, item_status_map))
     except Exception as e:
         print(f"Error getting commits for {workspace_path}: {e}")
     
@@ -597,66 +586,75 @@ def is_today(time_str: str) -> bool:
         return False
 
 
+# Background git state collector (created on first use, inside the event loop)
+_git_collector: Optional[GitStatusCollector] = None
+
+
+def get_git_collector() -> GitStatusCollector:
+    """Return the shared dashboard git collector"""
+    global _git_collector
+    if _git_collector is None:
+        _git_collector = GitStatusCollector(WORKSPACES_DIR, get_remote_branches_info)
+    return _git_collector
+
+
+@router.on_event("startup")
+async def start_git_collector():
+    """Collect git state in the background from server start"""
+    get_git_collector().start()
+
+
+@router.on_event("shutdown")
+async def stop_git_collector():
+    if _git_collector is not None:
+        await _git_collector.stop()
+
+
+def build_developer_status(state: WorkspaceGitState) -> DeveloperStatus:
+    """Build a developer's dashboard entry from cached git state"""
+    git_info = state.git_info
+    
+    # Determine status based on activity
+    status = "idle"
+    if git_info["modified_files_count"] > 0:
+        status = "working"
+    elif git_info["last_commit_time"] and is_today(git_info["last_commit_time"]):
+        status = "active"
+    
+    # Use assignment branch if available, otherwise current branch
+    display_branch = git_info["assignment_branch"] or git_info["current_branch"]
+    
+    # Try to get assigned item from branch name
+    # Branch format: assignment/zhongyu_sun_20260106
+    assigned_item = None
+    if display_branch and display_branch not in ["master", "main", "unknown"]:
+        # Extract assignment info from branch name
+        if display_branch.startswith("assignment/"):
+            assigned_item = display_branch.replace("assignment/", "")
+        else:
+            assigned_item = display_branch
+    
+    return DeveloperStatus(
+        developer_name=parse_developer_name(state.workspace_name),
+        workspace_name=state.workspace_name,
+        current_branch=display_branch,
+        last_commit_time=git_info["last_commit_time"],
+        last_commit_message=git_info["last_commit_message"],
+        modified_files_count=git_info["modified_files_count"],
+        modified_items=git_info.get("modified_items", []),
+        status=status,
+        assigned_item=assigned_item
+    )
+
+
 @router.get("/developers", response_model=List[DeveloperStatus])
 async def get_developers_status():
     """Get status of all developers from workspaces"""
-    developers = []
-    
     if not os.path.exists(WORKSPACES_DIR):
-        return developers
+        return []
     
-    # Get remote branches info once (fast, using git ls-remote)
-    remote_branches = await get_remote_branches_info()
-    
-    for workspace_name in os.listdir(WORKSPACES_DIR):
-        workspace_path = os.path.join(WORKSPACES_DIR, workspace_name)
-        
-        if not os.path.isdir(workspace_path):
-            continue
-        
-        # Check if it's a git repository
-        git_dir = os.path.join(workspace_path, ".git")
-        if not os.path.exists(git_dir):
-            continue
-        
-        developer_name = parse_developer_name(workspace_name)
-        # Extract snake_case developer name for branch matching
-        match = re.match(r"(.+?)_workspace_\d+_\d+", workspace_name)
-        developer_name_snake = match.group(1) if match else ""
-        
-        git_info = get_git_info(workspace_path, developer_name_snake, remote_branches)
-        
-        # Determine status based on activity
-        status = "idle"
-        if git_info["modified_files_count"] > 0:
-            status = "working"
-        elif git_info["last_commit_time"] and is_today(git_info["last_commit_time"]):
-            status = "active"
-        
-        # Use assignment branch if available, otherwise current branch
-        display_branch = git_info["assignment_branch"] or git_info["current_branch"]
-        
-        # Try to get assigned item from branch name
-        # Branch format: assignment/zhongyu_sun_20260106
-        assigned_item = None
-        if display_branch and display_branch not in ["master", "main", "unknown"]:
-            # Extract assignment info from branch name
-            if display_branch.startswith("assignment/"):
-                assigned_item = display_branch.replace("assignment/", "")
-            else:
-                assigned_item = display_branch
-        
-        developers.append(DeveloperStatus(
-            developer_name=developer_name,
-            workspace_name=workspace_name,
-            current_branch=display_branch,
-            last_commit_time=git_info["last_commit_time"],
-            last_commit_message=git_info["last_commit_message"],
-            modified_files_count=git_info["modified_files_count"],
-            modified_items=git_info.get("modified_items", []),
-            status=status,
-            assigned_item=assigned_item
-        ))
+    states = await get_git_collector().snapshot()
+    developers = [build_developer_status(state) for state in states.values()]
     
     # Sort by status (working > active > idle), then by name
     status_order = {"working": 0, "active": 1, "idle": 2}
@@ -673,30 +671,15 @@ async def get_recent_activity(limit: int = 20):
     if not os.path.exists(WORKSPACES_DIR):
         return all_activities
     
-    for workspace_name in os.listdir(WORKSPACES_DIR):
-        workspace_path = os.path.join(WORKSPACES_DIR, workspace_name)
-        
-        if not os.path.isdir(workspace_path):
-            continue
-        
-        git_dir = os.path.join(workspace_path, ".git")
-        if not os.path.exists(git_dir):
-            continue
-        
-        developer_name = parse_developer_name(workspace_name)
-        commits = get_recent_commits(workspace_path, developer_name, workspace_name, limit=5)
-        
-        for commit in commits:
-            all_activities.append(ActivityItem(
-                id=commit["id"],
-                developer=commit["developer"],
-                action=commit.get("message", "commit"),
-                item_id=commit.get("item_id"),
-                module=commit.get("module"),
-                status=commit["status"],
-                time=commit["time"],
-                workspace=commit["workspace"]
-            ))
+    states = await get_git_collector().snapshot()
+    # Excel is cached by mtime, but a reload reads the whole workbook
+    item_status_map = await asyncio.to_thread(get_item_status_from_excel)
+    
+    for state in states.values():
+        developer_name = parse_developer_name(state.workspace_name)
+        for commit in state.recent_commits:
+            activity = commit_to_activity(commit, developer_name, state.workspace_name, item_status_map)
+            all_activities.append(ActivityItem(**activity))
     
     # Sort by time (most recent first)
     all_activities.sort(key=lambda a: a.time, reverse=True)
@@ -736,11 +719,6 @@ async def refresh_items():
 @router.get("/stats", response_model=DashboardStats)
 async def get_dashboard_stats():
     """Get dashboard statistics"""
-    total_developers = 0
-    active_developers = 0
-    completed_today = 0
-    total_commits_today = 0
-    
     if not os.path.exists(WORKSPACES_DIR):
         return DashboardStats(
             total_developers=0,
@@ -749,44 +727,48 @@ async def get_dashboard_stats():
             total_commits_today=0
         )
     
-    for workspace_name in os.listdir(WORKSPACES_DIR):
-        workspace_path = os.path.join(WORKSPACES_DIR, workspace_name)
-        
-        if not os.path.isdir(workspace_path):
-            continue
-        
-        git_dir = os.path.join(workspace_path, ".git")
-        if not os.path.exists(git_dir):
-            continue
-        
-        total_developers += 1
-        
-        # Check today's commits
-        try:
-            today = datetime.now().strftime("%Y-%m-%d")
-            log_result = subprocess.run(
-                ["git", "log", f"--since={today} 00:00", "--oneline"],
-                cwd=workspace_path,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            
-            if log_result.returncode == 0 and log_result.stdout.strip():
-                commits = [l for l in log_result.stdout.strip().split("\n") if l]
-                commit_count = len(commits)
-                if commit_count > 0:
-                    active_developers += 1
-                    total_commits_today += commit_count
-                    completed_today += commit_count
-        except Exception as e:
-            print(f"Error getting stats for {workspace_path}: {e}")
+    states = await get_git_collector().snapshot()
+    commits_today = [state.commits_today for state in states.values()]
     
     return DashboardStats(
-        total_developers=total_developers,
-        active_developers=active_developers,
-        completed_today=completed_today,
-        total_commits_today=total_commits_today
+        total_developers=len(states),
+        active_developers=sum(1 for count in commits_today if count > 0),
+        completed_today=sum(commits_today),
+        total_commits_today=sum(commits_today)
+    )
+
+
+@router.get("/stream")
+async def stream_dashboard(request: Request, limit: int = 10):
+    """Push developers / activity / stats via SSE whenever git state changes"""
+    collector = get_git_collector()
+    
+    async def event_generator():
+        async for version in collector.subscribe():
+            if await request.is_disconnected():
+                break
+            if version is None:
+                yield ": keepalive\n\n"
+                continue
+            developers = await get_developers_status()
+            activities = await get_recent_activity(limit)
+            stats = await get_dashboard_stats()
+            payload = {
+                "version": version,
+                "developers": [d.model_dump() for d in developers],
+                "activities": [a.model_dump() for a in activities],
+                "stats": stats.model_dump()
+            }
+            yield f"data: {json.dumps(payload)}\n\n"
+    
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"
+        }
     )
 
 
@@ -805,7 +787,6 @@ async def refresh_from_remote():
         return {"status": "error", "message": "No workspaces found"}
     
     # Fetch all workspaces in parallel (up to 5 at a time)
-    import asyncio
     from concurrent.futures import ThreadPoolExecutor
     
     def fetch_workspace(workspace_name):
@@ -832,14 +813,20 @@ async def refresh_from_remote():
         except Exception as e:
             return {"workspace": workspace_name, "status": "error", "error": str(e)}
     
-    # Fetch workspaces with ThreadPoolExecutor
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        results = list(executor.map(fetch_workspace, workspaces))
+    # Fetch workspaces with ThreadPoolExecutor (off the event loop)
+    def fetch_all():
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            return list(executor.map(fetch_workspace, workspaces))
+    
+    results = await asyncio.to_thread(fetch_all)
     
     # Clear cache to force refresh
     _cache_timestamp = None
     _remote_branches_cache = {}
     
+    # Re-collect git state now (FETCH_HEAD changed) so the next read is current
+    await get_git_collector().refresh()
+    
     success_count = sum(1 for r in results if r["status"] == "success")
     
     return {
@@ -0,0 +1,387 @@
+"""
+Background git status collector for the dashboard.
+
+The dashboard endpoints used to shell out to git several times per developer
+workspace on every request, synchronously, inside async handlers - with
+dozens of workspaces that blocked the event loop for seconds per refresh.
+
+GitStatusCollector keeps a snapshot of every workspace's git state:
+- Collected with asyncio subprocesses, all workspaces concurrently
+- Cached per workspace, keyed by the mtimes of .git/HEAD, logs/HEAD, index,
+  FETCH_HEAD, packed-refs, the `git status --porcelain` output (working tree
+  edits do not touch .git) and the workspace's remote assignment branch SHA;
+  unchanged workspaces are not re-queried
+- Refreshed by a background task; endpoints serve the snapshot instantly
+- Change notifications for the SSE endpoint (/api/dashboard/stream)
+
+Environment variables:
+- DASHBOARD_GIT_POLL_SECONDS: seconds between change checks (default: 15)
+- DASHBOARD_GIT_CONCURRENCY: git subprocesses in flight (default: 8)
+"""
+
+import asyncio
+import os
+import re
+import subprocess
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+ITEM_ID_PATTERN = re.compile(r"(IMP-\d+-\d+-\d+-\d+|STA-\d+-\d+-\d+-\d+|MIG-\w+-\d+-\d+-\d+-\d+)")
+WORKSPACE_NAME_PATTERN = re.compile(r"(.+?)_workspace_\d+_\d+")
+
+# Files whose mtime changes whenever a workspace's git state can change
+# (logs/HEAD: the reflog is appended on every commit, reset, checkout, pull)
+_SIGNATURE_FILES = ("HEAD", "logs/HEAD", "index", "FETCH_HEAD", "packed-refs")
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        value = float(os.environ.get(name, default))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+async def run_git(cwd: str, *args: str, timeout: float = 5) -> Tuple[int, str]:
+    """Run a git command without blocking the event loop; returns (returncode, stdout)."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "git", *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except NotImplementedError:
+        # SelectorEventLoop (uvicorn --reload on Windows) has no subprocess
+        # support: run the blocking call on a worker thread instead
+        try:
+            result = await asyncio.to_thread(
+                subprocess.run, ["git", *args],
+                cwd=cwd, capture_output=True, text=True, timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            raise asyncio.TimeoutError(f"git {' '.join(args)} timed out") from None
+        return result.returncode, result.stdout
+
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stdout.decode("utf-8", errors="replace")
+
+
+def find_assignment_branch(remote_branches: Optional[dict], developer_name_snake: str) -> Optional[str]:
+    """Return the developer's original (earliest) assignment branch, if any."""
+    if not remote_branches or not developer_name_snake:
+        return None
+    assignment_branches = sorted(
+        b for b in remote_branches.keys()
+        if f"assignment/{developer_name_snake}_" in b
+    )
+    return assignment_branches[0] if assignment_branches else None
+
+
+def parse_last_commit(stdout: str) -> Tuple[Optional[str], Optional[str]]:
+    """Parse `git log -1 --format=%ai|%s` into (time, message)."""
+    if not stdout.strip():
+        return None, None
+    parts = stdout.strip().split("|", 1)
+    return parts[0], (parts[1] if len(parts) >= 2 else None)
+
+
+def checker_items_from_files(stdout: str) -> List[str]:
+    """Item IDs of checker scripts in a `git show --name-only` file list."""
+    item_ids = set()
+    for file_path in stdout.strip().split("\n"):
+        # Only look for checker python files: checker/IMP-X-X-X-XX.py
+        if "Check_modules/" in file_path and "checker/" in file_path and file_path.endswith(".py"):
+            match = ITEM_ID_PATTERN.search(file_path)
+            if match:
+                item_ids.add(match.group(1))
+    return sorted(item_ids)
+
+
+def parse_commit_log(stdout: str) -> List[dict]:
+    """Parse `git log --format=%H|%ai|%s` into [{hash, time, message}]."""
+    commits = []
+    for line in stdout.strip().split("\n"):
+        parts = line.split("|", 2)
+        if len(parts) >= 3:
+            commits.append({"hash": parts[0], "time": parts[1], "message": parts[2]})
+    return commits
+
+
+async def collect_git_info(workspace_path: str, developer_name_snake: str = "",
+                           remote_branches: Optional[dict] = None) -> dict:
+    """Async equivalent of dashboard.get_git_info (same result keys)."""
+    result = {
+        "current_branch": "unknown",
+        "assignment_branch": None,
+        "last_commit_time": None,
+        "last_commit_message": None,
+        "modified_files_count": 0,
+        "modified_items": [],
+        "remote_sha": None
+    }
+
+    assignment_branch = find_assignment_branch(remote_branches, developer_name_snake)
+    if assignment_branch:
+        result["assignment_branch"] = assignment_branch
+        result["remote_sha"] = remote_branches.get(assignment_branch)
+    # Prefer the assignment branch (most up-to-date work), else local HEAD
+    ref = f"origin/{assignment_branch}" if assignment_branch else "HEAD"
+
+    try:
+        (branch_rc, branch_out), (log_rc, log_out), (show_rc, show_out) = await asyncio.gather(
+            run_git(workspace_path, "rev-parse", "--abbrev-ref", "HEAD"),
+            run_git(workspace_path, "log", "-1", "--format=%ai|%s", ref),
+            run_git(workspace_path, "show", "--name-only", "--format=", ref),
+        )
+        if branch_rc == 0:
+            result["current_branch"] = branch_out.strip()
+        if log_rc == 0:
+            result["last_commit_time"], result["last_commit_message"] = parse_last_commit(log_out)
+
+        if show_rc == 0 and show_out.strip():
+            result["modified_items"] = checker_items_from_files(show_out)
+            result["modified_files_count"] = len(result["modified_items"])
+        else:
+            # Fallback: check local uncommitted changes
+            status_rc, status_out = await run_git(workspace_path, "--no-optional-locks", "status", "--porcelain")
+            if status_rc == 0:
+                result["modified_files_count"] = len([l for l in status_out.strip().split("\n") if l])
+    except Exception as e:
+        print(f"Error getting git info for {workspace_path}: {e}")
+
+    return result
+
+
+@dataclass
+class WorkspaceGitState:
+    """Cached git state of one developer workspace."""
+
+    workspace_name: str
+    developer_name_snake: str
+    signature: tuple
+    git_info: dict
+    recent_commits: List[dict] = field(default_factory=list)  # [{hash, time, message}]
+    commits_today: int = 0
+
+    def view(self) -> tuple:
+        """What the dashboard shows (the signature aside)."""
+        return (self.git_info, self.recent_commits, self.commits_today)
+
+
+class GitStatusCollector:
+    """Keeps an up-to-date snapshot of git state for all workspaces."""
+
+    def __init__(
+        self,
+        workspaces_dir: str,
+        remote_branches_provider: Optional[Callable[[], Awaitable[dict]]] = None,
+        poll_seconds: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        commit_limit: int = 5,
+    ) -> None:
+        """
+        Args:
+            workspaces_dir: Directory containing the developer workspaces
+            remote_branches_provider: Async callable returning {branch: sha}
+                                      of the remote assignment branches
+            poll_seconds: Seconds between change checks
+            concurrency: git subprocesses in flight
+            commit_limit: Recent commits kept per workspace
+        """
+        self.workspaces_dir = workspaces_dir
+        self.remote_branches_provider = remote_branches_provider
+        self.poll_seconds = poll_seconds or _env_number("DASHBOARD_GIT_POLL_SECONDS", 15)
+        self.concurrency = int(concurrency or _env_number("DASHBOARD_GIT_CONCURRENCY", 8))
+        self.commit_limit = commit_limit
+
+        self.version = 0
+        self.last_refresh: Optional[datetime] = None
+        self._states: Dict[str, WorkspaceGitState] = {}
+        self._lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._task: Optional[asyncio.Task] = None
+        self._subscribers: List[asyncio.Queue] = []
+
+    def _list_workspaces(self) -> List[str]:
+        if not os.path.isdir(self.workspaces_dir):
+            return []
+        return sorted(
+            name for name in os.listdir(self.workspaces_dir)
+            if os.path.exists(os.path.join(self.workspaces_dir, name, ".git"))
+        )
+
+    async def _signature(self, workspace_path: str, remote_sha: Optional[str]) -> tuple:
+        git_dir = os.path.join(workspace_path, ".git")
+        mtimes = []
+        for name in _SIGNATURE_FILES:
+            try:
+                mtimes.append(os.stat(os.path.join(git_dir, name)).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        # Uncommitted edits only show up in `git status`. --no-optional-locks
+        # (here and in collect_git_info) stops it from rewriting the index,
+        # which would change the index mtime and race the developer's own git
+        status = None
+        async with self._semaphore:
+            try:
+                status_rc, status_out = await run_git(workspace_path, "--no-optional-locks", "status", "--porcelain")
+                if status_rc == 0:
+                    status = status_out
+            except (OSError, asyncio.TimeoutError):
+                pass
+        # The date is part of the key: "today" commit counts roll over at midnight
+        return (*mtimes, status, remote_sha, datetime.now().strftime("%Y-%m-%d"))
+
+    async def _collect(self, workspace_name: str, developer_name_snake: str,
+                       signature: tuple, remote_branches: dict) -> WorkspaceGitState:
+        workspace_path = os.path.join(self.workspaces_dir, workspace_name)
+        today = datetime.now().strftime("%Y-%m-%d")
+        async with self._semaphore:
+            git_info, commits, today_log = await asyncio.gather(
+                collect_git_info(workspace_path, developer_name_snake, remote_branches),
+                run_git(workspace_path, "log", f"-{self.commit_limit}", "--format=%H|%ai|%s", timeout=10),
+                run_git(workspace_path, "log", f"--since={today} 00:00", "--oneline"),
+                return_exceptions=True,
+            )
+        if isinstance(git_info, BaseException):
+            raise git_info
+
+        recent_commits: List[dict] = []
+        if isinstance(commits, BaseException):
+            print(f"Error getting commits for {workspace_path}: {commits}")
+        elif commits[0] == 0:
+            recent_commits = parse_commit_log(commits[1])
+
+        commits_today = 0
+        if isinstance(today_log, BaseException):
+            print(f"Error getting stats for {workspace_path}: {today_log}")
+        elif today_log[0] == 0:
+            commits_today = len([l for l in today_log[1].strip().split("\n") if l])
+
+        return WorkspaceGitState(
+            workspace_name=workspace_name,
+            developer_name_snake=developer_name_snake,
+            signature=signature,
+            git_info=git_info,
+            recent_commits=recent_commits,
+            commits_today=commits_today,
+        )
+
+    async def refresh(self, force: bool = False) -> bool:
+        """
+        Re-collect workspaces whose git state changed (all of them if force).
+
+        Returns:
+            True if the snapshot changed
+        """
+        async with self._lock:
+            remote_branches = {}
+            if self.remote_branches_provider is not None:
+                try:
+                    remote_branches = await self.remote_branches_provider() or {}
+                except Exception as e:
+                    print(f"Error getting remote branches: {e}")
+
+            workspaces = self._list_workspaces()
+            snakes = []
+            for workspace_name in workspaces:
+                match = WORKSPACE_NAME_PATTERN.match(workspace_name)
+                snakes.append(match.group(1) if match else "")
+            branches = [find_assignment_branch(remote_branches, snake) for snake in snakes]
+            signatures = await asyncio.gather(*(
+                self._signature(
+                    os.path.join(self.workspaces_dir, workspace_name),
+                    remote_branches.get(branch) if branch else None,
+                )
+                for workspace_name, branch in zip(workspaces, branches)
+            ))
+            stale = []
+            for workspace_name, developer_name_snake, signature in zip(workspaces, snakes, signatures):
+                cached = self._states.get(workspace_name)
+                if force or cached is None or cached.signature != signature:
+                    stale.append((workspace_name, developer_name_snake, signature))
+
+            collected = await asyncio.gather(
+                *(self._collect(name, snake, sig, remote_branches) for name, snake, sig in stale),
+                return_exceptions=True,
+            )
+            changed = False
+            for (workspace_name, _, _), state in zip(stale, collected):
+                if isinstance(state, BaseException):
+                    print(f"Error collecting git state for {workspace_name}: {state}")
+                    continue
+                cached = self._states.get(workspace_name)
+                if cached is None or cached.view() != state.view():
+                    changed = True
+                self._states[workspace_name] = state
+            for workspace_name in set(self._states) - set(workspaces):
+                del self._states[workspace_name]
+                changed = True
+
+            self.last_refresh = datetime.now()
+            if changed or self.version == 0:
+                self.version += 1
+                self._notify()
+            return changed
+
+    async def snapshot(self) -> Dict[str, WorkspaceGitState]:
+        """Current per-workspace state (collected on first use, then cached)."""
+        self.start()
+        if self.last_refresh is None:
+            await self.refresh()
+        return dict(self._states)
+
+    def start(self) -> None:
+        """Start the background refresh task (idempotent; needs a running loop)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._poll())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _poll(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"Dashboard git refresh failed: {e}")
+            await asyncio.sleep(self.poll_seconds)
+
+    def _notify(self) -> None:
+        for queue in self._subscribers:
+            if queue.empty():
+                queue.put_nowait(self.version)
+
+    async def subscribe(self, keepalive: float = 15) -> AsyncIterator[Optional[int]]:
+        """
+        Yield the snapshot version now and after every change; None every
+        keepalive seconds without a change.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._subscribers.append(queue)
+        try:
+            await self.snapshot()
+            yield self.version
+            while True:
+                try:
+                    await asyncio.wait_for(queue.get(), keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                yield self.version
+        finally:
+            self._subscribers.remove(queue)
@@ -9,7 +9,12 @@ from typing import List, Dict, Any
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 import yaml
-import glob
+
+# "**" patterns are answered from a shared, incrementally refreshed file tree index
+try:
+    from utils.file_tree_index import glob_files
+except ImportError:
+    from AutoGenChecker.utils.file_tree_index import glob_files
 
 router = APIRouter()
 
@@ -61,7 +66,7 @@ def expand_file_patterns(patterns: List[str]) -> List[str]:
         expanded_pattern = expand_checklist_root(pattern)
         
         # Glob expansion
-        matched_files = glob.glob(expanded_pattern, recursive=True)
+        matched_files = glob_files(expanded_pattern)
         if matched_files:
             expanded_files.extend(matched_files)
         else:
@@ -9,6 +9,7 @@ in workflow/mixins/file_analysis_mixin.py
 import os
 import sys
 import glob
+import asyncio
 import json
 import re
 from pathlib import Path
@@ -16,11 +17,13 @@ from typing import Dict, Any, List
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-# Import LLM models
+# Import LLM models and the line-indexed file reader
 try:
     from utils.models import LLMCallConfig
+    from utils.file_index import get_line_index, read_text_head
 except ImportError:
     from AutoGenChecker.utils.models import LLMCallConfig
+    from AutoGenChecker.utils.file_index import get_line_index, read_text_head
 
 router = APIRouter()
 
@@ -110,10 +113,10 @@ async def get_file_stats(request: FileStatsRequest) -> Dict[str, Any]:
         else:
             size_str = f"{size_bytes / (1024 * 1024):.1f} MB"
         
-        # Count lines
+        # Count lines (binary chunked scan, cached by size/mtime; off the event loop)
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                line_count = sum(1 for _ in f)
+            index = await asyncio.to_thread(get_line_index, file_path)
+            line_count = index.line_count
         except Exception:
             line_count = "?"
         
@@ -137,6 +140,8 @@ class FileContentRequest(BaseModel):
     """File content request model."""
     file_path: str
     max_lines: int = 500  # Limit lines for large files
+    start_line: int = 1  # 1-based first line of the window
+    from_end: bool = False  # Show the last max_lines lines instead (tail)
 
 
 @router.post("/file-content")
@@ -144,8 +149,11 @@ async def get_file_content(request: FileContentRequest) -> Dict[str, Any]:
     """
     Get file content for display.
     
+    Serves a window of max_lines lines starting at start_line (or the last
+    max_lines lines with from_end) by seeking via the file's line index.
+    
     Args:
-        request: File path and max lines to read
+        request: File path and the line window to read
         
     Returns:
         Dict with file content and metadata
@@ -168,26 +176,25 @@ async def get_file_content(request: FileContentRequest) -> Dict[str, Any]:
                 "truncated": False
             }
         
-        # Read file content
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-        
-        total_lines = len(lines)
-        truncated = total_lines > request.max_lines
+        # Read only the requested window (off the event loop)
+        def read_window():
+            index = get_line_index(file_path)
+            if request.from_end:
+                start = max(0, index.line_count - request.max_lines)
+            else:
+                start = max(0, request.start_line - 1)
+            return index.line_count, start, index.read_lines(start, request.max_lines)
         
-        # Limit to max_lines
-        if truncated:
-            content = ''.join(lines[:request.max_lines])
-        else:
-            content = ''.join(lines)
+        total_lines, start, lines = await asyncio.to_thread(read_window)
         
         return {
             "success": True,
-            "content": content,
+            "content": ''.join(lines),
             "error": None,
             "total_lines": total_lines,
-            "truncated": truncated,
-            "shown_lines": min(total_lines, request.max_lines)
+            "truncated": len(lines) < total_lines,
+            "shown_lines": len(lines),
+            "start_line": start + 1
         }
         
     except Exception as e:
@@ -200,6 +207,46 @@ async def get_file_content(request: FileContentRequest) -> Dict[str, Any]:
         }
 
 
+class FileSearchRequest(BaseModel):
+    """File keyword search request model."""
+    file_path: str
+    keywords: List[str]
+    max_hits: int = 100
+    ignore_case: bool = True
+
+
+@router.post("/file-search")
+async def search_file(request: FileSearchRequest) -> Dict[str, Any]:
+    """
+    Find lines containing any of the keywords.
+    
+    Args:
+        request: File path, keywords and hit limit
+        
+    Returns:
+        Dict with hits ([{line, text}], 1-based line numbers)
+    """
+    file_path = Path(expand_path_variables(request.file_path).replace('/', os.sep).replace('\\', os.sep))
+    
+    if not file_path.exists():
+        return {"success": False, "hits": [], "error": f"File not found: {file_path}"}
+    
+    try:
+        def search():
+            index = get_line_index(file_path)
+            return index.search(request.keywords, request.max_hits, request.ignore_case)
+        
+        hits = await asyncio.to_thread(search)
+        return {
+            "success": True,
+            "hits": [{"line": line, "text": text} for line, text in hits],
+            "error": None,
+            "truncated": len(hits) >= request.max_hits
+        }
+    except Exception as e:
+        return {"success": False, "hits": [], "error": str(e)}
+
+
 @router.post("/analyze-file")
 async def analyze_file(request: FileAnalysisRequest) -> Dict[str, Any]:
     """
@@ -238,21 +285,19 @@ async def analyze_file(request: FileAnalysisRequest) -> Dict[str, Any]:
         # Read ENTIRE file content - LLM needs complete context to find relevant patterns
         # Modern LLMs can handle large context, and checker analysis requires seeing all data
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()  # Read entire file
-                
-                # Only limit if file is extremely large (>500KB)
-                # Most report/log files are under this size
-                max_bytes = 500 * 1024
-                if len(content.encode('utf-8')) > max_bytes:
-                    # Keep first 80% to capture most patterns
-                    truncate_point = int(len(content) * 0.8)
-                    content = content[:truncate_point]
-                    content += "\n\n... [File truncated - showing first 80% for analysis] ..."
-                
-                line_count = content.count('\n') + 1
-                print(f"[DEBUG] File content: {len(content)} chars, {line_count} lines")
-                print(f"[DEBUG] First 500 chars:\n{content[:500]}")
+            # Only limit if file is extremely large (>500KB)
+            # Most report/log files are under this size
+            max_bytes = 500 * 1024
+            content, truncated = await asyncio.to_thread(read_text_head, file_path, max_bytes)
+            if truncated:
+                # Keep the leading 500KB (whole lines) to capture most patterns
+                shown = content.count('\n')
+                total = (await asyncio.to_thread(get_line_index, file_path)).line_count
+                content += f"\n\n... [File truncated - showing first {shown} of {total} lines for analysis] ..."
+            
+            line_count = content.count('\n') + 1
+            print(f"[DEBUG] File content: {len(content)} chars, {line_count} lines")
+            print(f"[DEBUG] First 500 chars:\n{content[:500]}")
                     
         except Exception as e:
             raise HTTPException(
@@ -1017,11 +1062,8 @@ async def refine_analysis(request: RefineAnalysisRequest):
         # Read file content for context
         file_path = Path(expand_path_variables(request.file_path))
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                # Limit to 100KB for context
-                if len(content) > 100 * 1024:
-                    content = content[:100 * 1024]
+            # Limit to 100KB for context
+            content, _ = await asyncio.to_thread(read_text_head, file_path, 100 * 1024)
         except Exception as e:
             content = "[File content unavailable]"
         
@@ -12,12 +12,15 @@ Key features matching CLI's intelligent_agent:
 4. Load hints from hints.txt for resume functionality
 """
 
+import json
 import os
 import sys
+import traceback
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 router = APIRouter()
@@ -262,6 +265,7 @@ class ReadmeGenerationRequest(BaseModel):
     llm_provider: str = 'jedai'
     llm_model: str = 'claude-sonnet-4-5'
     hints: str = ''  # User hints for README generation
+    regenerate: bool = False  # Skip the LLM response cache
 
 
 class LoadHintsRequest(BaseModel):
@@ -478,6 +482,144 @@ async def load_readme(request: LoadHintsRequest):
         )
 
 
+def _prepare_readme_generation(request: ReadmeGenerationRequest):
+    """
+    Steps 3.1-3.2 plus client/prompt setup shared by the plain and the
+    streaming endpoint.
+
+    Returns: (llm_client, prompt, config, backup_path)
+    """
+    # Import LLM client manager
+    _backend_dir = Path(__file__).resolve().parent.parent.parent
+    if str(_backend_dir) not in sys.path:
+        sys.path.insert(0, str(_backend_dir))
+    
+    from llm_client_manager import llm_client_manager
+    
+    print(f"[Step3] 📝 Generating README for {request.item_id}")
+    print(f"[Step3] LLM Provider: {request.llm_provider}, Model: {request.llm_model}")
+    
+    # Step 3.1: Backup existing README template BEFORE AI generation
+    backup_path = backup_readme_template(request.module, request.item_id)
+    if backup_path:
+        print(f"[Step3] ✅ Backup created: {backup_path}")
+    
+    # Step 3.2: Save user hints to hints.txt (if provided AND different from latest)
+    if request.hints and request.hints.strip():
+        # Check if this is actually new content (not just loaded from history)
+        existing_hints = load_hints_from_file(request.module, request.item_id)
+        should_save = True
+        
+        if existing_hints:
+            latest_hints = existing_hints.get('latest', '')
+            # Don't save if hints are exactly the same as latest version
+            # Also check if it's just a numbered version (1) xxx\n\n2) xxx pattern)
+            if latest_hints == request.hints:
+                should_save = False
+                print(f"[Step3] ℹ️ Hints unchanged, skipping save")
+        
+        if should_save:
+            hints_saved = save_hints_to_file(request.module, request.item_id, request.hints)
+            if hints_saved:
+                print(f"[Step3] ✅ Hints saved to Work/phase-1-dev/{request.module}/hints.txt")
+    
+    # Import LLM utilities
+    _tool_dir = Path(__file__).resolve().parent.parent.parent.parent
+    if str(_tool_dir) not in sys.path:
+        sys.path.insert(0, str(_tool_dir))
+    
+    try:
+        from utils.models import LLMCallConfig
+    except ImportError:
+        from AutoGenChecker.utils.models import LLMCallConfig
+    
+    # Get or create LLM client (reuses existing instance)
+    llm_client = llm_client_manager.get_client(
+        provider=request.llm_provider,
+        model=request.llm_model,
+        verbose=True
+    )
+    
+    print(f"[Step3] LLM client ready: {type(llm_client)}")
+    
+    # Build README generation prompt
+    prompt = build_readme_generation_prompt(
+        module=request.module,
+        item_id=request.item_id,
+        item_name=request.item_name,
+        description=request.description,
+        input_files=request.input_files,
+        file_analysis=request.file_analysis,
+        hints=request.hints
+    )
+    
+    print(f"[Step3] Prompt built, length: {len(prompt)} chars")
+    
+    # Call LLM with appropriate config
+    config = LLMCallConfig(
+        model=request.llm_model,
+        temperature=0.3,  # Medium temp for creativity
+        max_tokens=16000,  # Large for comprehensive README
+        use_cache=not request.regenerate  # Re-generate asks for a fresh answer
+    )
+    return llm_client, prompt, config, backup_path
+
+
+def _finalize_readme(readme_content: str, request: ReadmeGenerationRequest,
+                     backup_path: Optional[str]) -> Dict[str, Any]:
+    """Unwrap the LLM output, save it (step 3.3) and build the API result."""
+    print(f"[Step3] README generated, length: {len(readme_content)} chars")
+    print(f"[Step3] First 200 chars: {readme_content[:200]}")
+    
+    # Extract README from markdown code block ONLY if LLM wrapped it
+    # (be careful not to extract code blocks INSIDE the README)
+    original_content = readme_content
+    extracted_content = None
+    
+    if '```markdown' in readme_content:
+        print(f"[Step3] Found ```markdown block, attempting extraction...")
+        start = readme_content.find('```markdown') + len('```markdown')
+        end = readme_content.find('```', start)
+        if end != -1:
+            extracted_content = readme_content[start:end].strip()
+    elif readme_content.startswith('```'):
+        # Only extract if the ENTIRE response is wrapped in a code block
+        print(f"[Step3] Content starts with ```, attempting extraction...")
+        start = 3
+        # Skip language identifier if present
+        first_newline = readme_content.find('\n', start)
+        if first_newline != -1:
+            start = first_newline + 1
+        end = readme_content.rfind('```')
+        if end > start:
+            extracted_content = readme_content[start:end].strip()
+    
+    # Validate extraction: README should start with # (markdown heading)
+    if extracted_content:
+        if extracted_content.startswith('#') and len(extracted_content) > 100:
+            readme_content = extracted_content
+            print(f"[Step3] ✅ Extracted valid README: {len(readme_content)} chars")
+        else:
+            readme_content = original_content
+            print(f"[Step3] ⚠️ Extraction invalid (len={len(extracted_content)}, starts={extracted_content[:20]}), using original")
+    else:
+        print(f"[Step3] No extraction needed, using original content")
+    
+    print(f"[Step3] Final README length: {len(readme_content)} chars")
+    
+    # Step 3.3: Save generated README to file (CRITICAL for resume)
+    saved_path = save_readme_to_file(readme_content, request.module, request.item_id)
+    print(f"[Step3] ✅ README saved to: {saved_path}")
+    
+    return {
+        "readme": readme_content,
+        "status": "success",
+        "message": f"Generated {len(readme_content)} characters",
+        "saved_path": saved_path,
+        "backup_path": backup_path
+    }
+
+
 @router.post("/generate-readme")
 async def generate_readme(request: ReadmeGenerationRequest):
     """
@@ -492,133 +634,12 @@ async def generate_readme(request: ReadmeGenerationRequest):
     4. Save generated README to file path
     """
     try:
-        # Import LLM client manager
-        _backend_dir = Path(__file__).resolve().parent.parent.parent
-        if str(_backend_dir) not in sys.path:
-            sys.path.insert(0, str(_backend_dir))
-        
-        from llm_client_manager import llm_client_manager
+        llm_client, prompt, config, backup_path = _prepare_readme_generation(request)
         
-        print(f"[Step3] 📝 Generating README for {request.item_id}")
-        print(f"[Step3] LLM Provider: {request.llm_provider}, Model: {request.llm_model}")
-        
-        # Step 3.1: Backup existing README template BEFORE AI generation
-        backup_path = backup_readme_template(request.module, request.item_id)
-        if backup_path:
-            print(f"[Step3] ✅ Backup created: {backup_path}")
-        
-        # Step 3.2: Save user hints to hints.txt (if provided AND different from latest)
-        if request.hints and request.hints.strip():
-            # Check if this is actually new content (not just loaded from history)
-            existing_hints = load_hints_from_file(request.module, request.item_id)
-            should_save = True
-            
-            if existing_hints:
-                latest_hints = existing_hints.get('latest', '')
-                # Don't save if hints are exactly the same as latest version
-                # Also check if it's just a numbered version (1) xxx\n\n2) xxx pattern)
-                if latest_hints == request.hints:
-                    should_save = False
-                    print(f"[Step3] ℹ️ Hints unchanged, skipping save")
-            
-            if should_save:
-                hints_saved = save_hints_to_file(request.module, request.item_id, request.hints)
-                if hints_saved:
-                    print(f"[Step3] ✅ Hints saved to Work/phase-1-dev/{request.module}/hints.txt")
-        
-        # Import LLM utilities
-        _tool_dir = Path(__file__).resolve().parent.parent.parent.parent
-        if str(_tool_dir) not in sys.path:
-            sys.path.insert(0, str(_tool_dir))
-        
-        try:
-            from utils.models import LLMCallConfig
-        except ImportError:
-            from AutoGenChecker.utils.models import LLMCallConfig
-        
-        # Get or create LLM client (reuses existing instance)
-        llm_client = llm_client_manager.get_client(
-            provider=request.llm_provider,
-            model=request.llm_model,
-            verbose=True
-        )
-        
-        print(f"[Step3] LLM client ready: {type(llm_client)}")
-        
-        # Build README generation prompt
-        prompt = build_readme_generation_prompt(
-            module=request.module,
-            item_id=request.item_id,
-            item_name=request.item_name,
-            description=request.description,
-            input_files=request.input_files,
-            file_analysis=request.file_analysis,
-            hints=request.hints
-        )
-        
-        print(f"[Step3] Prompt built, length: {len(prompt)} chars")
         print(f"[Step3] 🤖 Calling LLM to generate README...")
-        
-        # Call LLM with appropriate config
-        config = LLMCallConfig(
-            model=request.llm_model,
-            temperature=0.3,  # Medium temp for creativity
-            max_tokens=16000  # Large for comprehensive README
-        )
-        
         llm_response = llm_client.complete(prompt, config=config)
-        readme_content = llm_response.text
-        
-        print(f"[Step3] README generated, length: {len(readme_content)} chars")
-        print(f"[Step3] First 200 chars: {readme_content[:200]}")
-        
-        # Extract README from markdown code block ONLY if LLM wrapped it
-        # (be careful not to extract code blocks INSIDE the README)
-        original_content = readme_content
-        extracted_content = None
         
-        if '```markdown' in readme_content:
-            print(f"[Step3] Found ```markdown block, attempting extraction...")
-            start = readme_content.find('```markdown') + len('```markdown')
-            end = readme_content.find('```', start)
-            if end != -1:
-                extracted_content = readme_content[start:end].strip()
-        elif readme_content.startswith('```'):
-            # Only extract if the ENTIRE response is wrapped in a code block
-            print(f"[Step3] Content starts with ```, attempting extraction...")
-            start = 3
-            # Skip language identifier if present
-            first_newline = readme_content.find('\n', start)
-            if first_newline != -1:
-                start = first_newline + 1
-            end = readme_content.rfind('```')
-            if end > start:
-                extracted_content = readme_content[start:end].strip()
-        
-        # Validate extraction: README should start with # (markdown heading)
-        if extracted_content:
-            if extracted_content.startswith('#') and len(extracted_content) > 100:
-                readme_content = extracted_content
-                print(f"[Step3] ✅ Extracted valid README: {len(readme_content)} chars")
-            else:
-                readme_content = original_content
-                print(f"[Step3] ⚠️ Extraction invalid (len={len(extracted_content)}, starts={extracted_content[:20]}), using original")
-        else:
-            print(f"[Step3] No extraction needed, using original content")
-        
-        print(f"[Step3] Final README length: {len(readme_content)} chars")
-        
-        # Step 3.3: Save generated README to file (CRITICAL for resume)
-        saved_path = save_readme_to_file(readme_content, request.module, request.item_id)
-        print(f"[Step3] ✅ README saved to: {saved_path}")
-        
-        return {
-            "readme": readme_content,
-            "status": "success",
-            "message": f"Generated {len(readme_content)} characters",
-            "saved_path": saved_path,
-            "backup_path": backup_path
-        }
+        return _finalize_readme(llm_response.text, request, backup_path)
         
     except ImportError as e:
         print(f"[Step3] ❌ Import failed: {e}")
@@ -636,6 +657,56 @@ async def generate_readme(request: ReadmeGenerationRequest):
         )
 
 
+def generate_readme_events(request: ReadmeGenerationRequest):
+    """
+    Generator for streaming README generation via SSE.
+    
+    Events:
+    - {'type': 'token', 'text': ...}: next chunk of LLM output
+    - {'type': 'complete', 'status': 'success', ...}: same fields as /generate-readme
+    - {'type': 'complete', 'status': 'error', 'error': ...}
+    
+    A plain (sync) generator: Starlette iterates it in a worker thread, so the
+    blocking LLM stream does not stall the event loop.
+    """
+    try:
+        llm_client, prompt, config, backup_path = _prepare_readme_generation(request)
+        
+        print("[Step3] 🤖 Streaming README from LLM...")
+        chunks = []
+        for chunk in llm_client.complete_stream(prompt, config=config):
+            chunks.append(chunk)
+            yield f"data: {json.dumps({'type': 'token', 'text': chunk})}\n\n"
+        
+        result = _finalize_readme(''.join(chunks), request, backup_path)
+        yield f"data: {json.dumps({'type': 'complete', **result})}\n\n"
+        
+    except Exception as e:
+        error_msg = f"README generation failed: {str(e)}"
+        print(f"[Step3] ❌ {error_msg}")
+        traceback.print_exc()
+        yield f"data: {json.dumps({'type': 'complete', 'status': 'error', 'error': error_msg})}\n\n"
+
+
+@router.post("/generate-readme-stream")
+async def generate_readme_stream(request: ReadmeGenerationRequest):
+    """
+    Stream README generation token by token via Server-Sent Events.
+    
+    Returns:
+        StreamingResponse with SSE events (see generate_readme_events)
+    """
+    return StreamingResponse(
+        generate_readme_events(request),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
 def build_readme_generation_prompt(
     module: str,
     item_id: str,
@@ -234,7 +234,8 @@ async def generate_code(request: CodeGenerationRequest):
                 phases_log.append("    ⚠️ CLI agent not available, using fallback...")
                 code, quality_score, warnings = generate_code_fallback(
                     config, file_analysis_dict, request.readme, 
-                    existing_skeleton, request.llm_provider, request.llm_model
+                    existing_skeleton, request.llm_provider, request.llm_model,
+                    use_cache=not request.regenerate
                 )
                 
                 # Save and return
@@ -281,6 +282,7 @@ async def generate_code(request: CodeGenerationRequest):
                 config=config,
                 file_analysis=file_analysis_dict,
                 readme=request.readme,
+                use_cache=not request.regenerate,  # Regenerate asks for fresh code
             )
         finally:
             # Always restore stdout
@@ -354,6 +356,7 @@ def generate_code_fallback(
     existing_skeleton: str,
     llm_provider: str,
     llm_model: str,
+    use_cache: bool = True,
 ) -> tuple:
     """
     Fallback code generation when CLI agent is not available.
@@ -376,7 +379,7 @@ def generate_code_fallback(
     prompt = build_fallback_prompt(config, file_analysis, readme, existing_skeleton)
     
     # Call LLM
-    llm_config = LLMCallConfig(temperature=0.2, max_tokens=64000)
+    llm_config = LLMCallConfig(temperature=0.2, max_tokens=64000, use_cache=use_cache)
     response = llm_client.complete(prompt, config=llm_config)
     
     # Extract code
@@ -104,6 +104,113 @@ async def get_test_types():
     return {"test_types": TEST_TYPES}
 
 
+def _build_test_config(agent, request, test_type: str, paths) -> Optional[dict]:
+    """
+    Generate the config for one test type, make its input paths portable
+    and save it to test_inputs/items/{item_id}_test_{type}.yaml.
+    
+    Returns:
+        The flat item config, or None if it could not be generated
+    """
+    import yaml
+    
+    # Debug: Log the incoming config
+    print(f"[DEBUG] Step 7 test config for {test_type}")
+    print(f"[DEBUG] request.config keys: {request.config.keys() if request.config else 'None'}")
+    print(f"[DEBUG] request.config.input_files: {request.config.get('input_files', 'NOT FOUND')}")
+    
+    # Generate test config
+    test_config = agent._generate_test_config(
+        test_id=test_type,
+        config=request.config,
+        readme=request.readme
+    )
+    
+    print(f"[DEBUG] Generated test_config: {test_config}")
+    
+    if not test_config:
+        return None
+    
+    # Save test config to temporary file (flat format matching original YAML)
+    test_config_dir = paths.workspace_root / "Check_modules" / request.module / "test_inputs" / "items"
+    test_config_dir.mkdir(parents=True, exist_ok=True)
+    
+    test_config_file = test_config_dir / f"{request.item_id}_test_{test_type}.yaml"
+    
+    # Convert input_files paths back to ${CHECKLIST_ROOT} format for portability
+    portable_input_files = []
+    workspace_root_str = str(paths.workspace_root).replace('\\', '/')
+    for input_file in test_config.get('input_files', []):
+        input_file_str = str(input_file).replace('\\', '/')
+        # Replace absolute path with ${CHECKLIST_ROOT} variable
+        if workspace_root_str in input_file_str:
+            portable_path = input_file_str.replace(workspace_root_str, '${CHECKLIST_ROOT}')
+            portable_input_files.append(portable_path)
+        elif input_file_str.startswith('${CHECKLIST_ROOT}'):
+            # Already in portable format
+            portable_input_files.append(input_file_str)
+        else:
+            # Relative path - prepend ${CHECKLIST_ROOT}
+            portable_input_files.append(f'${{CHECKLIST_ROOT}}/{input_file_str.lstrip("/")}')
+    
+    # Update test_config with portable paths
+    test_config['input_files'] = portable_input_files
+    
+    # Save as flat format (no item_id/module at root, just the config fields)
+    # This matches the format in README examples
+    with open(test_config_file, 'w', encoding='utf-8') as f:
+        yaml.dump(test_config, f, default_flow_style=False, allow_unicode=True)
+    
+    return test_config
+
+
+def _run_sandboxed(request, variants: Dict[str, dict], paths) -> Dict[str, Any]:
+    """
+    Save the code under test and run the variants concurrently, each in its
+    own sandbox root (see workflow/sandbox_runner.py). The real
+    inputs/items/ YAML is never swapped; per-type log/report files are
+    copied to test_outputs/.
+    """
+    from workflow.sandbox_runner import SandboxTestRunner
+    
+    # Save code to checker location
+    checker_file = paths.workspace_root / "Check_modules" / request.module / "scripts" / "checker" / f"{request.item_id}.py"
+    checker_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(checker_file, 'w', encoding='utf-8') as f:
+        f.write(request.code)
+    
+    runner = SandboxTestRunner(paths.workspace_root, request.module, request.item_id, request.code, timeout=60)
+    outcomes = runner.run(variants)
+    runner.save_outputs(outcomes)
+    return outcomes
+
+
+def _response_from_outcome(outcome, test_config: dict) -> TestResponse:
+    """Build the TestResponse for one sandboxed variant run."""
+    if outcome.error:
+        return TestResponse(
+            status="error",
+            test_passed=False,
+            check_result="ERROR",
+            error=f"Test execution failed: {outcome.error}",
+            execution_time=outcome.execution_time,
+            test_config=test_config
+        )
+    
+    check_result = outcome.check_result
+    return TestResponse(
+        status="success",
+        test_passed=check_result == 'PASS',
+        check_result=check_result,
+        output=outcome.stdout,
+        log_output=outcome.log,
+        report_output=outcome.report,
+        stderr=outcome.stderr if outcome.stderr else None,
+        execution_time=outcome.execution_time,
+        test_config=test_config
+    )
+
+
 @router.post("/run-test", response_model=TestResponse)
 async def run_test(request: TestRequest):
     """
@@ -122,11 +229,6 @@ async def run_test(request: TestRequest):
     """
     try:
         from workflow.intelligent_agent import IntelligentCheckerAgent
-        import time
-        import subprocess
-        import sys
-        import shutil
-        import yaml
         
         try:
             from utils.paths import discover_project_paths
@@ -143,22 +245,7 @@ async def run_test(request: TestRequest):
             interactive=False
         )
         
-        start_time = time.time()
-        
-        # Debug: Log the incoming config
-        print(f"[DEBUG] Step 7 run_test called for {request.test_type}")
-        print(f"[DEBUG] request.config keys: {request.config.keys() if request.config else 'None'}")
-        print(f"[DEBUG] request.config.input_files: {request.config.get('input_files', 'NOT FOUND')}")
-        
-        # Generate test config
-        test_config = agent._generate_test_config(
-            test_id=request.test_type,
-            config=request.config,
-            readme=request.readme
-        )
-        
-        print(f"[DEBUG] Generated test_config: {test_config}")
-        
+        test_config = _build_test_config(agent, request, request.test_type, paths)
         if not test_config:
             return TestResponse(
                 status="error",
@@ -167,125 +254,8 @@ async def run_test(request: TestRequest):
                 error=f"Could not generate test config for {request.test_type}"
             )
         
-        # Save test config to temporary file (flat format matching original YAML)
-        test_config_dir = paths.workspace_root / "Check_modules" / request.module / "test_inputs" / "items"
-        test_config_dir.mkdir(parents=True, exist_ok=True)
-        
-        test_config_file = test_config_dir / f"{request.item_id}_test_{request.test_type}.yaml"
-        
-        # Convert input_files paths back to ${CHECKLIST_ROOT} format for portability
-        portable_input_files = []
-        workspace_root_str = str(paths.workspace_root).replace('\\', '/')
-        for input_file in test_config.get('input_files', []):
-            input_file_str = str(input_file).replace('\\', '/')
-            # Replace absolute path with ${CHECKLIST_ROOT} variable
-            if workspace_root_str in input_file_str:
-                portable_path = input_file_str.replace(workspace_root_str, '${CHECKLIST_ROOT}')
-                portable_input_files.append(portable_path)
-            elif input_file_str.startswith('${CHECKLIST_ROOT}'):
-                # Already in portable format
-                portable_input_files.append(input_file_str)
-            else:
-                # Relative path - prepend ${CHECKLIST_ROOT}
-                portable_input_files.append(f'${{CHECKLIST_ROOT}}/{input_file_str.lstrip("/")}')
-        
-        # Update test_config with portable paths
-        test_config['input_files'] = portable_input_files
-        
-        # Save as flat format (no item_id/module at root, just the config fields)
-        # This matches the format in README examples
-        with open(test_config_file, 'w', encoding='utf-8') as f:
-            yaml.dump(test_config, f, default_flow_style=False, allow_unicode=True)
-        
-        # Save code to checker location
-        checker_file = paths.workspace_root / "Check_modules" / request.module / "scripts" / "checker" / f"{request.item_id}.py"
-        checker_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(checker_file, 'w', encoding='utf-8') as f:
-            f.write(request.code)
-        
-        # Backup and replace original YAML
-        original_yaml = paths.workspace_root / "Check_modules" / request.module / "inputs" / "items" / f"{request.item_id}.yaml"
-        original_yaml_backup = None
-        
-        if original_yaml.exists():
-            original_yaml_backup = original_yaml.with_suffix('.yaml.backup')
-            shutil.copy(original_yaml, original_yaml_backup)
-        
-        original_yaml.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy(test_config_file, original_yaml)
-        
-        # Run checker
-        import os
-        env = os.environ.copy()
-        if 'CHECKLIST_ROOT' not in env:
-            env['CHECKLIST_ROOT'] = str(paths.workspace_root)
-        
-        try:
-            result = subprocess.run(
-                [sys.executable, str(checker_file)],
-                cwd=paths.workspace_root,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                env=env
-            )
-        finally:
-            # Restore original YAML
-            if original_yaml_backup and original_yaml_backup.exists():
-                shutil.move(original_yaml_backup, original_yaml)
-        
-        execution_time = time.time() - start_time
-        
-        # Read checker output files
-        log_file = paths.workspace_root / "Check_modules" / request.module / "logs" / f"{request.item_id}.log"
-        report_file = paths.workspace_root / "Check_modules" / request.module / "reports" / f"{request.item_id}.rpt"
-        
-        checker_log = ""
-        checker_report = ""
-        
-        if log_file.exists():
-            checker_log = log_file.read_text(encoding='utf-8')
-        
-        if report_file.exists():
-            checker_report = report_file.read_text(encoding='utf-8')
-        
-        # Move outputs to test_outputs directory
-        test_output_dir = paths.workspace_root / "Check_modules" / request.module / "test_outputs"
-        test_output_dir.mkdir(parents=True, exist_ok=True)
-        
-        if log_file.exists():
-            test_log_dest = test_output_dir / f"{request.item_id}_{request.test_type}.log"
-            shutil.move(str(log_file), str(test_log_dest))
-        
-        if report_file.exists():
-            test_report_dest = test_output_dir / f"{request.item_id}_{request.test_type}.rpt"
-            shutil.move(str(report_file), str(test_report_dest))
-        
-        # Determine check result
-        status_source = checker_log if checker_log else (checker_report if checker_report else result.stdout)
-        
-        check_result = 'UNKNOWN'
-        test_passed = False
-        
-        if result.returncode != 0:
-            check_result = 'ERROR'
-        elif "PASS:" in status_source:
-            check_result = 'PASS'
-            test_passed = True
-        elif "FAIL:" in status_source:
-            check_result = 'FAIL'
-        
-        return TestResponse(
-            status="success",
-            test_passed=test_passed,
-            check_result=check_result,
-            output=result.stdout,
-            log_output=checker_log,
-            report_output=checker_report,
-            stderr=result.stderr if result.stderr else None,
-            execution_time=execution_time,
-            test_config=test_config
-        )
+        outcomes = _run_sandboxed(request, {request.test_type: test_config}, paths)
+        return _response_from_outcome(outcomes[request.test_type], test_config)
         
     except Exception as e:
         error_msg = f"Test execution failed: {str(e)}"
@@ -305,10 +275,46 @@ async def run_all_tests(request: AllTestsRequest):
     """
     Run all 6 type tests (matching CLI's "Run All Types" option).
     
+    The six variants run concurrently, each in its own sandbox.
+    
     Returns:
         AllTestsResponse with all results and summary
     """
     try:
+        from workflow.intelligent_agent import IntelligentCheckerAgent
+        
+        try:
+            from utils.paths import discover_project_paths
+        except ImportError:
+            from AutoGenChecker.utils.paths import discover_project_paths
+        
+        paths = discover_project_paths()
+        
+        agent = IntelligentCheckerAgent(
+            item_id=request.item_id,
+            module=request.module,
+            verbose=False,
+            interactive=False
+        )
+        
+        responses: Dict[str, TestResponse] = {}
+        variants: Dict[str, dict] = {}
+        for test_type in TEST_TYPES:
+            test_config = _build_test_config(agent, request, test_type, paths)
+            if test_config:
+                variants[test_type] = test_config
+            else:
+                responses[test_type] = TestResponse(
+                    status="error",
+                    test_passed=False,
+                    check_result="ERROR",
+                    error=f"Could not generate test config for {test_type}"
+                )
+        
+        outcomes = _run_sandboxed(request, variants, paths)
+        for test_type, outcome in outcomes.items():
+            responses[test_type] = _response_from_outcome(outcome, variants[test_type])
+        
         results = {}
         
         # Test log format matching CLI output
@@ -318,21 +324,11 @@ async def run_all_tests(request: AllTestsRequest):
         failed = 0
         errors = 0
         
-        for idx, (test_type, test_info) in enumerate(TEST_TYPES.items(), 1):
-            test_req = TestRequest(
-                module=request.module,
-                item_id=request.item_id,
-                code=request.code,
-                config=request.config,
-                readme=request.readme,
-                test_type=test_type
-            )
-            
-            result = await run_test(test_req)
+        for test_type in TEST_TYPES:
+            result = responses[test_type]
             results[test_type] = result.model_dump()
             
             # Update stats
-            exec_time = result.execution_time or 0
             if result.check_result == 'PASS':
                 passed += 1
             elif result.check_result == 'FAIL':
@@ -341,12 +337,6 @@ async def run_all_tests(request: AllTestsRequest):
                 errors += 1
         
         # Generate log file content (matching CLI format)
-        try:
-            from utils.paths import discover_project_paths
-        except ImportError:
-            from AutoGenChecker.utils.paths import discover_project_paths
-        
-        paths = discover_project_paths()
         test_output_dir = paths.workspace_root / "Check_modules" / request.module / "test_outputs"
         test_output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -236,7 +236,9 @@ export default function Step3README({ itemId }) {
     addLog(`Loaded hints #${newCount} from ${version.timestamp}`, 'info')
   }
   
-  const handleStartGeneration = async () => {
+  // options.regenerate: skip the backend LLM response cache (Re-generate button)
+  const handleStartGeneration = async (options = {}) => {
+    const regenerate = options.regenerate === true
     // Debug: Log all prerequisites
     console.log('[Step3] handleStartGeneration called')
     console.log('[Step3] selectedModule:', selectedModule)
@@ -291,12 +293,13 @@ export default function Step3README({ itemId }) {
         llm_provider: settings.llmProvider || 'jedai',
         llm_model: settings.llmModel || 'claude-sonnet-4-5',
         hints: hintsMode === 'no_hints' ? '' : hints,
-        hints_mode: hintsMode
+        hints_mode: hintsMode,
+        regenerate
       }
       
       console.log('[Step3] Request body prepared:', JSON.stringify(requestBody).substring(0, 200) + '...')
       
-      const response = await fetch('http://localhost:8000/api/step3/generate-readme', {
+      const response = await fetch('http://localhost:8000/api/step3/generate-readme-stream', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify(requestBody)
@@ -306,7 +309,47 @@ export default function Step3README({ itemId }) {
       
       if (response.ok) {
         addLog('LLM generating README...', 'info')
-        const data = await response.json()
+        
+        // Read SSE stream: token events are shown live, the complete event
+        // carries the final (unwrapped, saved) README
+        const reader = response.body.getReader()
+        const decoder = new TextDecoder()
+        let buffer = ''
+        let streamed = ''
+        let lastPaint = 0
+        let data = null
+        
+        while (true) {
+          const { done, value } = await reader.read()
+          if (done) break
+          
+          buffer += decoder.decode(value, { stream: true })
+          const lines = buffer.split('\n')
+          buffer = lines.pop() || '' // Keep incomplete line in buffer
+          
+          for (const line of lines) {
+            if (!line.startsWith('data: ')) continue
+            const event = JSON.parse(line.slice(6))
+            if (event.type === 'token') {
+              streamed += event.text
+              // Throttle store updates (the store is persisted)
+              const now = Date.now()
+              if (now - lastPaint > 150) {
+                setGeneratedReadme(streamed)
+                lastPaint = now
+              }
+            } else if (event.type === 'complete') {
+              if (event.status !== 'success') {
+                throw new Error(event.error || 'Generation failed')
+              }
+              data = event
+            }
+          }
+        }
+        
+        if (!data) {
+          throw new Error('Stream ended before README generation completed')
+        }
         console.log('[Step3] README generated:', data.message)
         addLog(`${data.message}`, 'success')
         setGeneratedReadme(data.readme)
@@ -348,7 +391,7 @@ export default function Step3README({ itemId }) {
   const handleReGenerate = () => {
     if (window.confirm('This will replace existing README content. Continue?')) {
       setGeneratedReadme('')
-      handleStartGeneration()
+      handleStartGeneration({ regenerate: true })
     }
   }
   
@@ -24,6 +24,7 @@ export default function Dashboard() {
     loadingStats,
     fetchAll: fetchDashboardData,
     refresh: refreshDashboard,
+    subscribe: subscribeDashboard,
     lastFetched
   } = useDashboardStore()
 
@@ -99,7 +100,13 @@ export default function Dashboard() {
     }
   }
 
-  // Auto-refresh interval (only if enabled)
+  // Live git status updates pushed by the backend while the page is visible
+  useEffect(() => {
+    if (!isPageVisible) return
+    return subscribeDashboard(10)
+  }, [subscribeDashboard, isPageVisible])
+
+  // Auto-refresh interval (only if enabled): git fetch from remote
   useEffect(() => {
     if (refreshInterval === 0) return // Disabled, no interval
     
@@ -87,6 +87,33 @@ export const useDashboardStore = create((set, get) => ({
     }
   },
 
+  // Live updates: the backend pushes developers/activities/stats over SSE
+  // whenever a workspace's git state changes. Returns an unsubscribe function.
+  subscribe: (limit = 10) => {
+    const eventSource = new EventSource(`${API_BASE}/api/dashboard/stream?limit=${limit}`)
+
+    eventSource.onmessage = (event) => {
+      const data = JSON.parse(event.data)
+      set({
+        developers: data.developers,
+        activities: data.activities,
+        stats: data.stats,
+        loadingDevelopers: false,
+        loadingActivities: false,
+        loadingStats: false,
+        lastFetched: Date.now(),
+        isLoaded: true
+      })
+    }
+
+    // EventSource reconnects by itself after network errors
+    eventSource.onerror = () => {
+      console.warn('⚠️ Dashboard stream interrupted, reconnecting...')
+    }
+
+    return () => eventSource.close()
+  },
+
   // Force refresh
   refresh: async () => {
     console.log('🔄 Refreshing dashboard data...')
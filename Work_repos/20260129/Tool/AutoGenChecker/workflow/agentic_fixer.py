@@ -337,6 +337,7 @@ Please start by using find_definition or search_code to investigate."""
         config = LLMCallConfig(
             temperature=0.2,
             max_tokens=8000,
+            use_cache=False,  # Fix loop: never replay an earlier fix attempt
         )
         
         try:
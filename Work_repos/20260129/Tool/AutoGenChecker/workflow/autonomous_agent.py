@@ -474,7 +474,8 @@ Please provide the corrected Python code only, no explanations.
         
         try:
             client = create_llm_client(self.llm_provider)
-            config = LLMCallConfig(temperature=0.1, max_tokens=4000)
+            # Fix loop: never replay an earlier fix attempt
+            config = LLMCallConfig(temperature=0.1, max_tokens=4000, use_cache=False)
             response = client.complete(prompt, config=config)
             
             # Extract fixed code
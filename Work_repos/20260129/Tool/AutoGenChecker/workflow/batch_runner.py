@@ -0,0 +1,184 @@
+"""
+Concurrent Batch Runner for Checker Generation.
+
+Runs the per-item generation pipeline for several items at once. Most of an
+item's time is spent waiting on LLM HTTP calls, so a thread pool overlaps
+those waits; the LLM request rate and per-provider concurrency are bounded
+by llm_clients.rate_limit in front of every client.
+
+Supports:
+- N items in flight (thread pool)
+- Per-item console isolation: each worker's stdout/stderr goes to its own
+  log file instead of interleaving on the terminal
+- Combined progress view on the terminal (started / finished / running)
+- Non-interactive workers: stdin reads hit EOF instead of blocking on a
+  prompt nobody can see
+
+Storage: logs/batch_{timestamp}/{item_id}.log
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TextIO
+
+
+class ThreadRoutedStream:
+    """
+    Stand-in for sys.stdout / sys.stderr / sys.stdin that forwards each
+    thread to its own stream (default: the original stream).
+    """
+
+    def __init__(self, default: TextIO) -> None:
+        self._default = default
+        self._local = threading.local()
+
+    def route(self, stream: Optional[TextIO]) -> None:
+        """Send the calling thread's I/O to stream (None restores the default)."""
+        self._local.stream = stream
+
+    def _current(self) -> TextIO:
+        return getattr(self._local, "stream", None) or self._default
+
+    def write(self, text: str) -> int:
+        return self._current().write(text)
+
+    def flush(self) -> None:
+        self._current().flush()
+
+    def readline(self, *args) -> str:
+        return self._current().readline(*args)
+
+    def __getattr__(self, name: str):
+        return getattr(self._current(), name)
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one item in a batch."""
+
+    item_id: str
+    exit_code: int
+    seconds: float
+    log_path: Path
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.exit_code == 0
+
+
+class BatchRunner:
+    """Run run_item(item_id) -> exit code for many items concurrently."""
+
+    def __init__(
+        self,
+        run_item: Callable[[str], int],
+        jobs: int,
+        log_dir: Path,
+        progress: Optional[TextIO] = None,
+        status_interval: float = 60.0,
+    ) -> None:
+        """
+        Args:
+            run_item: Per-item generation; returns 0 on success
+            jobs: Items in flight at once
+            log_dir: Directory for per-item console logs
+            progress: Stream for the combined progress view (default: stdout)
+            status_interval: Seconds between "still running" lines
+        """
+        self.run_item = run_item
+        self.jobs = max(1, int(jobs))
+        self.log_dir = Path(log_dir)
+        self.progress = progress
+        self.status_interval = status_interval
+        self._out: TextIO = progress or sys.stdout
+        self._progress_lock = threading.Lock()
+
+    @staticmethod
+    def default_log_dir(root: Path) -> Path:
+        """Return logs/batch_{timestamp} under root."""
+        return root / "logs" / f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+    def _say(self, message: str) -> None:
+        with self._progress_lock:
+            self._out.write(message + "\n")
+            self._out.flush()
+
+    def _run_one(self, item_id: str, streams: List[ThreadRoutedStream]) -> BatchItemResult:
+        log_path = self.log_dir / f"{item_id}.log"
+        stdout, stderr, stdin = streams
+        start = time.monotonic()
+        error = None
+        with open(log_path, "w", encoding="utf-8", buffering=1) as log:
+            stdout.route(log)
+            stderr.route(log)
+            stdin.route(io.StringIO(""))
+            try:
+                exit_code = self.run_item(item_id)
+            except BaseException as e:  # noqa: BLE001 one item must not stop the batch
+                traceback.print_exc(file=log)
+                exit_code = 1
+                error = f"{type(e).__name__}: {e}"
+            finally:
+                stdout.route(None)
+                stderr.route(None)
+                stdin.route(None)
+        return BatchItemResult(item_id, exit_code, time.monotonic() - start, log_path, error)
+
+    def run(self, item_ids: List[str]) -> List[BatchItemResult]:
+        """
+        Run all items and return their results in input order.
+
+        The combined view prints one line per started / finished item and a
+        periodic list of items still running.
+        """
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        total = len(item_ids)
+        streams = [ThreadRoutedStream(sys.stdout), ThreadRoutedStream(sys.stderr),
+                   ThreadRoutedStream(sys.stdin)]
+        saved = (sys.stdout, sys.stderr, sys.stdin)
+        # The progress view writes to the real terminal, never to a worker log
+        self._out = self.progress or saved[0]
+        sys.stdout, sys.stderr, sys.stdin = streams
+
+        results: Dict[str, BatchItemResult] = {}
+        running: Dict[object, tuple] = {}
+        done_count = 0
+        try:
+            with ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="batch") as pool:
+                pending = list(reversed(item_ids))
+                while pending or running:
+                    while pending and len(running) < self.jobs:
+                        item_id = pending.pop()
+                        future = pool.submit(self._run_one, item_id, streams)
+                        running[future] = (item_id, time.monotonic())
+                        self._say(f"▶️  {item_id} started  (log: {self.log_dir / (item_id + '.log')})")
+                    finished, _ = wait(list(running), timeout=self.status_interval,
+                                       return_when=FIRST_COMPLETED)
+                    if not finished:
+                        now = time.monotonic()
+                        active = ", ".join(f"{item} {now - t0:.0f}s" for item, t0 in running.values())
+                        self._say(f"⏳ [{done_count}/{total}] running: {active}")
+                        continue
+                    for future in finished:
+                        item_id, _ = running.pop(future)
+                        result = future.result()
+                        results[item_id] = result
+                        done_count += 1
+                        mark = "✅" if result.success else "❌"
+                        detail = f" - {result.error}" if result.error else (
+                            "" if result.success else f" (exit code {result.exit_code})")
+                        self._say(f"{mark} [{done_count}/{total}] {item_id} "
+                                  f"finished in {result.seconds:.1f}s{detail}")
+        finally:
+            sys.stdout, sys.stderr, sys.stdin = saved
+        return [results[item_id] for item_id in item_ids]
@@ -622,9 +622,11 @@ class IntelligentCheckerAgent(LoggingMixin, FileAnalysisMixin, ReadmeGenerationM
             }
             
             if choice == 'A':
-                # Run all tests in batch mode (no confirmation for each)
+                # Run all tests in batch mode (no confirmation for each),
+                # concurrently, each type in its own sandbox
                 print("\n🚀 Running all 6 test types...")
                 test_results = []
+                all_results = self._run_all_tests_sandboxed(test_map, config, readme, code)
                 
                 # Create unified test report file in test_outputs directory
                 try:
@@ -650,7 +652,7 @@ class IntelligentCheckerAgent(LoggingMixin, FileAnalysisMixin, ReadmeGenerationM
                     log_f.write("="*80 + "\n\n")
                     
                     for idx, (test_id, test_name) in enumerate(test_map.values(), 1):
-                        result = self._run_single_test(test_id, test_name, config, readme, code, batch_mode=True)
+                        result = all_results[test_id]
                         
                         # Write to log file (checker log output)
                         log_f.write(f"[Test {idx}/6] {test_name}\n")
@@ -1309,6 +1311,74 @@ class IntelligentCheckerAgent(LoggingMixin, FileAnalysisMixin, ReadmeGenerationM
         # Execute the test
         return self._execute_test(test_config_file, test_name, code, batch_mode)
     
+    def _run_all_tests_sandboxed(
+        self,
+        test_map: dict[str, tuple[str, str]],
+        config: dict[str, Any],
+        readme: str,
+        code: str,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Run all test types concurrently, each in its own sandbox root.
+        
+        Test configs are still saved to test_inputs/items/ and the code to
+        scripts/checker/; per-type log/report files land in test_outputs/.
+        The real inputs/items/ YAML is never swapped.
+        
+        Returns:
+            dict mapping test ID to {'status', 'log', 'report', 'stderr'}
+        """
+        import yaml
+        
+        try:
+            from utils.paths import discover_project_paths
+            from workflow.sandbox_runner import SandboxTestRunner
+        except ImportError:
+            from AutoGenChecker.utils.paths import discover_project_paths
+            from AutoGenChecker.workflow.sandbox_runner import SandboxTestRunner
+        
+        paths = discover_project_paths()
+        module_dir = paths.workspace_root / "Check_modules" / self.module
+        test_config_dir = module_dir / "test_inputs" / "items"
+        test_config_dir.mkdir(parents=True, exist_ok=True)
+        
+        results: dict[str, dict[str, Any]] = {}
+        variants: dict[str, dict[str, Any]] = {}
+        for test_id, test_name in test_map.values():
+            test_config = self._generate_test_config(test_id, config, readme)
+            if not test_config:
+                print(f"⚠️  Could not generate test config for {test_name}")
+                results[test_id] = {'status': 'ERROR', 'log': '', 'report': '', 'stderr': ''}
+                continue
+            test_config_file = test_config_dir / f"{self.item_id}_test_{test_id}.yaml"
+            with open(test_config_file, 'w', encoding='utf-8') as f:
+                yaml.dump(test_config, f, default_flow_style=False, allow_unicode=True)
+            variants[test_id] = test_config
+        
+        # Save code (no backup - we modify skeleton incrementally)
+        checker_file = module_dir / "scripts" / "checker" / f"{self.item_id}.py"
+        with open(checker_file, 'w', encoding='utf-8') as f:
+            f.write(code)
+        
+        runner = SandboxTestRunner(paths.workspace_root, self.module, self.item_id, code, timeout=30)
+        outcomes = runner.run(variants)
+        runner.save_outputs(outcomes)
+        
+        for test_id, test_name in test_map.values():
+            outcome = outcomes.get(test_id)
+            if outcome is None:
+                continue
+            status = outcome.check_result
+            icon = "✅" if status == 'PASS' else "❌" if status in ('FAIL', 'ERROR') else "⚠️"
+            print(f"  {icon} {test_name}: {status} ({outcome.execution_time:.1f}s)")
+            results[test_id] = {
+                'status': status,
+                'log': outcome.log or (outcome.error or ''),
+                'report': outcome.report,
+                'stderr': outcome.stderr,
+            }
+        return results
+    
     def _execute_test(
         self,
         test_config_file: Path,
@@ -0,0 +1,275 @@
+"""
+LLM Throughput Benchmark for Batch Generation.
+
+Drives batch-generation-shaped traffic (N items, each making a few sequential
+LLM calls) through a real LLM client and ``workflow.batch_runner`` against
+the local mock server (``llm_clients/mock_server.py``). No network access is
+needed, and the mock's latency, rate limits and error injection are seeded,
+so throughput and retry / back-off behaviour are comparable between runs:
+
+    python workflow/llm_benchmark.py --jobs 1,4,8 --latency 0.3 --rpm 600
+    python workflow/llm_benchmark.py --jobs 8 --error-rate 0.1 --json out.json
+    python workflow/llm_benchmark.py --jobs 8 --baseline out.json   # exit 1 on regression
+
+Reported per scenario: wall time, calls/s, per-call latency percentiles,
+failures, and what the server saw (requests incl. client retries, 429s,
+injected errors, peak concurrency).
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Setup import path
+_parent_dir = Path(__file__).parent.parent
+if str(_parent_dir) not in sys.path:
+    sys.path.insert(0, str(_parent_dir))
+
+try:
+    from llm_clients.base import BaseLLMClient
+    from llm_clients.factory import create_llm_client
+    from llm_clients.mock_server import MOCK_TOKEN, MockLLMServer, MockServerConfig
+    from llm_clients.rate_limit import configure_scheduler
+    from utils.models import LLMCallConfig
+    from workflow.batch_runner import BatchRunner
+except ImportError:
+    from AutoGenChecker.llm_clients.base import BaseLLMClient
+    from AutoGenChecker.llm_clients.factory import create_llm_client
+    from AutoGenChecker.llm_clients.mock_server import MOCK_TOKEN, MockLLMServer, MockServerConfig
+    from AutoGenChecker.llm_clients.rate_limit import configure_scheduler
+    from AutoGenChecker.utils.models import LLMCallConfig
+    from AutoGenChecker.workflow.batch_runner import BatchRunner
+
+
+@dataclass
+class BenchmarkReport:
+    """Result of one benchmark scenario."""
+
+    name: str
+    jobs: int
+    items: int
+    calls: int
+    failures: int
+    seconds: float
+    latency: Dict[str, float] = field(default_factory=dict)
+    server: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def calls_per_second(self) -> float:
+        return self.calls / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["calls_per_second"] = round(self.calls_per_second, 3)
+        return data
+
+    def summary_line(self) -> str:
+        return (
+            f"{self.name:<24} jobs={self.jobs:<3} {self.calls_per_second:7.2f} calls/s  "
+            f"{self.seconds:7.2f}s  p50={self.latency.get('p50', 0):.3f}s "
+            f"p95={self.latency.get('p95', 0):.3f}s  failures={self.failures}  "
+            f"server: {self.server.get('requests', 0)} req, "
+            f"{self.server.get('rate_limited', 0) + self.server.get('over_concurrency', 0)} x429, "
+            f"{self.server.get('injected_errors', 0)} errors, peak {self.server.get('max_in_flight', 0)}"
+        )
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    n = len(ordered)
+    return {
+        "p50": round(ordered[n // 2], 4),
+        "p95": round(ordered[min(n - 1, int(n * 0.95))], 4),
+        "max": round(ordered[-1], 4),
+    }
+
+
+def run_llm_benchmark(
+    client: BaseLLMClient,
+    *,
+    items: int = 8,
+    calls_per_item: int = 3,
+    jobs: int = 4,
+    stream: bool = False,
+    prompt_words: int = 200,
+    server: Optional[MockLLMServer] = None,
+    name: str = "benchmark",
+    log_dir: Optional[Path] = None,
+) -> BenchmarkReport:
+    """
+    Run items x calls_per_item LLM calls through BatchRunner with jobs workers.
+
+    Each item makes its calls sequentially (like the generation steps of one
+    checker) and fails on the first exception, as the real pipeline would.
+
+    Args:
+        client: LLM client, normally pointed at a MockLLMServer
+        items: Number of simulated items
+        calls_per_item: Sequential LLM calls per item
+        jobs: Items in flight at once
+        stream: Use complete_stream instead of complete
+        prompt_words: Filler words per prompt
+        server: Mock server whose statistics are added to the report
+        name: Scenario label
+        log_dir: Per-item log directory (default: a temporary directory)
+    """
+    latencies: List[float] = []
+    lock = threading.Lock()
+    filler = " ".join(f"w{i}" for i in range(prompt_words))
+    config = LLMCallConfig(use_cache=False)
+
+    def run_item(item_id: str) -> int:
+        for step in range(calls_per_item):
+            prompt = f"[{item_id} step {step}] {filler}"
+            start = time.monotonic()
+            if stream:
+                text = "".join(client.complete_stream(prompt, config=config))
+            else:
+                text = client.complete(prompt, config=config).text
+            with lock:
+                latencies.append(time.monotonic() - start)
+            if not text:
+                raise RuntimeError(f"empty response for {item_id} step {step}")
+        return 0
+
+    if server is not None:
+        server.reset_stats()
+    item_ids = [f"BENCH-{i:03d}" for i in range(items)]
+    with tempfile.TemporaryDirectory(prefix="llm_bench_") as tmp:
+        runner = BatchRunner(run_item, jobs=jobs, log_dir=log_dir or Path(tmp), progress=io.StringIO())
+        start = time.monotonic()
+        results = runner.run(item_ids)
+        seconds = time.monotonic() - start
+
+    return BenchmarkReport(
+        name=name,
+        jobs=jobs,
+        items=items,
+        calls=len(latencies),
+        failures=sum(1 for r in results if not r.success),
+        seconds=round(seconds, 4),
+        latency=_percentiles(latencies),
+        server=server.stats() if server is not None else {},
+    )
+
+
+def compare_reports(
+    current: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float = 0.2
+) -> List[str]:
+    """Return regressions of current vs baseline scenarios (matched by name)."""
+    previous = {entry["name"]: entry for entry in baseline}
+    regressions = []
+    for entry in current:
+        before = previous.get(entry["name"])
+        if before is None:
+            continue
+        if entry["calls_per_second"] < before["calls_per_second"] * (1 - tolerance):
+            regressions.append(
+                f"{entry['name']}: {entry['calls_per_second']:.2f} calls/s "
+                f"(baseline {before['calls_per_second']:.2f})"
+            )
+        if entry["failures"] > before["failures"]:
+            regressions.append(
+                f"{entry['name']}: {entry['failures']} failed items (baseline {before['failures']})"
+            )
+    return regressions
+
+
+def create_mock_client(provider: str, server: MockLLMServer) -> BaseLLMClient:
+    """Real provider client pointed at the mock server (response cache off)."""
+    provider = provider.lower()
+    if provider == "jedai":
+        return create_llm_client("jedai", jedai_url=server.url, access_token=MOCK_TOKEN,
+                                 response_cache=False)
+    if provider == "openai":
+        return create_llm_client("openai", api_key="mock", base_url=f"{server.url}/v1",
+                                 response_cache=False)
+    if provider == "anthropic":
+        return create_llm_client("anthropic", api_key="mock", base_url=server.url,
+                                 response_cache=False)
+    raise ValueError(f"Unsupported provider: {provider}. Supported: jedai, openai, anthropic")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark batch LLM traffic against the mock server")
+    parser.add_argument("--provider", default="jedai", help="jedai | openai | anthropic")
+    parser.add_argument("--jobs", default="1,4,8", help="Comma-separated job counts to compare")
+    parser.add_argument("--items", type=int, default=16)
+    parser.add_argument("--calls-per-item", type=int, default=3)
+    parser.add_argument("--prompt-words", type=int, default=200)
+    parser.add_argument("--stream", action="store_true", help="Use streaming completions")
+    # Mock server behaviour
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--latency-jitter", type=float, default=0.1)
+    parser.add_argument("--token-latency", type=float, default=0.0)
+    parser.add_argument("--rpm", type=float, default=0, help="Server-side rate limit")
+    parser.add_argument("--burst", type=float, default=1)
+    parser.add_argument("--max-concurrency", type=int, default=0, help="Server-side concurrency cap")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    # Client-side scheduling (llm_clients.rate_limit)
+    parser.add_argument("--client-rpm", type=float, default=0)
+    parser.add_argument("--client-max-concurrency", type=int, default=0)
+    # Output / regression check
+    parser.add_argument("--json", help="Write reports to this JSON file")
+    parser.add_argument("--baseline", help="Compare against a previous --json file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed throughput drop")
+    args = parser.parse_args(argv)
+
+    server_config = MockServerConfig(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        token_latency=args.token_latency,
+        rpm=args.rpm,
+        burst=args.burst,
+        max_concurrency=args.max_concurrency,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    configure_scheduler(args.client_rpm, args.client_max_concurrency)
+
+    reports = []
+    with MockLLMServer(server_config) as server:
+        client = create_mock_client(args.provider, server)
+        print(f"Mock LLM server: {server.url}  provider: {args.provider}")
+        for jobs in [int(j) for j in args.jobs.split(",") if j.strip()]:
+            report = run_llm_benchmark(
+                client,
+                items=args.items,
+                calls_per_item=args.calls_per_item,
+                jobs=jobs,
+                stream=args.stream,
+                prompt_words=args.prompt_words,
+                server=server,
+                name=f"{args.provider}-jobs{jobs}{'-stream' if args.stream else ''}",
+            )
+            reports.append(report.to_dict())
+            print(report.summary_line())
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(reports, indent=2), encoding="utf-8")
+        print(f"Reports written to {args.json}")
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare_reports(reports, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
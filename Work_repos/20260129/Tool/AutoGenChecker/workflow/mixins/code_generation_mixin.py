@@ -8,6 +8,7 @@ This mixin handles all code implementation functionality:
 - Extracting code from AI responses
 """
 
+import dataclasses
 from typing import Any, TYPE_CHECKING
 from pathlib import Path
 
@@ -23,6 +24,7 @@ class CodeGenerationMixin:
         config: dict[str, Any],
         file_analysis: dict[str, Any],
         readme: str,
+        use_cache: bool = True,
     ) -> str:
         """
         AI implements COMPLETE checker code using MULTI-PHASE generation.
@@ -37,6 +39,9 @@ class CodeGenerationMixin:
         Each phase uses smaller token budgets and is more reliable.
         Type 4 reuses Type 1 core logic + waiver handling.
         Type 3 reuses Type 2 core logic + waiver handling.
+        
+        use_cache=False (e.g. a web UI regenerate) skips cached LLM responses
+        in every phase.
         """
         print("\n" + "─"*80)
         print("[Step 5/9] 💻 Multi-Phase Code Generation")
@@ -82,17 +87,17 @@ class CodeGenerationMixin:
         try:
             # Phase 1: Header + Imports + Class + _parse_input_files()
             print("\n  🔹 Phase 1/3: Generating header, imports, class, and _parse_input_files()...")
-            phase1_code = self._generate_phase1(config, file_analysis, readme, agent, existing_skeleton)
+            phase1_code = self._generate_phase1(config, file_analysis, readme, agent, existing_skeleton, use_cache)
             print(f"    ✅ Phase 1 complete ({len(phase1_code.split(chr(10)))} lines)")
             
             # Phase 2: Type 1 & Type 4 methods (boolean checks)
             print("\n  🔹 Phase 2/3: Generating Type 1 & Type 4 methods (Type4 reuses Type1 logic)...")
-            phase2_code = self._generate_phase2_type1_and_type4(config, file_analysis, readme, agent, phase1_code)
+            phase2_code = self._generate_phase2_type1_and_type4(config, file_analysis, readme, agent, phase1_code, use_cache)
             print(f"    ✅ Phase 2 complete ({len(phase2_code.split(chr(10)))} lines)")
             
             # Phase 3: Type 2 & Type 3 methods (pattern checks)
             print("\n  🔹 Phase 3/3: Generating Type 2 & Type 3 methods (Type3 reuses Type2 logic)...")
-            phase3_code = self._generate_phase3_type2_and_type3(config, file_analysis, readme, agent, phase1_code)
+            phase3_code = self._generate_phase3_type2_and_type3(config, file_analysis, readme, agent, phase1_code, use_cache)
             print(f"    ✅ Phase 3 complete ({len(phase3_code.split(chr(10)))} lines)")
             
             # Combine all phases (main() is in skeleton, no need for phase4)
@@ -112,7 +117,9 @@ class CodeGenerationMixin:
             
             for attempt in range(2):
                 try:
-                    response = agent._llm_client.complete(prompt, config=llm_config)
+                    # A retry must reach the model, not replay the failed answer
+                    call_config = dataclasses.replace(llm_config, use_cache=use_cache and attempt == 0)
+                    response = agent._llm_client.complete(prompt, config=call_config)
                     code_content = self._extract_code_from_response(response.text)
                     code_lines = len(code_content.split('\n'))
                     print(f"    ✅ Fallback generation complete ({code_lines} lines)")
@@ -923,6 +930,7 @@ DO NOT skip these steps - they are the core logic for each type!
         readme: str,
         agent: Any,
         existing_skeleton: str = "",
+        use_cache: bool = True,
     ) -> str:
         """
         Phase 1: MODIFY skeleton by filling TODO sections.
@@ -1285,7 +1293,7 @@ Do NOT use generic/placeholder text - use EXACT strings from README Output Descr
 Output ONLY raw Python code (no ```python markers):
 """
         
-        llm_config = LLMCallConfig(temperature=0.2, max_tokens=16000)
+        llm_config = LLMCallConfig(temperature=0.2, max_tokens=16000, use_cache=use_cache)
         response = agent._llm_client.complete(prompt, config=llm_config)
         return self._extract_code_from_response(response.text)
     
@@ -1296,6 +1304,7 @@ Output ONLY raw Python code (no ```python markers):
         readme: str,
         agent: Any,
         phase1_code: str,
+        use_cache: bool = True,
     ) -> str:
         """
         Phase 2: Generate Type 1 & Type 4 methods.
@@ -1643,7 +1652,7 @@ Type 4:
 ⚠️ DO NOT SKIP ANY PARAMETERS! COPY THE EXACT FORMAT ABOVE!
 """
         
-        llm_config = LLMCallConfig(temperature=0.2, max_tokens=16000)
+        llm_config = LLMCallConfig(temperature=0.2, max_tokens=16000, use_cache=use_cache)
         response = agent._llm_client.complete(prompt, config=llm_config)
         return self._extract_code_from_response(response.text)
     
@@ -1654,6 +1663,7 @@ Type 4:
         readme: str,
         agent: Any,
         phase1_code: str,
+        use_cache: bool = True,
     ) -> str:
         """
         Phase 3: Generate Type 2 & Type 3 methods.
@@ -1985,7 +1995,7 @@ Type 3:
 ⚠️ DO NOT SKIP ANY PARAMETERS! COPY THE EXACT FORMAT ABOVE!
 """
         
-        llm_config = LLMCallConfig(temperature=0.2, max_tokens=16000)
+        llm_config = LLMCallConfig(temperature=0.2, max_tokens=16000, use_cache=use_cache)
         response = agent._llm_client.complete(prompt, config=llm_config)
         return self._extract_code_from_response(response.text)
     
@@ -9,6 +9,7 @@ from typing import Any, TYPE_CHECKING
 import re
 import json
 import glob
+from itertools import islice
 
 if TYPE_CHECKING:
     pass
@@ -245,7 +246,7 @@ class FileAnalysisMixin:
         # Read file content (limit to 200 lines or 30KB to avoid timeout)
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()[:200]  # First 200 lines max
+                lines = list(islice(f, 200))  # First 200 lines max (without reading the rest)
                 content = ''.join(lines)
                 
                 # Further limit by size (30KB max)
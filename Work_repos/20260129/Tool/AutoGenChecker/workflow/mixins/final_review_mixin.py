@@ -506,6 +506,7 @@ Return the complete modified Python code without any explanations or markdown.
                 llm_config = LLMCallConfig(
                     temperature=0.2,
                     max_tokens=max_tokens,
+                    use_cache=attempt == 0,  # A retry must reach the model
                 )
                 
                 response = agent._llm_client.complete(prompt, config=llm_config)
@@ -634,6 +635,7 @@ Return the complete modified Python code without any explanations or markdown.
                 llm_config = LLMCallConfig(
                     temperature=0.2,
                     max_tokens=max_tokens,
+                    use_cache=attempt == 0,  # A retry must reach the model
                 )
                 
                 response = agent._llm_client.complete(prompt, config=llm_config)
@@ -150,6 +150,7 @@ Return the complete fixed Python code. Start with ##############################
         llm_config = LLMCallConfig(
             temperature=0.1,
             max_tokens=16000,  # Increased limit to avoid truncation
+            use_cache=False,  # Fix loop: never replay an earlier fix attempt
         )
         
         print(f"\n🤖 Step 3: Calling AI to fix code...")
@@ -434,6 +434,7 @@ Return the complete modified Python code. Start with:
                 llm_config = LLMCallConfig(
                     temperature=0.2,
                     max_tokens=max_tokens,
+                    use_cache=attempt == 0,  # A retry must reach the model
                 )
                 response = agent._llm_client.complete(prompt, config=llm_config)
                 extracted_code = self._extract_code_from_response(response.text)
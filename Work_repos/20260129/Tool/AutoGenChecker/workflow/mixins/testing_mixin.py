@@ -205,6 +205,7 @@ Return ONLY the fixed Python code, no explanations."""
         llm_config = LLMCallConfig(
             temperature=0.2,
             max_tokens=16000,  # Increased limit to avoid truncation
+            use_cache=False,  # Fix loop: never replay an earlier fix attempt
         )
         
         try:
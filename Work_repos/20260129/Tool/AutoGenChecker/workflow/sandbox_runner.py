@@ -0,0 +1,263 @@
+"""
+Sandboxed Parallel Runner for Checker Test Variants.
+
+The six test types (type1_na ... type4) used to run one after another: each
+variant swapped its YAML into Check_modules/{module}/inputs/items/ and the
+checker wrote to the shared logs/ and reports/ directories. Here every
+variant gets its own sandbox CHECKLIST root, so all variants run at once.
+
+Sandbox layout (per variant):
+- Check_modules/common/         copy (hard links where possible); checkers
+                                locate the project root from this path
+- Check_modules/{module}/       inputs/items/{item_id}.yaml = variant config,
+                                scripts/checker/{item_id}.py = code under test,
+                                fresh logs/ reports/ outputs/, other entries
+                                linked from the real module
+- everything else               symlinked to the real workspace root
+                                (IP_project_folder, Data_interface, ...)
+
+Supports:
+- N variants in flight (each checker is its own subprocess)
+- Per-variant timeout, stdout/stderr and log/report capture
+- Results feed TestRunner (TestResult / ResultMerger reports), the
+  interactive CLI tests and the web UI Step 7 API
+
+Storage: {tempdir}/checker_test_{item_id}_{random}/{test_id}/ (removed after the run)
+
+Environment variables:
+- AUTOGEN_TEST_JOBS: variants run concurrently (default: all, capped by CPU count)
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import yaml
+
+
+# Module subdirectories the sandbox creates itself instead of linking
+_OWN_MODULE_DIRS = {"inputs", "scripts", "logs", "reports", "outputs", "test_inputs", "test_outputs"}
+
+
+def default_jobs(variant_count: int) -> int:
+    """Variants to run at once (AUTOGEN_TEST_JOBS, else one per variant up to CPU count)."""
+    try:
+        configured = int(os.environ.get("AUTOGEN_TEST_JOBS", "0"))
+    except ValueError:
+        configured = 0
+    if configured > 0:
+        return configured
+    return max(1, min(variant_count, os.cpu_count() or 1))
+
+
+def parse_check_result(returncode: int, log: str, report: str, stdout: str) -> str:
+    """PASS / FAIL / ERROR / UNKNOWN, using the log, then report, then stdout."""
+    status_source = log if log else (report if report else stdout)
+    if returncode != 0:
+        return "ERROR"
+    if "PASS:" in status_source:
+        return "PASS"
+    if "FAIL:" in status_source:
+        return "FAIL"
+    return "UNKNOWN"
+
+
+@dataclass
+class VariantOutcome:
+    """Result of one test variant run in its sandbox."""
+
+    test_id: str
+    returncode: int
+    stdout: str
+    stderr: str
+    log: str
+    report: str
+    execution_time: float
+    error: Optional[str] = None  # timeout / sandbox failure
+    timed_out: bool = False
+
+    @property
+    def check_result(self) -> str:
+        if self.error:
+            return "ERROR"
+        return parse_check_result(self.returncode, self.log, self.report, self.stdout)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _symlink(target: Path, link: Path) -> None:
+    try:
+        link.symlink_to(target, target_is_directory=target.is_dir())
+    except OSError:
+        # No symlink privilege (e.g. Windows without developer mode)
+        if target.is_dir():
+            shutil.copytree(target, link, copy_function=_link_or_copy)
+        else:
+            shutil.copy2(target, link)
+
+
+class SandboxTestRunner:
+    """Run one checker against several test configs concurrently."""
+
+    def __init__(
+        self,
+        workspace_root: Path,
+        module: str,
+        item_id: str,
+        code: str,
+        jobs: Optional[int] = None,
+        timeout: float = 60.0,
+        keep_sandboxes: bool = False,
+    ) -> None:
+        """
+        Args:
+            workspace_root: Real CHECKLIST root
+            module: Check module name
+            item_id: Checker ID
+            code: Checker source under test
+            jobs: Variants in flight (default: default_jobs())
+            timeout: Per-variant checker timeout in seconds
+            keep_sandboxes: Leave sandbox trees on disk for debugging
+        """
+        self.workspace_root = Path(workspace_root)
+        self.module = module
+        self.item_id = item_id
+        self.code = code
+        self.jobs = jobs
+        self.timeout = timeout
+        self.keep_sandboxes = keep_sandboxes
+
+    def _build_sandbox(self, sandbox: Path, config: Dict[str, Any]) -> Path:
+        """Create the sandbox root for one variant; returns the checker path."""
+        real_modules = self.workspace_root / "Check_modules"
+        sandbox.mkdir(parents=True)
+        for entry in self.workspace_root.iterdir():
+            if entry.name != "Check_modules":
+                _symlink(entry, sandbox / entry.name)
+
+        modules = sandbox / "Check_modules"
+        shutil.copytree(
+            real_modules / "common",
+            modules / "common",
+            # __pycache__ is kept: linked/copied sources keep their mtime, so
+            # the bytecode stays valid and each sandbox skips recompilation
+            ignore=shutil.ignore_patterns("regression_testing"),
+            copy_function=_link_or_copy,
+        )
+
+        real_module = real_modules / self.module
+        module_dir = modules / self.module
+        module_dir.mkdir()
+        if real_module.is_dir():
+            for entry in real_module.iterdir():
+                if entry.name not in _OWN_MODULE_DIRS:
+                    _symlink(entry, module_dir / entry.name)
+
+        items_dir = module_dir / "inputs" / "items"
+        items_dir.mkdir(parents=True)
+        with open(items_dir / f"{self.item_id}.yaml", "w", encoding="utf-8") as f:
+            yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+
+        checker_dir = module_dir / "scripts" / "checker"
+        checker_dir.mkdir(parents=True)
+        # Sibling helpers the checker may import
+        real_checker_dir = real_module / "scripts" / "checker"
+        if real_checker_dir.is_dir():
+            for entry in real_checker_dir.iterdir():
+                if entry.name != f"{self.item_id}.py" and entry.name != "__pycache__":
+                    _symlink(entry, checker_dir / entry.name)
+        checker_file = checker_dir / f"{self.item_id}.py"
+        checker_file.write_text(self.code, encoding="utf-8")
+        return checker_file
+
+    def _run_variant(self, base: Path, test_id: str, config: Dict[str, Any]) -> VariantOutcome:
+        sandbox = base / test_id
+        start = time.time()
+        try:
+            checker_file = self._build_sandbox(sandbox, config)
+        except Exception as e:
+            return VariantOutcome(test_id, -1, "", "", "", "", time.time() - start,
+                                  error=f"Sandbox setup failed: {e}")
+
+        env = os.environ.copy()
+        env["CHECKLIST_ROOT"] = str(sandbox)
+        try:
+            result = subprocess.run(
+                [sys.executable, str(checker_file)],
+                cwd=sandbox,
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+                env=env,
+            )
+        except subprocess.TimeoutExpired:
+            return VariantOutcome(test_id, -1, "", "", "", "", time.time() - start,
+                                  error=f"Test timed out after {self.timeout:g} seconds",
+                                  timed_out=True)
+        except OSError as e:
+            return VariantOutcome(test_id, -1, "", "", "", "", time.time() - start,
+                                  error=f"Test failed: {e}")
+
+        module_dir = sandbox / "Check_modules" / self.module
+        log_file = module_dir / "logs" / f"{self.item_id}.log"
+        report_file = module_dir / "reports" / f"{self.item_id}.rpt"
+        return VariantOutcome(
+            test_id=test_id,
+            returncode=result.returncode,
+            stdout=result.stdout,
+            stderr=result.stderr,
+            log=log_file.read_text(encoding="utf-8") if log_file.exists() else "",
+            report=report_file.read_text(encoding="utf-8") if report_file.exists() else "",
+            execution_time=time.time() - start,
+        )
+
+    def run(self, variants: Dict[str, Dict[str, Any]]) -> Dict[str, VariantOutcome]:
+        """
+        Run every variant (test_id -> flat item config) in its own sandbox.
+
+        Returns:
+            Outcomes in the order of variants
+        """
+        if not variants:
+            return {}
+        jobs = self.jobs or default_jobs(len(variants))
+        base = Path(tempfile.mkdtemp(prefix=f"checker_test_{self.item_id}_"))
+
+        def run_one(test_id: str) -> VariantOutcome:
+            return self._run_variant(base, test_id, variants[test_id])
+
+        try:
+            # Threads only wait on the checker subprocesses, which do the work
+            with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="variant") as pool:
+                outcomes = dict(zip(variants, pool.map(run_one, variants)))
+        finally:
+            if not self.keep_sandboxes:
+                shutil.rmtree(base, ignore_errors=True)
+        return outcomes
+
+    def save_outputs(self, outcomes: Dict[str, VariantOutcome]) -> Path:
+        """Copy each variant's log/report to test_outputs/{item_id}_{test_id}.log/.rpt."""
+        test_output_dir = self.workspace_root / "Check_modules" / self.module / "test_outputs"
+        test_output_dir.mkdir(parents=True, exist_ok=True)
+        for test_id, outcome in outcomes.items():
+            if outcome.log:
+                (test_output_dir / f"{self.item_id}_{test_id}.log").write_text(
+                    outcome.log, encoding="utf-8")
+            if outcome.report:
+                (test_output_dir / f"{self.item_id}_{test_id}.rpt").write_text(
+                    outcome.report, encoding="utf-8")
+        return test_output_dir
@@ -4,7 +4,7 @@ Test Runner for Comprehensive Checker Testing.
 Runs generated test configurations and captures results.
 Supports:
 - Single test execution
-- Full test suite (all 6 types)
+- Full test suite (all 6 types), run concurrently in per-type sandboxes
 - Result capture (status, output, errors)
 - Progress tracking
 
@@ -96,10 +96,16 @@ class TestRunner:
         )
         self.test_results_dir.mkdir(parents=True, exist_ok=True)
     
-    def run_all_tests(self) -> Dict[str, TestResult]:
+    def run_all_tests(self, jobs: Optional[int] = None) -> Dict[str, TestResult]:
         """
         Run all 6 test types.
         
+        The types run concurrently, each in its own sandbox root (see
+        sandbox_runner.py); jobs=1 runs them one at a time in the workspace.
+        
+        Args:
+            jobs: Tests in flight (default: AUTOGEN_TEST_JOBS / CPU count)
+        
         Returns:
             Dict mapping test type to TestResult
         """
@@ -124,11 +130,12 @@ class TestRunner:
         
         print(f"\n🧪 Running {len(test_types)} tests for {self.item_id}...")
         
-        results = {}
-        for test_type in test_types:
-            result = self.run_single_test(test_type)
-            results[test_type] = result
-            
+        if jobs == 1:
+            results = {test_type: self.run_single_test(test_type) for test_type in test_types}
+        else:
+            results = self._run_sandboxed(test_types, jobs)
+        
+        for test_type, result in results.items():
             # Print result
             status_icon = "✅" if "PASS" in result.status else "❌" if "ERROR" in result.status else "⚠️"
             print(f"  {status_icon} {test_type}: {result.status} ({result.execution_time:.2f}s)")
@@ -217,6 +224,60 @@ class TestRunner:
                 execution_time=execution_time,
             )
     
+    def _run_sandboxed(self, test_types: List[str], jobs: Optional[int]) -> Dict[str, TestResult]:
+        """Run the test types concurrently, one sandbox each."""
+        try:
+            from workflow.sandbox_runner import SandboxTestRunner
+        except ImportError:
+            from AutoGenChecker.workflow.sandbox_runner import SandboxTestRunner
+        
+        results: Dict[str, TestResult] = {}
+        variants: Dict[str, Dict[str, Any]] = {}
+        for test_type in test_types:
+            config_file = self.test_config_dir / f"{test_type}.yaml"
+            if not config_file.exists():
+                results[test_type] = TestResult(
+                    test_type=test_type,
+                    status="SKIP",
+                    output="",
+                    errors=f"Config file not found: {config_file}",
+                )
+                continue
+            with open(config_file, 'r', encoding='utf-8') as f:
+                config = yaml.safe_load(f) or {}
+            # test_generator nests the config under the item ID
+            if isinstance(config.get(self.item_id), dict):
+                config = config[self.item_id]
+            variants[test_type] = config
+        
+        runner = SandboxTestRunner(
+            self.workspace_root,
+            self.module,
+            self.item_id,
+            self.checker_script.read_text(encoding='utf-8'),
+            jobs=jobs,
+            timeout=60,
+        )
+        outcomes = runner.run(variants)
+        
+        for test_type, outcome in outcomes.items():
+            if outcome.timed_out:
+                status = "TIMEOUT"
+            elif outcome.error:
+                status = "EXCEPTION"
+            else:
+                status = self._parse_status_from_output(outcome.stdout)
+                self._save_test_output(test_type, outcome.stdout, outcome.stderr)
+            results[test_type] = TestResult(
+                test_type=test_type,
+                status=status,
+                output=outcome.stdout,
+                errors=outcome.error or (outcome.stderr if outcome.stderr else None),
+                execution_time=outcome.execution_time,
+            )
+        
+        return {test_type: results[test_type] for test_type in test_types}
+    
     def _parse_status_from_output(self, output: str) -> str:
         """
         Extract status from checker output.